@@ -1,29 +1,6 @@
-from .align import app as align
-from .data import app as data
-from .db import app as db
-from .event import app as event
-from .plot import app as plot
-from .project import app as project
-from .seismogram import app as seismogram
-from .shell import app as shell
-from .snapshot import app as snapshot
-from .station import app as station
-from .tool import app as tool
-from .tui import app as tui
-from .utils import app as utils
+"""Sub-apps of the AIMBAT command line interface.
 
-__all__ = [
-    "utils",
-    "align",
-    "data",
-    "db",
-    "event",
-    "tool",
-    "plot",
-    "project",
-    "seismogram",
-    "shell",
-    "snapshot",
-    "station",
-    "tui",
-]
+Each module defines the cyclopts `App` of one command. `aimbat.app` registers
+them by import path, so a sub-app (and whatever it imports) is only loaded
+when its command is run. This package therefore does not import them itself.
+"""
@@ -0,0 +1,553 @@
+"""Local JSON-RPC API over the AIMBAT core functions.
+
+`aimbat api` serves [JSON-RPC 2.0](https://www.jsonrpc.org/specification)
+over HTTP on localhost, so that dashboards and pipeline orchestrators can
+query and drive a project without starting a new `aimbat` process for every
+request. Requests are `POST`ed to `/` with `Content-Type: application/json`:
+
+    {"jsonrpc": "2.0", "id": 1, "method": "event.parameter.set",
+     "params": {"event_id": "6a4a", "name": "min_cc", "value": 0.6}}
+
+Method names mirror the CLI commands (`event.dump`, `align.iccs`,
+`snapshot.create`, ...; see `METHODS`). Parameters are passed by name, and IDs
+may be shortened to any unique prefix, as on the command line. The results of
+the `dump` methods are the same as the JSON printed by the matching CLI
+commands.
+
+The server is an asyncio event loop handling the HTTP connections. The
+methods themselves run in a worker thread, one request at a time: they share
+the database engine and the ICCS cache, which is kept warm across requests.
+
+This module only imports the standard library at module level, so that the
+CLI can list the `api` command without importing the core.
+"""
+
+import asyncio
+import inspect
+import json
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlmodel import Session
+
+    from aimbat.models import AimbatTypes
+
+__all__ = ["HOST", "METHODS", "dispatch", "serve"]
+
+HOST = "127.0.0.1"
+"""The API only listens on the loopback interface: it has no authentication."""
+
+METHODS: dict[str, Callable[..., Any]] = {}
+"""API methods by name. Each takes a database session followed by the named
+parameters of the request."""
+
+# JSON-RPC error codes.
+_PARSE_ERROR = -32700
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INVALID_PARAMS = -32602
+_SERVER_ERROR = -32000
+
+_MAX_BODY = 16 * 1024 * 1024
+
+
+def _method[F: Callable[..., Any]](name: str) -> Callable[[F], F]:
+    """Register a function as API method `name`."""
+
+    def register(func: F) -> F:
+        METHODS[name] = func
+        return func
+
+    return register
+
+
+def _to_uuid(
+    session: "Session", value: str | None, aimbat_class: "type[AimbatTypes]"
+) -> Any:
+    """Resolve a full ID or unique prefix, passing `None` through."""
+    from aimbat.utils import string_to_uuid
+
+    return None if value is None else string_to_uuid(session, value, aimbat_class)
+
+
+def _event(session: "Session", event_id: str) -> Any:
+    from aimbat.core import resolve_event
+    from aimbat.models import AimbatEvent
+
+    return resolve_event(session, _to_uuid(session, event_id, AimbatEvent))
+
+
+# ---------------------------------------------------------------------------
+# Tables
+# ---------------------------------------------------------------------------
+
+
+@_method("data.dump")
+def _data_dump(
+    session: "Session", event_id: str | None = None, by_alias: bool = False
+) -> list[dict[str, Any]]:
+    from aimbat.core import dump_data_table
+    from aimbat.models import AimbatEvent
+
+    return dump_data_table(
+        session, event_id=_to_uuid(session, event_id, AimbatEvent), by_alias=by_alias
+    )
+
+
+@_method("event.dump")
+def _event_dump(session: "Session", by_alias: bool = False) -> list[dict[str, Any]]:
+    from aimbat.core import dump_event_table
+
+    return json.loads(dump_event_table(session, by_alias=by_alias))
+
+
+@_method("event.parameter.dump")
+def _event_parameter_dump(
+    session: "Session", event_id: str | None = None, by_alias: bool = False
+) -> list[dict[str, Any]]:
+    from aimbat.core import dump_event_parameter_table
+    from aimbat.models import AimbatEvent
+
+    return dump_event_parameter_table(
+        session, by_alias=by_alias, event_id=_to_uuid(session, event_id, AimbatEvent)
+    )
+
+
+@_method("event.quality.dump")
+def _event_quality_dump(
+    session: "Session", event_id: str | None = None, by_alias: bool = False
+) -> list[dict[str, Any]]:
+    from aimbat.core import dump_event_quality_table
+    from aimbat.models import AimbatEvent
+
+    return dump_event_quality_table(
+        session, by_alias=by_alias, event_id=_to_uuid(session, event_id, AimbatEvent)
+    )
+
+
+@_method("seismogram.dump")
+def _seismogram_dump(
+    session: "Session", event_id: str | None = None, by_alias: bool = False
+) -> list[dict[str, Any]]:
+    from aimbat.core import dump_seismogram_table
+    from aimbat.models import AimbatEvent
+
+    return dump_seismogram_table(
+        session, by_alias=by_alias, event_id=_to_uuid(session, event_id, AimbatEvent)
+    )
+
+
+@_method("seismogram.parameter.dump")
+def _seismogram_parameter_dump(
+    session: "Session", event_id: str | None = None, by_alias: bool = False
+) -> list[dict[str, Any]]:
+    from aimbat.core import dump_seismogram_parameter_table
+    from aimbat.models import AimbatEvent
+
+    return dump_seismogram_parameter_table(
+        session, by_alias=by_alias, event_id=_to_uuid(session, event_id, AimbatEvent)
+    )
+
+
+@_method("station.dump")
+def _station_dump(
+    session: "Session", event_id: str | None = None, by_alias: bool = False
+) -> list[dict[str, Any]]:
+    from aimbat.core import dump_station_table
+    from aimbat.models import AimbatEvent
+
+    return dump_station_table(
+        session, by_alias=by_alias, event_id=_to_uuid(session, event_id, AimbatEvent)
+    )
+
+
+@_method("snapshot.dump")
+def _snapshot_dump(
+    session: "Session", event_id: str | None = None, by_alias: bool = False
+) -> list[dict[str, Any]]:
+    from aimbat.core import dump_snapshot_table
+    from aimbat.models import AimbatEvent
+
+    return dump_snapshot_table(
+        session, event_id=_to_uuid(session, event_id, AimbatEvent), by_alias=by_alias
+    )
+
+
+# ---------------------------------------------------------------------------
+# Parameters
+# ---------------------------------------------------------------------------
+
+
+@_method("event.parameter.set")
+def _event_parameter_set(
+    session: "Session", event_id: str, name: str, value: bool | float | int | str
+) -> None:
+    from aimbat._types import EventParameter
+    from aimbat.core import set_event_parameter
+
+    event = _event(session, event_id)
+    set_event_parameter(
+        session, event.id, EventParameter(name), value, validate_iccs=True
+    )
+
+
+@_method("seismogram.parameter.set")
+def _seismogram_parameter_set(
+    session: "Session", seismogram_id: str, name: str, value: bool | str
+) -> None:
+    from aimbat._types import SeismogramParameter
+    from aimbat.core import set_seismogram_parameter
+    from aimbat.models import AimbatSeismogram
+
+    set_seismogram_parameter(
+        session,
+        _to_uuid(session, seismogram_id, AimbatSeismogram),
+        SeismogramParameter(name),
+        value,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Alignment
+# ---------------------------------------------------------------------------
+
+
+@_method("align.iccs")
+def _align_iccs(
+    session: "Session", event_id: str, autoflip: bool = False, autoselect: bool = False
+) -> dict[str, Any]:
+    from aimbat.core import create_iccs_instance, run_iccs
+
+    event = _event(session, event_id)
+    iccs = create_iccs_instance(session, event).iccs
+    result = run_iccs(session, event, iccs, autoflip, autoselect)
+    return {"converged": result.converged, "iterations": len(result.convergence)}
+
+
+@_method("align.mccc")
+def _align_mccc(
+    session: "Session", event_id: str, all_seismograms: bool = False
+) -> dict[str, Any]:
+    from aimbat.core import create_iccs_instance, run_mccc
+
+    event = _event(session, event_id)
+    iccs = create_iccs_instance(session, event).iccs
+    result = run_mccc(session, event, iccs, all_seismograms)
+    rmse = result.rmse
+    return {"rmse": None if rmse is None else rmse.total_seconds()}
+
+
+# ---------------------------------------------------------------------------
+# Snapshots and results
+# ---------------------------------------------------------------------------
+
+
+@_method("snapshot.create")
+def _snapshot_create(
+    session: "Session", event_id: str, comment: str | None = None
+) -> None:
+    from aimbat.core import create_snapshot
+
+    create_snapshot(session, _event(session, event_id), comment)
+
+
+@_method("snapshot.rollback")
+def _snapshot_rollback(session: "Session", snapshot_id: str) -> None:
+    from aimbat.core import rollback_to_snapshot
+    from aimbat.models import AimbatSnapshot
+
+    rollback_to_snapshot(session, _to_uuid(session, snapshot_id, AimbatSnapshot))
+
+
+@_method("snapshot.results")
+def _snapshot_results(
+    session: "Session", snapshot_id: str, by_alias: bool = False
+) -> Any:
+    from aimbat.core import dump_snapshot_results
+    from aimbat.models import AimbatSnapshot
+
+    return dump_snapshot_results(
+        session, _to_uuid(session, snapshot_id, AimbatSnapshot), by_alias=by_alias
+    )
+
+
+def _project_dir(session: "Session") -> "Path":
+    """Directory of the project file, or the working directory without one."""
+    from pathlib import Path
+
+    url = session.get_bind().url
+    database = url.database if url.get_backend_name() == "sqlite" else None
+    if not database or database == ":memory:" or database.startswith("file:"):
+        return Path.cwd().resolve()
+    return Path(database).resolve().parent
+
+
+@_method("snapshot.export")
+def _snapshot_export(
+    session: "Session",
+    path: str,
+    format: str = "parquet",
+    snapshot_ids: list[str] | None = None,
+) -> dict[str, int]:
+    from aimbat.core import export_results_table
+    from aimbat.models import AimbatSnapshot
+
+    if format not in ("parquet", "feather", "csv"):
+        raise ValueError(f"Unknown results format {format!r}.")
+    # Whoever can reach the port must not be able to overwrite arbitrary
+    # files of the user.
+    project_dir = _project_dir(session)
+    output = (project_dir / path).resolve()
+    if not output.is_relative_to(project_dir):
+        raise ValueError(
+            f"Export path must be inside the project directory {project_dir}."
+        )
+    ids = (
+        None
+        if snapshot_ids is None
+        else [_to_uuid(session, s, AimbatSnapshot) for s in snapshot_ids]
+    )
+    rows = export_results_table(session, output, format, snapshot_ids=ids)  # type: ignore[arg-type]
+    return {"rows": rows}
+
+
+# ---------------------------------------------------------------------------
+# JSON-RPC
+# ---------------------------------------------------------------------------
+
+
+def _error(request_id: Any, code: int, message: str, data: Any = None) -> dict:
+    error: dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+
+def _call(request: Any) -> dict | None:
+    """Run a single JSON-RPC request.
+
+    Returns:
+        The response, or `None` for a notification (a request without `id`).
+    """
+    from sqlmodel import Session
+
+    from aimbat.db import engine
+    from aimbat.logger import logger
+
+    if (
+        not isinstance(request, dict)
+        or request.get("jsonrpc") != "2.0"
+        or not isinstance(request.get("method"), str)
+    ):
+        request_id = request.get("id") if isinstance(request, dict) else None
+        return _error(request_id, _INVALID_REQUEST, "Invalid Request")
+
+    request_id = request.get("id")
+    method = METHODS.get(request["method"])
+    if method is None:
+        return _error(request_id, _METHOD_NOT_FOUND, "Method not found")
+
+    params = request.get("params", {})
+    if not isinstance(params, dict):
+        return _error(request_id, _INVALID_PARAMS, "Parameters must be passed by name")
+    try:
+        inspect.signature(method).bind(None, **params)
+    except TypeError as e:
+        return _error(request_id, _INVALID_PARAMS, str(e))
+
+    logger.debug(f"API call {request['method']} with {params=}.")
+    try:
+        with Session(engine) as session:
+            result = method(session, **params)
+    except Exception as e:
+        logger.opt(exception=e).debug(f"API call {request['method']} failed.")
+        return _error(request_id, _SERVER_ERROR, str(e), {"type": type(e).__name__})
+
+    if "id" not in request:
+        return None
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def dispatch(payload: bytes) -> bytes | None:
+    """Handle a JSON-RPC request or batch of requests.
+
+    Errors raised by a method are returned as JSON-RPC errors with the
+    exception message and type, they are never raised.
+
+    Args:
+        payload: The encoded request.
+
+    Returns:
+        The encoded response, or `None` if there is nothing to respond
+            (only notifications were sent).
+    """
+    try:
+        request = json.loads(payload)
+    except ValueError:
+        return json.dumps(_error(None, _PARSE_ERROR, "Parse error")).encode()
+
+    if isinstance(request, list) and request:
+        responses = [r for r in map(_call, request) if r is not None]
+        return json.dumps(responses).encode() if responses else None
+    if isinstance(request, list):
+        response = _error(None, _INVALID_REQUEST, "Invalid Request")
+    else:
+        response = _call(request)
+    return None if response is None else json.dumps(response).encode()
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+
+def _http_response(
+    status: HTTPStatus,
+    body: bytes = b"",
+    *,
+    keep_alive: bool,
+    headers: dict[str, str] | None = None,
+) -> bytes:
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    if body:
+        lines.append("Content-Type: application/json")
+    lines.append(f"Content-Length: {len(body)}")
+    lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    return "\r\n".join(lines).encode("latin-1") + b"\r\n\r\n" + body
+
+
+def _content_length(value: str | None) -> int | None:
+    """Parse a Content-Length header, `None` if it is malformed."""
+    if value is None:
+        return 0
+    if not (value.isascii() and value.isdigit()):
+        return None
+    return int(value)
+
+
+async def _handle_connection(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    executor: Executor,
+    connections: set[asyncio.StreamWriter],
+    hosts: set[str],
+) -> None:
+    """Answer the HTTP requests on a (possibly kept alive) connection.
+
+    Requests are only answered if their `Host` header is one of `hosts`.
+    """
+    loop = asyncio.get_running_loop()
+    connections.add(writer)
+    try:
+        while request_line := await reader.readline():
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                writer.write(_http_response(HTTPStatus.BAD_REQUEST, keep_alive=False))
+                break
+
+            headers: dict[str, str] = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            length = _content_length(headers.get("content-length"))
+            keep_alive = (
+                version == "HTTP/1.1"
+                and headers.get("connection", "").lower() != "close"
+            )
+
+            if length is None:
+                writer.write(_http_response(HTTPStatus.BAD_REQUEST, keep_alive=False))
+                break
+            if length > _MAX_BODY:
+                writer.write(
+                    _http_response(
+                        HTTPStatus.REQUEST_ENTITY_TOO_LARGE, keep_alive=False
+                    )
+                )
+                break
+            body = await reader.readexactly(length)
+
+            if headers.get("host", "").lower() not in hosts:
+                # A web page can point a name it controls at 127.0.0.1 (DNS
+                # rebinding) and reach the API as same-origin; its requests
+                # still carry that name as Host.
+                response = _http_response(HTTPStatus.FORBIDDEN, keep_alive=keep_alive)
+            elif target.split("?")[0] != "/":
+                response = _http_response(HTTPStatus.NOT_FOUND, keep_alive=keep_alive)
+            elif method != "POST":
+                response = _http_response(
+                    HTTPStatus.METHOD_NOT_ALLOWED,
+                    keep_alive=keep_alive,
+                    headers={"Allow": "POST"},
+                )
+            elif headers.get("content-type", "").split(";")[0] != "application/json":
+                # Also keeps web pages from calling the API: a cross-origin
+                # request with this content type needs a CORS preflight, which
+                # the server never grants.
+                response = _http_response(
+                    HTTPStatus.UNSUPPORTED_MEDIA_TYPE, keep_alive=keep_alive
+                )
+            else:
+                result = await loop.run_in_executor(executor, dispatch, body)
+                response = _http_response(
+                    HTTPStatus.OK if result is not None else HTTPStatus.NO_CONTENT,
+                    result or b"",
+                    keep_alive=keep_alive,
+                )
+            writer.write(response)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        connections.discard(writer)
+        writer.close()
+
+
+async def serve(
+    port: int, *, ready: Callable[[asyncio.Server], None] | None = None
+) -> None:
+    """Serve the API on localhost until cancelled.
+
+    Args:
+        port: Port to listen on, `0` to pick a free one.
+        ready: Called with the server once it is listening.
+    """
+    import aimbat.core  # noqa: F401
+
+    connections: set[asyncio.StreamWriter] = set()
+    hosts: set[str] = set()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="aimbat-api") as executor:
+        server = await asyncio.start_server(
+            partial(
+                _handle_connection,
+                executor=executor,
+                connections=connections,
+                hosts=hosts,
+            ),
+            HOST,
+            port,
+        )
+        # Filled before the loop gets to run any connection handler.
+        bound_port = server.sockets[0].getsockname()[1]
+        hosts.update({f"{HOST}:{bound_port}", f"localhost:{bound_port}"})
+        try:
+            if ready is not None:
+                ready(server)
+            await asyncio.Future()
+        finally:
+            server.close()
+            # Idle keep-alive connections would otherwise keep the server
+            # from shutting down.
+            for writer in list(connections):
+                writer.close()
+            await server.wait_closed()
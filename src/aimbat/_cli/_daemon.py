@@ -0,0 +1,312 @@
+"""Resident AIMBAT daemon and the client forwarding CLI commands to it.
+
+`aimbat serve` runs the CLI in a long-lived process listening on a Unix domain
+socket. Its database engine, ICCS cache and waveform cache stay warm between
+commands. With `AIMBAT_DAEMON=true`, the `aimbat` entry point sends its
+arguments to the daemon and streams back the output and exit code instead of
+running the command itself. Without a matching daemon it runs the command
+in-process as usual.
+
+The protocol is one JSON object per line. The client sends a single request:
+
+    {"argv": [...], "cwd": "...", "settings": {...}, "env": {...},
+     "isatty": true, "columns": 120}
+
+The daemon answers with `{"rejected": "<reason>"}` if it cannot run the
+command (the client then runs it in-process), or with any number of
+`{"stdout": "..."}` and `{"stderr": "..."}` messages followed by
+`{"exit": <code>}`.
+
+Commands are run one at a time: they share the process-wide caches, working
+directory and standard streams.
+
+Apart from `aimbat.settings`, which importing the `aimbat` package loads
+anyway, this module only imports the standard library at module level, so
+that the client adds nothing to the startup time of the CLI.
+"""
+
+import io
+import json
+import os
+import shutil
+import socket
+import socketserver
+import sys
+import traceback
+from collections.abc import Sequence
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, TextIO, cast
+
+from aimbat import settings
+
+__all__ = ["LOCAL_COMMANDS", "create_server", "forward", "is_forwardable"]
+
+LOCAL_COMMANDS = frozenset({"api", "serve", "shell", "tui", "tool", "plot"})
+"""Commands that are always run in-process: they are interactive, open
+windows or run a server, which only makes sense in the user's own process."""
+
+# Environment variables that change the behaviour of a command and are
+# therefore passed on to the daemon.
+_FORWARDED_ENV = ("DEFAULT_EVENT_ID", "COLUMNS")
+
+# Settings that may differ between the client and the daemon.
+_CLIENT_ONLY_SETTINGS = frozenset({"api_port", "daemon"})
+
+
+def _absolute_db_url(db_url: str) -> str:
+    """Resolve the path of a file-backed SQLite URL against the working directory.
+
+    The same relative URL (such as the default `sqlite+pysqlite:///aimbat.db`)
+    names a different project in every directory, so the client and the
+    daemon compare the resolved URLs instead.
+    """
+    scheme, sep, rest = db_url.partition(":///")
+    if not sep or not scheme.startswith("sqlite"):
+        return db_url
+    path, query_sep, query = rest.partition("?")
+    if path in ("", ":memory:") or path.startswith("file:") or os.path.isabs(path):
+        return db_url
+    return f"{scheme}:///{os.path.abspath(path)}{query_sep}{query}"
+
+
+def _settings_fingerprint() -> dict[str, Any]:
+    """JSON-compatible settings the daemon and client must agree on."""
+    fingerprint = json.loads(
+        settings.model_dump_json(exclude=set(_CLIENT_ONLY_SETTINGS))
+    )
+    fingerprint["db_url"] = _absolute_db_url(settings.db_url)
+    return fingerprint
+
+
+def _settings_values() -> dict[str, Any]:
+    """Current values of all settings (unlike `model_dump`, not serialised)."""
+    return {name: getattr(settings, name) for name in type(settings).model_fields}
+
+
+def is_forwardable(argv: Sequence[str]) -> bool:
+    """Check whether a command can be run by the daemon.
+
+    Args:
+        argv: Command line arguments without the program name.
+
+    Returns:
+        `False` for interactive commands (see `LOCAL_COMMANDS`), for
+            commands opening an editor and for batches read from standard
+            input (which is not forwarded), `True` otherwise.
+    """
+    if not argv or argv[0] in LOCAL_COMMANDS:
+        return False
+    if argv[0] == "batch" and "-" in argv:
+        return False
+    return "edit" not in argv
+
+
+def forward(
+    argv: Sequence[str],
+    socket_path: Path | None = None,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int | None:
+    """Run a command in the daemon and copy its output to the local streams.
+
+    Args:
+        argv: Command line arguments without the program name.
+        socket_path: Socket of the daemon. Defaults to `Settings.daemon_socket`.
+        stdout: Stream for the standard output of the command.
+        stderr: Stream for the standard error of the command.
+
+    Returns:
+        Exit code of the command, or `None` if the command was not run because
+            no daemon is listening, the daemon uses different settings, or
+            the command has to run in-process.
+    """
+    if not is_forwardable(argv) or not hasattr(socket, "AF_UNIX"):
+        return None
+    socket_path = socket_path or settings.daemon_socket
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    request = {
+        "argv": list(argv),
+        "cwd": os.getcwd(),
+        "settings": _settings_fingerprint(),
+        "env": {k: os.environ[k] for k in _FORWARDED_ENV if k in os.environ},
+        "isatty": stdout.isatty(),
+        "columns": shutil.get_terminal_size().columns,
+    }
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock, sock.makefile("rb") as responses:
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        for line in responses:
+            message = json.loads(line)
+            if "rejected" in message:
+                return None
+            if "exit" in message:
+                return message["exit"]
+            for name, stream in (("stdout", stdout), ("stderr", stderr)):
+                if name in message:
+                    stream.write(message[name])
+                    stream.flush()
+
+    # The daemon went away while the command was running. Running the command
+    # again in-process could apply it twice, so report the failure instead.
+    stderr.write("AIMBAT daemon closed the connection before the command finished.\n")
+    return 1
+
+
+class _ClientStream(io.TextIOBase):
+    """Text stream sending everything written to it to the client."""
+
+    def __init__(self, wfile: io.BufferedIOBase, name: str, isatty: bool) -> None:
+        self._wfile = wfile
+        self._name = name
+        self._isatty = isatty
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if s:
+            _send(self._wfile, {self._name: s})
+        return len(s)
+
+
+def _send(wfile: io.BufferedIOBase, message: dict[str, Any]) -> None:
+    try:
+        wfile.write(json.dumps(message).encode() + b"\n")
+        wfile.flush()
+    except (BrokenPipeError, ConnectionResetError):
+        # The client is gone; finish the command regardless.
+        pass
+
+
+def _run_command(request: dict[str, Any], stdout: TextIO, stderr: TextIO) -> int:
+    """Run a forwarded command with the client's directory and environment.
+
+    Settings changed by the command (e.g. by `--debug`) and the working
+    directory and environment are restored afterwards.
+    """
+    from aimbat.app import app
+    from aimbat.logger import configure_logging
+
+    saved_settings = _settings_values()
+    saved_cwd = os.getcwd()
+    saved_env = {k: os.environ.get(k) for k in _FORWARDED_ENV}
+
+    os.environ.update(request["env"])
+    for name in _FORWARDED_ENV:
+        if name not in request["env"]:
+            os.environ.pop(name, None)
+    os.environ.setdefault("COLUMNS", str(request["columns"]))
+
+    try:
+        os.chdir(request["cwd"])
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                app(request["argv"])
+            except SystemExit as e:
+                if isinstance(e.code, int) or e.code is None:
+                    return e.code or 0
+                print(e.code, file=stderr)
+                return 1
+            except Exception:
+                traceback.print_exc()
+                return 1
+        return 0
+    finally:
+        os.chdir(saved_cwd)
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        if _settings_values() != saved_settings:
+            for name, value in saved_settings.items():
+                setattr(settings, name, value)
+            configure_logging()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "_DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        request = json.loads(line)
+
+        if not is_forwardable(request["argv"]):
+            _send(self.wfile, {"rejected": "command must run in-process"})
+            return
+        if request["settings"] != self.server.fingerprint:
+            _send(self.wfile, {"rejected": "settings differ from the daemon's"})
+            return
+
+        stdout = _ClientStream(self.wfile, "stdout", request["isatty"])
+        stderr = _ClientStream(self.wfile, "stderr", request["isatty"])
+        code = _run_command(request, cast(TextIO, stdout), cast(TextIO, stderr))
+        _send(self.wfile, {"exit": code})
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path) -> None:
+        self.fingerprint = _settings_fingerprint()
+        super().__init__(str(socket_path), _RequestHandler)
+
+
+def _warm_up() -> None:
+    """Import everything a command may need, so the first one is fast too."""
+    import aimbat.core  # noqa: F401
+    import aimbat.db  # noqa: F401
+    from aimbat.app import app
+
+    for name in app:
+        if not name.startswith("-") and name not in LOCAL_COMMANDS:
+            app[name]
+
+
+def create_server(socket_path: Path) -> socketserver.UnixStreamServer:
+    """Create the daemon server listening on a Unix domain socket.
+
+    A stale socket file left behind by a daemon that did not shut down
+    cleanly is replaced.
+
+    Args:
+        socket_path: Path of the socket.
+
+    Returns:
+        The server; run it with `serve_forever()`.
+
+    Raises:
+        RuntimeError: If Unix domain sockets are not supported, or another
+            daemon is already listening on `socket_path`.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("The AIMBAT daemon requires Unix domain sockets.")
+
+    if socket_path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+        else:
+            raise RuntimeError(
+                f"An AIMBAT daemon is already listening on {socket_path}."
+            )
+        finally:
+            probe.close()
+
+    _warm_up()
+    return _DaemonServer(socket_path)
@@ -0,0 +1,67 @@
+"""
+Serve a local JSON-RPC API for dashboards and pipelines.
+
+Starts an HTTP server on `127.0.0.1` (port `AIMBAT_API_PORT`, default 8765)
+accepting [JSON-RPC 2.0](https://www.jsonrpc.org/specification) requests:
+
+```bash
+aimbat api &
+curl -s localhost:8765 -H 'Content-Type: application/json' \\
+  -d '{"jsonrpc": "2.0", "id": 1, "method": "event.dump"}'
+```
+
+Available methods: `data.dump`, `event.dump`, `event.parameter.dump`,
+`event.parameter.set`, `event.quality.dump`, `seismogram.dump`,
+`seismogram.parameter.dump`, `seismogram.parameter.set`, `station.dump`,
+`snapshot.dump`, `snapshot.create`, `snapshot.rollback`, `snapshot.results`,
+`snapshot.export`, `align.iccs` and `align.mccc`. They mirror the CLI
+commands with the same names; see the usage documentation for their
+parameters.
+
+The server has no authentication and only listens on localhost; it only
+answers requests addressed to `127.0.0.1` or `localhost`, and
+`snapshot.export` only writes inside the project directory. Requests are
+processed one at a time, sharing the warm ICCS cache.
+"""
+
+from typing import Annotated
+
+from cyclopts import App, Parameter
+
+from .common import DebugParameter, handle_issues
+
+app = App(name="api", help=__doc__, help_format="markdown")
+
+
+@app.default
+@handle_issues(profile=False)
+def cli_api(
+    *,
+    port: Annotated[
+        int | None,
+        Parameter(help="Port to listen on (default: `AIMBAT_API_PORT`)."),
+    ] = None,
+    _: DebugParameter = DebugParameter(),
+) -> None:
+    """Run the API server until interrupted with Ctrl+C."""
+    import asyncio
+
+    from rich.console import Console
+
+    from aimbat import settings
+
+    from ._api import serve
+
+    console = Console()
+
+    def ready(server: asyncio.Server) -> None:
+        host, bound_port = server.sockets[0].getsockname()[:2]
+        console.print(
+            f"[bold]AIMBAT API[/bold] listening on http://{host}:{bound_port}"
+            " (Ctrl+C to stop)"
+        )
+
+    try:
+        asyncio.run(serve(settings.api_port if port is None else port, ready=ready))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,255 @@
+"""
+Run a file of AIMBAT commands in one process.
+
+Each line of the file is one command, written as it would be typed in the
+shell (a leading `aimbat` is optional). Blank lines and lines starting with
+`#` are ignored:
+
+```bash
+# nightly.aimbat
+event parameter set --event-id 6a4a min_cc 0.6
+align iccs --event-id 6a4a --autoflip
+snapshot create --event-id 6a4a "nightly"
+```
+
+```bash
+aimbat batch nightly.aimbat
+```
+
+All commands share one process, so AIMBAT is imported, the project opened
+and waveforms read only once. The whole file is checked before the first
+command runs: a syntax error or an interactive command (`shell`, `tui`,
+`tool`, `plot`, note editing) aborts the batch without changing anything.
+
+By default the batch stops at the first failing command. With
+`--continue-on-error` the remaining commands are still run, and the exit
+code reports whether any of them failed.
+
+With `--transaction` all commands run in a single database transaction,
+which is only committed once the batch is done. If a command fails, the
+batch is rolled back as a whole. Combined with `--continue-on-error`, only
+the changes of the failed commands are discarded. Commands managing the
+project itself (`project`, `db`), bulk imports (`data add --bulk`) and
+vacuuming (`snapshot prune --vacuum`) are not allowed in a transaction.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+from cyclopts import App, Parameter
+
+from .common import DebugParameter, handle_issues
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy import Connection
+
+app = App(name="batch", help=__doc__, help_format="markdown")
+
+_TRANSACTION_UNSAFE_COMMANDS = frozenset({"project", "db"})
+"""Commands that need the engine itself rather than a connection."""
+
+_TRANSACTION_UNSAFE_OPTIONS: dict[tuple[str, ...], tuple[str, bool, frozenset[str]]] = {
+    ("data", "add"): ("--bulk", False, frozenset({"false"})),
+    ("snapshot", "prune"): ("--vacuum", True, frozenset({"none"})),
+}
+"""Options that make a command open its own connection on the engine (or
+run outside any transaction), by command. Each entry holds the option name,
+whether it takes a separate value, and the values that are safe."""
+
+
+def _transaction_conflict(tokens: list[str]) -> str | None:
+    """The part of a command that cannot run in a transaction, if any."""
+    if tokens[0] in _TRANSACTION_UNSAFE_COMMANDS:
+        return tokens[0]
+    entry = _TRANSACTION_UNSAFE_OPTIONS.get(tuple(tokens[:2]))
+    if entry is None:
+        return None
+    option, takes_value, safe_values = entry
+    for index, token in enumerate(tokens):
+        name, has_value, value = token.partition("=")
+        if name != option:
+            continue
+        if not has_value and takes_value:
+            value = tokens[index + 1] if index + 1 < len(tokens) else ""
+        if value.lower() not in safe_values:
+            return f"{' '.join(tokens[:2])} {option}"
+    return None
+
+
+def _read_commands(file: Path, *, transaction: bool) -> list[tuple[int, list[str]]]:
+    """Read and check the commands in a batch file.
+
+    Args:
+        file: Batch file, or `-` to read from standard input.
+        transaction: Whether the commands will run in a single transaction.
+
+    Returns:
+        Line number and arguments of each command.
+
+    Raises:
+        ValueError: If a line cannot be parsed or holds a command that cannot
+            be run in a batch.
+    """
+    import shlex
+    import sys
+
+    from ._daemon import is_forwardable
+
+    text = sys.stdin.read() if str(file) == "-" else file.read_text()
+
+    commands: list[tuple[int, list[str]]] = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        try:
+            tokens = shlex.split(line, comments=True)
+        except ValueError as e:
+            raise ValueError(f"{file}, line {number}: {e}.") from e
+        if tokens[:1] == ["aimbat"]:
+            tokens = tokens[1:]
+        if not tokens:
+            continue
+        if tokens[0] == "batch" or not is_forwardable(tokens):
+            raise ValueError(
+                f"{file}, line {number}: `{tokens[0]}` is interactive and "
+                "cannot be run in a batch."
+            )
+        if transaction and (conflict := _transaction_conflict(tokens)):
+            raise ValueError(
+                f"{file}, line {number}: `{conflict}` cannot be run in a transaction."
+            )
+        commands.append((number, tokens))
+    return commands
+
+
+def _run_command(tokens: list[str]) -> bool:
+    """Run a single command, reporting but not raising errors.
+
+    Returns:
+        Whether the command succeeded.
+    """
+    from cyclopts import CycloptsError
+
+    from aimbat.app import app as aimbat_app
+
+    from .common import print_error_panel
+
+    try:
+        aimbat_app(tokens, exit_on_error=False)
+    except SystemExit as e:
+        return not e.code
+    except CycloptsError:
+        # Already printed by cyclopts.
+        return False
+    except Exception as e:
+        print_error_panel(e)
+        return False
+    return True
+
+
+@contextmanager
+def _shared_connection() -> "Iterator[Connection]":
+    """Route all sessions through one connection for the duration of a batch.
+
+    Commands open their sessions on `aimbat.db.engine`. Replacing it with a
+    connection in an open transaction makes those sessions join that
+    transaction instead of committing their own.
+
+    Yields:
+        The connection; the caller commits or rolls back its transaction.
+    """
+    import aimbat.db
+
+    engine = aimbat.db.engine
+    with engine.connect() as connection:
+        aimbat.db.engine = connection  # type: ignore[assignment]
+        try:
+            yield connection
+        finally:
+            aimbat.db.engine = engine
+
+
+@app.default
+@handle_issues(profile=False)
+def cli_batch(
+    file: Annotated[
+        Path,
+        Parameter(help="File with one command per line (`-` for standard input)."),
+    ],
+    *,
+    continue_on_error: Annotated[
+        bool, Parameter(help="Keep running the remaining commands after a failure.")
+    ] = False,
+    transaction: Annotated[
+        bool,
+        Parameter(help="Run all commands in a single database transaction."),
+    ] = False,
+    timing: Annotated[
+        bool, Parameter(help="Print the run time of each command.")
+    ] = True,
+    _: DebugParameter = DebugParameter(),
+) -> None:
+    """Run the commands in a batch file."""
+    import shlex
+    import sys
+    import time
+    from contextlib import nullcontext
+
+    from rich.console import Console
+    from rich.text import Text
+
+    from aimbat.core import clear_iccs_cache
+
+    console = Console(stderr=True)
+    commands = _read_commands(file, transaction=transaction)
+
+    ran = 0
+    failed: list[int] = []
+    start = time.perf_counter()
+    with _shared_connection() if transaction else nullcontext() as connection:
+        outer = connection.begin() if connection is not None else None
+
+        for number, tokens in commands:
+            savepoint = connection.begin_nested() if connection is not None else None
+            command_start = time.perf_counter()
+            ok = _run_command(tokens)
+            elapsed = time.perf_counter() - command_start
+            ran += 1
+
+            if savepoint is not None and savepoint.is_active:
+                if ok:
+                    savepoint.commit()
+                else:
+                    savepoint.rollback()
+                    # Cached ICCS instances may hold the discarded changes.
+                    clear_iccs_cache()
+            if timing:
+                console.print(
+                    Text.assemble(
+                        (f"line {number:>4}", "dim"),
+                        f"  {elapsed:8.3f} s  ",
+                        ("ok    ", "green") if ok else ("failed", "red"),
+                        f"  {shlex.join(tokens)}",
+                    )
+                )
+            if not ok:
+                failed.append(number)
+                if not continue_on_error:
+                    break
+
+        if outer is not None:
+            if failed and not continue_on_error:
+                outer.rollback()
+                clear_iccs_cache()
+                console.print("[yellow]Transaction rolled back.[/yellow]")
+            else:
+                outer.commit()
+
+    if timing:
+        console.print(
+            f"Ran {ran} of {len(commands)} commands ({len(failed)} failed) "
+            f"in {time.perf_counter() - start:.3f} s."
+        )
+    if failed:
+        sys.exit(1)
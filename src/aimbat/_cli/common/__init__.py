@@ -2,6 +2,7 @@
 _internal_names = set(dir())
 
 from ._decorators import *
+from ._dump import *
 from ._parameters import *
 from ._table import *
 
@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from typing import Any
+from typing import Any, overload
 
 from aimbat import settings
 
@@ -33,7 +33,19 @@ def _print_warning(message: object) -> None:
     Console(stderr=True).print(Text(str(message), style="yellow"))
 
 
-def handle_issues[F: Callable[..., Any]](func: F) -> F:
+@overload
+def handle_issues[F: Callable[..., Any]](func: F, *, profile: bool = True) -> F: ...
+
+
+@overload
+def handle_issues[F: Callable[..., Any]](
+    func: None = None, *, profile: bool = True
+) -> Callable[[F], F]: ...
+
+
+def handle_issues[F: Callable[..., Any]](
+    func: F | None = None, *, profile: bool = True
+) -> F | Callable[[F], F]:
     """Decorator to report exceptions to the console and exit cleanly.
 
     Exceptions are printed (without traceback) in a red panel, then exit the
@@ -63,16 +75,35 @@ def handle_issues[F: Callable[..., Any]](func: F) -> F:
     turns any exception (including the now-promoted `SchemaStaleWarning`)
     into a styled red panel: in that mode the exception instead propagates
     as a plain Python traceback, exactly as any other exception would.
+
+    If profiling is enabled (`--profile` or `AIMBAT_PROFILE_DIR`, see
+    `aimbat.utils.profiling`), the command is run inside a profile named after
+    the decorated function. Interactive sessions that dispatch other commands
+    (the shell and the TUI) pass `profile=False`, so that each of those
+    commands is profiled separately instead.
+
+    Args:
+        func: Command function to wrap.
+        profile: Whether to profile the command when profiling is enabled.
     """
+    if func is None:
+        return lambda f: handle_issues(f, profile=profile)
+
     import sys
     import warnings
+    from contextlib import nullcontext
     from functools import wraps
 
     from aimbat.core._migrations import SchemaStaleWarning
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        with warnings.catch_warnings():
+        from aimbat.utils import profiling
+
+        profile_context = (
+            profiling(func.__name__, all_threads=True) if profile else nullcontext()
+        )
+        with warnings.catch_warnings(), profile_context:
             warnings.filterwarnings("error", category=SchemaStaleWarning)
 
             if settings.log_level in ("TRACE", "DEBUG"):
@@ -0,0 +1,77 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from ._parameters import TableDumpParameters
+
+if TYPE_CHECKING:
+    from sqlmodel import Session, SQLModel
+
+__all__ = ["dump_table"]
+
+
+def dump_table(
+    model: "type[SQLModel]",
+    dump_parameters: TableDumpParameters,
+    dump_json: "Callable[[Session], Any]",
+) -> None:
+    """Dump a table to stdout or a file in the format chosen on the command line.
+
+    The `json` format keeps the existing behaviour of pretty-printing the
+    list built by `dump_json`. The `ndjson` and `csv` formats stream the
+    table with `aimbat.core.export_table` instead.
+
+    Args:
+        model: AIMBAT ORM model (table) to dump.
+        dump_parameters: Shared table dump parameters.
+        dump_json: Function returning the table data for the `json` format,
+            either JSON serialisable data or an already encoded JSON string.
+    """
+    import sys
+
+    from sqlmodel import Session
+
+    from aimbat.core import export_table
+    from aimbat.db import engine
+    from aimbat.logger import Span
+
+    output = dump_parameters.output
+
+    with Session(engine) as session:
+        if dump_parameters.format == "json":
+            with Span("dump.table", table=model.__name__, format="json") as span:
+                data = dump_json(session)
+                if isinstance(data, list):
+                    span.set(rows=len(data))
+        elif output is None:
+            export_table(
+                session,
+                model,
+                sys.stdout,
+                dump_parameters.format,
+                by_alias=dump_parameters.by_alias,
+            )
+            return
+        else:
+            with output.open("w", encoding="utf-8", newline="") as f:
+                export_table(
+                    session,
+                    model,
+                    f,
+                    dump_parameters.format,
+                    by_alias=dump_parameters.by_alias,
+                )
+            return
+
+    if output is None:
+        from rich import print_json
+
+        if isinstance(data, str):
+            print_json(data)
+        else:
+            print_json(data=data)
+    else:
+        import json
+
+        if isinstance(data, str):
+            data = json.loads(data)
+        output.write_text(json.dumps(data, indent=2), encoding="utf-8")
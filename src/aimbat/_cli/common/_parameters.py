@@ -3,6 +3,7 @@
 import sys
 from collections.abc import Callable
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Annotated, Literal, overload
 from uuid import UUID
 
@@ -33,6 +34,7 @@ __all__ = [
     "IccsPlotParameters",
     "TableParameters",
     "JsonDumpParameters",
+    "TableDumpParameters",
 ]
 
 
@@ -279,11 +281,18 @@ def open_in_editor(initial_content: str) -> str:
 
 @dataclass
 class _DebugTrait:
-    """Mixin that adds an optional `--debug` flag to a CLI command."""
+    """Mixin that adds optional debugging and profiling flags to a CLI command."""
 
     debug: bool = False
     """Enable verbose logging for troubleshooting."""
 
+    profile: bool = False
+    """Profile the command and write the results to `aimbat-profiles/` (or
+    `AIMBAT_PROFILE_DIR`)."""
+
+    profile_sql: bool = False
+    """Log the number and timings of the SQL statements executed on exit."""
+
     # NOTE: only one __post_init__ is allowed per dataclass
     def __post_init__(self) -> None:
         if self.debug:
@@ -291,6 +300,12 @@ class _DebugTrait:
             from aimbat.logger import configure_logging
 
             configure_logging()
+        if self.profile and settings.profile_dir is None:
+            settings.profile_dir = Path("aimbat-profiles")
+        if self.profile_sql:
+            from aimbat.db import enable_sql_profiling
+
+            enable_sql_profiling()
 
 
 @dataclass
@@ -320,6 +335,27 @@ class _ByAliasTrait:
     ] = False
 
 
+@dataclass
+class _DumpFormatTrait:
+    """Mixin that adds `--format` and `--output` options to table dump commands."""
+
+    format: Annotated[
+        Literal["json", "ndjson", "csv"],
+        Parameter(
+            name="format",
+            help="Output format. `ndjson` and `csv` are streamed row by row, so"
+            " memory use stays constant and output starts immediately.",
+        ),
+    ] = "json"
+    output: Annotated[
+        Path | None,
+        Parameter(
+            name="output",
+            help="Write the dump to this file instead of printing to stdout.",
+        ),
+    ] = None
+
+
 @Parameter(name="*")
 @dataclass
 class EventDebugParameters(_DebugTrait, _EventContextTrait):
@@ -336,6 +372,15 @@ class JsonDumpParameters(_ByAliasTrait, _DebugTrait):
     pass
 
 
+@Parameter(name="*")
+@dataclass
+class TableDumpParameters(_DumpFormatTrait, _ByAliasTrait, _DebugTrait):
+    """Shared parameters for table dump commands (`--format`, `--output`, `--alias`,
+    `--debug`)."""
+
+    pass
+
+
 @Parameter(name="*")
 @dataclass
 class TableParameters(_TableParametersTrait, _DebugTrait):
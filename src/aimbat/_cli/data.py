@@ -29,13 +29,15 @@ records are reused rather than duplicated.
 seismogram data, so there is no need to run `snapshot create` right after
 ingestion (pass `--no-snapshot` to opt out for a given invocation). Use
 `snapshot create` later for deliberate checkpoints, e.g. before trying an
-experimental parameter change.
+experimental parameter change. With `AIMBAT_SNAPSHOT_AUTO_PRUNE` set, old
+automatic snapshots are pruned afterwards (see `snapshot prune`).
 """
 
 from __future__ import annotations
 
 import uuid
 from collections.abc import Sequence
+from contextlib import nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Literal
 
@@ -46,8 +48,9 @@ from aimbat.io import DataType
 
 from .common import (
     DebugParameter,
-    JsonDumpParameters,
+    TableDumpParameters,
     TableParameters,
+    dump_table,
     event_parameter_is_all,
     event_parameter_with_all,
     handle_issues,
@@ -117,10 +120,15 @@ def _create_snapshots_for_touched_events(
     added_datasources: Sequence[AimbatDataSource],
     existing_seismogram_ids: set[uuid.UUID],
 ) -> None:
-    """Create one snapshot per event that received a newly created seismogram."""
+    """Create one snapshot per event that received a newly created seismogram.
+
+    If `snapshot_auto_prune` is enabled, the snapshots of those events are
+    pruned with the configured retention rules afterwards.
+    """
     from collections import Counter
 
-    from aimbat.core import create_snapshot
+    from aimbat import settings
+    from aimbat.core import SnapshotRetentionPolicy, create_snapshot, prune_snapshots
     from aimbat.logger import logger
     from aimbat.models import AimbatEvent
 
@@ -157,6 +165,19 @@ def _create_snapshots_for_touched_events(
                 f"Could not create an automatic snapshot for event {event_id}: {e}"
             )
 
+    if not settings.snapshot_auto_prune:
+        return
+
+    policy = SnapshotRetentionPolicy.from_settings()
+    for event_id in new_seismogram_counts:
+        try:
+            prune_snapshots(session, policy, event_id=event_id)
+        except Exception as e:
+            # As above, the data itself has been added at this point.
+            session.rollback()
+            logger.warning(f"Failed to prune snapshots for event {event_id}: {e}")
+            _print_warning(f"Could not prune snapshots for event {event_id}: {e}")
+
 
 @app.command(name="add")
 @handle_issues
@@ -203,6 +224,14 @@ def cli_data_add(
             "new seismogram data.",
         ),
     ] = True,
+    bulk: Annotated[
+        bool,
+        Parameter(
+            help="Ingest under the `bulk-import` SQLite profile for faster "
+            "writes. A power loss or OS crash during ingestion can corrupt the "
+            "project file, so back it up first.",
+        ),
+    ] = False,
     _: DebugParameter = DebugParameter(),
 ) -> None:
     """Add or update data sources in the AIMBAT project.
@@ -219,13 +248,19 @@ def cli_data_add(
     Use `--dry-run` to preview what would be added without touching the
     database. Use `--no-snapshot` to skip the automatic post-ingestion
     snapshot for this invocation.
+
+    With `--bulk`, ingestion runs on a connection tuned with the `bulk-import`
+    SQLite profile; otherwise the configured `AIMBAT_SQLITE_PROFILE` is used.
     """
     from rich.progress import Progress
 
     from aimbat.core import add_data_to_project
-    from aimbat.db import engine
+    from aimbat.db import engine, sqlite_profile
 
-    with Session(engine) as session:
+    with (
+        sqlite_profile("bulk-import") if bulk else nullcontext(engine) as bind,
+        Session(bind) as session,
+    ):
         with Progress(disable=not show_progress_bar) as progress:
             task = progress.add_task("Adding data ...", total=len(data_sources))
 
@@ -264,19 +299,20 @@ def cli_data_add(
 @handle_issues
 def cli_data_dump(
     *,
-    dump_parameters: JsonDumpParameters = JsonDumpParameters(),
+    dump_parameters: TableDumpParameters = TableDumpParameters(),
 ) -> None:
-    """Dump AIMBAT datasources table as a JSON string.
+    """Dump AIMBAT datasources table as JSON, NDJSON or CSV.
 
     Output can be piped or redirected for use in external tools or scripts.
     """
-    from rich import print_json
-
     from aimbat.core import dump_data_table
-    from aimbat.db import engine
+    from aimbat.models import AimbatDataSource
 
-    with Session(engine) as session:
-        print_json(data=dump_data_table(session, by_alias=dump_parameters.by_alias))
+    dump_table(
+        AimbatDataSource,
+        dump_parameters,
+        lambda session: dump_data_table(session, by_alias=dump_parameters.by_alias),
+    )
 
 
 @app.command(name="list")
@@ -13,7 +13,9 @@ from .common import (
     DebugParameter,
     EventDebugParameters,
     JsonDumpParameters,
+    TableDumpParameters,
     TableParameters,
+    dump_table,
     event_parameter,
     event_parameter_is_all,
     event_parameter_with_all,
@@ -67,19 +69,20 @@ def cli_event_delete(
 @app.command(name="dump")
 @handle_issues
 def cli_event_dump(
-    *, dump_parameters: JsonDumpParameters = JsonDumpParameters()
+    *, dump_parameters: TableDumpParameters = TableDumpParameters()
 ) -> None:
-    """Dump the contents of the AIMBAT event table to JSON.
+    """Dump the contents of the AIMBAT event table to JSON, NDJSON or CSV.
 
     Output can be piped or redirected for use in external tools or scripts.
     """
-    from rich import print_json
-
     from aimbat.core import dump_event_table
-    from aimbat.db import engine
+    from aimbat.models import AimbatEvent
 
-    with Session(engine) as session:
-        print_json(dump_event_table(session, by_alias=dump_parameters.by_alias))
+    dump_table(
+        AimbatEvent,
+        dump_parameters,
+        lambda session: dump_event_table(session, by_alias=dump_parameters.by_alias),
+    )
 
 
 @app.command(name="list")
@@ -220,19 +223,19 @@ def cli_event_parameter_set(
 @handle_issues
 def cli_event_parameter_dump(
     *,
-    dump_parameters: JsonDumpParameters = JsonDumpParameters(),
+    dump_parameters: TableDumpParameters = TableDumpParameters(),
 ) -> None:
-    """Dump event parameter table to json."""
-    from rich import print_json
-    from sqlmodel import Session
-
+    """Dump event parameter table to JSON, NDJSON or CSV."""
     from aimbat.core import dump_event_parameter_table
-    from aimbat.db import engine
+    from aimbat.models import AimbatEventParameters
 
     by_alias = dump_parameters.by_alias
 
-    with Session(engine) as session:
-        print_json(data=dump_event_parameter_table(session, by_alias=by_alias))
+    dump_table(
+        AimbatEventParameters,
+        dump_parameters,
+        lambda session: dump_event_parameter_table(session, by_alias=by_alias),
+    )
 
 
 @_parameter.command(name="list")
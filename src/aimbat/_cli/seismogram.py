@@ -10,8 +10,9 @@ from aimbat.models import AimbatSeismogram
 
 from .common import (
     DebugParameter,
-    JsonDumpParameters,
+    TableDumpParameters,
     TableParameters,
+    dump_table,
     event_parameter_is_all,
     event_parameter_with_all,
     handle_issues,
@@ -104,22 +105,24 @@ def cli_seismogram_delete(
 @handle_issues
 def cli_seismogram_dump(
     *,
-    dump_parameters: JsonDumpParameters = JsonDumpParameters(),
+    dump_parameters: TableDumpParameters = TableDumpParameters(),
 ) -> None:
-    """Dump the contents of the AIMBAT seismogram table to JSON.
+    """Dump the contents of the AIMBAT seismogram table to JSON, NDJSON or CSV.
 
     Output can be piped or redirected for use in external tools or scripts.
+    Use `--format ndjson` or `--format csv` for large projects: those formats
+    are streamed row by row instead of being built in memory first.
     """
-    from rich import print_json
-    from sqlmodel import Session
-
     from aimbat.core import dump_seismogram_table
-    from aimbat.db import engine
+    from aimbat.models import AimbatSeismogram
 
-    with Session(engine) as session:
-        print_json(
-            data=dump_seismogram_table(session, by_alias=dump_parameters.by_alias)
-        )
+    dump_table(
+        AimbatSeismogram,
+        dump_parameters,
+        lambda session: dump_seismogram_table(
+            session, by_alias=dump_parameters.by_alias
+        ),
+    )
 
 
 @app.command(name="list")
@@ -259,21 +262,19 @@ def cli_seismogram_parameter_reset(
 @handle_issues
 def cli_seismogram_parameter_dump(
     *,
-    dump_parameters: JsonDumpParameters = JsonDumpParameters(),
+    dump_parameters: TableDumpParameters = TableDumpParameters(),
 ) -> None:
-    """Dump seismogram parameter table to json."""
-    from rich import print_json
-    from sqlmodel import Session
-
+    """Dump seismogram parameter table to JSON, NDJSON or CSV."""
     from aimbat.core import dump_seismogram_parameter_table
-    from aimbat.db import engine
+    from aimbat.models import AimbatSeismogramParameters
 
-    with Session(engine) as session:
-        print_json(
-            data=dump_seismogram_parameter_table(
-                session, by_alias=dump_parameters.by_alias
-            )
-        )
+    dump_table(
+        AimbatSeismogramParameters,
+        dump_parameters,
+        lambda session: dump_seismogram_parameter_table(
+            session, by_alias=dump_parameters.by_alias
+        ),
+    )
 
 
 @parameter.command(name="list")
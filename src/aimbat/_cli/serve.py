@@ -0,0 +1,63 @@
+"""
+Run a resident AIMBAT daemon for fast CLI commands.
+
+Every `aimbat` command normally starts a new process, which imports AIMBAT,
+opens the project database and rereads waveforms before doing any work. The
+daemon keeps all of that warm: it listens on a Unix domain socket (default
+`aimbat.sock`, see `AIMBAT_DAEMON_SOCKET`) and runs the commands sent to it
+one at a time.
+
+CLI commands are forwarded to the daemon when `AIMBAT_DAEMON=true` is set:
+
+```bash
+aimbat serve &
+export AIMBAT_DAEMON=true
+aimbat event list      # runs in the daemon
+```
+
+Commands run in-process as usual if no daemon is listening, or if it was
+started with different settings. Interactive commands (`shell`, `tui`,
+`tool`, `plot` and note editing) and batches read from standard input
+always run in-process.
+"""
+
+from pathlib import Path
+from typing import Annotated
+
+from cyclopts import App, Parameter
+
+from .common import DebugParameter, handle_issues
+
+app = App(name="serve", help=__doc__, help_format="markdown")
+
+
+@app.default
+@handle_issues(profile=False)
+def cli_serve(
+    *,
+    socket: Annotated[
+        Path | None,
+        Parameter(help="Socket to listen on (default: `AIMBAT_DAEMON_SOCKET`)."),
+    ] = None,
+    _: DebugParameter = DebugParameter(),
+) -> None:
+    """Run the AIMBAT daemon until interrupted with Ctrl+C."""
+    from rich.console import Console
+
+    from aimbat import settings
+
+    from ._daemon import create_server
+
+    socket_path = socket or settings.daemon_socket
+    console = Console()
+
+    with create_server(socket_path) as server:
+        console.print(
+            f"[bold]AIMBAT daemon[/bold] listening on {socket_path} (Ctrl+C to stop)"
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
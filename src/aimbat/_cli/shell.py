@@ -130,7 +130,7 @@ def _check_iccs(
 
 
 @app.default
-@handle_issues
+@handle_issues(profile=False)
 def cli_shell(
     event_id: Annotated[
         uuid.UUID | None,
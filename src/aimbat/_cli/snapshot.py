@@ -168,6 +168,140 @@ def cli_snapshot_delete(
         delete_snapshot(session, snapshot_id)
 
 
+@app.command(name="prune")
+@handle_issues
+def cli_snapshot_prune(
+    event_id: Annotated[UUID | Literal["all"], event_parameter_with_all()],
+    *,
+    keep_automatic: Annotated[
+        int | None,
+        Parameter(
+            name="keep-automatic",
+            help="Keep only this many of the most recent automatic snapshots per"
+            " event. Defaults to `AIMBAT_SNAPSHOT_KEEP_AUTOMATIC`.",
+        ),
+    ] = None,
+    thin_after: Annotated[
+        str | None,
+        Parameter(
+            name="thin-after",
+            help="Thin out automatic snapshots older than this (e.g. `30d`)."
+            " Defaults to `AIMBAT_SNAPSHOT_THIN_AFTER`.",
+        ),
+    ] = None,
+    thin_interval: Annotated[
+        str | None,
+        Parameter(
+            name="thin-interval",
+            help="Keep one thinned snapshot per interval (e.g. `1d`)."
+            " Defaults to `AIMBAT_SNAPSHOT_THIN_INTERVAL`.",
+        ),
+    ] = None,
+    include_manual: Annotated[
+        bool,
+        Parameter(
+            name="include-manual",
+            help="Apply the rules to manually created snapshots too.",
+        ),
+    ] = False,
+    vacuum: Annotated[
+        Literal["none", "incremental", "full"],
+        Parameter(
+            name="vacuum",
+            help="Release the freed space to the filesystem afterwards.",
+        ),
+    ] = "none",
+    dry_run: Annotated[
+        bool,
+        Parameter(
+            name="dry-run",
+            help="Only report how many snapshots would be deleted.",
+        ),
+    ] = False,
+    show_progress_bar: Annotated[
+        bool,
+        Parameter(name="progress", help="Display a progress bar while deleting."),
+    ] = True,
+    _: DebugParameter = DebugParameter(),
+) -> None:
+    """Delete old snapshots according to retention rules.
+
+    Rules only ever select snapshots for deletion, and manual snapshots are
+    kept unless `--include-manual` is given. Rules not given on the command
+    line fall back to the `AIMBAT_SNAPSHOT_*` settings; without any rule
+    nothing is deleted. Snapshots are deleted in batches, and `--vacuum`
+    returns the freed space to the filesystem (`incremental` is cheaper on
+    large projects; the first run switches the project to incremental
+    auto-vacuum, which requires a full vacuum once).
+    """
+    from pandas import Timedelta
+    from rich.console import Console
+    from rich.progress import Progress
+    from sqlmodel import Session
+
+    from aimbat import settings
+    from aimbat.core import (
+        SnapshotRetentionPolicy,
+        prune_snapshots,
+        resolve_event,
+        select_snapshots_to_prune,
+        vacuum_project,
+    )
+    from aimbat.db import engine
+
+    policy = SnapshotRetentionPolicy(
+        keep_last_automatic=(
+            keep_automatic
+            if keep_automatic is not None
+            else settings.snapshot_keep_automatic
+        ),
+        thin_after=(
+            Timedelta(thin_after)
+            if thin_after is not None
+            else settings.snapshot_thin_after
+        ),
+        thin_interval=(
+            Timedelta(thin_interval)
+            if thin_interval is not None
+            else settings.snapshot_thin_interval
+        ),
+        keep_manual=not include_manual,
+    )
+
+    console = Console()
+    if not policy.has_rules:
+        console.print("No retention rules given or configured, nothing to prune.")
+        return
+
+    with Session(engine) as session:
+        filter_event_id = (
+            None
+            if event_parameter_is_all(event_id)
+            else resolve_event(session, event_id).id
+        )
+
+        if dry_run:
+            n = len(select_snapshots_to_prune(session, policy, filter_event_id))
+            console.print(f"{n} snapshot(s) would be deleted.")
+            return
+
+        with Progress(disable=not show_progress_bar) as progress:
+            task = progress.add_task("Pruning snapshots ...", total=None)
+
+            def on_progress(done: int, total: int) -> None:
+                progress.update(task, completed=done, total=total)
+
+            deleted = prune_snapshots(
+                session, policy, event_id=filter_event_id, on_progress=on_progress
+            )
+
+    console.print(f"{deleted} snapshot(s) deleted.")
+
+    if vacuum != "none":
+        released = vacuum_project(engine, vacuum)
+        console.print(f"{released / 2**20:.1f} MiB released.")
+
+
 @app.command(name="dump")
 @handle_issues
 def cli_snapshot_dump(
@@ -477,5 +611,65 @@ def cli_snapshot_results(
         output.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
 
+@app.command(name="export")
+@handle_issues
+def cli_snapshot_export(
+    output: Annotated[
+        Path,
+        Parameter(name="output", help="File to write the results table to."),
+    ],
+    *,
+    format: Annotated[
+        Literal["parquet", "feather", "csv"] | None,
+        Parameter(
+            name="format",
+            help="Output format. Defaults to the format matching the file"
+            " extension, or Parquet.",
+        ),
+    ] = None,
+    snapshot_ids: Annotated[
+        list[str] | None,
+        Parameter(
+            name="snapshot",
+            help="UUID (or unique prefix) of a snapshot to export. Repeat to"
+            " export several. Defaults to the most recent snapshot of every event.",
+            consume_multiple=1,
+            negative_iterable=(),
+        ),
+    ] = None,
+    _: DebugParameter = DebugParameter(),
+) -> None:
+    """Export the results of all events as a single table.
+
+    Writes one row per seismogram with the frozen pick (T1), ICCS and MCCC
+    quality metrics, and the snapshot, event and station details, for the most
+    recent snapshot of every event (or the snapshots given with `--snapshot`).
+    Parquet and Feather output require `pyarrow` to be installed.
+    """
+    from rich.console import Console
+    from sqlmodel import Session
+
+    from aimbat.core import export_results_table
+    from aimbat.db import engine
+    from aimbat.utils import string_to_uuid
+
+    if format is None:
+        suffixes: dict[str, Literal["parquet", "feather", "csv"]] = {
+            ".feather": "feather",
+            ".csv": "csv",
+        }
+        format = suffixes.get(output.suffix.lower(), "parquet")
+
+    with Session(engine) as session:
+        ids = (
+            None
+            if snapshot_ids is None
+            else [string_to_uuid(session, s, AimbatSnapshot) for s in snapshot_ids]
+        )
+        rows = export_results_table(session, output, format, snapshot_ids=ids)
+
+    Console().print(f"{rows} result(s) written to {output}.")
+
+
 if __name__ == "__main__":
     app()
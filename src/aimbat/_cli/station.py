@@ -10,7 +10,9 @@ from aimbat.models import AimbatStation
 from .common import (
     DebugParameter,
     JsonDumpParameters,
+    TableDumpParameters,
     TableParameters,
+    dump_table,
     event_parameter_is_all,
     event_parameter_with_all,
     handle_issues,
@@ -132,21 +134,20 @@ def cli_station_seismograms_plot(
 @app.command(name="dump")
 @handle_issues
 def cli_station_dump(
-    *, dump_parameters: JsonDumpParameters = JsonDumpParameters()
+    *, dump_parameters: TableDumpParameters = TableDumpParameters()
 ) -> None:
-    """Dump the contents of the AIMBAT station table to JSON.
+    """Dump the contents of the AIMBAT station table to JSON, NDJSON or CSV.
 
     Output can be piped or redirected for use in external tools or scripts.
     """
-
-    from rich import print_json
-    from sqlmodel import Session
-
     from aimbat.core import dump_station_table
-    from aimbat.db import engine
+    from aimbat.models import AimbatStation
 
-    with Session(engine) as session:
-        print_json(data=dump_station_table(session, by_alias=dump_parameters.by_alias))
+    dump_table(
+        AimbatStation,
+        dump_parameters,
+        lambda session: dump_station_table(session, by_alias=dump_parameters.by_alias),
+    )
 
 
 @app.command(name="list")
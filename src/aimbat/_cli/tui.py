@@ -8,7 +8,7 @@ app = App(name="tui", help=__doc__, help_format="markdown")
 
 
 @app.default
-@handle_issues
+@handle_issues(profile=False)
 def cli_tui(*, _: DebugParameter = DebugParameter()) -> None:
     """Launch the AIMBAT terminal user interface."""
     import warnings
@@ -1,3 +1,4 @@
-"""Utilities for AIMBAT."""
+"""Utilities for AIMBAT.
 
-from .app import app as app
+The `utils` sub-app is defined in `app` and loaded lazily by `aimbat.app`.
+"""
@@ -23,6 +23,13 @@ class Settings(BaseSettings):
 
     model_config = SettingsConfigDict(env_prefix="aimbat_", env_file=".env")
 
+    api_port: int = Field(
+        default=8765,
+        ge=0,
+        le=65535,
+        description="Port on localhost the `aimbat api` server listens on.",
+    )
+
     bandpass_apply: bool = Field(
         default=False,
         description="Whether to apply bandpass filter to seismograms.",
@@ -55,6 +62,20 @@ class Settings(BaseSettings):
         description="AIMBAT database url (default value is derived from `project`).",
     )
 
+    daemon: bool = Field(
+        default=False,
+        description=(
+            "Forward CLI commands to an `aimbat serve` daemon listening on "
+            "`daemon_socket`. Commands run in-process if no daemon with the same "
+            "settings is listening."
+        ),
+    )
+
+    daemon_socket: Path = Field(
+        default=Path("aimbat.sock"),
+        description="Unix domain socket of the `aimbat serve` daemon.",
+    )
+
     log_level: Literal[
         "TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"
     ] = Field(
@@ -90,6 +111,15 @@ class Settings(BaseSettings):
         default=2, ge=1, description="Minimum length of ID string."
     )
 
+    profile_dir: Path | None = Field(
+        default=None,
+        description=(
+            "Directory to write profiles of CLI commands and TUI background "
+            "workers to (cProfile `.pstats` and collapsed-stack `.collapsed` "
+            "files). Unset disables profiling."
+        ),
+    )
+
     project: Path = Field(
         default=Path("aimbat.db"),
         description="AIMBAT project file location (ignored if `db_url` is specified).",
@@ -109,6 +139,74 @@ class Settings(BaseSettings):
         description="URL where sample data is downloaded from.",
     )
 
+    snapshot_auto_prune: bool = Field(
+        default=False,
+        description=(
+            "Prune snapshots with the retention rules below whenever `data add` "
+            "creates automatic snapshots."
+        ),
+    )
+
+    snapshot_keep_automatic: int | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Number of most recent automatic snapshots to keep per event when "
+            "pruning (unset keeps them all)."
+        ),
+    )
+
+    snapshot_thin_after: PydanticPositiveTimedelta | None = Field(
+        default=None,
+        description=(
+            "Age after which automatic snapshots are thinned to one per "
+            "`snapshot_thin_interval` when pruning (unset disables thinning)."
+        ),
+    )
+
+    snapshot_thin_interval: PydanticPositiveTimedelta = Field(
+        default=Timedelta(days=1),
+        description="Interval within which only one old automatic snapshot is kept.",
+    )
+
+    sql_profile: bool = Field(
+        default=False,
+        description=(
+            "Record the SQL statements executed by each command and log a summary "
+            "(statement counts, slow statements, suspected N+1 query patterns) "
+            "on exit."
+        ),
+    )
+
+    sql_profile_report: Path | None = Field(
+        default=None,
+        description="JSON file the SQL profile is also written to when enabled.",
+    )
+
+    sql_repeat_threshold: int = Field(
+        default=20,
+        ge=2,
+        description=(
+            "Number of executions of the same SELECT statement from which the SQL "
+            "profile reports it as a suspected N+1 query pattern."
+        ),
+    )
+
+    sql_slow_threshold: PydanticPositiveTimedelta = Field(
+        default=Timedelta(milliseconds=100),
+        description="Duration above which the SQL profile reports a statement as slow.",
+    )
+
+    sqlite_profile: Literal["safe", "fast", "bulk-import"] = Field(
+        default="safe",
+        description=(
+            "SQLite performance profile. `safe` keeps SQLite's durable defaults, "
+            "`fast` relaxes fsyncs and enlarges the page cache and memory map for "
+            "interactive work, and `bulk-import` trades crash safety for write "
+            "throughput (`data add --bulk` uses it for ingestion only)."
+        ),
+    )
+
     strict_schema_check: bool = Field(
         default=False,
         description=(
@@ -123,6 +221,14 @@ class Settings(BaseSettings):
         ),
     )
 
+    timing_log: Path | None = Field(
+        default=None,
+        description=(
+            "File to append timing spans of hot-path operations to as JSON lines "
+            "(unset disables the timing log)."
+        ),
+    )
+
     ramp_width: PydanticNonNegativeFloat = Field(
         default=0.1,
         description="Width of taper ramp as a multiple of the window length. Values greater than 1 are valid; the ramp extends outside the window.",
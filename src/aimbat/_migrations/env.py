@@ -81,8 +81,24 @@ def do_run_migrations(connection: Connection) -> None:
         render_item=render_item,
     )
 
-    with context.begin_transaction():
-        context.run_migrations()
+    # Batch mode rebuilds a table by copying it and dropping the original. With
+    # foreign keys enforced, that DROP TABLE would cascade to every row that
+    # references the table (e.g. snapshots of an event), so enforcement is
+    # switched off while migrating. The pragma is a no-op inside a transaction,
+    # hence it is issued (and committed) before the migration transaction.
+    foreign_keys = False
+    if connection.dialect.name == "sqlite":
+        foreign_keys = bool(connection.exec_driver_sql("PRAGMA foreign_keys").scalar())
+        connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        connection.commit()
+
+    try:
+        with context.begin_transaction():
+            context.run_migrations()
+    finally:
+        if foreign_keys:
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+            connection.commit()
 
 
 def run_migrations_online() -> None:
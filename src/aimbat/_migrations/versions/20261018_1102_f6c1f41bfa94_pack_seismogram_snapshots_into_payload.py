@@ -0,0 +1,515 @@
+"""pack seismogram snapshots into a single payload row per snapshot
+
+Revision ID: f6c1f41bfa94
+Revises: 121b562c0c67
+Create Date: 2026-10-18 11:02:51.402877+00:00
+
+"""
+
+import math
+import struct
+import uuid
+import zlib
+from collections.abc import Sequence
+from datetime import timezone
+from typing import NamedTuple
+
+import sqlalchemy as sa
+from alembic import op
+from pandas import Timedelta, Timestamp
+
+import aimbat._types
+
+# revision identifiers, used by Alembic.
+revision: str = "f6c1f41bfa94"
+down_revision: str | None = "121b562c0c67"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# One `aimbatseismogramparameterssnapshot` row (and possibly one
+# `aimbatseismogramqualitysnapshot` row) per seismogram per snapshot is
+# replaced by a single compressed `aimbatsnapshotpayload` row per snapshot.
+# Existing rows are packed into payloads before the old tables are dropped.
+# The per-snapshot counters are written once by `create_snapshot` from now
+# on, so the triggers that maintained them from the old table go too.
+
+# Frozen copy of version 1 of the payload layout (see `aimbat.models._payload`
+# at this revision). The migration must keep writing and reading exactly this
+# format, whatever the live module moves on to.
+_PAYLOAD_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BI")
+_MISSING_INT = -(2**63)
+_ROW_SIZE = 16 + 1 + 1 + 8 * 5
+
+
+class SeismogramSnapshotRow(NamedTuple):
+    seismogram_id: uuid.UUID
+    flip: bool
+    select: bool
+    t1: Timestamp | None
+    iccs_cc: float | None
+    mccc_cc_mean: float | None
+    mccc_cc_std: float | None
+    mccc_error: Timedelta | None
+
+
+def _timestamp_to_int(value: Timestamp | None) -> int:
+    if value is None:
+        return _MISSING_INT
+    ts = Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize(timezone.utc)
+    return int(ts.value)
+
+
+def _int_to_timestamp(value: int) -> Timestamp | None:
+    if value == _MISSING_INT:
+        return None
+    return Timestamp(value, unit="ns", tz=timezone.utc)
+
+
+def _timedelta_to_int(value: Timedelta | None) -> int:
+    return _MISSING_INT if value is None else int(Timedelta(value).value)
+
+
+def _int_to_timedelta(value: int) -> Timedelta | None:
+    return None if value == _MISSING_INT else Timedelta(value, unit="ns")
+
+
+def _float_or_nan(value: float | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _nan_to_none(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def pack_seismogram_snapshots(rows: Sequence[SeismogramSnapshotRow]) -> bytes:
+    n = len(rows)
+    parts = [
+        _HEADER.pack(_PAYLOAD_FORMAT_VERSION, n),
+        b"".join(row.seismogram_id.bytes for row in rows),
+        struct.pack(f"<{n}B", *(row.flip for row in rows)),
+        struct.pack(f"<{n}B", *(row.select for row in rows)),
+        struct.pack(f"<{n}q", *(_timestamp_to_int(row.t1) for row in rows)),
+        struct.pack(f"<{n}d", *(_float_or_nan(row.iccs_cc) for row in rows)),
+        struct.pack(f"<{n}d", *(_float_or_nan(row.mccc_cc_mean) for row in rows)),
+        struct.pack(f"<{n}d", *(_float_or_nan(row.mccc_cc_std) for row in rows)),
+        struct.pack(f"<{n}q", *(_timedelta_to_int(row.mccc_error) for row in rows)),
+    ]
+    return zlib.compress(b"".join(parts))
+
+
+def unpack_seismogram_snapshots(data: bytes) -> list[SeismogramSnapshotRow]:
+    raw = zlib.decompress(data)
+    version, n = _HEADER.unpack_from(raw)
+    if version != _PAYLOAD_FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot payload format version {version}.")
+    if len(raw) != _HEADER.size + n * _ROW_SIZE:
+        raise ValueError("Snapshot payload is truncated or corrupt.")
+
+    offset = _HEADER.size
+
+    def take(code: str, width: int) -> tuple:
+        nonlocal offset
+        column = struct.unpack_from(f"<{n}{code}", raw, offset)
+        offset += n * width
+        return column
+
+    ids = [
+        uuid.UUID(bytes=raw[offset + 16 * i : offset + 16 * (i + 1)]) for i in range(n)
+    ]
+    offset += 16 * n
+    flip = take("B", 1)
+    select = take("B", 1)
+    t1 = take("q", 8)
+    iccs_cc = take("d", 8)
+    mccc_cc_mean = take("d", 8)
+    mccc_cc_std = take("d", 8)
+    mccc_error = take("q", 8)
+
+    return [
+        SeismogramSnapshotRow(
+            seismogram_id=ids[i],
+            flip=bool(flip[i]),
+            select=bool(select[i]),
+            t1=_int_to_timestamp(t1[i]),
+            iccs_cc=_nan_to_none(iccs_cc[i]),
+            mccc_cc_mean=_nan_to_none(mccc_cc_mean[i]),
+            mccc_cc_std=_nan_to_none(mccc_cc_std[i]),
+            mccc_error=_int_to_timedelta(mccc_error[i]),
+        )
+        for i in range(n)
+    ]
+
+
+# IDs are handled as their stored 32-character hex strings rather than
+# `sa.Uuid`, so that rows are copied exactly as they are stored.
+_snapshot = sa.table("aimbatsnapshot", sa.column("id", sa.String()))
+_payload = sa.table(
+    "aimbatsnapshotpayload",
+    sa.column("id", sa.String()),
+    sa.column("data", sa.LargeBinary()),
+    sa.column("snapshot_id", sa.String()),
+)
+_seismogram_parameters = sa.table(
+    "aimbatseismogramparameters",
+    sa.column("id", sa.String()),
+    sa.column("seismogram_id", sa.String()),
+)
+_seismogram_quality = sa.table(
+    "aimbatseismogramquality",
+    sa.column("id", sa.String()),
+    sa.column("seismogram_id", sa.String()),
+)
+_seismogram_parameters_snapshot = sa.table(
+    "aimbatseismogramparameterssnapshot",
+    sa.column("id", sa.String()),
+    sa.column("seismogram_parameters_id", sa.String()),
+    sa.column("snapshot_id", sa.String()),
+    sa.column("flip", sa.Boolean()),
+    sa.column("select", sa.Boolean()),
+    sa.column("t1", aimbat._types.SAPandasTimestamp()),
+)
+_seismogram_quality_snapshot = sa.table(
+    "aimbatseismogramqualitysnapshot",
+    sa.column("id", sa.String()),
+    sa.column("seismogram_quality_id", sa.String()),
+    sa.column("snapshot_id", sa.String()),
+    sa.column("iccs_cc", sa.Float()),
+    sa.column("mccc_cc_mean", sa.Float()),
+    sa.column("mccc_cc_std", sa.Float()),
+    sa.column("mccc_error", aimbat._types.SAPandasTimedelta()),
+)
+
+# Triggers from revision 121b562c0c67, restored on downgrade.
+_SNAPSHOT_COUNTS_ON_SEIS_PARAMS_SNAPSHOT_INSERT = """
+    CREATE TRIGGER IF NOT EXISTS snapshot_counts_on_seis_params_snapshot_insert
+    AFTER INSERT ON aimbatseismogramparameterssnapshot
+    BEGIN
+        UPDATE aimbatsnapshot
+        SET seismogram_count = seismogram_count + 1,
+            selected_seismogram_count = selected_seismogram_count + (NEW."select" IS TRUE),
+            flipped_seismogram_count = flipped_seismogram_count + (NEW.flip IS TRUE)
+        WHERE id = NEW.snapshot_id;
+    END;
+"""
+
+_SNAPSHOT_COUNTS_ON_SEIS_PARAMS_SNAPSHOT_DELETE = """
+    CREATE TRIGGER IF NOT EXISTS snapshot_counts_on_seis_params_snapshot_delete
+    AFTER DELETE ON aimbatseismogramparameterssnapshot
+    BEGIN
+        UPDATE aimbatsnapshot
+        SET seismogram_count = seismogram_count - 1,
+            selected_seismogram_count = selected_seismogram_count - (OLD."select" IS TRUE),
+            flipped_seismogram_count = flipped_seismogram_count - (OLD.flip IS TRUE)
+        WHERE id = OLD.snapshot_id;
+    END;
+"""
+
+_SNAPSHOT_COUNTS_ON_SEIS_PARAMS_SNAPSHOT_UPDATE = """
+    CREATE TRIGGER IF NOT EXISTS snapshot_counts_on_seis_params_snapshot_update
+    AFTER UPDATE OF snapshot_id, "select", flip ON aimbatseismogramparameterssnapshot
+    BEGIN
+        UPDATE aimbatsnapshot
+        SET seismogram_count = seismogram_count - 1,
+            selected_seismogram_count = selected_seismogram_count - (OLD."select" IS TRUE),
+            flipped_seismogram_count = flipped_seismogram_count - (OLD.flip IS TRUE)
+        WHERE id = OLD.snapshot_id;
+        UPDATE aimbatsnapshot
+        SET seismogram_count = seismogram_count + 1,
+            selected_seismogram_count = selected_seismogram_count + (NEW."select" IS TRUE),
+            flipped_seismogram_count = flipped_seismogram_count + (NEW.flip IS TRUE)
+        WHERE id = NEW.snapshot_id;
+    END;
+"""
+
+_SNAPSHOT_COUNTER_TRIGGERS = (
+    _SNAPSHOT_COUNTS_ON_SEIS_PARAMS_SNAPSHOT_INSERT,
+    _SNAPSHOT_COUNTS_ON_SEIS_PARAMS_SNAPSHOT_DELETE,
+    _SNAPSHOT_COUNTS_ON_SEIS_PARAMS_SNAPSHOT_UPDATE,
+)
+
+_SNAPSHOT_COUNTER_TRIGGER_NAMES = (
+    "snapshot_counts_on_seis_params_snapshot_insert",
+    "snapshot_counts_on_seis_params_snapshot_delete",
+    "snapshot_counts_on_seis_params_snapshot_update",
+)
+
+_SNAPSHOT_COUNTER_BACKFILL = """
+    UPDATE aimbatsnapshot SET
+        seismogram_count = (
+            SELECT COUNT(*) FROM aimbatseismogramparameterssnapshot
+            WHERE snapshot_id = aimbatsnapshot.id
+        ),
+        selected_seismogram_count = (
+            SELECT COUNT(*) FROM aimbatseismogramparameterssnapshot
+            WHERE snapshot_id = aimbatsnapshot.id AND "select" IS TRUE
+        ),
+        flipped_seismogram_count = (
+            SELECT COUNT(*) FROM aimbatseismogramparameterssnapshot
+            WHERE snapshot_id = aimbatsnapshot.id AND flip IS TRUE
+        )
+"""
+
+
+def _pack_existing_snapshots(connection: sa.Connection) -> None:
+    """Pack the per-seismogram snapshot rows into one payload per snapshot."""
+    rows: dict[str, dict[str, SeismogramSnapshotRow]] = {
+        snapshot_id: {}
+        for snapshot_id in connection.execute(sa.select(_snapshot.c.id)).scalars()
+    }
+
+    sps, sp = _seismogram_parameters_snapshot, _seismogram_parameters
+    parameters = connection.execute(
+        sa.select(
+            sps.c.snapshot_id,
+            sp.c.seismogram_id,
+            sps.c.flip,
+            sps.c["select"],
+            sps.c.t1,
+        ).join_from(sps, sp, sps.c.seismogram_parameters_id == sp.c.id)
+    )
+    for snapshot_id, seismogram_id, flip, select, t1 in parameters:
+        rows.setdefault(snapshot_id, {})[seismogram_id] = SeismogramSnapshotRow(
+            seismogram_id=uuid.UUID(seismogram_id),
+            flip=bool(flip),
+            select=bool(select),
+            t1=t1,
+            iccs_cc=None,
+            mccc_cc_mean=None,
+            mccc_cc_std=None,
+            mccc_error=None,
+        )
+
+    sqs, sq = _seismogram_quality_snapshot, _seismogram_quality
+    quality = connection.execute(
+        sa.select(
+            sqs.c.snapshot_id,
+            sq.c.seismogram_id,
+            sqs.c.iccs_cc,
+            sqs.c.mccc_cc_mean,
+            sqs.c.mccc_cc_std,
+            sqs.c.mccc_error,
+        ).join_from(sqs, sq, sqs.c.seismogram_quality_id == sq.c.id)
+    )
+    for snapshot_id, seismogram_id, iccs_cc, cc_mean, cc_std, error in quality:
+        row = rows.get(snapshot_id, {}).get(seismogram_id)
+        if row is None:
+            continue
+        rows[snapshot_id][seismogram_id] = row._replace(
+            iccs_cc=iccs_cc,
+            mccc_cc_mean=cc_mean,
+            mccc_cc_std=cc_std,
+            mccc_error=error,
+        )
+
+    if rows:
+        op.bulk_insert(
+            _payload,
+            [
+                {
+                    "id": uuid.uuid4().hex,
+                    "data": pack_seismogram_snapshots(list(seismograms.values())),
+                    "snapshot_id": snapshot_id,
+                }
+                for snapshot_id, seismograms in rows.items()
+            ],
+        )
+
+
+def _unpack_payloads(connection: sa.Connection) -> None:
+    """Restore per-seismogram snapshot rows from the payloads."""
+    parameters_ids = dict(
+        connection.execute(
+            sa.select(
+                _seismogram_parameters.c.seismogram_id, _seismogram_parameters.c.id
+            )
+        ).all()
+    )
+    quality_ids = dict(
+        connection.execute(
+            sa.select(_seismogram_quality.c.seismogram_id, _seismogram_quality.c.id)
+        ).all()
+    )
+
+    parameters_rows = []
+    quality_rows = []
+    for snapshot_id, data in connection.execute(
+        sa.select(_payload.c.snapshot_id, _payload.c.data)
+    ):
+        for row in unpack_seismogram_snapshots(data):
+            seismogram_id = row.seismogram_id.hex
+            if seismogram_id in parameters_ids:
+                parameters_rows.append(
+                    {
+                        "id": uuid.uuid4().hex,
+                        "seismogram_parameters_id": parameters_ids[seismogram_id],
+                        "snapshot_id": snapshot_id,
+                        "flip": row.flip,
+                        "select": row.select,
+                        "t1": row.t1,
+                    }
+                )
+            has_quality = any(
+                v is not None
+                for v in (
+                    row.iccs_cc,
+                    row.mccc_cc_mean,
+                    row.mccc_cc_std,
+                    row.mccc_error,
+                )
+            )
+            if has_quality and seismogram_id in quality_ids:
+                quality_rows.append(
+                    {
+                        "id": uuid.uuid4().hex,
+                        "seismogram_quality_id": quality_ids[seismogram_id],
+                        "snapshot_id": snapshot_id,
+                        "iccs_cc": row.iccs_cc,
+                        "mccc_cc_mean": row.mccc_cc_mean,
+                        "mccc_cc_std": row.mccc_cc_std,
+                        "mccc_error": row.mccc_error,
+                    }
+                )
+
+    if parameters_rows:
+        op.bulk_insert(_seismogram_parameters_snapshot, parameters_rows)
+    if quality_rows:
+        op.bulk_insert(_seismogram_quality_snapshot, quality_rows)
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table(
+        "aimbatsnapshotpayload",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("snapshot_id", sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["snapshot_id"], ["aimbatsnapshot.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("aimbatsnapshotpayload", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_aimbatsnapshotpayload_snapshot_id"),
+            ["snapshot_id"],
+            unique=True,
+        )
+
+    # ### end Alembic commands ###
+
+    _pack_existing_snapshots(op.get_bind())
+
+    for name in _SNAPSHOT_COUNTER_TRIGGER_NAMES:
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS {name}"))
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table(
+        "aimbatseismogramqualitysnapshot", schema=None
+    ) as batch_op:
+        batch_op.drop_index(
+            batch_op.f("ix_aimbatseismogramqualitysnapshot_snapshot_id")
+        )
+        batch_op.drop_index(
+            batch_op.f("ix_aimbatseismogramqualitysnapshot_seismogram_quality_id")
+        )
+
+    op.drop_table("aimbatseismogramqualitysnapshot")
+    with op.batch_alter_table(
+        "aimbatseismogramparameterssnapshot", schema=None
+    ) as batch_op:
+        batch_op.drop_index(
+            batch_op.f("ix_aimbatseismogramparameterssnapshot_snapshot_id")
+        )
+        batch_op.drop_index(
+            batch_op.f("ix_aimbatseismogramparameterssnapshot_seismogram_parameters_id")
+        )
+
+    op.drop_table("aimbatseismogramparameterssnapshot")
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table(
+        "aimbatseismogramparameterssnapshot",
+        sa.Column("flip", sa.Boolean(), nullable=False),
+        sa.Column("select", sa.Boolean(), nullable=False),
+        sa.Column("t1", aimbat._types.SAPandasTimestamp(timezone=True), nullable=True),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("seismogram_parameters_id", sa.Uuid(), nullable=False),
+        sa.Column("snapshot_id", sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["seismogram_parameters_id"],
+            ["aimbatseismogramparameters.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["snapshot_id"], ["aimbatsnapshot.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table(
+        "aimbatseismogramparameterssnapshot", schema=None
+    ) as batch_op:
+        batch_op.create_index(
+            batch_op.f(
+                "ix_aimbatseismogramparameterssnapshot_seismogram_parameters_id"
+            ),
+            ["seismogram_parameters_id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_aimbatseismogramparameterssnapshot_snapshot_id"),
+            ["snapshot_id"],
+            unique=False,
+        )
+
+    op.create_table(
+        "aimbatseismogramqualitysnapshot",
+        sa.Column("iccs_cc", sa.Float(), nullable=True),
+        sa.Column("mccc_cc_mean", sa.Float(), nullable=True),
+        sa.Column("mccc_cc_std", sa.Float(), nullable=True),
+        sa.Column("mccc_error", aimbat._types.SAPandasTimedelta(), nullable=True),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("seismogram_quality_id", sa.Uuid(), nullable=False),
+        sa.Column("snapshot_id", sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["seismogram_quality_id"],
+            ["aimbatseismogramquality.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["snapshot_id"], ["aimbatsnapshot.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table(
+        "aimbatseismogramqualitysnapshot", schema=None
+    ) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_aimbatseismogramqualitysnapshot_seismogram_quality_id"),
+            ["seismogram_quality_id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_aimbatseismogramqualitysnapshot_snapshot_id"),
+            ["snapshot_id"],
+            unique=False,
+        )
+
+    # ### end Alembic commands ###
+
+    _unpack_payloads(op.get_bind())
+    op.execute(sa.text(_SNAPSHOT_COUNTER_BACKFILL))
+    for trigger in _SNAPSHOT_COUNTER_TRIGGERS:
+        op.execute(sa.text(trigger))
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table("aimbatsnapshotpayload", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_aimbatsnapshotpayload_snapshot_id"))
+
+    op.drop_table("aimbatsnapshotpayload")
+    # ### end Alembic commands ###
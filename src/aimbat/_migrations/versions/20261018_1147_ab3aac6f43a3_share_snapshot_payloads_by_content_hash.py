@@ -0,0 +1,292 @@
+"""share snapshot payloads by content hash
+
+Revision ID: ab3aac6f43a3
+Revises: f6c1f41bfa94
+Create Date: 2026-10-18 11:47:12.530194+00:00
+
+"""
+
+import hashlib
+import struct
+import uuid
+import zlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ab3aac6f43a3"
+down_revision: str | None = "f6c1f41bfa94"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Payloads no longer belong to exactly one snapshot. Instead, each snapshot
+# references a payload by `payload_id` and identical payloads are stored once,
+# keyed by `content_hash`. A `ref_count` maintained by triggers on
+# `aimbatsnapshot` removes a payload when its last snapshot is deleted.
+#
+# Existing payloads are repacked with their seismograms sorted by ID (as
+# `create_snapshot` now does), so that new snapshots deduplicate against them.
+#
+# SQLite's batch mode recreates `aimbatsnapshot` to make `payload_id` NOT NULL
+# and add its foreign key, which silently drops the triggers defined on that
+# table (see revision ffa5c8fcbe9b). The snapshot counter triggers from
+# revision 121b562c0c67 are therefore recreated here as well. These bodies
+# must stay in sync with core/_project.py::create_project(), checked by
+# tests/integration/core/test_migrations.py::test_same_triggers.
+
+# Version 1 of the payload layout (see revision f6c1f41bfa94): a header with
+# the format version and seismogram count, followed by one column per field.
+# Repacking only reorders the entries of each column, so the values are
+# copied byte for byte and the live payload module is not needed.
+_PAYLOAD_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BI")
+_COLUMN_WIDTHS = (16, 1, 1, 8, 8, 8, 8, 8)
+
+# IDs are handled as their stored 32-character hex strings rather than
+# `sa.Uuid`, so that rows are copied exactly as they are stored.
+_snapshot = sa.table(
+    "aimbatsnapshot",
+    sa.column("id", sa.String()),
+    sa.column("payload_id", sa.String()),
+)
+_owned_payload = sa.table(
+    "aimbatsnapshotpayload",
+    sa.column("id", sa.String()),
+    sa.column("data", sa.LargeBinary()),
+    sa.column("snapshot_id", sa.String()),
+)
+_shared_payload = sa.table(
+    "aimbatsnapshotpayload",
+    sa.column("id", sa.String()),
+    sa.column("data", sa.LargeBinary()),
+    sa.column("content_hash", sa.String()),
+    sa.column("ref_count", sa.Integer()),
+)
+
+_SNAPSHOT_COUNT_ON_SNAPSHOT_INSERT = """
+    CREATE TRIGGER IF NOT EXISTS snapshot_count_on_snapshot_insert
+    AFTER INSERT ON aimbatsnapshot
+    BEGIN
+        UPDATE aimbatevent SET snapshot_count = snapshot_count + 1
+        WHERE id = NEW.event_id;
+    END;
+"""
+
+_SNAPSHOT_COUNT_ON_SNAPSHOT_DELETE = """
+    CREATE TRIGGER IF NOT EXISTS snapshot_count_on_snapshot_delete
+    AFTER DELETE ON aimbatsnapshot
+    BEGIN
+        UPDATE aimbatevent SET snapshot_count = snapshot_count - 1
+        WHERE id = OLD.event_id;
+    END;
+"""
+
+_SNAPSHOT_COUNT_TRIGGERS = (
+    _SNAPSHOT_COUNT_ON_SNAPSHOT_INSERT,
+    _SNAPSHOT_COUNT_ON_SNAPSHOT_DELETE,
+)
+
+_PAYLOAD_REFS_ON_SNAPSHOT_INSERT = """
+    CREATE TRIGGER IF NOT EXISTS payload_refs_on_snapshot_insert
+    AFTER INSERT ON aimbatsnapshot
+    BEGIN
+        UPDATE aimbatsnapshotpayload SET ref_count = ref_count + 1
+        WHERE id = NEW.payload_id;
+    END;
+"""
+
+_PAYLOAD_REFS_ON_SNAPSHOT_DELETE = """
+    CREATE TRIGGER IF NOT EXISTS payload_refs_on_snapshot_delete
+    AFTER DELETE ON aimbatsnapshot
+    BEGIN
+        UPDATE aimbatsnapshotpayload SET ref_count = ref_count - 1
+        WHERE id = OLD.payload_id;
+        DELETE FROM aimbatsnapshotpayload
+        WHERE id = OLD.payload_id AND ref_count <= 0;
+    END;
+"""
+
+_PAYLOAD_REFS_ON_SNAPSHOT_UPDATE = """
+    CREATE TRIGGER IF NOT EXISTS payload_refs_on_snapshot_update
+    AFTER UPDATE OF payload_id ON aimbatsnapshot
+    WHEN NEW.payload_id IS NOT OLD.payload_id
+    BEGIN
+        UPDATE aimbatsnapshotpayload SET ref_count = ref_count + 1
+        WHERE id = NEW.payload_id;
+        UPDATE aimbatsnapshotpayload SET ref_count = ref_count - 1
+        WHERE id = OLD.payload_id;
+        DELETE FROM aimbatsnapshotpayload
+        WHERE id = OLD.payload_id AND ref_count <= 0;
+    END;
+"""
+
+_PAYLOAD_REF_TRIGGERS = (
+    _PAYLOAD_REFS_ON_SNAPSHOT_INSERT,
+    _PAYLOAD_REFS_ON_SNAPSHOT_DELETE,
+    _PAYLOAD_REFS_ON_SNAPSHOT_UPDATE,
+)
+
+_PAYLOAD_REF_TRIGGER_NAMES = (
+    "payload_refs_on_snapshot_insert",
+    "payload_refs_on_snapshot_delete",
+    "payload_refs_on_snapshot_update",
+)
+
+
+def _repack_sorted(data: bytes) -> bytes:
+    """Repack a payload with its seismograms in canonical (ID) order."""
+    raw = zlib.decompress(data)
+    version, n = _HEADER.unpack_from(raw)
+    if version != _PAYLOAD_FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot payload format version {version}.")
+    if len(raw) != _HEADER.size + n * sum(_COLUMN_WIDTHS):
+        raise ValueError("Snapshot payload is truncated or corrupt.")
+
+    columns: list[list[bytes]] = []
+    offset = _HEADER.size
+    for width in _COLUMN_WIDTHS:
+        columns.append(
+            [raw[offset + width * i : offset + width * (i + 1)] for i in range(n)]
+        )
+        offset += width * n
+
+    # Seismogram IDs are the first column; ordering their raw bytes matches
+    # ordering them as UUIDs.
+    order = sorted(range(n), key=lambda i: columns[0][i])
+    parts = [raw[: _HEADER.size]]
+    parts.extend(column[i] for column in columns for i in order)
+    return zlib.compress(b"".join(parts))
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    owned = connection.execute(
+        sa.select(_owned_payload.c.snapshot_id, _owned_payload.c.data)
+    ).all()
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table("aimbatsnapshotpayload", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_aimbatsnapshotpayload_snapshot_id"))
+
+    op.drop_table("aimbatsnapshotpayload")
+    op.create_table(
+        "aimbatsnapshotpayload",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("content_hash", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("aimbatsnapshotpayload", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_aimbatsnapshotpayload_content_hash"),
+            ["content_hash"],
+            unique=True,
+        )
+
+    with op.batch_alter_table("aimbatsnapshot", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("payload_id", sa.Uuid(), nullable=True))
+
+    # ### end Alembic commands ###
+
+    payloads: dict[str, dict[str, object]] = {}
+    snapshot_payload_ids: list[dict[str, str]] = []
+    for snapshot_id, data in owned:
+        data = _repack_sorted(data)
+        content_hash = hashlib.sha256(data).hexdigest()
+        payload = payloads.setdefault(
+            content_hash,
+            {
+                "id": uuid.uuid4().hex,
+                "data": data,
+                "content_hash": content_hash,
+                "ref_count": 0,
+            },
+        )
+        payload["ref_count"] += 1  # type: ignore[operator]
+        snapshot_payload_ids.append(
+            {"b_snapshot_id": snapshot_id, "b_payload_id": str(payload["id"])}
+        )
+
+    if payloads:
+        op.bulk_insert(_shared_payload, list(payloads.values()))
+    if snapshot_payload_ids:
+        connection.execute(
+            _snapshot.update()
+            .where(_snapshot.c.id == sa.bindparam("b_snapshot_id"))
+            .values(payload_id=sa.bindparam("b_payload_id")),
+            snapshot_payload_ids,
+        )
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table("aimbatsnapshot", schema=None) as batch_op:
+        batch_op.alter_column("payload_id", existing_type=sa.Uuid(), nullable=False)
+        batch_op.create_index(
+            batch_op.f("ix_aimbatsnapshot_payload_id"), ["payload_id"], unique=False
+        )
+        batch_op.create_foreign_key(
+            "fk_aimbatsnapshot_payload_id_aimbatsnapshotpayload",
+            "aimbatsnapshotpayload",
+            ["payload_id"],
+            ["id"],
+        )
+
+    # ### end Alembic commands ###
+
+    for trigger in (*_SNAPSHOT_COUNT_TRIGGERS, *_PAYLOAD_REF_TRIGGERS):
+        op.execute(sa.text(trigger))
+
+
+def downgrade() -> None:
+    for name in _PAYLOAD_REF_TRIGGER_NAMES:
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS {name}"))
+
+    connection = op.get_bind()
+    shared = connection.execute(
+        sa.select(_snapshot.c.id, _shared_payload.c.data).join_from(
+            _snapshot, _shared_payload, _snapshot.c.payload_id == _shared_payload.c.id
+        )
+    ).all()
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table("aimbatsnapshot", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_aimbatsnapshot_payload_id"))
+        batch_op.drop_column("payload_id")
+
+    for trigger in _SNAPSHOT_COUNT_TRIGGERS:
+        op.execute(sa.text(trigger))
+
+    with op.batch_alter_table("aimbatsnapshotpayload", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_aimbatsnapshotpayload_content_hash"))
+
+    op.drop_table("aimbatsnapshotpayload")
+    op.create_table(
+        "aimbatsnapshotpayload",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("snapshot_id", sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["snapshot_id"], ["aimbatsnapshot.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("aimbatsnapshotpayload", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_aimbatsnapshotpayload_snapshot_id"),
+            ["snapshot_id"],
+            unique=True,
+        )
+
+    # ### end Alembic commands ###
+
+    if shared:
+        op.bulk_insert(
+            _owned_payload,
+            [
+                {"id": uuid.uuid4().hex, "data": data, "snapshot_id": snapshot_id}
+                for snapshot_id, data in shared
+            ],
+        )
@@ -0,0 +1,205 @@
+"""Detection of project changes made outside the TUI."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, Engine, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col, select
+
+from aimbat.logger import logger
+from aimbat.models import (
+    AimbatEvent,
+    AimbatEventQuality,
+    AimbatNote,
+    AimbatSeismogram,
+    AimbatSeismogramQuality,
+    AimbatSnapshot,
+    AimbatStation,
+)
+
+__all__ = ["ChangeWatcher", "ProjectChanges"]
+
+
+@dataclass(frozen=True)
+class ProjectChanges:
+    """Parts of the project that changed since the previous check.
+
+    Attributes:
+        events: Events that were added, removed or modified, including their
+            parameters, seismograms and quality metrics.
+        snapshots: Events whose snapshots were added or removed.
+        stations: Whether stations were added or removed.
+        notes: Whether any note was added, removed or edited.
+    """
+
+    events: frozenset[uuid.UUID] = frozenset()
+    snapshots: frozenset[uuid.UUID] = frozenset()
+    stations: bool = False
+    notes: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.events or self.snapshots or self.stations or self.notes)
+
+
+@dataclass(frozen=True)
+class _Fingerprint:
+    events: dict[uuid.UUID, Hashable]
+    snapshots: dict[uuid.UUID, Hashable]
+    stations: Hashable
+    notes: Hashable
+
+
+def _changed_keys(
+    old: dict[uuid.UUID, Hashable], new: dict[uuid.UUID, Hashable]
+) -> frozenset[uuid.UUID]:
+    return frozenset(k for k in old.keys() | new.keys() if old.get(k) != new.get(k))
+
+
+class ChangeWatcher:
+    """Report which parts of the project database were changed by other connections.
+
+    Holds a dedicated connection to the database and reads SQLite's
+    `PRAGMA data_version` on every `poll`. The value only changes when another
+    connection (the CLI, the shell, the API server or a TUI background worker)
+    committed a write, so an idle project costs a single pragma per poll. Only
+    then are a handful of aggregate queries run to fingerprint the events
+    (using the trigger-maintained `last_modified` and count columns),
+    snapshots, stations and notes, and compared with the previous fingerprint.
+
+    Writes made through the watcher's own connection are not seen by the
+    pragma; on other databases every poll compares fingerprints.
+
+    Args:
+        engine: The engine of the project database.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self._connection: Connection | None = None
+        self._data_version: int | None = None
+        self._fingerprint: _Fingerprint | None = None
+
+    def poll(self) -> ProjectChanges | None:
+        """Return what changed since the previous call.
+
+        The first call establishes the baseline and reports no changes.
+
+        Returns:
+            The changes, or `None` if nothing changed or the project could not
+                be read (e.g. because it does not exist yet).
+        """
+        try:
+            connection = self._connect()
+            try:
+                if self._engine.dialect.name == "sqlite":
+                    data_version = connection.exec_driver_sql(
+                        "PRAGMA data_version"
+                    ).scalar_one()
+                    if (
+                        data_version == self._data_version
+                        and self._fingerprint is not None
+                    ):
+                        return None
+                    self._data_version = data_version
+                fingerprint = self._take_fingerprint(connection)
+            finally:
+                # Don't hold a read transaction open between polls.
+                connection.rollback()
+        except SQLAlchemyError as exc:
+            logger.debug(f"Unable to check the project for changes: {exc}")
+            self._fingerprint = None
+            return None
+
+        previous, self._fingerprint = self._fingerprint, fingerprint
+        if previous is None:
+            return None
+        changes = ProjectChanges(
+            events=_changed_keys(previous.events, fingerprint.events),
+            snapshots=_changed_keys(previous.snapshots, fingerprint.snapshots),
+            stations=previous.stations != fingerprint.stations,
+            notes=previous.notes != fingerprint.notes,
+        )
+        return changes or None
+
+    def reset(self) -> None:
+        """Take the current state of the project as the new baseline.
+
+        Call this after refreshing the UI from the database, so that the
+        writes the refresh already reflects are not reported again.
+        """
+        self.poll()
+
+    def close(self) -> None:
+        """Close the dedicated connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._data_version = None
+        self._fingerprint = None
+
+    def _connect(self) -> Connection:
+        if self._connection is None or self._connection.closed:
+            self._connection = self._engine.connect()
+            self._data_version = None
+        return self._connection
+
+    @staticmethod
+    def _take_fingerprint(connection: Connection) -> _Fingerprint:
+        events: dict[uuid.UUID, Hashable] = {
+            row.id: tuple(row)
+            for row in connection.execute(
+                select(
+                    AimbatEvent.id,
+                    AimbatEvent.last_modified,
+                    AimbatEvent.seismogram_count,
+                    AimbatEvent.station_count,
+                    col(AimbatEventQuality.mccc_rmse),
+                ).outerjoin(
+                    AimbatEventQuality,
+                    col(AimbatEventQuality.event_id) == AimbatEvent.id,
+                )
+            )
+        }
+        # Quality metrics are written by ICCS and MCCC without touching the
+        # event's `last_modified`.
+        for row in connection.execute(
+            select(
+                AimbatSeismogram.event_id,
+                func.total(AimbatSeismogramQuality.iccs_cc),
+                func.total(AimbatSeismogramQuality.mccc_cc_mean),
+                func.total(AimbatSeismogramQuality.mccc_cc_std),
+                func.total(AimbatSeismogramQuality.mccc_error),
+                func.count(AimbatSeismogramQuality.mccc_error),
+            )
+            .join(
+                AimbatSeismogramQuality,
+                col(AimbatSeismogramQuality.seismogram_id) == AimbatSeismogram.id,
+            )
+            .group_by(col(AimbatSeismogram.event_id))
+        ):
+            events[row[0]] = (events.get(row[0]), tuple(row[1:]))
+
+        snapshots: dict[uuid.UUID, Hashable] = {
+            row[0]: tuple(row[1:])
+            for row in connection.execute(
+                select(
+                    AimbatSnapshot.event_id,
+                    func.count(),
+                    func.max(AimbatSnapshot.time),
+                    func.total(func.length(AimbatSnapshot.comment)),
+                ).group_by(col(AimbatSnapshot.event_id))
+            )
+        }
+        stations = tuple(
+            connection.execute(select(func.count(), func.max(AimbatStation.id))).one()
+        )
+        notes = tuple(
+            connection.execute(
+                select(func.count(), func.total(func.length(AimbatNote.content)))
+            ).one()
+        )
+        return _Fingerprint(events, snapshots, stations, notes)
@@ -3,23 +3,30 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
-from typing import Any, ClassVar, Literal
+from functools import partial
+from types import MappingProxyType
+from typing import Any, ClassVar, Literal, Self
 
+from pandas import Timestamp
 from pydantic import BaseModel
 from rich.text import Text
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError
 from sqlmodel import Session, select
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
+from textual.coordinate import Coordinate
 from textual.css.query import NoMatches
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import DataTable, Static
+from textual.widgets.data_table import RowDoesNotExist
+from textual.worker import get_current_worker
 
 from pysmo.tools.plotutils import relative_time_array
 
@@ -35,6 +42,7 @@ from aimbat.core import (
     get_station_quality,
 )
 from aimbat.db import engine
+from aimbat.logger import logger
 from aimbat.models import (
     AimbatEvent,
     AimbatEventRead,
@@ -44,6 +52,7 @@ from aimbat.models import (
     AimbatStationRead,
     SeismogramQualityStats,
 )
+from aimbat.utils import minmax_decimate, profiled
 from aimbat.utils.formatters import fmt_float_sem
 
 from ._format import format_quality_panel, tui_cell, tui_display_title
@@ -110,26 +119,48 @@ _TAB_ROW_ACTIONS: dict[str, list[RowAction]] = {
 
 def _settle_cursor(
     widget: Widget,
-    tables: Sequence[tuple[DataTable, int]],
+    tables: Sequence[tuple[DataTable, str | None, int]],
     on_settled: Callable[[], None],
 ) -> None:
     """Restore cursor position on `tables`, deferring `on_settled` until any
     RowHighlighted events the moves trigger have been processed.
 
+    Each entry holds the table, the key of the row the cursor was on before
+    the refresh, and its index. The cursor follows that row if it is still
+    shown, and otherwise stays at the same index (clamped to the new row count).
+    When the cursor does not need to move, `RowHighlighted` is posted anyway,
+    as the row under it may have changed.
+
     If none of `tables` has any rows, no cursor move happens and `on_settled`
     runs immediately instead of being deferred.
     """
     moved = False
-    for table, saved_row in tables:
-        if table.row_count > 0:
-            table.move_cursor(row=min(saved_row, table.row_count - 1))
-            moved = True
+    for table, saved_key, saved_row in tables:
+        if table.row_count == 0:
+            continue
+        row = min(saved_row, table.row_count - 1)
+        if saved_key is not None:
+            with suppress(RowDoesNotExist):
+                row = table.get_row_index(saved_key)
+        if row == table.cursor_row:
+            row_key = table.coordinate_to_cell_key(Coordinate(row, 0)).row_key
+            table.post_message(DataTable.RowHighlighted(table, row, row_key))
+        else:
+            table.move_cursor(row=row)
+        moved = True
     if moved:
         widget.call_after_refresh(on_settled)
     else:
         on_settled()
 
 
+def _cursor_key(table: DataTable) -> str | None:
+    """Return the key of the row under the cursor of `table`, if any."""
+    if table.row_count == 0:
+        return None
+    return table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+
+
 def _setup_table(
     widget: Widget,
     selector: str,
@@ -164,34 +195,83 @@ def _styled_cell(cell: str | Text, style: str) -> Text:
     return Text(cell, style=style)
 
 
-def _populate_rows(
-    table: DataTable,
-    rows: Sequence[dict[str, Any]],
+# A displayed row before formatting: its style and its raw cell values.
+type _RowSource = tuple[str | None, tuple[Any, ...]]
+
+
+def _sync_rows(
+    table: _RowActionTable,
+    rows: Sequence[Mapping[str, Any]],
     model: type[BaseModel],
     *,
-    on_row: Callable[[dict[str, Any]], Sequence[str]] | None = None,
-    row_style: Callable[[dict[str, Any]], str | None] | None = None,
+    on_row: Callable[[Mapping[str, Any]], Sequence[str]] | None = None,
+    row_style: Callable[[Mapping[str, Any]], str | None] | None = None,
 ) -> None:
-    """Add `rows` (dicts with title keys and an "ID" key) to `table`,
+    """Show `rows` (dicts with title keys and an "ID" key) in `table`,
     formatting cells via `tui_cell(model, ...)`.
 
-    If given, `on_row` is called with each row dict before "ID" is popped;
-    its return value is prepended as extra leading cells (e.g. a marker).
-
-    If given, `row_style` is called with each row dict (before "ID" is
-    popped); when it returns a Rich style string, every cell in that row
-    (including any `on_row` prefix) is wrapped in that style, e.g. to fade
-    rows not relevant to the current context.
+    Rows are matched to the displayed ones by "ID", and only the difference
+    is applied: rows that disappeared are removed, new rows are appended and
+    cells whose raw value or row style changed are updated in place. Editing
+    one row therefore only reformats and redraws that row, and the cursor and
+    scroll position are left alone. The table is rebuilt instead when the
+    rows that are kept changed their relative order, new rows would not go at
+    the end, or more rows are added and removed than kept.
+
+    If given, `on_row` is called with each row dict; its return value is
+    prepended as extra leading cells (e.g. a marker).
+
+    If given, `row_style` is called with each row dict; when it returns a
+    Rich style string, every cell in that row (including any `on_row`
+    prefix) is wrapped in that style, e.g. to fade rows not relevant to the
+    current context.
     """
+    n_prefix = 0
+    sources: dict[str, _RowSource] = {}
     for row in rows:
         style = row_style(row) if row_style is not None else None
-        prefix: Sequence[str | Text] = on_row(row) if on_row is not None else ()
-        row_id = str(row.pop("ID"))
-        cells: Sequence[str | Text] = [tui_cell(model, k, v) for k, v in row.items()]
+        prefix = tuple(on_row(row)) if on_row is not None else ()
+        n_prefix = len(prefix)
+        items = tuple((k, v) for k, v in row.items() if k != "ID")
+        sources[str(row["ID"])] = (style, (*prefix, *items))
+
+    def format_row(source: _RowSource) -> list[str | Text]:
+        style, values = source
+        cells: list[str | Text] = [
+            *values[:n_prefix],
+            *(tui_cell(model, k, v) for k, v in values[n_prefix:]),
+        ]
         if style is not None:
-            prefix = [_styled_cell(c, style) for c in prefix]
             cells = [_styled_cell(c, style) for c in cells]
-        table.add_row(*prefix, *cells, key=row_id)
+        return cells
+
+    displayed = table.row_sources
+    kept = [k for k in displayed if k in sources]
+    added = [k for k in sources if k not in displayed]
+    n_removed = len(displayed) - len(kept)
+    if [*kept, *added] != list(sources) or n_removed + len(added) > len(kept):
+        table.clear()
+        for row_id, source in sources.items():
+            table.add_row(*format_row(source), key=row_id)
+        table.row_sources = sources
+        return
+
+    for row_id in displayed.keys() - sources.keys():
+        table.remove_row(row_id)
+    column_keys = list(table.columns)
+    for row_id in kept:
+        old, new = displayed[row_id], sources[row_id]
+        if old == new:
+            continue
+        restyled = old[0] != new[0]
+        for column_key, old_value, new_value, cell in zip(
+            column_keys, old[1], new[1], format_row(new)
+        ):
+            if restyled or old_value != new_value:
+                table.update_cell(row_id, column_key, cell, update_width=True)
+    for row_id in added:
+        table.add_row(*format_row(sources[row_id]), key=row_id)
+    table.row_sources = sources
 
 
 def _update_note(
@@ -260,6 +340,11 @@ class _RowActionTable(VimDataTable):
 
     TAB_ID: ClassVar[str]
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.row_sources: dict[str, _RowSource] = {}
+        """Unformatted rows currently shown, in display order (see `_sync_rows`)."""
+
     class RowActionSelected(Message):
         """Posted when a row action is triggered directly via its footer hotkey."""
 
@@ -292,6 +377,10 @@ class _RowActionTable(VimDataTable):
         ]
         super().__init_subclass__(**kwargs)
 
+    def clear(self, columns: bool = False) -> Self:
+        self.row_sources = {}
+        return super().clear(columns)
+
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
         if action == "row_action":
             return self.row_count > 0
@@ -329,12 +418,172 @@ class _SnapshotTable(_RowActionTable):
     TAB_ID = "tab-snapshots"
 
 
+# ---------------------------------------------------------------------------
+# Background loading
+# ---------------------------------------------------------------------------
+
+_LOADING_INDICATOR_DELAY = 0.3
+"""Seconds a background load may take before its tables show a loading indicator."""
+
+type _Rows = tuple[Mapping[str, Any], ...]
+
+
+def _freeze_rows(rows: Sequence[dict[str, Any]]) -> _Rows:
+    """Return `rows` as an immutable snapshot safe to hand to the UI thread."""
+    return tuple(MappingProxyType(row) for row in rows)
+
+
+@dataclass(frozen=True)
+class _ProjectRows:
+    """Rows of the Project tab's tables, loaded in a background worker."""
+
+    events: _Rows = ()
+    stations: _Rows = ()
+    used_station_ids: frozenset[str] = frozenset()
+    """IDs of the stations with seismograms in the current event."""
+
+
+def _load_project_rows(current_event_id: uuid.UUID | None) -> _ProjectRows:
+    with Session(engine) as session:
+        event_rows = dump_event_table(
+            session,
+            from_read_model=True,
+            by_title=True,
+            exclude=_EVENT_TABLE_EXCLUDE,
+        )
+        station_rows = dump_station_table(
+            session,
+            from_read_model=True,
+            by_title=True,
+            exclude=_STATION_TABLE_EXCLUDE,
+        )
+        used_station_ids = (
+            frozenset(
+                str(station_id)
+                for station_id in session.exec(
+                    select(AimbatSeismogram.station_id)
+                    .where(AimbatSeismogram.event_id == current_event_id)
+                    .distinct()
+                ).all()
+            )
+            if current_event_id is not None
+            else frozenset()
+        )
+    return _ProjectRows(
+        _freeze_rows(event_rows), _freeze_rows(station_rows), used_station_ids
+    )
+
+
+def _load_seismogram_rows(
+    current_event_id: uuid.UUID | None, live_cc_map: Mapping[str, float]
+) -> _Rows:
+    if current_event_id is None:
+        return ()
+    with Session(engine) as session:
+        event = session.get(AimbatEvent, current_event_id)
+        if event is None:
+            return ()
+        rows = dump_seismogram_table(
+            session,
+            from_read_model=True,
+            by_title=True,
+            exclude=_SEISMOGRAM_TABLE_EXCLUDE,
+            event_id=event.id,
+        )
+    for row in rows:
+        seis_id = str(row["ID"])
+        if seis_id in live_cc_map:
+            row["Stack CC"] = live_cc_map[seis_id]
+    rows.sort(
+        key=lambda r: r["Stack CC"] if r.get("Stack CC") is not None else -2.0,
+        reverse=True,
+    )
+    return _freeze_rows(rows)
+
+
+def _load_snapshot_rows(current_event_id: uuid.UUID | None) -> _Rows:
+    if current_event_id is None:
+        return ()
+    with Session(engine) as session:
+        event = session.get(AimbatEvent, current_event_id)
+        if event is None:
+            return ()
+        return _freeze_rows(
+            dump_snapshot_table(
+                session,
+                from_read_model=True,
+                by_title=True,
+                exclude=_SNAPSHOT_TABLE_EXCLUDE,
+                event_id=event.id,
+            )
+        )
+
+
+class _LoadingPanel(Widget):
+    """Base class for panels that load their table rows in a background worker.
+
+    A panel's `refresh_data` calls `_begin_load` and starts a thread worker
+    in its own exclusive worker group, so starting a load cancels the one
+    still running. The worker reads the rows into an immutable snapshot and
+    passes it back to the UI thread, where `_end_load` drops it unless it
+    belongs to the most recent load. If a load takes longer than
+    `_LOADING_INDICATOR_DELAY`, the tables show a loading indicator until
+    it is applied.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._load_id = 0
+        self._loading_timer: Timer | None = None
+
+    def _begin_load(self, *tables: DataTable) -> int:
+        """Register a new load of `tables` and return its ID."""
+        self._load_id += 1
+        if self._loading_timer is not None:
+            self._loading_timer.stop()
+        self._loading_timer = self.set_timer(
+            _LOADING_INDICATOR_DELAY, partial(self._set_loading, tables, True)
+        )
+        return self._load_id
+
+    def _end_load(self, load_id: int, *tables: DataTable) -> bool:
+        """Return whether the load `load_id` is current, and if so clear its indicator."""
+        if load_id != self._load_id:
+            return False
+        if self._loading_timer is not None:
+            self._loading_timer.stop()
+            self._loading_timer = None
+        self._set_loading(tables, False)
+        return True
+
+    @staticmethod
+    def _set_loading(tables: Sequence[DataTable], loading: bool) -> None:
+        for table in tables:
+            table.loading = loading
+
+    def _deliver[T](
+        self, load: Callable[[], T], apply: Callable[[T], None], empty: T
+    ) -> None:
+        """Run `load` in the current worker and pass its result to `apply` on the UI thread.
+
+        Database errors (e.g. the project was deleted from the CLI) show
+        `empty` instead. Nothing is delivered if the worker was cancelled.
+        """
+        try:
+            result = load()
+        except (NoResultFound, RuntimeError, SQLAlchemyError) as exc:
+            logger.debug(f"Unable to load {type(self).__name__} rows: {exc}")
+            result = empty
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(apply, result)
+
+
 # ---------------------------------------------------------------------------
 # Project tab
 # ---------------------------------------------------------------------------
 
 
-class ProjectPanel(Widget):
+class ProjectPanel(_LoadingPanel):
     """Event and station tables for the Project tab.
 
     Owns both `VimDataTable`s (events and stations), the shared quality
@@ -382,74 +631,67 @@ class ProjectPanel(Widget):
         )
 
     def refresh_data(self, current_event_id: uuid.UUID | None) -> None:
-        et = self.query_one("#project-event-table", DataTable)
-        st = self.query_one("#project-station-table", DataTable)
-        et_saved, st_saved = et.cursor_row, st.cursor_row
-        et.clear()
-        st.clear()
-        with suppress(NoResultFound, RuntimeError):
-            with Session(engine) as session:
-                event_rows = dump_event_table(
-                    session,
-                    from_read_model=True,
-                    by_title=True,
-                    exclude=_EVENT_TABLE_EXCLUDE,
-                )
-                station_rows = dump_station_table(
-                    session,
-                    from_read_model=True,
-                    by_title=True,
-                    exclude=_STATION_TABLE_EXCLUDE,
-                )
-                used_station_ids: set[str] = (
-                    {
-                        str(station_id)
-                        for station_id in session.exec(
-                            select(AimbatSeismogram.station_id)
-                            .where(AimbatSeismogram.event_id == current_event_id)
-                            .distinct()
-                        ).all()
-                    }
-                    if current_event_id is not None
-                    else set()
-                )
+        et = self.query_one("#project-event-table", _EventTable)
+        st = self.query_one("#project-station-table", _StationTable)
+        self._load_rows(self._begin_load(et, st), current_event_id)
+
+    @work(thread=True, exclusive=True, group="project-panel-load")
+    @profiled("tui-load-project")
+    def _load_rows(self, load_id: int, current_event_id: uuid.UUID | None) -> None:
+        """Background worker: read the event and station rows."""
+        self._deliver(
+            partial(_load_project_rows, current_event_id),
+            partial(self._apply_rows, load_id, current_event_id),
+            _ProjectRows(),
+        )
 
-            total = len(event_rows)
-            completed = sum(1 for r in event_rows if r.get("Completed"))
-            et.border_title = (
-                f"Events  [dim]{total} total · {completed} completed[/dim]"
+    def _apply_rows(
+        self, load_id: int, current_event_id: uuid.UUID | None, rows: _ProjectRows
+    ) -> None:
+        et = self.query_one("#project-event-table", _EventTable)
+        st = self.query_one("#project-station-table", _StationTable)
+        if not self._end_load(load_id, et, st):
+            return
+        et_saved = (et, _cursor_key(et), et.cursor_row)
+        st_saved = (st, _cursor_key(st), st.cursor_row)
+
+        total = len(rows.events)
+        completed = sum(1 for r in rows.events if r.get("Completed"))
+        et.border_title = f"Events  [dim]{total} total · {completed} completed[/dim]"
+
+        st.border_title = "Stations"
+        if current_event_id is not None:
+            active = next(
+                (r for r in rows.events if r.get("ID") == str(current_event_id)),
+                None,
             )
-
-            if current_event_id is not None:
-                active = next(
-                    (r for r in event_rows if r.get("ID") == str(current_event_id)),
-                    None,
+            if active is not None:
+                _sc_key = tui_display_title(AimbatEventRead, "station_count")
+                st.border_title = (
+                    f"Stations  [dim]{active.get(_sc_key, '?')} in active event[/dim]"
                 )
-                if active is not None:
-                    _sc_key = tui_display_title(AimbatEventRead, "station_count")
-                    st.border_title = f"Stations  [dim]{active.get(_sc_key, '?')} in active event[/dim]"
-
-            _populate_rows(
-                et,
-                event_rows,
-                AimbatEventRead,
-                on_row=lambda row: (
-                    "▶" if str(row["ID"]) == str(current_event_id) else " ",
-                ),
-            )
-            _populate_rows(
-                st,
-                station_rows,
-                AimbatStationRead,
-                row_style=lambda row: (
-                    None
-                    if current_event_id is None or str(row["ID"]) in used_station_ids
-                    else "dim"
-                ),
-            )
+
+        _sync_rows(
+            et,
+            rows.events,
+            AimbatEventRead,
+            on_row=lambda row: (
+                "▶" if str(row["ID"]) == str(current_event_id) else " ",
+            ),
+        )
+        _sync_rows(
+            st,
+            rows.stations,
+            AimbatStationRead,
+            row_style=lambda row: (
+                None
+                if current_event_id is None or str(row["ID"]) in rows.used_station_ids
+                else "dim"
+            ),
+        )
 
         self._refreshing = True
-        _settle_cursor(self, [(et, et_saved), (st, st_saved)], self._on_settled)
+        _settle_cursor(self, [et_saved, st_saved], self._on_settled)
 
     def _dispatch_row_action(self, tab: str, item_id: str, action: str) -> None:
         self.post_message(self.RowActionChosen(tab, item_id, action))
@@ -542,7 +784,48 @@ class ProjectPanel(Widget):
 # ---------------------------------------------------------------------------
 
 
-class SeismogramPanel(Widget):
+@dataclass(frozen=True)
+class _Preview:
+    """CC and context traces of a seismogram, decimated for plotting."""
+
+    cc_times: list[float]
+    cc_data: list[float]
+    context_times: list[float]
+    context_data: list[float]
+
+
+def _make_preview(
+    bound: BoundICCS, seismogram_id: uuid.UUID, resolution: int
+) -> _Preview | None:
+    """Build the preview of a seismogram, or return `None` if it can't be plotted.
+
+    The traces are reduced to their min/max envelope at `resolution` points
+    across, so converting and plotting them costs the same for long and short
+    traces.
+    """
+    idx = bound.index_of(seismogram_id)
+    if idx is None:
+        return None
+    iccs = bound.iccs
+    parent = iccs.seismograms[idx]
+    pick = parent.t1 if parent.t1 is not None else parent.t0
+    try:
+        cc_seis = iccs.cc_seismograms[idx]
+        ctx_seis = iccs.context_seismograms[idx]
+    except Exception:
+        return None
+    cc_times, cc_data = minmax_decimate(
+        relative_time_array(cc_seis, pick), cc_seis.data, resolution
+    )
+    ctx_times, ctx_data = minmax_decimate(
+        relative_time_array(ctx_seis, pick), ctx_seis.data, resolution
+    )
+    return _Preview(
+        cc_times.tolist(), cc_data.tolist(), ctx_times.tolist(), ctx_data.tolist()
+    )
+
+
+class SeismogramPanel(_LoadingPanel):
     """Seismogram table, waveform plot, and note widget for the Live data tab.
 
     Call `refresh_data` to reload from the database and cache the current
@@ -568,6 +851,8 @@ class SeismogramPanel(Widget):
         self._highlighted_id: str | None = None
         self._refreshing: bool = False
         self._bound_iccs: BoundICCS | None = None
+        self._previews: dict[uuid.UUID, _Preview | None] = {}
+        self._preview_state: tuple[int, Timestamp, int] | None = None
         _setup_table(
             self,
             "#seismogram-table",
@@ -580,10 +865,10 @@ class SeismogramPanel(Widget):
         self, current_event_id: uuid.UUID | None, bound_iccs: BoundICCS | None
     ) -> None:
         self._bound_iccs = bound_iccs
-        table = self.query_one("#seismogram-table", DataTable)
-        saved_row = table.cursor_row
-        table.clear()
+        table = self.query_one("#seismogram-table", _SeismogramTable)
 
+        # Read the live CCs here rather than in the worker, as an alignment
+        # worker may be updating the ICCS instance.
         live_cc_map: dict[str, float] = {}
         if bound_iccs is not None:
             with suppress(AttributeError, ValueError):
@@ -592,40 +877,31 @@ class SeismogramPanel(Widget):
                 ):
                     live_cc_map[str(iccs_seis.extra["id"])] = float(cc)
 
-        with suppress(NoResultFound, RuntimeError):
-            with Session(engine) as session:
-                event = (
-                    session.get(AimbatEvent, current_event_id)
-                    if current_event_id is not None
-                    else None
-                )
-                rows = (
-                    dump_seismogram_table(
-                        session,
-                        from_read_model=True,
-                        by_title=True,
-                        exclude=_SEISMOGRAM_TABLE_EXCLUDE,
-                        event_id=event.id,
-                    )
-                    if event is not None
-                    else None
-                )
+        self._load_rows(self._begin_load(table), current_event_id, live_cc_map)
 
-            if rows is not None:
-                for row in rows:
-                    seis_id = str(row["ID"])
-                    if seis_id in live_cc_map:
-                        row["Stack CC"] = live_cc_map[seis_id]
-
-                rows.sort(
-                    key=lambda r: (
-                        r["Stack CC"] if r.get("Stack CC") is not None else -2.0
-                    ),
-                    reverse=True,
-                )
+    @work(thread=True, exclusive=True, group="seismogram-panel-load")
+    @profiled("tui-load-seismograms")
+    def _load_rows(
+        self,
+        load_id: int,
+        current_event_id: uuid.UUID | None,
+        live_cc_map: Mapping[str, float],
+    ) -> None:
+        """Background worker: read the seismogram rows of the current event."""
+        self._deliver(
+            partial(_load_seismogram_rows, current_event_id, live_cc_map),
+            partial(self._apply_rows, load_id),
+            (),
+        )
 
-                _populate_rows(table, rows, AimbatSeismogramRead)
+    def _apply_rows(self, load_id: int, rows: _Rows) -> None:
+        table = self.query_one("#seismogram-table", _SeismogramTable)
+        if not self._end_load(load_id, table):
+            return
+        saved = (table, _cursor_key(table), table.cursor_row)
+        _sync_rows(table, rows, AimbatSeismogramRead)
 
+        bound_iccs = self._bound_iccs
         stats = cc_stats(bound_iccs.iccs) if bound_iccs is not None else None
         if stats is not None and stats.n_all > 0:
             table.border_title = (
@@ -639,7 +915,7 @@ class SeismogramPanel(Widget):
         self._refreshing = True
         if table.row_count == 0:
             self._highlighted_id = None
-        _settle_cursor(self, [(table, saved_row)], self._on_settled)
+        _settle_cursor(self, [saved], self._on_settled)
 
     def clear_selection_if_empty(self) -> None:
         if self.query_one("#seismogram-table", DataTable).row_count == 0:
@@ -684,37 +960,32 @@ class SeismogramPanel(Widget):
             plot_widget = self.query_one("#seismogram-plot", SeismogramPlotWidget)
         except NoMatches:
             return
-        if item_id is None or self._bound_iccs is None:
+        bound = self._bound_iccs
+        if item_id is None or bound is None:
             plot_widget.clear()
             return
+
+        # Previews stay valid until the ICCS instance is replaced or changed
+        # in place (which stamps `created_at`), or the plot is resized.
+        state = (id(bound.iccs), bound.created_at, plot_widget.resolution)
+        if state != self._preview_state:
+            self._previews.clear()
+            self._preview_state = state
         seis_uuid = uuid.UUID(item_id)
-        iccs = self._bound_iccs.iccs
-        idx = next(
-            (
-                i
-                for i, s in enumerate(iccs.seismograms)
-                if s.extra.get("id") == seis_uuid
-            ),
-            None,
-        )
-        if idx is None:
-            plot_widget.clear()
-            return
-        parent = iccs.seismograms[idx]
-        pick = parent.t1 if parent.t1 is not None else parent.t0
-        try:
-            cc_seis = iccs.cc_seismograms[idx]
-            ctx_seis = iccs.context_seismograms[idx]
-        except Exception:
+        if seis_uuid not in self._previews:
+            self._previews[seis_uuid] = _make_preview(
+                bound, seis_uuid, plot_widget.resolution
+            )
+        preview = self._previews[seis_uuid]
+
+        if preview is None:
             plot_widget.clear()
             return
-        cc_times = relative_time_array(cc_seis, pick).tolist()
-        ctx_times = relative_time_array(ctx_seis, pick).tolist()
         plot_widget.update_plots(
-            cc_times,
-            cc_seis.data.tolist(),
-            ctx_times,
-            ctx_seis.data.tolist(),
+            preview.cc_times,
+            preview.cc_data,
+            preview.context_times,
+            preview.context_data,
         )
 
     def _on_settled(self) -> None:
@@ -728,7 +999,7 @@ class SeismogramPanel(Widget):
 # ---------------------------------------------------------------------------
 
 
-class SnapshotPanel(Widget):
+class SnapshotPanel(_LoadingPanel):
     """Snapshot table, quality panel, and note widget for the Snapshots tab.
 
     Pushes `SnapshotActionMenuModal` itself (it has extra preview/save
@@ -767,26 +1038,29 @@ class SnapshotPanel(Widget):
         )
 
     def refresh_data(self, current_event_id: uuid.UUID | None) -> None:
-        table = self.query_one("#snapshot-table", DataTable)
-        saved_row = table.cursor_row
-        table.clear()
-        with suppress(NoResultFound, RuntimeError):
-            if current_event_id is not None:
-                with Session(engine) as session:
-                    event = session.get(AimbatEvent, current_event_id)
-                    if event is not None:
-                        snapshots = dump_snapshot_table(
-                            session,
-                            from_read_model=True,
-                            by_title=True,
-                            exclude=_SNAPSHOT_TABLE_EXCLUDE,
-                            event_id=event.id,
-                        )
-                        _populate_rows(table, snapshots, AimbatSnapshotRead)
+        table = self.query_one("#snapshot-table", _SnapshotTable)
+        self._load_rows(self._begin_load(table), current_event_id)
+
+    @work(thread=True, exclusive=True, group="snapshot-panel-load")
+    @profiled("tui-load-snapshots")
+    def _load_rows(self, load_id: int, current_event_id: uuid.UUID | None) -> None:
+        """Background worker: read the snapshot rows of the current event."""
+        self._deliver(
+            partial(_load_snapshot_rows, current_event_id),
+            partial(self._apply_rows, load_id),
+            (),
+        )
+
+    def _apply_rows(self, load_id: int, rows: _Rows) -> None:
+        table = self.query_one("#snapshot-table", _SnapshotTable)
+        if not self._end_load(load_id, table):
+            return
+        saved = (table, _cursor_key(table), table.cursor_row)
+        _sync_rows(table, rows, AimbatSnapshotRead)
         self._refreshing = True
         if table.row_count == 0:
             self._highlighted_id = None
-        _settle_cursor(self, [(table, saved_row)], self._on_settled)
+        _settle_cursor(self, [saved], self._on_settled)
 
     def clear_selection_if_empty(self) -> None:
         if self.query_one("#snapshot-table", DataTable).row_count == 0:
@@ -73,6 +73,15 @@ class SeismogramPlotWidget(Widget):
             with TabPane("Context", id="seis-plot-tab-context"):
                 yield PlotextPlot(id="seis-context-plot")
 
+    @property
+    def resolution(self) -> int:
+        """Number of braille dots across the plot area.
+
+        Traces with many more samples than this can be decimated before
+        plotting without any visible difference.
+        """
+        return 2 * max(self.size.width, 40)
+
     def update_plots(
         self,
         cc_times: list[float],
@@ -32,6 +32,7 @@ from textual_fspicker import FileOpen, FileSave, Filters
 from pysmo.tools.iccs import ICCS
 
 from aimbat import settings
+from aimbat._tui._changes import ChangeWatcher, ProjectChanges
 from aimbat._tui._panels import ProjectPanel, SeismogramPanel, SnapshotPanel
 from aimbat._tui.modals import (
     ActionMenuModal,
@@ -88,6 +89,7 @@ from aimbat.plot import (
     update_pick,
     update_timewindow,
 )
+from aimbat.utils import profiled
 from aimbat.utils.formatters import fmt_timestamp
 
 from ._format import tui_cell, tui_display_title
@@ -259,10 +261,12 @@ class AimbatTUI(App[None]):
         self._iccs_retry_pending: bool = False
         self._current_event_id: uuid.UUID | None = None
         self._active_tab: str = "tab-project"
+        self._changes = ChangeWatcher(engine)
 
         self.theme = _DEFAULT_THEME
 
-        self.set_interval(5, self._check_iccs_staleness)
+        self.set_interval(1, self._poll_changes)
+        self.set_interval(5, self._retry_iccs_creation)
 
         logger.info("TUI started.")
         if not _project_exists(engine):
@@ -277,6 +281,9 @@ class AimbatTUI(App[None]):
                 self._create_iccs()
                 self.refresh_all()
 
+    def on_unmount(self) -> None:
+        self._changes.close()
+
     def _on_no_project_modal(self, create: bool | None) -> None:
         if create:
             logger.info("User chose to create a new project.")
@@ -434,6 +441,7 @@ class AimbatTUI(App[None]):
         self._worker_create_iccs(is_retry)
 
     @work(thread=True)
+    @profiled("tui-create-iccs")
     def _worker_create_iccs(self, is_retry: bool = False) -> None:
         """Background worker: create ICCS instance without blocking the UI."""
         try:
@@ -475,10 +483,13 @@ class AimbatTUI(App[None]):
 
         Call this after any mutation by default. Only use a targeted
         `<Panel>.refresh_data(...)` call when you can name the specific
-        reason no other panel's displayed data (including `column_property`
+        reason no other panel's displayed data (including the trigger-maintained
         counts and the live quality getters) is affected, and record that
         reasoning as a comment at the call site.
         """
+        # Re-baseline first: a write landing during the refresh is reported
+        # again by the next poll rather than missed.
+        self._changes.reset()
         self.refresh_bindings()
         self._refresh_event_bar()
         self.query_one(ProjectPanel).refresh_data(self._current_event_id)
@@ -487,7 +498,49 @@ class AimbatTUI(App[None]):
         )
         self.query_one(SnapshotPanel).refresh_data(self._current_event_id)
 
-    def _check_iccs_staleness(self) -> None:
+    def _poll_changes(self) -> None:
+        """Refresh the panels showing data that was changed outside the TUI.
+
+        Asks the `ChangeWatcher` which events, snapshots, stations and notes
+        were written by other connections since the last poll or refresh, and
+        only reloads the panels displaying them: changes to other events only
+        touch the project tables, and the live data and snapshot tabs are
+        reloaded only when the current event's seismograms or snapshots
+        changed. Notes are shown in several panels and are rarely edited
+        elsewhere, so a note change refreshes everything.
+        """
+        changes = self._changes.poll()
+        if changes is None:
+            return
+        logger.debug(f"External changes detected: {changes}.")
+        if changes.notes:
+            self.refresh_all()
+            return
+        self._refresh_changed(changes)
+
+    def _refresh_changed(self, changes: ProjectChanges) -> None:
+        current_event_id = self._current_event_id
+        if current_event_id in changes.events:
+            if self._check_iccs_staleness():
+                return
+            self.refresh_bindings()
+            # Also clears `_current_event_id` if the event was deleted.
+            self._refresh_event_bar()
+            self.query_one(SeismogramPanel).refresh_data(
+                self._current_event_id, self._bound_iccs
+            )
+        # Event rows include the snapshot count, station rows the seismogram
+        # counts of every event.
+        self.query_one(ProjectPanel).refresh_data(self._current_event_id)
+        if current_event_id in changes.snapshots:
+            self.query_one(SnapshotPanel).refresh_data(self._current_event_id)
+
+    def _retry_iccs_creation(self) -> None:
+        """Give a failed ICCS creation its one automatic retry."""
+        if self._iccs_retry_pending:
+            self._check_iccs_staleness()
+
+    def _check_iccs_staleness(self) -> bool:
         """Trigger ICCS recreation if the current event has been modified externally.
 
         When ICCS creation previously failed (e.g. due to an invalid parameter set via
@@ -495,9 +548,12 @@ class AimbatTUI(App[None]):
         `event.last_modified` to change again before retrying further — this avoids
         retrying forever against a persistently failing event. On any detected
         change the full UI is refreshed so panels reflect the new DB state immediately.
+
+        Returns:
+            True if the UI was refreshed.
         """
         if self._current_event_id is None:
-            return
+            return False
         try:
             with Session(engine) as session:
                 event = self._get_current_event(session)
@@ -508,7 +564,7 @@ class AimbatTUI(App[None]):
                     else last_modified != self._iccs_last_modified_seen
                 )
         except (NoResultFound, RuntimeError):
-            return
+            return False
         if stale:
             logger.debug(
                 "ICCS staleness detected; recreating instance and refreshing UI."
@@ -516,10 +572,13 @@ class AimbatTUI(App[None]):
             self._iccs_last_modified_seen = last_modified
             self._create_iccs()
             self.refresh_all()
-        elif self._iccs_retry_pending:
+            return True
+        if self._iccs_retry_pending:
             logger.debug("Retrying ICCS creation after a previous failure.")
             self._create_iccs(is_retry=True)
             self.refresh_all()
+            return True
+        return False
 
     def _refresh_event_bar(self) -> None:
         bar = self.query_one("#event-bar", Static)
@@ -657,12 +716,12 @@ class AimbatTUI(App[None]):
                 new_value = not getattr(seis.parameters, param)
                 set_seismogram_parameter(session, seis_uuid, param, new_value)
             if self._bound_iccs is not None:
-                for iccs_seis in self._bound_iccs.iccs.seismograms:
-                    if iccs_seis.extra.get("id") == seis_uuid:
-                        setattr(iccs_seis, param, new_value)
-                        self._bound_iccs.iccs.clear_cache()
-                        self._bound_iccs.created_at = Timestamp.now("UTC")
-                        break
+                idx = self._bound_iccs.index_of(seis_uuid)
+                if idx is not None:
+                    iccs_seis = self._bound_iccs.iccs.seismograms[idx]
+                    setattr(iccs_seis, param, new_value)
+                    self._bound_iccs.iccs.clear_cache()
+                    self._bound_iccs.created_at = Timestamp.now("UTC")
             # Deliberately scoped: this only mutates the in-memory ICCS instance
             # and clears its cache, without re-upserting iccs_cc, so no other
             # panel's displayed data (quality panels, station cc_mean/cc_sem)
@@ -957,6 +1016,7 @@ class AimbatTUI(App[None]):
         self.push_screen(AlignModal(), on_result)
 
     @work(thread=True)
+    @profiled("tui-align")
     def _run_align_tool(
         self,
         bound: BoundICCS,
@@ -14,40 +14,94 @@ to identify the record unambiguously — from the shortest displayed prefix up t
 the full UUID. Dashes are optional.
 """
 
+import ast
 import sys
-from importlib import metadata
+import tokenize
+from importlib import metadata, util
 
 from cyclopts import App
 from rich.console import Console
 
-import aimbat._cli as cli
+from aimbat import settings
 
 try:
     __version__ = str(metadata.version("aimbat"))
 except Exception:
     __version__ = "unknown"
 
+# Sub-apps by command name. They are registered by import path and only imported
+# when their command is run, so e.g. `aimbat --help` does not import the models,
+# SQLModel or pysmo.
+_COMMANDS = {
+    "align": "aimbat._cli.align",
+    "api": "aimbat._cli.api",
+    "batch": "aimbat._cli.batch",
+    "data": "aimbat._cli.data",
+    "db": "aimbat._cli.db",
+    "event": "aimbat._cli.event",
+    "tool": "aimbat._cli.tool",
+    "plot": "aimbat._cli.plot",
+    "project": "aimbat._cli.project",
+    "seismogram": "aimbat._cli.seismogram",
+    "snapshot": "aimbat._cli.snapshot",
+    "station": "aimbat._cli.station",
+    "utils": "aimbat._cli.utils.app",
+    "serve": "aimbat._cli.serve",
+    "shell": "aimbat._cli.shell",
+    "tui": "aimbat._cli.tui",
+}
+
+
+def _module_docstring(module: str) -> str | None:
+    """Read the docstring of a module without importing it.
+
+    The sub-apps use their module docstring as help. Lazily registered commands
+    need it up front to be listed in the help of the main app.
+
+    Args:
+        module: Name of the module.
+
+    Returns:
+        The docstring, or `None` if the module has none.
+    """
+    spec = util.find_spec(module)
+    if spec is None or spec.origin is None:
+        return None
+    with tokenize.open(spec.origin) as f:
+        for token in tokenize.generate_tokens(f.readline):
+            if token.type in (tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE):
+                continue
+            if token.type == tokenize.STRING:
+                return ast.literal_eval(token.string)
+            return None
+    return None
+
+
 console = Console()
 
 app = App(version=__version__, help=__doc__, help_format="markdown", console=console)
-app.command(cli.align)
-app.command(cli.data)
-app.command(cli.db)
-app.command(cli.event)
-app.command(cli.tool)
-app.command(cli.plot)
-app.command(cli.project)
-app.command(cli.seismogram)
-app.command(cli.snapshot)
-app.command(cli.station)
-app.command(cli.utils)
-app.command(cli.shell)
-app.command(cli.tui)
+for _name, _module in _COMMANDS.items():
+    app.command(f"{_module}:app", name=_name, help=_module_docstring(_module))
+
+
+def main() -> None:
+    """Entry point of the `aimbat` command.
+
+    Forwards the command to a running `aimbat serve` daemon if enabled with
+    `AIMBAT_DAEMON`, and runs it in-process otherwise.
+    """
+    if settings.daemon:
+        from aimbat._cli._daemon import forward
+
+        code = forward(sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
+    app()
 
 
 if __name__ == "__main__":
     try:
-        app()
+        main()
     except Exception:
         console.print_exception(show_locals=True)
         sys.exit(1)
@@ -11,10 +11,13 @@ All functions take a SQLModel `Session` and work with the models in
 - **ICCS / MCCC** — run the Iterative Cross-Correlation and Stack (`run_iccs`)
   and Multi-Channel Cross-Correlation (`run_mccc`) algorithms; update picks,
   time windows, and correlation thresholds.
-- **Snapshots** — save, restore, and delete parameter snapshots
-  (`create_snapshot`, `rollback_to_snapshot`).
-- **Project** — create and delete the project database (`create_project`,
-  `delete_project`).
+- **Snapshots** — save, restore, delete, and prune parameter snapshots
+  (`create_snapshot`, `rollback_to_snapshot`, `prune_snapshots`).
+- **Export** — stream a table to NDJSON or CSV without loading it into
+  memory (`export_table`, `iter_table_rows`), and export the results of every
+  event as one Parquet/Feather/CSV table (`export_results_table`).
+- **Project** — create, delete, and vacuum the project database
+  (`create_project`, `delete_project`, `vacuum_project`).
 - **Migrations** — bring an existing project database up to date with the
   current schema via Alembic (`upgrade_project`, `get_current_revision`).
 """
@@ -25,6 +28,7 @@ _internal_names = set(dir())
 
 from ._data import *
 from ._event import *
+from ._export import *
 from ._iccs import *
 from ._migrations import *
 from ._note import *
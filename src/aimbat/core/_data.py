@@ -16,7 +16,7 @@ from aimbat.io import (
     supports_seismogram_creation,
     supports_station_creation,
 )
-from aimbat.logger import logger
+from aimbat.logger import Span, annotate_span, logger
 from aimbat.models._models import (
     AimbatDataSource,
     AimbatEvent,
@@ -197,6 +197,7 @@ def _process_datasource(
     return aimbat_data_source
 
 
+@Span("data.add")
 def add_data_to_project(
     session: Session,
     data_sources: Sequence[os.PathLike | str],
@@ -243,6 +244,7 @@ def add_data_to_project(
     """
 
     logger.info(f"Adding {len(data_sources)} {data_type} data sources to project.")
+    annotate_span(data_sources=len(data_sources), data_type=data_type, dry_run=dry_run)
 
     if station_id is not None and session.get(AimbatStation, station_id) is None:
         raise NoResultFound(f"No station found with ID {station_id}.")
@@ -267,6 +269,7 @@ def add_data_to_project(
                     added_datasources.append(result)
                 if on_progress is not None:
                     on_progress(done, total)
+            annotate_span(added=len(added_datasources))
 
             if dry_run:
                 logger.info("Dry run: displaying data that would be added.")
@@ -237,10 +237,9 @@ def dump_event_table(
     if exclude is not None:
         exclude: dict[str, set] = {"__all__": exclude}  # type: ignore[no-redef]
 
+    # Counts come from trigger-maintained columns, so the seismograms themselves
+    # don't need to be loaded.
     statement = select(AimbatEvent).options(
-        selectinload(rel(AimbatEvent.seismograms)).selectinload(
-            rel(AimbatSeismogram.parameters)
-        ),
         selectinload(rel(AimbatEvent.parameters)),
         selectinload(rel(AimbatEvent.quality)),
     )
@@ -0,0 +1,368 @@
+import csv
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, Literal, TextIO
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter
+from sqlalchemy import and_, func
+from sqlalchemy import select as sa_select
+from sqlmodel import Session, SQLModel, col, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from aimbat.logger import Span, annotate_span, logger
+from aimbat.models import (
+    AimbatEvent,
+    AimbatEventQualitySnapshot,
+    AimbatSeismogram,
+    AimbatSnapshot,
+    AimbatSnapshotPayload,
+    AimbatStation,
+)
+from aimbat.models._payload import unpack_seismogram_snapshot_columns
+
+__all__ = [
+    "ExportFormat",
+    "ResultsFormat",
+    "iter_table_rows",
+    "export_table",
+    "get_results_table",
+    "export_results_table",
+    "RESULTS_COLUMNS",
+]
+
+type ExportFormat = Literal["ndjson", "csv"]
+type ResultsFormat = Literal["parquet", "feather", "csv"]
+
+RESULTS_COLUMNS = (
+    "snapshot_id",
+    "snapshot_time",
+    "snapshot_comment",
+    "event_id",
+    "event_time",
+    "event_latitude",
+    "event_longitude",
+    "event_depth",
+    "mccc_rmse",
+    "seismogram_id",
+    "network",
+    "station",
+    "location",
+    "channel",
+    "station_latitude",
+    "station_longitude",
+    "station_elevation",
+    "select",
+    "flip",
+    "t1",
+    "iccs_cc",
+    "mccc_cc_mean",
+    "mccc_cc_std",
+    "mccc_error",
+)
+"""Columns of the table returned by `get_results_table`, in order."""
+
+
+def _iter_table[T: SQLModel](
+    session: Session,
+    model: type[T],
+    statement: SelectOfScalar[T] | None,
+    batch_size: int,
+) -> Iterator[T]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    if statement is None:
+        statement = select(model)
+
+    # `yield_per` fetches rows from the cursor in batches instead of loading the
+    # whole result, and the session's identity map only holds weak references,
+    # so rows that have been written out can be garbage collected.
+    yield from session.exec(statement.execution_options(yield_per=batch_size))
+
+
+def iter_table_rows(
+    session: Session,
+    model: type[SQLModel],
+    by_alias: bool = False,
+    exclude: set[str] | None = None,
+    statement: SelectOfScalar | None = None,
+    batch_size: int = 1000,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over a table as JSON serialisable dicts, one row at a time.
+
+    Unlike the `dump_*_table` functions this does not build a list of the
+    whole table, so memory use does not grow with the number of rows.
+
+    Args:
+        session: Database session.
+        model: AIMBAT ORM model (table) to iterate over.
+        by_alias: Whether to use serialization aliases for the field names.
+        exclude: Set of field names to exclude from the output.
+        statement: Select statement for `model` to iterate over instead of the
+            whole table (e.g. to filter by event).
+        batch_size: Number of rows fetched from the database at a time.
+
+    Yields:
+        One dict per row.
+
+    Raises:
+        ValueError: If `batch_size` is smaller than 1.
+    """
+    adapter: TypeAdapter[SQLModel] = TypeAdapter(model)
+    for row in _iter_table(session, model, statement, batch_size):
+        yield adapter.dump_python(row, mode="json", exclude=exclude, by_alias=by_alias)
+
+
+@Span("export.table")
+def export_table(
+    session: Session,
+    model: type[SQLModel],
+    file: TextIO,
+    format: ExportFormat = "ndjson",
+    by_alias: bool = False,
+    exclude: set[str] | None = None,
+    statement: SelectOfScalar | None = None,
+    batch_size: int = 1000,
+) -> int:
+    """Stream a table to a file as NDJSON or CSV.
+
+    Rows are serialised and written as they are read from the database, so
+    output starts immediately and memory use stays constant regardless of the
+    size of the table. NDJSON writes one JSON object per line. CSV writes a
+    header row with the field names followed by one line per row, with
+    missing values as empty fields (an empty table produces no output).
+
+    Args:
+        session: Database session.
+        model: AIMBAT ORM model (table) to export.
+        file: Text file (or stream such as `sys.stdout`) to write to.
+        format: Output format.
+        by_alias: Whether to use serialization aliases for the field names.
+        exclude: Set of field names to exclude from the output.
+        statement: Select statement for `model` to export instead of the whole
+            table (e.g. to filter by event).
+        batch_size: Number of rows fetched from the database at a time.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ValueError: If `batch_size` is smaller than 1.
+    """
+    logger.debug(f"Exporting {model.__name__} table as {format}.")
+    annotate_span(table=model.__name__, format=format)
+
+    count = 0
+
+    if format == "ndjson":
+        adapter: TypeAdapter[SQLModel] = TypeAdapter(model)
+        for row in _iter_table(session, model, statement, batch_size):
+            file.write(
+                adapter.dump_json(row, exclude=exclude, by_alias=by_alias).decode()
+            )
+            file.write("\n")
+            count += 1
+        annotate_span(rows=count)
+        return count
+
+    writer: csv.DictWriter | None = None
+    for data in iter_table_rows(
+        session, model, by_alias, exclude, statement, batch_size
+    ):
+        if writer is None:
+            writer = csv.DictWriter(file, fieldnames=list(data))
+            writer.writeheader()
+        writer.writerow(data)
+        count += 1
+    annotate_span(rows=count)
+    return count
+
+
+def get_results_table(
+    session: Session, snapshot_ids: Sequence[UUID] | None = None
+) -> pd.DataFrame:
+    """Collect the results of one snapshot per event into a single table.
+
+    This is the project-wide counterpart of `dump_snapshot_results`: one row
+    per seismogram, with the snapshot, event and station fields repeated on
+    every row so the table can be used directly by downstream tools (e.g.
+    tomographic inversions). The snapshots, events and payloads are read with
+    a single join, and the columns are built from the packed payloads with
+    numpy rather than through a Pydantic model per row. Seismograms deleted
+    since a snapshot was taken are left out.
+
+    Args:
+        session: Database session.
+        snapshot_ids: Snapshots to export. If none are provided, the most
+            recent snapshot of every event is used.
+
+    Returns:
+        DataFrame with the columns listed in `RESULTS_COLUMNS`. Times are
+            timezone-aware (UTC), durations are timedeltas and missing quality
+            metrics are `NaN`/`NaT`.
+    """
+    logger.debug("Collecting results table.")
+
+    statement = (
+        sa_select(
+            AimbatSnapshot.id,
+            AimbatSnapshot.time,
+            AimbatSnapshot.comment,
+            AimbatEvent.id,
+            AimbatEvent.time,
+            AimbatEvent.latitude,
+            AimbatEvent.longitude,
+            AimbatEvent.depth,
+            AimbatEventQualitySnapshot.mccc_rmse,
+            AimbatSnapshotPayload.data,
+        )
+        .select_from(AimbatSnapshot)
+        .join(AimbatEvent, col(AimbatEvent.id) == AimbatSnapshot.event_id)
+        .join(
+            AimbatSnapshotPayload,
+            col(AimbatSnapshotPayload.id) == AimbatSnapshot.payload_id,
+        )
+        .outerjoin(
+            AimbatEventQualitySnapshot,
+            col(AimbatEventQualitySnapshot.snapshot_id) == AimbatSnapshot.id,
+        )
+        .order_by(col(AimbatEvent.time))
+    )
+    seismogram_statement = (
+        sa_select(
+            AimbatSeismogram.id,
+            AimbatStation.network,
+            AimbatStation.name,
+            AimbatStation.location,
+            AimbatStation.channel,
+            AimbatStation.latitude,
+            AimbatStation.longitude,
+            AimbatStation.elevation,
+        )
+        .select_from(AimbatSeismogram)
+        .join(AimbatStation, col(AimbatStation.id) == AimbatSeismogram.station_id)
+    )
+
+    if snapshot_ids is None:
+        latest = (
+            sa_select(
+                AimbatSnapshot.event_id, func.max(AimbatSnapshot.time).label("time")
+            )
+            .group_by(col(AimbatSnapshot.event_id))
+            .subquery()
+        )
+        statement = statement.join(
+            latest,
+            and_(
+                latest.c.event_id == AimbatSnapshot.event_id,
+                latest.c.time == AimbatSnapshot.time,
+            ),
+        )
+    else:
+        statement = statement.where(col(AimbatSnapshot.id).in_(snapshot_ids))
+        seismogram_statement = seismogram_statement.where(
+            col(AimbatSeismogram.event_id).in_(
+                sa_select(AimbatSnapshot.event_id).where(
+                    col(AimbatSnapshot.id).in_(snapshot_ids)
+                )
+            )
+        )
+
+    connection = session.connection()
+
+    frames = []
+    for (
+        snapshot_id,
+        snapshot_time,
+        snapshot_comment,
+        event_id,
+        event_time,
+        event_latitude,
+        event_longitude,
+        event_depth,
+        mccc_rmse,
+        data,
+    ) in connection.execute(statement):
+        columns = unpack_seismogram_snapshot_columns(data)
+        if len(columns["seismogram_id"]) == 0:
+            continue
+        frame = pd.DataFrame(columns)
+        frame["snapshot_id"] = str(snapshot_id)
+        frame["snapshot_time"] = snapshot_time
+        frame["snapshot_comment"] = snapshot_comment
+        frame["event_id"] = str(event_id)
+        frame["event_time"] = event_time
+        frame["event_latitude"] = event_latitude
+        frame["event_longitude"] = event_longitude
+        frame["event_depth"] = np.nan if event_depth is None else event_depth
+        frame["mccc_rmse"] = np.timedelta64(
+            "NaT" if mccc_rmse is None else mccc_rmse.value, "ns"
+        )
+        frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame(columns=list(RESULTS_COLUMNS))
+
+    results = pd.concat(frames, ignore_index=True)
+    results["t1"] = results["t1"].dt.tz_localize("UTC")
+
+    stations = pd.DataFrame(
+        connection.execute(seismogram_statement).all(),
+        columns=[
+            "seismogram_id",
+            "network",
+            "station",
+            "location",
+            "channel",
+            "station_latitude",
+            "station_longitude",
+            "station_elevation",
+        ],
+    )
+    stations["seismogram_id"] = stations["seismogram_id"].astype(str)
+
+    results = results.merge(stations, on="seismogram_id", how="inner")
+    return results[list(RESULTS_COLUMNS)].reset_index(drop=True)
+
+
+@Span("export.results_table")
+def export_results_table(
+    session: Session,
+    path: Path,
+    format: ResultsFormat = "parquet",
+    snapshot_ids: Sequence[UUID] | None = None,
+) -> int:
+    """Write the project-wide results table to a columnar file.
+
+    Parquet and Feather output require `pyarrow` to be installed; CSV works
+    without it.
+
+    Args:
+        session: Database session.
+        path: Output file.
+        format: Output format.
+        snapshot_ids: Snapshots to export. If none are provided, the most
+            recent snapshot of every event is used.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ImportError: If `pyarrow` is needed for `format` but not installed.
+    """
+    logger.info(f"Exporting results table to {path} as {format}.")
+
+    results = get_results_table(session, snapshot_ids)
+
+    if format == "parquet":
+        results.to_parquet(path, index=False)
+    elif format == "feather":
+        results.to_feather(path)
+    else:
+        results.to_csv(path, index=False)
+
+    annotate_span(format=format, rows=len(results))
+    return len(results)
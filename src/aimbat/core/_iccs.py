@@ -1,6 +1,6 @@
 """Processing of data for AIMBAT."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID, uuid4
 
 from pandas import Timestamp
@@ -15,10 +15,11 @@ from pysmo.tools.iccs import (
 )
 
 from aimbat import settings
-from aimbat.logger import logger
+from aimbat.logger import Span, annotate_span, logger
 from aimbat.models import (
     AimbatEvent,
     AimbatSeismogram,
+    AimbatSeismogramParameters,
     AimbatSnapshot,
 )
 from aimbat.models._parameters import (
@@ -53,6 +54,28 @@ class BoundICCS:
     iccs: ICCS
     event_id: UUID
     created_at: Timestamp
+    _indices: dict[UUID, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def index_of(self, seismogram_id: UUID) -> int | None:
+        """Return the position of a seismogram in `iccs.seismograms`.
+
+        Looks the ID up in a map that is built on first use (and rebuilt if
+        the number of seismograms changes), instead of scanning the list.
+
+        Args:
+            seismogram_id: ID of the seismogram.
+
+        Returns:
+            The index, or `None` if the seismogram is not part of this instance.
+        """
+        seismograms = self.iccs.seismograms
+        if len(self._indices) != len(seismograms):
+            self._indices = {
+                seis.extra.get("id"): i for i, seis in enumerate(seismograms)
+            }
+        return self._indices.get(seismogram_id)
 
     def is_stale(self, event: AimbatEvent) -> bool:
         """Return True if the event has been modified since this ICCS was created.
@@ -122,6 +145,7 @@ def clear_iccs_cache() -> None:
     _iccs_cache.clear()
 
 
+@Span("iccs.build")
 def _build_iccs(
     event: AimbatEvent, parameters: AimbatEventParametersBase | None = None
 ) -> ICCS:
@@ -150,6 +174,7 @@ def _build_iccs(
         )
         for seis in event.seismograms
     ]
+    annotate_span(seismograms=len(seismograms))
     return ICCS(
         seismograms=seismograms,
         window_pre=p.window_pre,
@@ -211,12 +236,15 @@ def create_iccs_instance(session: Session, event: AimbatEvent) -> BoundICCS:
     return bound
 
 
+@Span("db.write_iccs_stats")
 def _write_iccs_stats(event_id: UUID, iccs: ICCS) -> None:
     """Upsert per-seismogram ICCS CC values into the live quality table.
 
     Iterates over the seismograms in the ICCS instance and writes (or
     overwrites) the Pearson cross-correlation coefficient for each one, preserving
-    any existing MCCC fields.
+    any existing MCCC fields. The existing quality rows are fetched with a single
+    query, so the number of statements does not grow with the number of
+    seismograms.
 
     Uses its own short-lived session so that the caller's session is not
     committed or expired as a side-effect.
@@ -229,26 +257,33 @@ def _write_iccs_stats(event_id: UUID, iccs: ICCS) -> None:
     from aimbat.models import AimbatSeismogramQuality
 
     logger.debug(f"Writing ICCS stats for event {event_id}.")
+    annotate_span(seismograms=len(iccs.seismograms))
+    cc_values = {
+        iccs_seis.extra["id"]: max(-1.0, min(1.0, float(cc)))
+        for iccs_seis, cc in zip(iccs.seismograms, iccs.ccs)
+    }
     with Session(_engine) as write_session:
-        for iccs_seis, cc in zip(iccs.seismograms, iccs.ccs):
-            seis_id = iccs_seis.extra["id"]
-            existing = write_session.exec(
+        existing = {
+            quality.seismogram_id: quality
+            for quality in write_session.exec(
                 select(AimbatSeismogramQuality).where(
-                    col(AimbatSeismogramQuality.seismogram_id) == seis_id
+                    col(AimbatSeismogramQuality.seismogram_id).in_(list(cc_values))
                 )
-            ).first()
-            cc_val = max(-1.0, min(1.0, float(cc)))
-            if existing is None:
-                row = AimbatSeismogramQuality(
+            )
+        }
+        for seis_id, cc_val in cc_values.items():
+            quality = existing.get(seis_id)
+            if quality is None:
+                quality = AimbatSeismogramQuality(
                     id=uuid4(), seismogram_id=seis_id, iccs_cc=cc_val
                 )
-                write_session.add(row)
             else:
-                existing.iccs_cc = cc_val
-                write_session.add(existing)
+                quality.iccs_cc = cc_val
+            write_session.add(quality)
         write_session.commit()
 
 
+@Span("db.write_mccc_quality")
 def _write_mccc_quality(
     event_id: UUID, iccs: ICCS, result: McccResult, all_seismograms: bool
 ) -> None:
@@ -279,6 +314,7 @@ def _write_mccc_quality(
     )
 
     logger.debug(f"Writing MCCC quality for event {event_id}.")
+    annotate_span(seismograms=len(iccs.seismograms))
     with Session(_engine) as write_session:
         # Event quality
         existing_eq = write_session.exec(
@@ -392,7 +428,7 @@ def build_iccs_from_snapshot(session: Session, snapshot_id: UUID) -> BoundICCS:
             .selectinload(rel(AimbatEvent.seismograms))
             .selectinload(rel(AimbatSeismogram.parameters)),
             selectinload(rel(AimbatSnapshot.event_parameters_snapshot)),
-            selectinload(rel(AimbatSnapshot.seismogram_parameters_snapshots)),
+            selectinload(rel(AimbatSnapshot.payload)),
         )
     )
     snapshot = session.exec(statement).one_or_none()
@@ -403,15 +439,14 @@ def build_iccs_from_snapshot(session: Session, snapshot_id: UUID) -> BoundICCS:
     ep = snapshot.event_parameters_snapshot
     snap_params = AimbatEventParametersBase.model_validate(ep)
 
-    # Build a map from seismogram_parameters_id → snapshot parameters
+    # Build a map from seismogram_id → snapshot parameters
     snap_seis_map = {
-        sp.seismogram_parameters_id: sp
-        for sp in snapshot.seismogram_parameters_snapshots
+        sp.seismogram_id: sp for sp in snapshot.seismogram_parameters_snapshots
     }
 
     seismograms = []
     for seis in snapshot.event.seismograms:
-        snap_sp = snap_seis_map.get(seis.parameters.id)
+        snap_sp = snap_seis_map.get(seis.id)
         if snap_sp is None:
             # Seismogram was added after the snapshot — use live parameters
             seis_params = AimbatSeismogramParametersBase.model_validate(seis.parameters)
@@ -468,9 +503,12 @@ def validate_iccs_construction(
     _build_iccs(event, parameters=parameters)
 
 
+@Span("db.write_back_seismograms")
 def _write_back_seismograms(session: Session, iccs: ICCS) -> None:
     """Write t1, flip, and select from ICCS seismograms back to the database.
 
+    The parameter rows of all seismograms are fetched with a single query, so
+    the number of statements does not grow with the number of seismograms.
     Calls `session.commit()` after writing; any other pending changes on
     `session` are also committed.
 
@@ -479,13 +517,24 @@ def _write_back_seismograms(session: Session, iccs: ICCS) -> None:
         iccs: ICCS instance whose seismograms carry UUIDs in their extra dict.
     """
     logger.debug(f"Writing back {len(iccs.seismograms)} seismogram parameters to DB.")
-
+    annotate_span(seismograms=len(iccs.seismograms))
+
+    db_parameters = {
+        parameters.seismogram_id: parameters
+        for parameters in session.exec(
+            select(AimbatSeismogramParameters).where(
+                col(AimbatSeismogramParameters.seismogram_id).in_(
+                    [seis.extra["id"] for seis in iccs.seismograms]
+                )
+            )
+        )
+    }
     for seis in iccs.seismograms:
-        db_seis = session.get(AimbatSeismogram, seis.extra["id"])
-        if db_seis is not None:
-            db_seis.parameters.t1 = seis.t1
-            db_seis.parameters.flip = seis.flip
-            db_seis.parameters.select = seis.select
+        parameters = db_parameters.get(seis.extra["id"])
+        if parameters is not None:
+            parameters.t1 = seis.t1
+            parameters.flip = seis.flip
+            parameters.select = seis.select
     session.commit()
 
 
@@ -540,7 +589,9 @@ def run_iccs(
 
     logger.info(f"Running ICCS (autoflip={autoflip}, autoselect={autoselect}).")
 
-    result = iccs(autoflip=autoflip, autoselect=autoselect)
+    with Span("iccs.run", seismograms=len(iccs.seismograms)) as span:
+        result = iccs(autoflip=autoflip, autoselect=autoselect)
+        span.set(iterations=len(result.convergence), converged=result.converged)
     n_iter = len(result.convergence)
     status = "converged" if result.converged else "did not converge"
     logger.info(f"ICCS {status} after {n_iter} iterations.")
@@ -568,11 +619,12 @@ def run_mccc(
         f"Running MCCC for event {event.id} (all_seismograms={all_seismograms})."
     )
 
-    result = iccs.run_mccc(
-        all_seismograms=all_seismograms,
-        min_cc=event.parameters.mccc_min_cc,
-        damping=event.parameters.mccc_damp,
-    )
+    with Span("mccc.run", seismograms=len(iccs.seismograms)):
+        result = iccs.run_mccc(
+            all_seismograms=all_seismograms,
+            min_cc=event.parameters.mccc_min_cc,
+            damping=event.parameters.mccc_damp,
+        )
     _write_back_seismograms(session, iccs)
     _write_iccs_stats(event.id, iccs)
     _write_mccc_quality(event.id, iccs, result, all_seismograms)
@@ -1,11 +1,12 @@
 from pathlib import Path
+from typing import Literal
 
-from sqlalchemy import Engine
+from sqlalchemy import Connection, Engine
 from sqlmodel import SQLModel, text
 
 from aimbat.logger import logger
 
-__all__ = ["create_project", "delete_project"]
+__all__ = ["create_project", "delete_project", "vacuum_project"]
 
 
 def _project_exists(engine: Engine) -> bool:
@@ -303,6 +304,170 @@ def create_project(engine: Engine) -> None:
             """)
             )
 
+            # Trigger 6a: Maintain the seismogram/station/event counters when a seismogram
+            # is added. The distinct station (event) count only goes up if no other
+            # seismogram of the same event (station) links the same station (event).
+            connection.execute(
+                text("""
+                CREATE TRIGGER IF NOT EXISTS counts_on_seismogram_insert
+                AFTER INSERT ON aimbatseismogram
+                BEGIN
+                    UPDATE aimbatevent
+                    SET seismogram_count = seismogram_count + 1,
+                        station_count = station_count + (NOT EXISTS (
+                            SELECT 1 FROM aimbatseismogram
+                            WHERE event_id = NEW.event_id AND station_id = NEW.station_id
+                              AND id != NEW.id
+                        ))
+                    WHERE id = NEW.event_id;
+                    UPDATE aimbatstation
+                    SET seismogram_count = seismogram_count + 1,
+                        event_count = event_count + (NOT EXISTS (
+                            SELECT 1 FROM aimbatseismogram
+                            WHERE station_id = NEW.station_id AND event_id = NEW.event_id
+                              AND id != NEW.id
+                        ))
+                    WHERE id = NEW.station_id;
+                END;
+            """)
+            )
+
+            # Trigger 6b: Maintain the counters when a seismogram is removed (including
+            # via ON DELETE CASCADE from its event or station).
+            connection.execute(
+                text("""
+                CREATE TRIGGER IF NOT EXISTS counts_on_seismogram_delete
+                AFTER DELETE ON aimbatseismogram
+                BEGIN
+                    UPDATE aimbatevent
+                    SET seismogram_count = seismogram_count - 1,
+                        station_count = station_count - (NOT EXISTS (
+                            SELECT 1 FROM aimbatseismogram
+                            WHERE event_id = OLD.event_id AND station_id = OLD.station_id
+                        ))
+                    WHERE id = OLD.event_id;
+                    UPDATE aimbatstation
+                    SET seismogram_count = seismogram_count - 1,
+                        event_count = event_count - (NOT EXISTS (
+                            SELECT 1 FROM aimbatseismogram
+                            WHERE station_id = OLD.station_id AND event_id = OLD.event_id
+                        ))
+                    WHERE id = OLD.station_id;
+                END;
+            """)
+            )
+
+            # Trigger 6c: Maintain the counters if a seismogram is moved to a different
+            # event or station.
+            connection.execute(
+                text("""
+                CREATE TRIGGER IF NOT EXISTS counts_on_seismogram_reparent
+                AFTER UPDATE OF event_id, station_id ON aimbatseismogram
+                WHEN (NEW.event_id IS NOT OLD.event_id)
+                  OR (NEW.station_id IS NOT OLD.station_id)
+                BEGIN
+                    -- Remove the row from its old parents first (it no longer matches the
+                    -- OLD pair), then add it to the new ones.
+                    UPDATE aimbatevent
+                    SET seismogram_count = seismogram_count - 1,
+                        station_count = station_count - (NOT EXISTS (
+                            SELECT 1 FROM aimbatseismogram
+                            WHERE event_id = OLD.event_id AND station_id = OLD.station_id
+                        ))
+                    WHERE id = OLD.event_id;
+                    UPDATE aimbatstation
+                    SET seismogram_count = seismogram_count - 1,
+                        event_count = event_count - (NOT EXISTS (
+                            SELECT 1 FROM aimbatseismogram
+                            WHERE station_id = OLD.station_id AND event_id = OLD.event_id
+                        ))
+                    WHERE id = OLD.station_id;
+                    UPDATE aimbatevent
+                    SET seismogram_count = seismogram_count + 1,
+                        station_count = station_count + (NOT EXISTS (
+                            SELECT 1 FROM aimbatseismogram
+                            WHERE event_id = NEW.event_id AND station_id = NEW.station_id
+                              AND id != NEW.id
+                        ))
+                    WHERE id = NEW.event_id;
+                    UPDATE aimbatstation
+                    SET seismogram_count = seismogram_count + 1,
+                        event_count = event_count + (NOT EXISTS (
+                            SELECT 1 FROM aimbatseismogram
+                            WHERE station_id = NEW.station_id AND event_id = NEW.event_id
+                              AND id != NEW.id
+                        ))
+                    WHERE id = NEW.station_id;
+                END;
+            """)
+            )
+
+            # Trigger 7a/7b: Maintain the per-event snapshot counter.
+            connection.execute(
+                text("""
+                CREATE TRIGGER IF NOT EXISTS snapshot_count_on_snapshot_insert
+                AFTER INSERT ON aimbatsnapshot
+                BEGIN
+                    UPDATE aimbatevent SET snapshot_count = snapshot_count + 1
+                    WHERE id = NEW.event_id;
+                END;
+            """)
+            )
+
+            connection.execute(
+                text("""
+                CREATE TRIGGER IF NOT EXISTS snapshot_count_on_snapshot_delete
+                AFTER DELETE ON aimbatsnapshot
+                BEGIN
+                    UPDATE aimbatevent SET snapshot_count = snapshot_count - 1
+                    WHERE id = OLD.event_id;
+                END;
+            """)
+            )
+
+            # Trigger 8a/8b/8c: Reference count the shared snapshot payloads, and
+            # drop a payload once the last snapshot referencing it is gone
+            # (including via ON DELETE CASCADE from its event).
+            connection.execute(
+                text("""
+                CREATE TRIGGER IF NOT EXISTS payload_refs_on_snapshot_insert
+                AFTER INSERT ON aimbatsnapshot
+                BEGIN
+                    UPDATE aimbatsnapshotpayload SET ref_count = ref_count + 1
+                    WHERE id = NEW.payload_id;
+                END;
+            """)
+            )
+
+            connection.execute(
+                text("""
+                CREATE TRIGGER IF NOT EXISTS payload_refs_on_snapshot_delete
+                AFTER DELETE ON aimbatsnapshot
+                BEGIN
+                    UPDATE aimbatsnapshotpayload SET ref_count = ref_count - 1
+                    WHERE id = OLD.payload_id;
+                    DELETE FROM aimbatsnapshotpayload
+                    WHERE id = OLD.payload_id AND ref_count <= 0;
+                END;
+            """)
+            )
+
+            connection.execute(
+                text("""
+                CREATE TRIGGER IF NOT EXISTS payload_refs_on_snapshot_update
+                AFTER UPDATE OF payload_id ON aimbatsnapshot
+                WHEN NEW.payload_id IS NOT OLD.payload_id
+                BEGIN
+                    UPDATE aimbatsnapshotpayload SET ref_count = ref_count + 1
+                    WHERE id = NEW.payload_id;
+                    UPDATE aimbatsnapshotpayload SET ref_count = ref_count - 1
+                    WHERE id = OLD.payload_id;
+                    DELETE FROM aimbatsnapshotpayload
+                    WHERE id = OLD.payload_id AND ref_count <= 0;
+                END;
+            """)
+            )
+
     # Mark the new database as being at the latest Alembic revision so that
     # `aimbat db upgrade` treats it consistently with a database that was
     # brought up to date via a real migration, rather than as an
@@ -339,3 +504,64 @@ def delete_project(engine: Engine) -> None:
     raise RuntimeError(
         f"Unable to delete project: unsupported engine driver '{engine.driver}'."
     )
+
+
+def _database_size(connection: Connection) -> int:
+    """Size of the SQLite database in bytes, excluding the WAL file."""
+    page_count = connection.exec_driver_sql("PRAGMA page_count").scalar_one()
+    page_size = connection.exec_driver_sql("PRAGMA page_size").scalar_one()
+    return page_count * page_size
+
+
+def vacuum_project(
+    engine: Engine, mode: Literal["full", "incremental"] = "full"
+) -> int:
+    """Return free pages in the project database to the filesystem.
+
+    Deleting rows (e.g. pruning snapshots) leaves free pages in the database
+    file that SQLite reuses but does not release. `full` rebuilds the whole
+    file with `VACUUM`. `incremental` only releases the free pages with
+    `PRAGMA incremental_vacuum`, which is much cheaper on large projects; the
+    first incremental run on a project switches it to incremental
+    auto-vacuum, which itself requires one full `VACUUM`.
+
+    Args:
+        engine: The SQLAlchemy/SQLModel Engine instance connected to the
+            project database.
+        mode: `full` or `incremental`.
+
+    Returns:
+        Number of bytes released.
+
+    Raises:
+        RuntimeError: If the engine is not a SQLite engine.
+    """
+
+    logger.info(f"Vacuuming project at {engine.url} ({mode}).")
+
+    if engine.name != "sqlite":
+        raise RuntimeError(
+            f"Unable to vacuum project: unsupported engine '{engine.name}'."
+        )
+
+    # VACUUM cannot run inside a transaction.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        before = _database_size(conn)
+        if mode == "incremental":
+            # 2 = INCREMENTAL, see https://sqlite.org/pragma.html#pragma_auto_vacuum
+            if conn.exec_driver_sql("PRAGMA auto_vacuum").scalar_one() != 2:
+                logger.info("Switching project to incremental auto-vacuum.")
+                conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.exec_driver_sql("VACUUM")
+            # Each step of the pragma frees one page, and the sqlite3 module
+            # only steps a statement without result rows once, so it is run
+            # as a script (which is stepped to completion).
+            conn.connection.driver_connection.executescript(  # type: ignore[union-attr]
+                "PRAGMA incremental_vacuum;"
+            )
+        else:
+            conn.exec_driver_sql("VACUUM")
+        after = _database_size(conn)
+
+    logger.debug(f"Vacuum released {before - after} bytes.")
+    return before - after
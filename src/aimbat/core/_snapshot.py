@@ -1,15 +1,21 @@
 import hashlib
 import json
-from collections.abc import Sequence
-from typing import Any
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Any, Self
 from uuid import UUID, uuid4
 
+from pandas import Timedelta, Timestamp
 from pydantic import TypeAdapter
+from sqlalchemy import delete
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import selectinload
-from sqlmodel import Session, select
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import Session, col, select
 
-from aimbat.logger import logger
+from aimbat import settings
+from aimbat.logger import Span, annotate_span, logger
 from aimbat.models import (
     AimbatEvent,
     AimbatEventParametersSnapshot,
@@ -21,6 +27,7 @@ from aimbat.models import (
     AimbatSeismogramQuality,
     AimbatSeismogramQualitySnapshot,
     AimbatSnapshot,
+    AimbatSnapshotPayload,
     AimbatSnapshotRead,
     SeismogramQualityStats,
     SnapshotResults,
@@ -30,6 +37,7 @@ from aimbat.models._parameters import (
     AimbatEventParametersBase,
     AimbatSeismogramParametersBase,
 )
+from aimbat.models._payload import SeismogramSnapshotRow, pack_seismogram_snapshots
 from aimbat.models._quality import (
     AimbatEventQualityBase,
     AimbatSeismogramQualityBase,
@@ -42,6 +50,9 @@ __all__ = [
     "rollback_to_snapshot",
     "sync_from_matching_hash",
     "delete_snapshot",
+    "SnapshotRetentionPolicy",
+    "select_snapshots_to_prune",
+    "prune_snapshots",
     "get_snapshots",
     "get_snapshot_quality",
     "dump_snapshot_table",
@@ -102,6 +113,7 @@ def compute_parameters_hash(event: AimbatEvent) -> str:
     return hashlib.sha256(payload.encode()).hexdigest()
 
 
+@Span("snapshot.create")
 def create_snapshot(
     session: Session,
     event: AimbatEvent,
@@ -110,10 +122,13 @@ def create_snapshot(
 ) -> None:
     """Create a snapshot of the AIMBAT processing parameters and quality metrics.
 
-    Parameter snapshots are always created. Quality snapshots are created
-    whenever the corresponding live quality record has at least one non-None
-    field. Seismogram quality is omitted when all quality fields are `None`
-    (e.g. before any ICCS or MCCC run).
+    Parameter snapshots are always created. The event quality snapshot is
+    created whenever MCCC quality is available. Per-seismogram parameters and
+    quality metrics are packed into a single `AimbatSnapshotPayload` row, so
+    the number of rows written does not grow with the number of seismograms.
+    If an identical payload is already stored (e.g. after a rollback or an
+    unchanged automatic snapshot), the new snapshot references it instead of
+    storing another copy.
 
     Args:
         session: Database session.
@@ -153,23 +168,8 @@ def create_snapshot(
         f"Adding event parameters snapshot with id={event_parameters_snapshot.id} to snapshot."
     )
 
-    seismogram_parameter_snapshots = []
-    for aimbat_seismogram in event.seismograms:
-        seismogram_parameter_snapshot = AimbatSeismogramParametersSnapshot.model_validate(
-            aimbat_seismogram.parameters,
-            update={
-                "id": uuid4(),  # we don't want to carry over the id from the input seismogram parameters
-                "seismogram_parameters_id": aimbat_seismogram.parameters.id,
-            },
-        )
-        logger.debug(
-            f"Adding seismogram parameters snapshot with id={seismogram_parameter_snapshot.id} to snapshot."
-        )
-        seismogram_parameter_snapshots.append(seismogram_parameter_snapshot)
-
     # Capture quality metrics from the live quality tables.
     event_quality_snap: AimbatEventQualitySnapshot | None = None
-    seis_quality_snaps: list[AimbatSeismogramQualitySnapshot] = []
 
     if event.quality is not None and event.quality.mccc_rmse is not None:
         logger.debug("Capturing event quality snapshot from live quality table.")
@@ -181,36 +181,49 @@ def create_snapshot(
             },
         )
 
-    for aimbat_seismogram in event.seismograms:
+    seismogram_rows = []
+    # Sorted so identical states always pack to identical payloads.
+    for aimbat_seismogram in sorted(event.seismograms, key=lambda s: s.id):
+        sp = aimbat_seismogram.parameters
         sq = aimbat_seismogram.quality
-        if sq is None:
-            continue
-        if any(
-            v is not None
-            for v in [sq.iccs_cc, sq.mccc_cc_mean, sq.mccc_cc_std, sq.mccc_error]
-        ):
-            logger.debug(
-                f"Adding seismogram quality snapshot for seismogram {aimbat_seismogram.id}."
-            )
-            seis_quality_snaps.append(
-                AimbatSeismogramQualitySnapshot.model_validate(
-                    sq,
-                    update={
-                        "id": uuid4(),
-                        "seismogram_quality_id": sq.id,
-                    },
-                )
+        seismogram_rows.append(
+            SeismogramSnapshotRow(
+                seismogram_id=aimbat_seismogram.id,
+                flip=sp.flip,
+                select=sp.select,
+                t1=sp.t1,
+                iccs_cc=sq.iccs_cc if sq is not None else None,
+                mccc_cc_mean=sq.mccc_cc_mean if sq is not None else None,
+                mccc_cc_std=sq.mccc_cc_std if sq is not None else None,
+                mccc_error=sq.mccc_error if sq is not None else None,
             )
+        )
+    logger.debug(f"Packing {len(seismogram_rows)} seismograms into snapshot payload.")
+    annotate_span(seismograms=len(seismogram_rows))
+    data = pack_seismogram_snapshots(seismogram_rows)
+    content_hash = hashlib.sha256(data).hexdigest()
+
+    payload = session.exec(
+        select(AimbatSnapshotPayload).where(
+            AimbatSnapshotPayload.content_hash == content_hash
+        )
+    ).one_or_none()
+    if payload is None:
+        payload = AimbatSnapshotPayload(data=data, content_hash=content_hash)
+    else:
+        logger.debug(f"Reusing identical snapshot payload with id={payload.id}.")
 
     aimbat_snapshot = AimbatSnapshot(
         event=event,
         event_parameters_snapshot=event_parameters_snapshot,
-        seismogram_parameters_snapshots=seismogram_parameter_snapshots,
         event_quality_snapshot=event_quality_snap,
-        seismogram_quality_snapshots=seis_quality_snaps,
+        payload=payload,
         comment=comment,
         automatic=automatic,
         parameters_hash=compute_parameters_hash(event),
+        seismogram_count=len(seismogram_rows),
+        selected_seismogram_count=sum(row.select for row in seismogram_rows),
+        flipped_seismogram_count=sum(row.flip for row in seismogram_rows),
     )
     session.add(aimbat_snapshot)
     session.commit()
@@ -229,13 +242,14 @@ def rollback_to_snapshot(session: Session, snapshot_id: UUID) -> None:
         select(AimbatSnapshot)
         .where(AimbatSnapshot.id == snapshot_id)
         .options(
-            selectinload(rel(AimbatSnapshot.event)).selectinload(
-                rel(AimbatEvent.parameters)
+            selectinload(rel(AimbatSnapshot.event)).options(
+                selectinload(rel(AimbatEvent.parameters)),
+                selectinload(rel(AimbatEvent.seismograms)).selectinload(
+                    rel(AimbatSeismogram.parameters)
+                ),
             ),
             selectinload(rel(AimbatSnapshot.event_parameters_snapshot)),
-            selectinload(
-                rel(AimbatSnapshot.seismogram_parameters_snapshots)
-            ).selectinload(rel(AimbatSeismogramParametersSnapshot.parameters)),
+            selectinload(rel(AimbatSnapshot.payload)),
         )
     )
     snapshot = session.exec(statement).one_or_none()
@@ -259,14 +273,23 @@ def rollback_to_snapshot(session: Session, snapshot_id: UUID) -> None:
 
     session.add(current_event_parameters)
 
+    live_seismogram_parameters = {
+        seis.id: seis.parameters for seis in snapshot.event.seismograms
+    }
     for seismogram_parameters_snapshot in snapshot.seismogram_parameters_snapshots:
+        seismogram_id = seismogram_parameters_snapshot.seismogram_id
+        current_seismogram_parameters = live_seismogram_parameters.get(seismogram_id)
+        if current_seismogram_parameters is None:
+            logger.debug(
+                f"Seismogram {seismogram_id} no longer belongs to the event; skipping."
+            )
+            continue
         rollback_seismogram_parameters = AimbatSeismogramParametersBase.model_validate(
             seismogram_parameters_snapshot
         )
         logger.debug(
-            f"Using seismogram parameters snapshot with id={seismogram_parameters_snapshot.id} for rollback."
+            f"Using seismogram parameters snapshot of seismogram {seismogram_id} for rollback."
         )
-        current_seismogram_parameters = seismogram_parameters_snapshot.parameters
         for k in AimbatSeismogramParametersBase.model_fields.keys():
             v = getattr(rollback_seismogram_parameters, k)
             logger.debug(f"Setting seismogram parameter {k} to {v!r} for rollback.")
@@ -321,11 +344,16 @@ def sync_from_matching_hash(
 
     logger.debug(f"Looking for quality metrics to sync for hash {parameters_hash}.")
 
+    # Only the payload of the chosen snapshot is needed; it is loaded once the
+    # candidate has been picked.
     candidates = [
         s
-        for s in get_snapshots(session)
-        if s.parameters_hash == parameters_hash
-        and s.event_quality_snapshot is not None
+        for s in session.exec(
+            select(AimbatSnapshot)
+            .where(AimbatSnapshot.parameters_hash == parameters_hash)
+            .options(selectinload(rel(AimbatSnapshot.event_quality_snapshot)))
+        )
+        if s.event_quality_snapshot is not None
         and s.event_quality_snapshot.mccc_rmse is not None
     ]
     if not candidates:
@@ -338,6 +366,11 @@ def sync_from_matching_hash(
     )
 
     logger.info(f"Syncing quality metrics from snapshot {snapshot.id}.")
+    snapshot = session.exec(
+        select(AimbatSnapshot)
+        .where(AimbatSnapshot.id == snapshot.id)
+        .options(selectinload(rel(AimbatSnapshot.payload)))
+    ).one()
 
     event_quality_snap = snapshot.event_quality_snapshot
     if event_quality_snap is None:
@@ -358,13 +391,22 @@ def sync_from_matching_hash(
             setattr(live_event_quality, k, v)
         session.add(live_event_quality)
 
-    for seis_quality_snap in snapshot.seismogram_quality_snapshots:
-        live_seis_quality = session.get(
-            AimbatSeismogramQuality, seis_quality_snap.seismogram_quality_id
+    seis_quality_snaps = snapshot.seismogram_quality_snapshots
+    live_seis_qualities = {
+        q.seismogram_id: q
+        for q in session.exec(
+            select(AimbatSeismogramQuality).where(
+                col(AimbatSeismogramQuality.seismogram_id).in_(
+                    [sq.seismogram_id for sq in seis_quality_snaps]
+                )
+            )
         )
+    }
+    for seis_quality_snap in seis_quality_snaps:
+        live_seis_quality = live_seis_qualities.get(seis_quality_snap.seismogram_id)
         if live_seis_quality is None:
             logger.warning(
-                f"Live seismogram quality record {seis_quality_snap.seismogram_quality_id} not found; skipping."
+                f"Live quality record of seismogram {seis_quality_snap.seismogram_id} not found; skipping."
             )
             continue
         for k in AimbatSeismogramQualityBase.model_fields:
@@ -380,6 +422,9 @@ def sync_from_matching_hash(
 def delete_snapshot(session: Session, snapshot_id: UUID) -> None:
     """Delete an AIMBAT parameter snapshot.
 
+    The snapshot's payload is only removed (by a database trigger) once no
+    other snapshot references it.
+
     Args:
         snapshot_id: Snapshot id.
     """
@@ -393,14 +438,178 @@ def delete_snapshot(session: Session, snapshot_id: UUID) -> None:
     session.commit()
 
 
+@dataclass(frozen=True)
+class SnapshotRetentionPolicy:
+    """Rules deciding which snapshots `prune_snapshots` deletes.
+
+    Rules are applied per event and only ever select snapshots for deletion: a
+    snapshot is deleted if any rule selects it. Manual snapshots are never
+    selected unless `keep_manual` is `False`. A policy without any rules
+    (the default) deletes nothing.
+
+    Attributes:
+        keep_last_automatic: Keep only this many of the most recent automatic
+            snapshots per event. `None` disables the rule.
+        thin_after: Thin out automatic snapshots older than this, keeping only
+            the most recent snapshot per `thin_interval`. `None` disables the
+            rule.
+        thin_interval: Width of the time buckets used when thinning.
+        keep_manual: Exempt manually created snapshots from every rule.
+    """
+
+    keep_last_automatic: int | None = None
+    thin_after: Timedelta | None = None
+    thin_interval: Timedelta = Timedelta(days=1)
+    keep_manual: bool = True
+
+    def __post_init__(self) -> None:
+        if self.keep_last_automatic is not None and self.keep_last_automatic < 0:
+            raise ValueError("keep_last_automatic must not be negative.")
+        if self.thin_after is not None and self.thin_after < Timedelta(0):
+            raise ValueError("thin_after must not be negative.")
+        if self.thin_interval <= Timedelta(0):
+            raise ValueError("thin_interval must be positive.")
+
+    @classmethod
+    def from_settings(cls) -> Self:
+        """Build the policy configured in the AIMBAT settings."""
+        return cls(
+            keep_last_automatic=settings.snapshot_keep_automatic,
+            thin_after=settings.snapshot_thin_after,
+            thin_interval=settings.snapshot_thin_interval,
+        )
+
+    @property
+    def has_rules(self) -> bool:
+        """Whether any rule is enabled."""
+        return self.keep_last_automatic is not None or self.thin_after is not None
+
+
+def select_snapshots_to_prune(
+    session: Session,
+    policy: SnapshotRetentionPolicy,
+    event_id: UUID | None = None,
+    now: Timestamp | None = None,
+) -> list[UUID]:
+    """Select the snapshots a retention policy would delete.
+
+    Only the snapshot ID, event ID, timestamp and `automatic` flag are read,
+    so this stays cheap however many snapshots a project holds.
+
+    Args:
+        session: Database session.
+        policy: Retention policy to apply.
+        event_id: Only consider snapshots of this event (if none is provided,
+            snapshots of all events are considered).
+        now: Reference time for age-based rules (defaults to the current time).
+
+    Returns:
+        IDs of the snapshots to delete, oldest first.
+    """
+    logger.debug(f"Selecting snapshots to prune with {policy}.")
+
+    if not policy.has_rules:
+        return []
+
+    statement = select(
+        AimbatSnapshot.id, AimbatSnapshot.event_id, AimbatSnapshot.time
+    ).order_by(col(AimbatSnapshot.time).desc())
+    if policy.keep_manual:
+        statement = statement.where(col(AimbatSnapshot.automatic).is_(True))
+    if event_id is not None:
+        statement = statement.where(AimbatSnapshot.event_id == event_id)
+
+    # Newest first, per event.
+    by_event: defaultdict[UUID, list[tuple[UUID, Timestamp]]] = defaultdict(list)
+    for snapshot_id, snapshot_event_id, time in session.exec(statement):
+        by_event[snapshot_event_id].append((snapshot_id, time))
+
+    now = now if now is not None else Timestamp.now(tz=timezone.utc)
+    selected: list[tuple[Timestamp, UUID]] = []
+    for snapshots in by_event.values():
+        if policy.keep_last_automatic is not None:
+            selected.extend(
+                (time, snapshot_id)
+                for snapshot_id, time in snapshots[policy.keep_last_automatic :]
+            )
+            snapshots = snapshots[: policy.keep_last_automatic]
+        if policy.thin_after is not None:
+            cutoff = now - policy.thin_after
+            interval_ns = policy.thin_interval.value
+            seen_buckets: set[int] = set()
+            for snapshot_id, time in snapshots:
+                if time >= cutoff:
+                    continue
+                bucket = time.value // interval_ns
+                if bucket in seen_buckets:
+                    selected.append((time, snapshot_id))
+                else:
+                    seen_buckets.add(bucket)
+
+    return [snapshot_id for _, snapshot_id in sorted(selected)]
+
+
+def prune_snapshots(
+    session: Session,
+    policy: SnapshotRetentionPolicy,
+    event_id: UUID | None = None,
+    batch_size: int = 500,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """Delete the snapshots selected by a retention policy.
+
+    Snapshots are deleted with set-based `DELETE` statements in batches of
+    `batch_size`, each committed separately, rather than one ORM delete per
+    snapshot. Their event parameter and quality snapshots and notes go with
+    them via `ON DELETE CASCADE`, and payloads no longer referenced by any
+    snapshot are removed by the payload reference-count triggers.
+
+    Args:
+        session: Database session.
+        policy: Retention policy to apply.
+        event_id: Only prune snapshots of this event (if none is provided,
+            snapshots of all events are pruned).
+        batch_size: Maximum number of snapshots deleted per statement.
+        on_progress: Optional callback invoked as `on_progress(done, total)`
+            after each batch, for callers that want to display progress.
+
+    Returns:
+        Number of snapshots deleted.
+
+    Raises:
+        ValueError: If `batch_size` is smaller than 1.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    snapshot_ids = select_snapshots_to_prune(session, policy, event_id)
+    total = len(snapshot_ids)
+    logger.info(f"Pruning {total} snapshot(s).")
+
+    for start in range(0, total, batch_size):
+        batch = snapshot_ids[start : start + batch_size]
+        session.connection().execute(
+            delete(AimbatSnapshot).where(col(AimbatSnapshot.id).in_(batch))
+        )
+        session.commit()
+        if on_progress is not None:
+            on_progress(min(start + batch_size, total), total)
+
+    return total
+
+
 def get_snapshots(
-    session: Session, event_id: UUID | None = None
+    session: Session, event_id: UUID | None = None, load_payload: bool = False
 ) -> Sequence[AimbatSnapshot]:
     """Get the snapshots, optional filtered by event ID.
 
     Args:
         session: Database session.
         event_id: Event ID to filter snapshots by (if none is provided, snapshots for all events are returned).
+        load_payload: Whether to also load the packed seismogram payloads.
+            Without them the per-seismogram records of the snapshots can't
+            be accessed (doing so raises rather than silently querying one
+            payload per snapshot).
 
     Returns: Snapshots.
     """
@@ -414,9 +623,10 @@ def get_snapshots(
     statement = statement.options(
         selectinload(rel(AimbatSnapshot.event)),
         selectinload(rel(AimbatSnapshot.event_parameters_snapshot)),
-        selectinload(rel(AimbatSnapshot.seismogram_parameters_snapshots)),
         selectinload(rel(AimbatSnapshot.event_quality_snapshot)),
-        selectinload(rel(AimbatSnapshot.seismogram_quality_snapshots)),
+        selectinload(rel(AimbatSnapshot.payload))
+        if load_payload
+        else raiseload(rel(AimbatSnapshot.payload)),
     )
 
     logger.debug(f"Executing statement to get snapshots: {statement}")
@@ -455,7 +665,8 @@ def dump_snapshot_table(
     if exclude is not None:
         exclude: dict[str, set] = {"__all__": exclude}  # type: ignore[no-redef]
 
-    snapshots = get_snapshots(session, event_id)
+    # The read model averages the per-seismogram quality of each snapshot.
+    snapshots = get_snapshots(session, event_id, load_payload=from_read_model)
 
     if from_read_model:
         snapshot_read_adapter: TypeAdapter[Sequence[AimbatSnapshotRead]] = TypeAdapter(
@@ -504,7 +715,7 @@ def get_snapshot_quality(session: Session, snapshot_id: UUID) -> SeismogramQuali
         select(AimbatSnapshot)
         .where(AimbatSnapshot.id == snapshot_id)
         .options(
-            selectinload(rel(AimbatSnapshot.seismogram_quality_snapshots)),
+            selectinload(rel(AimbatSnapshot.payload)),
             selectinload(rel(AimbatSnapshot.event_quality_snapshot)),
         )
     ).one_or_none()
@@ -545,7 +756,7 @@ def dump_snapshot_quality_table(
     exclude = (exclude or set()) | {"station_id"}
     exclude: dict[str, set] = {"__all__": exclude}  # type: ignore[no-redef]
 
-    snapshots = get_snapshots(session, event_id)
+    snapshots = get_snapshots(session, event_id, load_payload=True)
     stats = [SeismogramQualityStats.from_snapshot(s) for s in snapshots]
 
     adapter: TypeAdapter[Sequence[SeismogramQualityStats]] = TypeAdapter(
@@ -593,6 +804,33 @@ def dump_event_parameter_snapshot_table(
     return event_dicts
 
 
+def _live_record_ids(
+    session: Session,
+    model: type[AimbatSeismogramParameters] | type[AimbatSeismogramQuality],
+    seismogram_ids: set[UUID],
+    batch_size: int = 500,
+) -> dict[UUID, UUID]:
+    """Map seismogram IDs to the IDs of their live parameters or quality rows.
+
+    Decoded snapshot records only carry the seismogram ID; dumps also report
+    the ID of the live record they were taken from, as the per-seismogram
+    snapshot tables did before the payload was introduced. The IDs are looked
+    up in batches of `batch_size`, keeping each `IN` list well below SQLite's
+    limit on bound parameters.
+    """
+    ids = sorted(seismogram_ids)
+    live_ids: dict[UUID, UUID] = {}
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start : start + batch_size]
+        rows = session.exec(
+            select(model.seismogram_id, model.id).where(
+                col(model.seismogram_id).in_(batch)
+            )
+        )
+        live_ids.update(rows.all())
+    return live_ids
+
+
 def dump_seismogram_parameter_snapshot_table(
     session: Session,
     event_id: UUID | None = None,
@@ -613,12 +851,21 @@ def dump_seismogram_parameter_snapshot_table(
     if exclude is not None:
         exclude: dict[str, set] = {"__all__": exclude}  # type: ignore[no-redef]
 
-    snapshots = get_snapshots(session, event_id)
+    snapshots = get_snapshots(session, event_id, load_payload=True)
 
     seis_params_adapter: TypeAdapter[Sequence[AimbatSeismogramParametersSnapshot]] = (
         TypeAdapter(Sequence[AimbatSeismogramParametersSnapshot])
     )
     seis_snaps = [sp for s in snapshots for sp in s.seismogram_parameters_snapshots]
+    live_ids = _live_record_ids(
+        session, AimbatSeismogramParameters, {sp.seismogram_id for sp in seis_snaps}
+    )
+    seis_snaps = [
+        sp.model_copy(
+            update={"seismogram_parameters_id": live_ids.get(sp.seismogram_id)}
+        )
+        for sp in seis_snaps
+    ]
     seis_dicts = seis_params_adapter.dump_python(
         seis_snaps, mode="json", by_alias=by_alias, exclude=exclude
     )
@@ -684,7 +931,7 @@ def dump_seismogram_quality_snapshot_table(
     if exclude is not None:
         exclude: dict[str, set] = {"__all__": exclude}  # type: ignore[no-redef]
 
-    snapshots = get_snapshots(session, event_id)
+    snapshots = get_snapshots(session, event_id, load_payload=True)
 
     seis_quality_adapter: TypeAdapter[Sequence[AimbatSeismogramQualitySnapshot]] = (
         TypeAdapter(Sequence[AimbatSeismogramQualitySnapshot])
@@ -693,6 +940,15 @@ def dump_seismogram_quality_snapshot_table(
     seis_quality_snaps = [
         sq for s in snapshots for sq in s.seismogram_quality_snapshots
     ]
+    live_ids = _live_record_ids(
+        session,
+        AimbatSeismogramQuality,
+        {sq.seismogram_id for sq in seis_quality_snaps},
+    )
+    seis_quality_snaps = [
+        sq.model_copy(update={"seismogram_quality_id": live_ids.get(sq.seismogram_id)})
+        for sq in seis_quality_snaps
+    ]
     seis_quality_dicts = seis_quality_adapter.dump_python(
         seis_quality_snaps, mode="json", by_alias=by_alias, exclude=exclude
     )
@@ -731,18 +987,7 @@ def dump_snapshot_results(
         .options(
             selectinload(rel(AimbatSnapshot.event)),
             selectinload(rel(AimbatSnapshot.event_quality_snapshot)),
-            selectinload(rel(AimbatSnapshot.seismogram_parameters_snapshots)).options(
-                selectinload(
-                    rel(AimbatSeismogramParametersSnapshot.parameters)
-                ).options(
-                    selectinload(
-                        rel(AimbatSeismogramParameters.seismogram)
-                    ).selectinload(rel(AimbatSeismogram.station))
-                )
-            ),
-            selectinload(rel(AimbatSnapshot.seismogram_quality_snapshots)).selectinload(
-                rel(AimbatSeismogramQualitySnapshot.quality)
-            ),
+            selectinload(rel(AimbatSnapshot.payload)),
         )
     ).one_or_none()
 
@@ -752,17 +997,32 @@ def dump_snapshot_results(
     eq = snapshot.event_quality_snapshot
     mccc_rmse = eq.mccc_rmse if eq is not None else None
 
-    # Build a lookup from seismogram_id → quality snapshot.
+    param_snaps = snapshot.seismogram_parameters_snapshots
+
+    # Build lookups from seismogram_id → live seismogram and quality snapshot.
+    # Seismograms deleted since the snapshot was taken are left out.
+    seismogram_map: dict[UUID, AimbatSeismogram] = {
+        seis.id: seis
+        for seis in session.exec(
+            select(AimbatSeismogram)
+            .where(
+                col(AimbatSeismogram.id).in_([ps.seismogram_id for ps in param_snaps])
+            )
+            .options(selectinload(rel(AimbatSeismogram.station)))
+        )
+    }
     quality_map: dict[UUID, AimbatSeismogramQualitySnapshot] = {
-        sq.quality.seismogram_id: sq for sq in snapshot.seismogram_quality_snapshots
+        sq.seismogram_id: sq for sq in snapshot.seismogram_quality_snapshots
     }
 
     seismograms = [
         SnapshotSeismogramResult.from_snapshot_records(
             param_snap=ps,
-            quality_snap=quality_map.get(ps.parameters.seismogram_id),
+            seismogram=seismogram_map[ps.seismogram_id],
+            quality_snap=quality_map.get(ps.seismogram_id),
         )
-        for ps in snapshot.seismogram_parameters_snapshots
+        for ps in param_snaps
+        if ps.seismogram_id in seismogram_map
     ]
 
     event = snapshot.event
@@ -32,20 +32,54 @@ and `aimbat._tui.app.AimbatTUI.on_mount` for the TUI (a blocking modal
 instead of the main UI). `AIMBAT_STRICT_SCHEMA_CHECK` is only meaningful for
 third-party code that imports `engine` from this module directly and never
 goes through AIMBAT's own entry points.
+
+On top of those fixed PRAGMAs, every SQLite connection is tuned according to
+a *performance profile* (`Settings.sqlite_profile`, `AIMBAT_SQLITE_PROFILE`):
+
+| Profile       | `synchronous` | `cache_size` | `mmap_size` | `temp_store` | `wal_autocheckpoint` |
+| ------------- | ------------- | ------------ | ----------- | ------------ | -------------------- |
+| `safe`        | `FULL`        | 2 MiB        | off         | `DEFAULT`    | 1000 pages           |
+| `fast`        | `NORMAL`      | 64 MiB       | 256 MiB     | `MEMORY`     | 1000 pages           |
+| `bulk-import` | `OFF`         | 256 MiB      | 1 GiB       | `MEMORY`     | 10000 pages          |
+
+Bulk operations can borrow a connection tuned with another profile with
+`sqlite_profile` and bind their session to it; the override never leaks to
+other connections in the pool, and the configured profile is restored before
+the connection is returned. `PRAGMA optimize` is run
+whenever a pooled connection is closed (including on interpreter exit), so
+the query planner statistics stay current without an explicit `ANALYZE`.
+
+The statements executed through `engine` can be profiled with
+`enable_sql_profiling` (enabled at import when `Settings.sql_profile` is set,
+or per CLI command with `--profile-sql`). A summary with per-statement counts
+and timings, slow statements and suspected N+1 query patterns is logged when
+the process exits, and written as JSON to `Settings.sql_profile_report` if set:
+
+```bash
+AIMBAT_SQL_PROFILE=true AIMBAT_SQL_PROFILE_REPORT=sql.json aimbat snapshot list
+aimbat snapshot list --profile-sql
+```
 """
 
+import atexit
 import sqlite3
 import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Literal
 
-from sqlalchemy import event
-from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy import Connection, event
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
 from sqlmodel import create_engine
 
 from aimbat import settings
 from aimbat.core._migrations import SchemaStaleWarning
 from aimbat.logger import logger
+from aimbat.utils._sqlprofile import SQLProfiler
+
+__all__ = ["engine", "sqlite_profile", "enable_sql_profiling"]
 
-__all__ = ["engine"]
+type SQLiteProfile = Literal["safe", "fast", "bulk-import"]
 
 if settings.strict_schema_check:
     warnings.simplefilter("error", SchemaStaleWarning)
@@ -70,6 +104,140 @@ _SQLITE_PRAGMAS = [
     "PRAGMA journal_mode=WAL",
 ]
 
+_SQLITE_PROFILES: dict[SQLiteProfile, list[str]] = {
+    "safe": [
+        "PRAGMA synchronous=FULL",
+        "PRAGMA cache_size=-2000",
+        "PRAGMA mmap_size=0",
+        "PRAGMA temp_store=DEFAULT",
+        "PRAGMA wal_autocheckpoint=1000",
+    ],
+    "fast": [
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA wal_autocheckpoint=1000",
+    ],
+    "bulk-import": [
+        "PRAGMA synchronous=OFF",
+        "PRAGMA cache_size=-262144",
+        "PRAGMA mmap_size=1073741824",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA wal_autocheckpoint=10000",
+    ],
+}
+"""PRAGMAs applied for each performance profile.
+
+Every profile sets the same PRAGMAs, so switching between them never leaves a
+connection with a value from the previous profile.
+"""
+
+_PROFILE_INFO_KEY = "aimbat_sqlite_profile"
+
+
+@contextmanager
+def sqlite_profile(profile: SQLiteProfile) -> Iterator[Connection]:
+    """Yield a connection of `engine` tuned with another SQLite performance profile.
+
+    Only the yielded connection is re-tuned; every other connection keeps the
+    configured profile, so threads sharing the pool (TUI workers, the daemon,
+    the API server) are unaffected. Bind a session to it with
+    `Session(connection)`. The configured profile is re-applied before the
+    connection goes back to the pool, even if the block raises.
+
+    Args:
+        profile: Name of the profile to use inside the block.
+
+    Yields:
+        The re-tuned connection.
+
+    Raises:
+        ValueError: If `profile` is not a known profile.
+    """
+    if profile not in _SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLite profile {profile!r}. "
+            f"Choose from: {', '.join(_SQLITE_PROFILES)}."
+        )
+    with engine.connect() as connection:
+        dbapi_connection = connection.connection.dbapi_connection
+        if engine.name != "sqlite" or dbapi_connection is None:
+            yield connection
+            return
+
+        logger.debug(f"Switching SQLite performance profile to {profile!r}.")
+        _apply_sqlite_profile(dbapi_connection, connection.info, profile)
+        try:
+            yield connection
+        finally:
+            # SQLite refuses to change `synchronous` inside a transaction.
+            if connection.in_transaction():
+                connection.rollback()
+            try:
+                _apply_sqlite_profile(
+                    dbapi_connection, connection.info, settings.sqlite_profile
+                )
+                logger.debug(
+                    f"Restored SQLite performance profile {settings.sqlite_profile!r}."
+                )
+            except sqlite3.Error as e:
+                # Never hand a connection with the temporary profile back to
+                # the pool.
+                logger.debug(f"Discarding connection after failed profile reset: {e}")
+                connection.invalidate()
+
+
+def _apply_sqlite_profile(
+    dbapi_connection: Any, info: dict[Any, Any], profile: SQLiteProfile
+) -> None:
+    """Apply a performance profile to a raw SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PROFILES[profile]:
+        cursor.execute(pragma)
+    cursor.close()
+    info[_PROFILE_INFO_KEY] = profile
+
+
+_sql_profiler: SQLProfiler | None = None
+
+
+def _finish_sql_profiling() -> None:
+    """Log the SQL profile and write the JSON report if requested."""
+    if _sql_profiler is None:
+        return
+    _sql_profiler.detach()
+    _sql_profiler.log_report()
+    if settings.sql_profile_report is not None:
+        _sql_profiler.write_report(settings.sql_profile_report)
+        logger.info(f"SQL profile written to {settings.sql_profile_report}.")
+
+
+def enable_sql_profiling() -> SQLProfiler:
+    """Profile the SQL statements executed through `engine`.
+
+    Thresholds are taken from `Settings.sql_slow_threshold` and
+    `Settings.sql_repeat_threshold`. The profile is reported when the process
+    exits. Calling this more than once returns the profiler already attached.
+
+    Returns:
+        The profiler recording the statements.
+    """
+    global _sql_profiler
+
+    if _sql_profiler is None:
+        logger.debug("Enabling SQL profiling.")
+        _sql_profiler = SQLProfiler(
+            slow_threshold=settings.sql_slow_threshold.total_seconds(),
+            repeat_threshold=settings.sql_repeat_threshold,
+        ).attach(engine)
+        atexit.register(_finish_sql_profiling)
+    return _sql_profiler
+
+
+if settings.sql_profile:
+    enable_sql_profiling()
+
 
 # Automatically enforce foreign keys for every new connection if using SQLite
 if engine.name == "sqlite":
@@ -86,6 +254,38 @@ if engine.name == "sqlite":
         for pragma in _SQLITE_PRAGMAS:
             cursor.execute(pragma)
         cursor.close()
+        _apply_sqlite_profile(
+            dbapi_connection, connection_record.info, settings.sqlite_profile
+        )
+
+    @event.listens_for(engine, "checkout")
+    def _switch_sqlite_profile(
+        dbapi_connection: sqlite3.Connection,
+        connection_record: ConnectionPoolEntry,
+        connection_proxy: PoolProxiedConnection,
+    ) -> None:
+        """Re-tune a pooled connection that does not have the configured profile."""
+        if connection_record.info.get(_PROFILE_INFO_KEY) != settings.sqlite_profile:
+            logger.debug(
+                f"Applying SQLite performance profile {settings.sqlite_profile!r}."
+            )
+            _apply_sqlite_profile(
+                dbapi_connection, connection_record.info, settings.sqlite_profile
+            )
+
+    @event.listens_for(engine, "close")
+    def _optimize_on_close(
+        dbapi_connection: sqlite3.Connection, connection_record: ConnectionPoolEntry
+    ) -> None:
+        """Let SQLite refresh its query planner statistics before closing."""
+        try:
+            dbapi_connection.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.debug(f"Skipping PRAGMA optimize on close: {e}")
+
+    # Pooled connections are otherwise only closed at garbage collection, when
+    # the close event no longer fires reliably.
+    atexit.register(engine.dispose)
 
     @event.listens_for(engine, "handle_error")
     def _handle_missing_schema(exception_context) -> None:  # type: ignore[no-untyped-def]
@@ -18,7 +18,7 @@ from typing import TYPE_CHECKING, Callable
 import numpy as np
 import numpy.typing as npt
 
-from aimbat.logger import logger
+from aimbat.logger import Span, logger
 
 from ._data import DataType
 
@@ -383,7 +383,9 @@ def read_seismogram_data(
         )
     key = (str(datasource), datatype)
     if key not in _cache:
-        arr = reader(datasource)
+        with Span("io.read_seismogram_data", datasource=str(datasource)) as span:
+            arr = reader(datasource)
+            span.set(samples=arr.size)
         arr.flags.writeable = False
         _cache[key] = arr
     else:
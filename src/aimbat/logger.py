@@ -15,22 +15,167 @@ Both settings can be overridden per project via environment variable or a
 AIMBAT_LOG_LEVEL=DEBUG
 AIMBAT_LOGFILE=/path/to/custom.log
 ```
+
+Hot-path operations (data ingestion, waveform reads, building and running
+ICCS, MCCC, database write-back, snapshot creation and table exports) are
+timed with `Span`. Each span is logged at `DEBUG` level with its duration and
+structured fields such as the number of seismograms involved. Setting
+`timing_log` (`AIMBAT_TIMING_LOG`) additionally appends every span as one
+JSON object per line to that file, regardless of `log_level`, e.g.:
+
+```json
+{"time": "2026-10-18T12:00:00.123456+00:00", "span": "iccs.run", "duration_ms": 812.4,
+ "status": "ok", "host": "node17", "pid": 4242, "thread": "MainThread",
+ "fields": {"seismograms": 250, "iterations": 4, "converged": true}}
+```
 """
 
+import json
+import socket
+import time
+from collections.abc import Callable
+from contextlib import ContextDecorator
+from contextvars import ContextVar, Token
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
+
 from loguru import logger
 
 from aimbat import settings
 
+if TYPE_CHECKING:
+    from loguru import Message
+
+__all__ = ["logger", "configure_logging", "Span", "annotate_span"]
+
+_current_span: ContextVar["Span | None"] = ContextVar("aimbat_span", default=None)
+
+
+class Span(ContextDecorator):
+    """Time an operation and log its duration with structured fields.
+
+    Can be used as a context manager or as a decorator. Fields known up front
+    are passed to the constructor; fields only known later (e.g. the number of
+    rows written) can be added with `set`, or with `annotate_span` from inside
+    a decorated function.
+
+    Examples:
+        ```python
+        with Span("iccs.run", seismograms=len(iccs.seismograms)) as span:
+            result = iccs()
+            span.set(iterations=len(result.convergence))
+
+
+        @Span("snapshot.create")
+        def create_snapshot(...):
+            ...
+            annotate_span(seismograms=len(rows))
+        ```
+
+    Attributes:
+        name: Name of the operation, dotted by area (e.g. `iccs.build`).
+        level: Log level the finished span is logged at.
+        fields: Structured fields logged with the span.
+        duration: Duration in seconds, set when the span finishes.
+    """
+
+    def __init__(self, name: str, level: str = "DEBUG", **fields: Any) -> None:
+        self.name = name
+        self.level = level
+        self.fields = fields
+        self.duration: float | None = None
+        self._start = 0.0
+        self._token: Token[Span | None] | None = None
+
+    def _recreate_cm(self) -> Self:
+        # A decorated function may run concurrently or recursively, so every
+        # call gets a span of its own.
+        return type(self)(self.name, self.level, **self.fields)
+
+    def set(self, **fields: Any) -> None:
+        """Add or update structured fields of the span."""
+        self.fields.update(fields)
+
+    def __enter__(self) -> Self:
+        self._token = _current_span.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.duration = time.perf_counter() - self._start
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+
+        status = "ok" if exc_type is None else "error"
+        details = ", ".join(f"{k}={v}" for k, v in self.fields.items())
+        logger.opt(depth=1).bind(
+            span=self.name, duration=self.duration, status=status, fields=self.fields
+        ).log(
+            self.level,
+            f"{self.name} {'finished' if exc_type is None else 'failed'} in "
+            f"{self.duration * 1000:.1f} ms" + (f" ({details})." if details else "."),
+        )
+
+
+def annotate_span(**fields: Any) -> None:
+    """Add structured fields to the innermost active `Span`, if any.
+
+    Args:
+        **fields: Fields to add.
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.set(**fields)
+
+
+def _timing_sink(path: Path) -> "Callable[[Message], None]":
+    """Create a loguru sink that appends finished spans to a JSON-lines file."""
+    host = socket.gethostname()
+
+    def sink(message: "Message") -> None:
+        record = message.record
+        extra = record["extra"]
+        entry = {
+            "time": record["time"].isoformat(),
+            "span": extra["span"],
+            "duration_ms": extra["duration"] * 1000,
+            "status": extra["status"],
+            "host": host,
+            "pid": record["process"].id,
+            "thread": record["thread"].name,
+            "fields": extra["fields"],
+        }
+        # One write per line in append mode, so several processes can share
+        # the file.
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+    return sink
+
 
 def configure_logging() -> None:
     """Reconfigure loguru sinks based on current settings.
 
     Removes all existing loguru handlers and adds a single file sink using
     `Settings.logfile` and `Settings.log_level` from the active `aimbat.settings`
-    instance. Log files are rotated at 100 MB.
+    instance. Log files are rotated at 100 MB. If `Settings.timing_log` is set,
+    a second sink appends finished spans (see `Span`) to it as JSON lines.
     """
     logger.remove()
     logger.add(settings.logfile, rotation="100 MB", level=settings.log_level)
+    if settings.timing_log is not None:
+        logger.add(
+            _timing_sink(settings.timing_log),
+            level="TRACE",
+            filter=lambda record: "span" in record["extra"],
+        )
 
 
 configure_logging()
@@ -21,12 +21,16 @@ The main classes and their relationships are:
 - `AimbatSnapshot` — captures a point-in-time copy of event and seismogram
   parameters via `AimbatEventParametersSnapshot` and
   `AimbatSeismogramParametersSnapshot`, enabling rollback and comparison.
+  Per-seismogram records are packed into a single `AimbatSnapshotPayload` row,
+  shared by all snapshots of an identical state.
 - `AimbatEventQuality` / `AimbatSeismogramQuality` — live quality metrics updated
   during processing; `AimbatSeismogramQuality` stores the ICCS cross-correlation
   coefficient `iccs_cc` and MCCC per-seismogram metrics; `AimbatEventQuality`
   stores the MCCC global RMSE.
 - `AimbatEventQualitySnapshot` / `AimbatSeismogramQualitySnapshot` — point-in-time
   copies of quality metrics captured alongside parameter snapshots.
+  `AimbatSeismogramParametersSnapshot` and `AimbatSeismogramQualitySnapshot`
+  are not tables; they are decoded from the snapshot's payload.
 """
 
 from .._utils import export_module_names
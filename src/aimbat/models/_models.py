@@ -11,10 +11,17 @@ import numpy.typing as npt
 from pandas import Timestamp
 from pydantic import computed_field, model_validator
 from pydantic.alias_generators import to_camel
-from sqlalchemy import CheckConstraint, Column, PickleType, func
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    Index,
+    LargeBinary,
+    PickleType,
+    text,
+)
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.mutable import MutableDict
-from sqlalchemy.orm import column_property
-from sqlmodel import Field, Relationship, SQLModel, col, select
+from sqlmodel import Field, Relationship, SQLModel
 from sqlmodel._compat import SQLModelConfig
 
 from aimbat._types import (
@@ -27,6 +34,7 @@ from aimbat.io import DataType, read_seismogram_data, write_seismogram_data
 
 from ._format import RichColSpec
 from ._parameters import AimbatEventParametersBase, AimbatSeismogramParametersBase
+from ._payload import SeismogramSnapshotRow, unpack_seismogram_snapshots
 from ._quality import (
     AimbatEventQualityBase,
     AimbatSeismogramQualityBase,
@@ -48,8 +56,12 @@ __all__ = [
     "AimbatSeismogramQuality",
     "AimbatSeismogramQualitySnapshot",
     "AimbatSnapshot",
+    "AimbatSnapshotPayload",
 ]
 
+_PAYLOAD_ROWS_KEY = "aimbat_payload_rows"
+"""Key of the decoded payload rows in an `AimbatSnapshot`'s instance state info."""
+
 
 class _AimbatDataSourceCreate(SQLModel):
     """Input model for creating a new data source entry."""
@@ -78,6 +90,7 @@ class AimbatDataSource(SQLModel, table=True):
         schema_extra={"rich": RichColSpec(style="yellow", highlight=False)},
     )
     sourcename: str = Field(
+        index=True,
         title="Source name",
         description="Path or name of the data source.",
     )
@@ -89,6 +102,7 @@ class AimbatDataSource(SQLModel, table=True):
     seismogram_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatseismogram.id",
+        index=True,
         ondelete="CASCADE",
         title="Seismogram ID",
         description="Foreign key referencing the parent seismogram.",
@@ -115,6 +129,7 @@ class AimbatSeismogramParameters(AimbatSeismogramParametersBase, table=True):
     seismogram_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatseismogram.id",
+        index=True,
         ondelete="CASCADE",
         title="Seismogram ID",
         description="Foreign key referencing the parent seismogram.",
@@ -123,42 +138,45 @@ class AimbatSeismogramParameters(AimbatSeismogramParametersBase, table=True):
     seismogram: "AimbatSeismogram" = Relationship(back_populates="parameters")
     "The seismogram these parameters belong to."
 
-    snapshots: list["AimbatSeismogramParametersSnapshot"] = Relationship(
-        back_populates="parameters", cascade_delete=True
-    )
-    "Parameter snapshots for this seismogram."
 
+class AimbatSeismogramParametersSnapshot(AimbatSeismogramParametersBase):
+    """Snapshot of processing parameters for a single seismogram.
 
-class AimbatSeismogramParametersSnapshot(AimbatSeismogramParametersBase, table=True):
-    """Snapshot of processing parameters for a single seismogram."""
+    Not a table: records are decoded from the packed `AimbatSnapshotPayload`
+    of their snapshot (see `AimbatSnapshot.seismogram_parameters_snapshots`).
+    """
 
     model_config = SQLModelConfig(
         alias_generator=to_camel,
         populate_by_name=True,
     )
 
-    id: uuid.UUID = Field(
-        default_factory=uuid.uuid4, primary_key=True, description="Unique ID."
-    )
-    seismogram_parameters_id: uuid.UUID = Field(
-        foreign_key="aimbatseismogramparameters.id",
-        ondelete="CASCADE",
-        title="Seismogram parameters ID",
-        description="Foreign key referencing the source seismogram parameters.",
+    seismogram_id: uuid.UUID = Field(
+        title="Seismogram ID",
+        description="ID of the seismogram these parameters were taken from.",
     )
-    parameters: AimbatSeismogramParameters = Relationship(back_populates="snapshots")
-    "The seismogram parameters this snapshot was taken from."
     snapshot_id: uuid.UUID = Field(
-        default=None,
-        foreign_key="aimbatsnapshot.id",
-        ondelete="CASCADE",
         title="Snapshot ID",
-        description="Foreign key referencing the parent snapshot.",
+        description="ID of the parent snapshot.",
     )
-    snapshot: "AimbatSnapshot" = Relationship(
-        back_populates="seismogram_parameters_snapshots"
+    seismogram_parameters_id: uuid.UUID | None = Field(
+        default=None,
+        title="Seismogram parameters ID",
+        description="ID of the live seismogram parameters of the seismogram (set when "
+        "dumping; `None` if the seismogram no longer exists).",
     )
-    "The snapshot this record belongs to."
+
+    if TYPE_CHECKING:
+
+        @property
+        def id(self) -> uuid.UUID: ...
+
+    else:
+
+        @computed_field(description="Unique ID.")
+        def id(self) -> uuid.UUID:
+            """Stable ID derived from the snapshot and seismogram IDs."""
+            return uuid.uuid5(self.snapshot_id, str(self.seismogram_id))
 
 
 class AimbatEventParameters(AimbatEventParametersBase, table=True):
@@ -181,6 +199,7 @@ class AimbatEventParameters(AimbatEventParametersBase, table=True):
     event_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatevent.id",
+        index=True,
         ondelete="CASCADE",
         title="Event ID",
         description="Foreign key referencing the parent event.",
@@ -210,6 +229,7 @@ class AimbatEventParametersSnapshot(AimbatEventParametersBase, table=True):
     snapshot_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatsnapshot.id",
+        index=True,
         ondelete="CASCADE",
         title="Snapshot ID",
         description="Foreign key referencing the parent snapshot.",
@@ -217,6 +237,7 @@ class AimbatEventParametersSnapshot(AimbatEventParametersBase, table=True):
     parameters_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbateventparameters.id",
+        index=True,
         ondelete="CASCADE",
         title="Event parameters ID",
         description="Foreign key referencing the source event parameters.",
@@ -247,49 +268,53 @@ class AimbatSeismogramQuality(AimbatSeismogramQualityBase, table=True):
     seismogram_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatseismogram.id",
+        index=True,
         ondelete="CASCADE",
         title="Seismogram ID",
         description="Foreign key referencing the parent seismogram.",
     )
     seismogram: "AimbatSeismogram" = Relationship(back_populates="quality")
     "The seismogram these quality metrics belong to."
-    snapshots: list["AimbatSeismogramQualitySnapshot"] = Relationship(
-        back_populates="quality", cascade_delete=True
-    )
-    "Quality snapshots taken from this live record."
 
 
-class AimbatSeismogramQualitySnapshot(AimbatSeismogramQualityBase, table=True):
-    """Snapshot of quality metrics for a single seismogram."""
+class AimbatSeismogramQualitySnapshot(AimbatSeismogramQualityBase):
+    """Snapshot of quality metrics for a single seismogram.
+
+    Not a table: records are decoded from the packed `AimbatSnapshotPayload`
+    of their snapshot (see `AimbatSnapshot.seismogram_quality_snapshots`).
+    """
 
     model_config = SQLModelConfig(
         alias_generator=to_camel,
         populate_by_name=True,
     )
 
-    id: uuid.UUID = Field(
-        default_factory=uuid.uuid4, primary_key=True, description="Unique ID."
-    )
-    seismogram_quality_id: uuid.UUID = Field(
-        default=None,
-        foreign_key="aimbatseismogramquality.id",
-        ondelete="CASCADE",
-        title="Seismogram quality ID",
-        description="Foreign key referencing the source seismogram quality.",
+    seismogram_id: uuid.UUID = Field(
+        title="Seismogram ID",
+        description="ID of the seismogram these quality metrics were taken from.",
     )
-    quality: AimbatSeismogramQuality = Relationship(back_populates="snapshots")
-    "The seismogram quality this snapshot was taken from."
     snapshot_id: uuid.UUID = Field(
-        default=None,
-        foreign_key="aimbatsnapshot.id",
-        ondelete="CASCADE",
         title="Snapshot ID",
-        description="Foreign key referencing the parent snapshot.",
+        description="ID of the parent snapshot.",
     )
-    snapshot: "AimbatSnapshot" = Relationship(
-        back_populates="seismogram_quality_snapshots"
+    seismogram_quality_id: uuid.UUID | None = Field(
+        default=None,
+        title="Seismogram quality ID",
+        description="ID of the live seismogram quality metrics of the seismogram (set when "
+        "dumping; `None` if the seismogram no longer exists).",
     )
-    "The snapshot this record belongs to."
+
+    if TYPE_CHECKING:
+
+        @property
+        def id(self) -> uuid.UUID: ...
+
+    else:
+
+        @computed_field(description="Unique ID.")
+        def id(self) -> uuid.UUID:
+            """Stable ID derived from the snapshot and seismogram IDs."""
+            return uuid.uuid5(self.snapshot_id, str(self.seismogram_id))
 
 
 class AimbatEventQuality(AimbatEventQualityBase, table=True):
@@ -310,6 +335,7 @@ class AimbatEventQuality(AimbatEventQualityBase, table=True):
     event_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatevent.id",
+        index=True,
         ondelete="CASCADE",
         title="Event ID",
         description="Foreign key referencing the parent event.",
@@ -336,6 +362,7 @@ class AimbatEventQualitySnapshot(AimbatEventQualityBase, table=True):
     event_quality_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbateventquality.id",
+        index=True,
         ondelete="CASCADE",
         title="Event quality ID",
         description="Foreign key referencing the source event quality.",
@@ -345,6 +372,7 @@ class AimbatEventQualitySnapshot(AimbatEventQualityBase, table=True):
     snapshot_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatsnapshot.id",
+        index=True,
         ondelete="CASCADE",
         title="Snapshot ID",
         description="Foreign key referencing the parent snapshot.",
@@ -353,12 +381,56 @@ class AimbatEventQualitySnapshot(AimbatEventQualityBase, table=True):
     "The snapshot this record belongs to."
 
 
+class AimbatSnapshotPayload(SQLModel, table=True):
+    """Packed per-seismogram parameters and quality metrics of a snapshot.
+
+    Holds the data of all seismograms in a snapshot as a single compressed,
+    columnar blob instead of one row per seismogram. See
+    `aimbat.models._payload` for the layout.
+
+    Payloads are content-addressed: snapshots capturing an identical state
+    share one payload, identified by the hash of its data. The payload is
+    removed once the last snapshot referencing it is deleted.
+    """
+
+    model_config = SQLModelConfig(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4, primary_key=True, description="Unique ID."
+    )
+    data: bytes = Field(
+        sa_type=LargeBinary,
+        title="Data",
+        description="Compressed, packed per-seismogram parameters and quality metrics.",
+    )
+    content_hash: str = Field(
+        unique=True,
+        index=True,
+        title="Content hash",
+        description="SHA-256 hash of `data`, used to share identical payloads.",
+    )
+    snapshots: list["AimbatSnapshot"] = Relationship(back_populates="payload")
+    "Snapshots referencing this payload."
+
+    # Counter maintained by database triggers (see core/_project.py::create_project).
+    ref_count: int = Field(
+        default=0,
+        exclude=True,
+        title="Reference count",
+        description="Number of snapshots referencing this payload.",
+    )
+
+
 class AimbatSnapshot(SQLModel, table=True):
     """Container for a point-in-time snapshot of event and seismogram parameters.
 
     The AimbatSnapshot class does not actually save any parameter data.
     It is used to keep track of the AimbatEventParametersSnapshot and
-    AimbatSeismogramParametersSnapshot instances.
+    AimbatEventQualitySnapshot instances, and of the `AimbatSnapshotPayload`
+    from which the per-seismogram records are decoded.
     """
 
     model_config = SQLModelConfig(
@@ -393,21 +465,24 @@ class AimbatSnapshot(SQLModel, table=True):
         back_populates="snapshot", cascade_delete=True
     )
     "Event parameter snapshot associated with this snapshot."
-    seismogram_parameters_snapshots: list[AimbatSeismogramParametersSnapshot] = (
-        Relationship(back_populates="snapshot", cascade_delete=True)
-    )
-    "Seismogram parameter snapshots associated with this snapshot."
     event_quality_snapshot: AimbatEventQualitySnapshot | None = Relationship(
         back_populates="snapshot", cascade_delete=True
     )
     "Event quality metric snapshot associated with this snapshot."
-    seismogram_quality_snapshots: list[AimbatSeismogramQualitySnapshot] = Relationship(
-        back_populates="snapshot", cascade_delete=True
-    )
-    "Seismogram quality metric snapshots associated with this snapshot."
+    payload_id: uuid.UUID = Field(
+        default=None,
+        foreign_key="aimbatsnapshotpayload.id",
+        index=True,
+        exclude=True,
+        title="Payload ID",
+        description="Foreign key referencing the (shared) seismogram payload.",
+    )
+    payload: AimbatSnapshotPayload = Relationship(back_populates="snapshots")
+    "Packed per-seismogram parameters and quality metrics of this snapshot."
     event_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatevent.id",
+        index=True,
         ondelete="CASCADE",
         title="Event ID",
         description="Foreign key referencing the parent event.",
@@ -415,11 +490,89 @@ class AimbatSnapshot(SQLModel, table=True):
     event: "AimbatEvent" = Relationship(back_populates="snapshots")
     "The event this snapshot belongs to."
 
-    if TYPE_CHECKING:
-        # defined as column properties below, but add same default values for type checking purposes
-        seismogram_count: int = 0
-        selected_seismogram_count: int = 0
-        flipped_seismogram_count: int = 0
+    # Counters written once with the snapshot (see core/_snapshot.py::create_snapshot).
+    seismogram_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        exclude=True,
+        title="Seismogram count",
+        description="Number of seismogram parameter snapshots associated with this snapshot.",
+    )
+    selected_seismogram_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        exclude=True,
+        title="Selected seismogram count",
+        description="Number of seismogram parameter snapshots marked as selected.",
+    )
+    flipped_seismogram_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        exclude=True,
+        title="Flipped seismogram count",
+        description="Number of seismogram parameter snapshots marked as flipped.",
+    )
+
+    def _payload_rows(self) -> list[SeismogramSnapshotRow]:
+        # Decoded rows are kept in the instance state, keyed on the payload
+        # blob (which is never modified once written).
+        data = self.payload.data
+        info = sa_inspect(self).info
+        cached = info.get(_PAYLOAD_ROWS_KEY)
+        if cached is None or cached[0] is not data:
+            cached = info[_PAYLOAD_ROWS_KEY] = (
+                data,
+                unpack_seismogram_snapshots(data),
+            )
+        return cached[1]
+
+    @property
+    def seismogram_parameters_snapshots(
+        self,
+    ) -> list[AimbatSeismogramParametersSnapshot]:
+        """Seismogram parameter snapshots associated with this snapshot.
+
+        Built from the decoded `payload`, one record per seismogram.
+        """
+        return [
+            AimbatSeismogramParametersSnapshot(
+                seismogram_id=row.seismogram_id,
+                snapshot_id=self.id,
+                flip=row.flip,
+                select=row.select,
+                t1=row.t1,
+            )
+            for row in self._payload_rows()
+        ]
+
+    @property
+    def seismogram_quality_snapshots(self) -> list[AimbatSeismogramQualitySnapshot]:
+        """Seismogram quality metric snapshots associated with this snapshot.
+
+        Built from the decoded `payload`. Seismograms for which no
+        quality metric had been computed when the snapshot was taken are
+        omitted.
+        """
+        return [
+            AimbatSeismogramQualitySnapshot(
+                seismogram_id=row.seismogram_id,
+                snapshot_id=self.id,
+                iccs_cc=row.iccs_cc,
+                mccc_cc_mean=row.mccc_cc_mean,
+                mccc_cc_std=row.mccc_cc_std,
+                mccc_error=row.mccc_error,
+            )
+            for row in self._payload_rows()
+            if any(
+                v is not None
+                for v in (
+                    row.iccs_cc,
+                    row.mccc_cc_mean,
+                    row.mccc_cc_std,
+                    row.mccc_error,
+                )
+            )
+        ]
 
 
 class AimbatSeismogram(SQLModel, table=True):
@@ -459,6 +612,7 @@ class AimbatSeismogram(SQLModel, table=True):
     station_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatstation.id",
+        index=True,
         ondelete="CASCADE",
         title="Station ID",
         description="Foreign key referencing the recording station.",
@@ -468,6 +622,7 @@ class AimbatSeismogram(SQLModel, table=True):
     event_id: uuid.UUID = Field(
         default=None,
         foreign_key="aimbatevent.id",
+        index=True,
         ondelete="CASCADE",
         title="Event ID",
         description="Foreign key referencing the parent event.",
@@ -564,6 +719,17 @@ class AimbatStation(SQLModel, table=True):
         populate_by_name=True,
     )
 
+    __table_args__ = (
+        # Composite lookup used to find an existing station when adding data.
+        Index(
+            "ix_aimbatstation_name_network_location_channel",
+            "name",
+            "network",
+            "location",
+            "channel",
+        ),
+    )
+
     id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
         primary_key=True,
@@ -605,10 +771,21 @@ class AimbatStation(SQLModel, table=True):
     )
     "Seismograms recorded at this station."
 
-    if TYPE_CHECKING:
-        # Column properties defined below, but add same default values for type checking purposes
-        seismogram_count: int = 0
-        event_count: int = 0
+    # Counters maintained by database triggers (see core/_project.py::create_project).
+    seismogram_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        exclude=True,
+        title="Seismogram count",
+        description="Number of seismograms recorded at this station.",
+    )
+    event_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        exclude=True,
+        title="Event count",
+        description="Number of unique events recorded at this station.",
+    )
 
 
 class AimbatEvent(SQLModel, table=True):
@@ -666,88 +843,28 @@ class AimbatEvent(SQLModel, table=True):
     )
     "List of snapshots."
 
-    if TYPE_CHECKING:
-        # Column properties defined below, but add same default values for type checking purposes
-        seismogram_count: int = 0
-        station_count: int = 0
-        snapshot_count: int = 0
-
-
-# ----------------------------------------------------------------------------
-# Column properties
-# ----------------------------------------------------------------------------
-
-AimbatEvent.seismogram_count = column_property(  # type: ignore[assignment]
-    select(func.count(col(AimbatSeismogram.id)))
-    .where(col(AimbatSeismogram.event_id) == col(AimbatEvent.id))
-    .correlate_except(AimbatSeismogram)
-    .scalar_subquery()
-)
-"Number of seismograms for this event."
-
-AimbatEvent.station_count = column_property(  # type: ignore[assignment]
-    select(func.count(func.distinct(col(AimbatSeismogram.station_id))))
-    .where(col(AimbatSeismogram.event_id) == col(AimbatEvent.id))
-    .correlate_except(AimbatSeismogram)
-    .scalar_subquery()
-)
-"Number of unique stations for this event."
-
-AimbatEvent.snapshot_count = column_property(  # type: ignore[assignment]
-    select(func.count(col(AimbatSnapshot.id)))
-    .where(col(AimbatSnapshot.event_id) == col(AimbatEvent.id))
-    .correlate_except(AimbatSnapshot)
-    .scalar_subquery()
-)
-"Number of snapshots for this event."
-
-AimbatStation.seismogram_count = column_property(  # type: ignore[assignment]
-    select(func.count(col(AimbatSeismogram.id)))
-    .where(col(AimbatSeismogram.station_id) == col(AimbatStation.id))
-    .correlate_except(AimbatSeismogram)
-    .scalar_subquery()
-)
-"Number of seismograms recorded at this station."
-
-AimbatStation.event_count = column_property(  # type: ignore[assignment]
-    select(func.count(func.distinct(col(AimbatSeismogram.event_id))))
-    .where(col(AimbatSeismogram.station_id) == col(AimbatStation.id))
-    .correlate_except(AimbatSeismogram)
-    .scalar_subquery()
-)
-"Number of unique events recorded at this station."
-
-AimbatSnapshot.seismogram_count = column_property(  # type: ignore[assignment]
-    select(func.count(col(AimbatSeismogramParametersSnapshot.id)))
-    .where(
-        col(AimbatSeismogramParametersSnapshot.snapshot_id) == col(AimbatSnapshot.id)
+    # Counters maintained by database triggers (see core/_project.py::create_project).
+    seismogram_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        exclude=True,
+        title="Seismogram count",
+        description="Number of seismograms for this event.",
     )
-    .correlate_except(AimbatSeismogramParametersSnapshot)
-    .scalar_subquery()
-)
-"Number of seismogram parameter snapshots associated with this snapshot."
-
-AimbatSnapshot.selected_seismogram_count = column_property(  # type: ignore[assignment]
-    select(func.count(col(AimbatSeismogramParametersSnapshot.id)))
-    .where(
-        (col(AimbatSeismogramParametersSnapshot.snapshot_id) == col(AimbatSnapshot.id))
-        & (col(AimbatSeismogramParametersSnapshot.select) == True)  # noqa: E712
+    station_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        exclude=True,
+        title="Station count",
+        description="Number of unique stations for this event.",
     )
-    .correlate_except(AimbatSeismogramParametersSnapshot)
-    .scalar_subquery()
-)
-"Number of seismogram parameter snapshots associated with this snapshot that are marked as selected."
-
-AimbatSnapshot.flipped_seismogram_count = column_property(  # type: ignore[assignment]
-    select(func.count(col(AimbatSeismogramParametersSnapshot.id)))
-    .where(
-        (col(AimbatSeismogramParametersSnapshot.snapshot_id) == col(AimbatSnapshot.id))
-        & (col(AimbatSeismogramParametersSnapshot.flip) == True)  # noqa: E712
+    snapshot_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        exclude=True,
+        title="Snapshot count",
+        description="Number of snapshots for this event.",
     )
-    .correlate_except(AimbatSeismogramParametersSnapshot)
-    .scalar_subquery()
-)
-"Number of seismogram parameter snapshots associated with this snapshot that are marked as flipped."
 
 
 class AimbatNote(SQLModel, table=True):
@@ -784,24 +901,28 @@ class AimbatNote(SQLModel, table=True):
     event_id: uuid.UUID | None = Field(
         default=None,
         foreign_key="aimbatevent.id",
+        index=True,
         ondelete="CASCADE",
         description="Foreign key referencing the parent event.",
     )
     station_id: uuid.UUID | None = Field(
         default=None,
         foreign_key="aimbatstation.id",
+        index=True,
         ondelete="CASCADE",
         description="Foreign key referencing the parent station.",
     )
     seismogram_id: uuid.UUID | None = Field(
         default=None,
         foreign_key="aimbatseismogram.id",
+        index=True,
         ondelete="CASCADE",
         description="Foreign key referencing the parent seismogram.",
     )
     snapshot_id: uuid.UUID | None = Field(
         default=None,
         foreign_key="aimbatsnapshot.id",
+        index=True,
         ondelete="CASCADE",
         description="Foreign key referencing the parent snapshot.",
     )
@@ -836,9 +957,8 @@ type AimbatTypes = (
     | AimbatSeismogramParameters
     | AimbatSeismogramQuality
     | AimbatSnapshot
+    | AimbatSnapshotPayload
     | AimbatEventParametersSnapshot
     | AimbatEventQualitySnapshot
-    | AimbatSeismogramParametersSnapshot
-    | AimbatSeismogramQualitySnapshot
 )
 """Union of all AIMBAT models that exist in the database."""
@@ -0,0 +1,230 @@
+"""Packed storage format for the per-seismogram data of a snapshot.
+
+Rather than one database row per seismogram, a snapshot stores the frozen
+seismogram parameters and quality metrics of all its seismograms as a single
+compressed blob (see `AimbatSnapshotPayload`). The blob holds one packed,
+little-endian array per field (columnar layout), which compresses far better
+than row-wise data because neighbouring values in a column tend to be similar.
+
+Layout (before zlib compression):
+
+| Part            | Encoding                                               |
+| --------------- | ------------------------------------------------------ |
+| header          | `<BI`: format version, number of seismograms `n`        |
+| `seismogram_id` | `n` x 16 bytes (UUID)                                  |
+| `flip`          | `n` x `u1`                                             |
+| `select`        | `n` x `u1`                                             |
+| `t1`            | `n` x `<i8` nanoseconds since the epoch (UTC)          |
+| `iccs_cc`       | `n` x `<f8`                                            |
+| `mccc_cc_mean`  | `n` x `<f8`                                            |
+| `mccc_cc_std`   | `n` x `<f8`                                            |
+| `mccc_error`    | `n` x `<i8` nanoseconds                                |
+
+Missing values are stored as `NaN` (floats) or the minimum `int64` value
+(timestamps and durations).
+"""
+
+import math
+import struct
+import uuid
+import zlib
+from collections.abc import Sequence
+from datetime import timezone
+from typing import Any, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+from pandas import Timedelta, Timestamp
+
+__all__ = [
+    "PAYLOAD_FORMAT_VERSION",
+    "SeismogramSnapshotRow",
+    "pack_seismogram_snapshots",
+    "unpack_seismogram_snapshots",
+    "unpack_seismogram_snapshot_columns",
+]
+
+PAYLOAD_FORMAT_VERSION = 1
+"""Version of the packed layout written by `pack_seismogram_snapshots`."""
+
+_HEADER = struct.Struct("<BI")
+_MISSING_INT = -(2**63)
+_ROW_SIZE = 16 + 1 + 1 + 8 * 5
+"""Number of packed bytes per seismogram, summed over all columns."""
+
+
+class SeismogramSnapshotRow(NamedTuple):
+    """Frozen parameters and quality metrics of one seismogram in a snapshot."""
+
+    seismogram_id: uuid.UUID
+    flip: bool
+    select: bool
+    t1: Timestamp | None
+    iccs_cc: float | None
+    mccc_cc_mean: float | None
+    mccc_cc_std: float | None
+    mccc_error: Timedelta | None
+
+
+def _timestamp_to_int(value: Timestamp | None) -> int:
+    if value is None:
+        return _MISSING_INT
+    ts = Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize(timezone.utc)
+    return int(ts.value)
+
+
+def _int_to_timestamp(value: int) -> Timestamp | None:
+    if value == _MISSING_INT:
+        return None
+    return Timestamp(value, unit="ns", tz=timezone.utc)
+
+
+def _timedelta_to_int(value: Timedelta | None) -> int:
+    return _MISSING_INT if value is None else int(Timedelta(value).value)
+
+
+def _int_to_timedelta(value: int) -> Timedelta | None:
+    return None if value == _MISSING_INT else Timedelta(value, unit="ns")
+
+
+def _float_or_nan(value: float | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _nan_to_none(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def pack_seismogram_snapshots(rows: Sequence[SeismogramSnapshotRow]) -> bytes:
+    """Pack per-seismogram snapshot rows into a compressed columnar blob.
+
+    Args:
+        rows: One row per seismogram in the snapshot.
+
+    Returns:
+        Compressed payload suitable for `AimbatSnapshotPayload.data`.
+    """
+    n = len(rows)
+    parts = [
+        _HEADER.pack(PAYLOAD_FORMAT_VERSION, n),
+        b"".join(row.seismogram_id.bytes for row in rows),
+        struct.pack(f"<{n}B", *(row.flip for row in rows)),
+        struct.pack(f"<{n}B", *(row.select for row in rows)),
+        struct.pack(f"<{n}q", *(_timestamp_to_int(row.t1) for row in rows)),
+        struct.pack(f"<{n}d", *(_float_or_nan(row.iccs_cc) for row in rows)),
+        struct.pack(f"<{n}d", *(_float_or_nan(row.mccc_cc_mean) for row in rows)),
+        struct.pack(f"<{n}d", *(_float_or_nan(row.mccc_cc_std) for row in rows)),
+        struct.pack(f"<{n}q", *(_timedelta_to_int(row.mccc_error) for row in rows)),
+    ]
+    return zlib.compress(b"".join(parts))
+
+
+def _decompress(data: bytes) -> tuple[bytes, int]:
+    raw = zlib.decompress(data)
+    version, n = _HEADER.unpack_from(raw)
+    if version != PAYLOAD_FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot payload format version {version}.")
+    if len(raw) != _HEADER.size + n * _ROW_SIZE:
+        raise ValueError("Snapshot payload is truncated or corrupt.")
+    return raw, n
+
+
+def unpack_seismogram_snapshots(data: bytes) -> list[SeismogramSnapshotRow]:
+    """Unpack a blob written by `pack_seismogram_snapshots`.
+
+    Args:
+        data: Compressed payload.
+
+    Returns:
+        Rows in the order they were packed.
+
+    Raises:
+        ValueError: If the payload was written with an unsupported format
+            version or is truncated.
+    """
+    raw, n = _decompress(data)
+
+    offset = _HEADER.size
+
+    def take(code: str, width: int) -> tuple:
+        nonlocal offset
+        column = struct.unpack_from(f"<{n}{code}", raw, offset)
+        offset += n * width
+        return column
+
+    ids = [
+        uuid.UUID(bytes=raw[offset + 16 * i : offset + 16 * (i + 1)]) for i in range(n)
+    ]
+    offset += 16 * n
+    flip = take("B", 1)
+    select = take("B", 1)
+    t1 = take("q", 8)
+    iccs_cc = take("d", 8)
+    mccc_cc_mean = take("d", 8)
+    mccc_cc_std = take("d", 8)
+    mccc_error = take("q", 8)
+
+    return [
+        SeismogramSnapshotRow(
+            seismogram_id=ids[i],
+            flip=bool(flip[i]),
+            select=bool(select[i]),
+            t1=_int_to_timestamp(t1[i]),
+            iccs_cc=_nan_to_none(iccs_cc[i]),
+            mccc_cc_mean=_nan_to_none(mccc_cc_mean[i]),
+            mccc_cc_std=_nan_to_none(mccc_cc_std[i]),
+            mccc_error=_int_to_timedelta(mccc_error[i]),
+        )
+        for i in range(n)
+    ]
+
+
+def unpack_seismogram_snapshot_columns(data: bytes) -> dict[str, npt.NDArray[Any]]:
+    """Unpack a blob written by `pack_seismogram_snapshots` into numpy columns.
+
+    The columns are read straight from the packed buffer without building a
+    Python object per seismogram, which makes this the faster choice for bulk
+    exports. Missing values are `NaN` (floats) and `NaT` (`t1` and
+    `mccc_error`).
+
+    Args:
+        data: Compressed payload.
+
+    Returns:
+        Dict mapping field name to an array of length `n`. `seismogram_id`
+            holds the UUIDs as strings, `t1` is `datetime64[ns]` (UTC) and
+            `mccc_error` is `timedelta64[ns]`.
+
+    Raises:
+        ValueError: If the payload was written with an unsupported format
+            version or is truncated.
+    """
+    raw, n = _decompress(data)
+    offset = _HEADER.size
+
+    def take(dtype: str, width: int) -> npt.NDArray[Any]:
+        nonlocal offset
+        column = np.frombuffer(raw, dtype=dtype, count=n, offset=offset)
+        offset += n * width
+        return column
+
+    ids = [
+        str(uuid.UUID(bytes=raw[offset + 16 * i : offset + 16 * (i + 1)]))
+        for i in range(n)
+    ]
+    offset += 16 * n
+
+    # int64 minimum is the NaT sentinel of numpy's datetime types, which is
+    # exactly what is used for missing values in the payload.
+    return {
+        "seismogram_id": np.array(ids, dtype=object),
+        "flip": take("u1", 1).astype(bool),
+        "select": take("u1", 1).astype(bool),
+        "t1": take("<i8", 8).view("datetime64[ns]"),
+        "iccs_cc": take("<f8", 8),
+        "mccc_cc_mean": take("<f8", 8),
+        "mccc_cc_std": take("<f8", 8),
+        "mccc_error": take("<i8", 8).view("timedelta64[ns]"),
+    }
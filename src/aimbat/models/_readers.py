@@ -357,9 +357,9 @@ class AimbatEventRead(BaseModel):
         data.update(
             {
                 "completed": event.parameters.completed if event.parameters else False,
-                "seismogram_count": event.seismogram_count or 0,
-                "station_count": event.station_count or 0,
-                "snapshot_count": event.snapshot_count or 0,
+                "seismogram_count": event.seismogram_count,
+                "station_count": event.station_count,
+                "snapshot_count": event.snapshot_count,
             }
         )
         return cls(**data)
@@ -449,8 +449,8 @@ class AimbatStationRead(BaseModel):
 
         data.update(
             {
-                "seismogram_count": station.seismogram_count or 0,
-                "event_count": station.event_count or 0,
+                "seismogram_count": station.seismogram_count,
+                "event_count": station.event_count,
             }
         )
         return cls(**data)
@@ -785,24 +785,25 @@ class SnapshotSeismogramResult(BaseModel):
     def from_snapshot_records(
         cls,
         param_snap: "AimbatSeismogramParametersSnapshot",
+        seismogram: "AimbatSeismogram",
         quality_snap: "AimbatSeismogramQualitySnapshot | None",
     ) -> "SnapshotSeismogramResult":
         """Build a result record from pre-loaded snapshot records.
 
         Warning:
-            `param_snap.parameters.seismogram.station` must be loaded before
-            calling (e.g. via `selectinload`). `quality_snap.quality` must also
-            be loaded when `quality_snap` is not `None`.
+            `seismogram.station` must be loaded before calling (e.g. via
+            `selectinload`).
 
         Args:
             param_snap: Seismogram parameters snapshot record.
+            seismogram: The seismogram `param_snap` was taken from.
             quality_snap: Matching seismogram quality snapshot, or `None` if
                 no quality data was captured for this seismogram.
 
         Returns:
             Assembled result record.
         """
-        seis = param_snap.parameters.seismogram
+        seis = seismogram
         station = seis.station
         name = (f"{station.network}." if station.network else "") + station.name
         return cls(
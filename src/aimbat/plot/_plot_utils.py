@@ -1,21 +1,56 @@
 """Prepare seismogram data for plotting."""
 
+import os
 import uuid
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from pysmo import MiniSeismogram
-from pysmo.functions import clone_to_mini, detrend, normalize, resample
+from pysmo.functions import detrend, normalize, resample
 from pysmo.tools.azdist import distance
 from pysmo.tools.signal import bandpass
 
-from aimbat.logger import logger
+from aimbat.logger import Span, annotate_span, logger
 from aimbat.models import AimbatEvent, AimbatSeismogram, AimbatStation
 
-__all__ = ["clean_timedelta", "event_seismograms", "station_seismograms"]
+__all__ = [
+    "clean_timedelta",
+    "clear_prepared_cache",
+    "event_seismograms",
+    "station_seismograms",
+]
 
 _RESAMPLE_DELTA = pd.Timedelta(0.1, unit="s")
 
+# Seismogram ID and the event's bandpass settings (apply, fmin, fmax).
+type _PreparedKey = tuple[uuid.UUID, bool, float, float]
+
+
+@dataclass(frozen=True)
+class _PreparedEntry:
+    source: npt.NDArray[np.float64]
+    begin_time: pd.Timestamp
+    delta: pd.Timedelta
+    seismogram: MiniSeismogram
+
+
+# Process-level cache of prepared traces. In normal CLI use this is always cold
+# (one plot per process). In the shell and the TUI repeated plots of the same
+# event or station reuse the entries, and only traces whose data or filter
+# settings changed are prepared again.
+_PREPARED_CACHE_SIZE = 20_000
+_prepared_cache: dict[_PreparedKey, _PreparedEntry] = {}
+
+
+def clear_prepared_cache() -> None:
+    """Clear the process-level cache of seismograms prepared for plotting."""
+    _prepared_cache.clear()
+
 
 def clean_timedelta(x: float, _: int | None) -> str:
     """Format elapsed seconds as `[-]MM:SS` for a matplotlib tick formatter."""
@@ -25,20 +60,109 @@ def clean_timedelta(x: float, _: int | None) -> str:
     return f"{sign}{minutes:02d}:{seconds:02d}"
 
 
-def _prepare_seismogram_for_plotting(seismogram: AimbatSeismogram) -> MiniSeismogram:
-    logger.debug(f"Preparing seismogram {seismogram.id} for plotting.")
-    preped_seis = clone_to_mini(MiniSeismogram, seismogram)
+@dataclass(frozen=True)
+class _PrepareJob:
+    """Everything needed to prepare a seismogram without touching the database."""
+
+    key: _PreparedKey
+    begin_time: pd.Timestamp
+    delta: pd.Timedelta
+    data: npt.NDArray[np.float64]
+
+
+def _prepare_job(seismogram: AimbatSeismogram) -> _PrepareJob:
+    parameters = seismogram.event.parameters
+    return _PrepareJob(
+        key=(
+            seismogram.id,
+            parameters.bandpass_apply,
+            parameters.bandpass_fmin,
+            parameters.bandpass_fmax,
+        ),
+        begin_time=seismogram.begin_time,
+        delta=seismogram.delta,
+        data=seismogram.data,
+    )
+
+
+def _prepare_seismogram_for_plotting(job: _PrepareJob) -> MiniSeismogram:
+    seismogram_id, bandpass_apply, fmin, fmax = job.key
+    logger.debug(f"Preparing seismogram {seismogram_id} for plotting.")
+    preped_seis = MiniSeismogram(
+        begin_time=job.begin_time, delta=job.delta, data=job.data.copy()
+    )
     detrend(preped_seis)
-    if seismogram.event.parameters.bandpass_apply is True:
-        fmin = seismogram.event.parameters.bandpass_fmin
-        fmax = seismogram.event.parameters.bandpass_fmax
+    if bandpass_apply is True:
         logger.debug(f"Applying bandpass filter: {fmin}-{fmax} Hz.")
         bandpass(preped_seis, fmin, fmax)
     resample(preped_seis, _RESAMPLE_DELTA)
     normalize(preped_seis)
+    preped_seis.data.flags.writeable = False
     return preped_seis
 
 
+def _is_current(entry: _PreparedEntry, job: _PrepareJob) -> bool:
+    # The cached entry holds a reference to the array it was prepared from, so
+    # an identity check detects data that was re-read or rewritten since.
+    return (
+        entry.source is job.data
+        and entry.begin_time == job.begin_time
+        and entry.delta == job.delta
+    )
+
+
+@Span("plot.prepare_seismograms")
+def _prepare_seismograms(
+    seismograms: Sequence[AimbatSeismogram],
+) -> list[MiniSeismogram]:
+    """Prepare seismograms for plotting, reusing cached traces where possible.
+
+    Database attributes and waveform data are read on the calling thread, as
+    the session is not thread-safe. Only the signal processing of traces
+    missing from the cache runs on a thread pool.
+
+    Args:
+        seismograms: Seismograms to prepare.
+
+    Returns:
+        Prepared seismograms, in the order of `seismograms`.
+    """
+    jobs = [_prepare_job(s) for s in seismograms]
+    prepared: dict[_PreparedKey, MiniSeismogram] = {}
+    pending: list[_PrepareJob] = []
+    for job in jobs:
+        entry = _prepared_cache.get(job.key)
+        if entry is not None and _is_current(entry, job):
+            prepared[job.key] = entry.seismogram
+        else:
+            pending.append(job)
+    annotate_span(seismograms=len(jobs), prepared=len(pending))
+    logger.debug(
+        f"Reusing {len(jobs) - len(pending)} prepared seismograms, "
+        f"preparing {len(pending)}."
+    )
+
+    workers = min(len(pending), os.cpu_count() or 1)
+    if workers > 1:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="aimbat-plot"
+        ) as executor:
+            results = list(executor.map(_prepare_seismogram_for_plotting, pending))
+    else:
+        results = [_prepare_seismogram_for_plotting(job) for job in pending]
+
+    for job, seismogram in zip(pending, results, strict=True):
+        _prepared_cache.pop(job.key, None)
+        _prepared_cache[job.key] = _PreparedEntry(
+            job.data, job.begin_time, job.delta, seismogram
+        )
+        prepared[job.key] = seismogram
+    while len(_prepared_cache) > _PREPARED_CACHE_SIZE:
+        del _prepared_cache[next(iter(_prepared_cache))]
+
+    return [prepared[job.key] for job in jobs]
+
+
 def event_seismograms(
     event: AimbatEvent,
 ) -> list[tuple[MiniSeismogram, AimbatStation, float, uuid.UUID]]:
@@ -52,14 +176,12 @@ def event_seismograms(
             event, and seismogram ID for each seismogram.
     """
 
+    seismograms = event.seismograms
     data = [
-        (
-            _prepare_seismogram_for_plotting(s),
-            s.station,
-            distance(s.station, s.event) / 1000,
-            s.id,
+        (prepared, s.station, distance(s.station, s.event) / 1000, s.id)
+        for prepared, s in zip(
+            _prepare_seismograms(seismograms), seismograms, strict=True
         )
-        for s in event.seismograms
     ]
     data.sort(key=lambda x: x[2], reverse=True)
     return data
@@ -77,9 +199,12 @@ def station_seismograms(
         List of tuples containing the seismogram, event, pick time, and
             seismogram ID for each seismogram.
     """
+    seismograms = station.seismograms
     data = [
-        (_prepare_seismogram_for_plotting(s), s.event, s.t1 or s.t0, s.id)
-        for s in station.seismograms
+        (prepared, s.event, s.t1 or s.t0, s.id)
+        for prepared, s in zip(
+            _prepare_seismograms(seismograms), seismograms, strict=True
+        )
     ]
     data.sort(key=lambda x: x[2])
     return data
@@ -1,18 +1,22 @@
+from collections.abc import Sequence
 from functools import singledispatch
-from typing import Literal, overload
+from typing import Any, Literal, overload
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import mplcursors  # type: ignore[import-untyped]
-import pandas as pd
+import numpy as np
+import numpy.typing as npt
 from matplotlib import ticker
 from matplotlib.backend_bases import MouseEvent
+from matplotlib.collections import LineCollection
 from sqlmodel import Session
 
 from pysmo.tools.plotutils import relative_time_array, time_array
 
 from aimbat.logger import logger
 from aimbat.models import AimbatEvent, AimbatStation
+from aimbat.utils import minmax_decimate
 
 from ._plot_utils import clean_timedelta, event_seismograms, station_seismograms
 
@@ -20,6 +24,10 @@ __all__ = ["plot_seismograms"]
 
 _VISIBLE_SEISMOGRAMS = 7
 
+# Lower bound for the number of points across the axes a trace is decimated to,
+# so traces stay smooth while the figure is not laid out yet.
+_MIN_RESOLUTION = 200
+
 
 def _add_scroll_pan(ax: plt.Axes) -> None:
     """Pan the y-axis on scroll and the x-axis on shift+scroll."""
@@ -50,6 +58,93 @@ def _add_scroll_pan(ax: plt.Axes) -> None:
     ax.figure.canvas.mpl_connect("scroll_event", on_scroll)
 
 
+class _TraceCollection:
+    """Draw a record section as one `LineCollection` at screen resolution.
+
+    Only traces that overlap the current y-limits are drawn, each cut to the
+    current x-limits and reduced with `minmax_decimate` to two points per
+    pixel of the axes width. The segments are recomputed whenever the limits
+    change (scroll, pan, zoom) or the figure is resized, so drawing costs the
+    same for a few traces and thousands of them.
+
+    Args:
+        ax: Axes to draw on.
+        traces: `(x, y)` arrays of each trace, with `y` already scaled and
+            offset to its position on the y-axis.
+        offsets: Position of each trace on the y-axis.
+        half_height: Largest distance of a trace from its offset.
+        labels: Label of each trace, shown when hovering over it.
+    """
+
+    def __init__(
+        self,
+        ax: plt.Axes,
+        traces: Sequence[tuple[npt.NDArray[Any], npt.NDArray[Any]]],
+        offsets: npt.ArrayLike,
+        half_height: float,
+        labels: Sequence[str],
+    ) -> None:
+        self._ax = ax
+        self._traces = traces
+        self._offsets = np.asarray(offsets, dtype=float)
+        self._half_height = half_height
+        self._labels = labels
+        self._colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+        self._visible: list[int] = []
+        self.collection = LineCollection([], linewidths=plt.rcParams["lines.linewidth"])
+        ax.add_collection(self.collection, autolim=False)
+        ax.update_datalim(
+            [
+                (min(x[0] for x, _ in traces), self._offsets.min() - half_height),
+                (max(x[-1] for x, _ in traces), self._offsets.max() + half_height),
+            ]
+        )
+        ax.autoscale_view()
+        ax.callbacks.connect("xlim_changed", self.update)
+        ax.callbacks.connect("ylim_changed", self.update)
+        ax.figure.canvas.mpl_connect("resize_event", self.update)
+
+    def label(self, index: int) -> str:
+        """Return the label of the `index`-th segment currently drawn."""
+        return self._labels[self._visible[index]]
+
+    def update(self, *_: Any) -> None:
+        """Recompute the drawn segments for the current limits and size."""
+        xmin, xmax = sorted(self._ax.get_xlim())
+        ymin, ymax = sorted(self._ax.get_ylim())
+        resolution = max(int(self._ax.bbox.width), _MIN_RESOLUTION)
+        visible = np.flatnonzero(
+            (self._offsets + self._half_height >= ymin)
+            & (self._offsets - self._half_height <= ymax)
+        )
+        segments = []
+        self._visible = []
+        for i in visible:
+            x, y = self._traces[i]
+            # Keep one sample beyond each limit so lines reach the edges.
+            start = max(int(np.searchsorted(x, xmin)) - 1, 0)
+            stop = int(np.searchsorted(x, xmax, side="right")) + 1
+            if stop - start < 2:
+                continue
+            x_visible, y_visible = minmax_decimate(
+                x[start:stop], y[start:stop], resolution
+            )
+            segments.append(np.column_stack([x_visible, y_visible]))
+            self._visible.append(int(i))
+        self.collection.set_segments(segments)
+        self.collection.set_color(
+            [self._colors[i % len(self._colors)] for i in self._visible]
+        )
+
+
+def _add_hover_labels(traces: _TraceCollection) -> None:
+    cursor = mplcursors.cursor([traces.collection], hover=True)
+
+    @cursor.connect("add")
+    def on_add(sel: mplcursors.Selection) -> None:
+        sel.annotation.set_text(traces.label(sel.index[0]))
+
+
 @singledispatch
 def _plot_seis(
     arg: AimbatEvent | AimbatStation, session: Session
@@ -77,18 +172,21 @@ def _(event: AimbatEvent, session: Session) -> tuple[plt.Figure, plt.Axes]:
         distance_spacing = (distance_max - distance_min) / (len(seismograms) - 1)
         scaling_factor = distance_spacing * 0.8
 
-    for seismogram, station, distance_km, id in seismograms:
-        data = seismogram.data * scaling_factor + distance_km
-        times = time_array(seismogram)
-        pd.Series(data, index=times).plot(
-            ax=ax, scalex=True, scaley=True, label=f"Seismogram: {id}"
-        )
-
-    cursor = mplcursors.cursor(ax.lines, hover=True)
-
-    @cursor.connect("add")
-    def on_add(sel: mplcursors.Selection) -> None:
-        sel.annotation.set_text(sel.artist.get_label())
+    ax.xaxis_date()
+    traces = _TraceCollection(
+        ax,
+        [
+            (
+                mdates.date2num(time_array(seismogram)),
+                seismogram.data * scaling_factor + distance_km,
+            )
+            for seismogram, _, distance_km, _ in seismograms
+        ],
+        offsets=[d[2] for d in seismograms],
+        half_height=scaling_factor,
+        labels=[f"Seismogram: {d[3]}" for d in seismograms],
+    )
+    _add_hover_labels(traces)
 
     plt.xlabel(xlabel="Time of day")
     plt.ylabel(ylabel="Epicentral distance [km]")
@@ -106,6 +204,7 @@ def _(event: AimbatEvent, session: Session) -> tuple[plt.Figure, plt.Axes]:
         top = seismograms[0][2] + scaling_factor
         ax.set_ylim(bottom, top)
 
+    traces.update()
     return fig, ax
 
 
@@ -119,16 +218,17 @@ def _(station: AimbatStation, session: Session) -> tuple[plt.Figure, plt.Axes]:
 
     fig, ax = plt.subplots(figsize=(10, 6), layout="tight")
 
-    for i, (seismogram, event, pick, id) in enumerate(seismograms):
-        data = seismogram.data * 0.4 + i
-        rel_times = relative_time_array(seismogram, pick)
-        ax.plot(rel_times, data, label=f"Seismogram: {id}")
-
-    cursor = mplcursors.cursor(ax.lines, hover=True)
-
-    @cursor.connect("add")
-    def on_add(sel: mplcursors.Selection) -> None:
-        sel.annotation.set_text(sel.artist.get_label())
+    traces = _TraceCollection(
+        ax,
+        [
+            (relative_time_array(seismogram, pick), seismogram.data * 0.4 + i)
+            for i, (seismogram, _, pick, _) in enumerate(seismograms)
+        ],
+        offsets=np.arange(len(seismograms)),
+        half_height=0.4,
+        labels=[f"Seismogram: {d[3]}" for d in seismograms],
+    )
+    _add_hover_labels(traces)
 
     ax.xaxis.set_major_formatter(ticker.FuncFormatter(clean_timedelta))
     ax.yaxis.set_visible(False)
@@ -138,6 +238,7 @@ def _(station: AimbatStation, session: Session) -> tuple[plt.Figure, plt.Axes]:
     if len(seismograms) > _VISIBLE_SEISMOGRAMS:
         ax.set_ylim(-0.5, _VISIBLE_SEISMOGRAMS - 0.1)
 
+    traces.update()
     return fig, ax
 
 
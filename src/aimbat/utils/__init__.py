@@ -1,11 +1,15 @@
 # flake8: noqa: E402, F403
 """Miscellaneous helpers for AIMBAT.
 
-Covers four areas:
+Covers six areas:
 
 - **JSON** — render JSON data as Rich tables (`json_to_table`).
+- **Profiling** — profile commands and workers with cProfile and sampled
+  call stacks (`profiling`, `profiled`).
 - **Sample data** — download and delete the bundled sample dataset
   (`download_sampledata`, `delete_sampledata`).
+- **SQL profiling** — time and count the statements executed by an engine
+  (`SQLProfiler`).
 - **Styling** — shared Rich/table style helpers (`make_table`).
 - **UUIDs** — look up model records by short UUID prefix (`get_by_uuid`).
 """
@@ -15,9 +19,11 @@ from .._utils import export_module_names
 _internal_names = set(dir())
 
 from ._maths import *
+from ._profiling import *
 from ._pydantic import *
 from ._sampledata import *
 from ._sqlalchemy import *
+from ._sqlprofile import *
 from ._uuid import *
 
 __all__ = [s for s in dir() if not s.startswith("_") and s not in _internal_names]
@@ -0,0 +1,191 @@
+"""Profiling of CLI commands and TUI workers."""
+
+import cProfile
+import itertools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Collection, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from aimbat import settings
+from aimbat.logger import logger
+
+__all__ = ["StackSampler", "profiling", "profiled"]
+
+_counter = itertools.count(1)
+
+# Only one cProfile profiler can be active at a time in a process.
+_cprofile_lock = threading.Lock()
+
+# Profiles are not nested: an inner block in the same thread is part of the
+# outer profile already.
+_local = threading.local()
+
+
+def _collapse(frame: FrameType | None) -> str:
+    """Format a stack as `outermost;...;innermost` frame names."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Periodically sample the call stacks of running threads.
+
+    A background thread records the stacks of the selected threads every
+    `interval` seconds. The result is written in the collapsed-stack format
+    read by flame graph tools (e.g. `flamegraph.pl`, speedscope or inferno):
+    one line per distinct stack, with frames from outermost to innermost
+    separated by `;`, followed by the number of samples.
+
+    Attributes:
+        interval: Seconds between samples.
+        thread_ids: Identifiers of the threads to sample, or `None` for all
+            threads.
+        counts: Number of samples per collapsed stack.
+    """
+
+    def __init__(
+        self, interval: float = 0.005, thread_ids: Collection[int] | None = None
+    ):
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self.counts: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="aimbat-stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the background thread to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if self.thread_ids is not None and thread_id not in self.thread_ids:
+                    continue
+                if thread_id not in names:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                thread_name = names.get(thread_id, str(thread_id))
+                self.counts[f"{thread_name};{_collapse(frame)}"] += 1
+
+    def write(self, path: Path) -> None:
+        """Write the collected samples in collapsed-stack format.
+
+        Args:
+            path: Output file.
+        """
+        with path.open("w", encoding="utf-8") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def profiling(
+    name: str, directory: Path | None = None, all_threads: bool = False
+) -> Iterator[Path | None]:
+    """Profile a block of code if profiling is enabled.
+
+    Writes two files named after `name`, the start time and the process ID to
+    `directory`: a `.pstats` file from `cProfile` (read it with `pstats`,
+    snakeviz, etc.) and a `.collapsed` file with sampled call stacks for flame
+    graph tools (see `StackSampler`). The cProfile data is only recorded if no
+    other profile is running in the process at the same time; the stacks are
+    always sampled. Nested blocks in the same thread are part of the outer
+    profile and do not write files of their own.
+
+    Args:
+        name: Name of the profiled operation (e.g. the command name).
+        directory: Output directory. Defaults to `Settings.profile_dir`;
+            profiling is disabled if neither is set.
+        all_threads: Sample the stacks of all threads instead of only the
+            thread running the block.
+
+    Yields:
+        Path of the output files without suffix, or `None` if nothing is
+            profiled.
+    """
+    directory = directory or settings.profile_dir
+    if directory is None or getattr(_local, "active", False):
+        yield None
+        return
+
+    directory.mkdir(parents=True, exist_ok=True)
+    timestamp = time.strftime("%Y%m%dT%H%M%S")
+    stem = directory / f"{name}-{timestamp}-{os.getpid()}-{next(_counter)}"
+
+    profiler = cProfile.Profile() if _cprofile_lock.acquire(blocking=False) else None
+    sampler = StackSampler(thread_ids=None if all_threads else {threading.get_ident()})
+
+    logger.debug(f"Profiling {name}.")
+    _local.active = True
+    sampler.start()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield stem
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            _cprofile_lock.release()
+        sampler.stop()
+        _local.active = False
+
+        files = [Path(f"{stem}.collapsed")]
+        sampler.write(files[0])
+        if profiler is not None:
+            files.insert(0, Path(f"{stem}.pstats"))
+            profiler.dump_stats(files[0])
+        logger.info(f"Profile of {name} written to {', '.join(map(str, files))}.")
+
+
+def profiled[F: Callable[..., Any]](
+    name: str | None = None, all_threads: bool = False
+) -> Callable[[F], F]:
+    """Decorator that runs a function inside `profiling`.
+
+    Whether to profile is decided on each call, so the decorator can be
+    applied at import time.
+
+    Args:
+        name: Name used for the profile files. Defaults to the function name.
+        all_threads: Sample the stacks of all threads instead of only the
+            thread running the function.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with profiling(name or func.__name__, all_threads=all_threads):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
@@ -0,0 +1,227 @@
+"""SQL statement profiling via SQLAlchemy engine events."""
+
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from aimbat.logger import logger
+
+__all__ = ["SQLProfiler", "normalise_statement"]
+
+_START_TIMES_KEY = "aimbat_sql_profile_start"
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_VALUES = re.compile(r"(?:\(\?\.\.\.\)\s*,\s*)+\(\?\.\.\.\)")
+
+
+def normalise_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape, so repeated queries group together.
+
+    Literals become `?`, lists of placeholders (e.g. from `IN (...)` or a
+    multi-row `VALUES`) collapse to `(?...)` and whitespace is collapsed.
+
+    Args:
+        statement: SQL statement as sent to the database driver.
+
+    Returns:
+        Normalised statement.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(?...)", statement)
+    statement = _REPEATED_VALUES.sub("(?...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@dataclass
+class _StatementStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+class SQLProfiler:
+    """Record timings of the SQL statements executed by an engine.
+
+    Statements are timed between SQLAlchemy's `before_cursor_execute` and
+    `after_cursor_execute` events and aggregated per normalised statement
+    (see `normalise_statement`). Statements slower than `slow_threshold` are
+    kept individually, and a `SELECT` executed at least `repeat_threshold`
+    times is reported as a suspected N+1 pattern (a query issued once per
+    row of an earlier result instead of once for all rows).
+
+    Examples:
+        ```python
+        profiler = SQLProfiler().attach(engine)
+        ...  # run some queries
+        profiler.detach()
+        print(profiler.report())
+        ```
+
+    Attributes:
+        slow_threshold: Duration in seconds above which a statement is
+            reported as slow.
+        repeat_threshold: Number of executions of the same `SELECT` from
+            which it is reported as a suspected N+1 pattern.
+    """
+
+    def __init__(self, slow_threshold: float = 0.1, repeat_threshold: int = 20):
+        self.slow_threshold = slow_threshold
+        self.repeat_threshold = repeat_threshold
+        self._stats: dict[str, _StatementStats] = {}
+        self._slow: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._engine: Engine | None = None
+
+    def attach(self, engine: Engine) -> "SQLProfiler":
+        """Start recording the statements executed by `engine`.
+
+        Args:
+            engine: Engine to instrument.
+
+        Returns:
+            The profiler itself.
+
+        Raises:
+            RuntimeError: If the profiler is already attached to an engine.
+        """
+        if self._engine is not None:
+            raise RuntimeError("SQLProfiler is already attached to an engine.")
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engine = engine
+        return self
+
+    def detach(self) -> None:
+        """Stop recording statements (the recorded data is kept)."""
+        if self._engine is None:
+            return
+        event.remove(self._engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self._engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engine = None
+
+    def _before_cursor_execute(self, conn: Any, *args: Any) -> None:
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self, conn: Any, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if not start_times:
+            return
+        self.record(statement, time.perf_counter() - start_times.pop())
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record one execution of a statement.
+
+        Args:
+            statement: SQL statement as sent to the database driver.
+            duration: Execution time in seconds.
+        """
+        key = normalise_statement(statement)
+        with self._lock:
+            stats = self._stats.setdefault(key, _StatementStats())
+            stats.count += 1
+            stats.total += duration
+            stats.max = max(stats.max, duration)
+            if duration >= self.slow_threshold:
+                self._slow.append((duration, statement))
+
+    @property
+    def statement_count(self) -> int:
+        """Total number of statements recorded."""
+        with self._lock:
+            return sum(s.count for s in self._stats.values())
+
+    def n_plus_one_suspects(self) -> list[tuple[str, int]]:
+        """Normalised `SELECT` statements executed suspiciously often.
+
+        Returns:
+            Tuples of normalised statement and number of executions, most
+                frequent first.
+        """
+        with self._lock:
+            suspects = [
+                (statement, stats.count)
+                for statement, stats in self._stats.items()
+                if stats.count >= self.repeat_threshold
+                and statement.upper().startswith("SELECT")
+            ]
+        return sorted(suspects, key=lambda s: s[1], reverse=True)
+
+    def report(self) -> dict[str, Any]:
+        """Summarise the recorded statements.
+
+        Returns:
+            JSON serialisable dict with the totals, per-statement aggregates
+                (slowest total first), the slow statements (slowest first) and
+                the suspected N+1 patterns. Times are in milliseconds.
+        """
+        with self._lock:
+            statements = sorted(
+                self._stats.items(), key=lambda item: item[1].total, reverse=True
+            )
+            slow = sorted(self._slow, reverse=True)
+        return {
+            "statement_count": sum(s.count for _, s in statements),
+            "total_ms": sum(s.total for _, s in statements) * 1000,
+            "statements": [
+                {
+                    "statement": statement,
+                    "count": stats.count,
+                    "total_ms": stats.total * 1000,
+                    "mean_ms": stats.total / stats.count * 1000,
+                    "max_ms": stats.max * 1000,
+                }
+                for statement, stats in statements
+            ],
+            "slow_statements": [
+                {"statement": statement, "duration_ms": duration * 1000}
+                for duration, statement in slow
+            ],
+            "n_plus_one_suspects": [
+                {"statement": statement, "count": count}
+                for statement, count in self.n_plus_one_suspects()
+            ],
+        }
+
+    def log_report(self) -> None:
+        """Write a summary of the recorded statements to the AIMBAT log."""
+        report = self.report()
+        logger.info(
+            f"SQL profile: {report['statement_count']} statement(s) in "
+            f"{report['total_ms']:.1f} ms "
+            f"({len(report['statements'])} distinct)."
+        )
+        for entry in report["statements"][:10]:
+            logger.info(
+                f"SQL profile: {entry['count']}x, {entry['total_ms']:.1f} ms total, "
+                f"{entry['max_ms']:.1f} ms max: {entry['statement']}"
+            )
+        for entry in report["slow_statements"]:
+            logger.warning(
+                f"SQL profile: slow statement ({entry['duration_ms']:.1f} ms): "
+                f"{entry['statement']}"
+            )
+        for entry in report["n_plus_one_suspects"]:
+            logger.warning(
+                f"SQL profile: possible N+1 query pattern, executed "
+                f"{entry['count']} times: {entry['statement']}"
+            )
+
+    def write_report(self, path: Path) -> None:
+        """Write the report returned by `report` to a JSON file.
+
+        Args:
+            path: Output file.
+        """
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
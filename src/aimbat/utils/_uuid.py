@@ -1,8 +1,12 @@
 """UUID functions for AIMBAT."""
 
+from os.path import commonprefix
+from string import hexdigits
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import String, cast, func
+from sqlalchemy import String, cast, event, func, type_coerce
+from sqlalchemy.orm import Session as _OrmSession
 from sqlmodel import Session, select
 
 from aimbat.logger import logger
@@ -11,8 +15,63 @@ from aimbat.models import AimbatTypes
 __all__ = [
     "string_to_uuid",
     "uuid_shortener",
+    "uuid_shortener_map",
 ]
 
+_PREFIX_CACHE_KEY = "aimbat_uuid_prefix_lengths"
+"""Key in `Session.info` under which shortest-prefix lengths are cached."""
+
+
+@event.listens_for(_OrmSession, "after_flush")
+@event.listens_for(_OrmSession, "after_soft_rollback")
+def _clear_prefix_cache(session: _OrmSession, *_: Any) -> None:
+    """Drop cached prefix lengths once the session may have added or removed rows."""
+    session.info.pop(_PREFIX_CACHE_KEY, None)
+
+
+def _unique_prefix_lengths(ids: list[str]) -> dict[str, int]:
+    """Map each ID to the length of its shortest unique prefix.
+
+    Once sorted, the IDs sharing the longest common prefix with any given ID
+    are its immediate neighbours, so one pass over adjacent pairs is enough.
+
+    Args:
+        ids: Hyphenated UUID strings.
+
+    Returns:
+        Dictionary mapping each ID to its shortest unique prefix length.
+    """
+    ids = sorted(ids)
+    shared = [len(commonprefix((a, b))) for a, b in zip(ids, ids[1:])]
+    lengths: dict[str, int] = {}
+    for i, uid in enumerate(ids):
+        before = shared[i - 1] if i > 0 else 0
+        after = shared[i] if i < len(shared) else 0
+        lengths[uid] = max(before, after) + 1
+    return lengths
+
+
+def _prefix_lengths(
+    session: Session, model_class: type[AimbatTypes], refresh: bool = False
+) -> dict[str, int]:
+    """Return the shortest unique prefix lengths for a table, cached per session."""
+    cache: dict[type, dict[str, int]] = session.info.setdefault(_PREFIX_CACHE_KEY, {})
+    if refresh or model_class not in cache:
+        ids = [str(uid) for uid in session.exec(select(model_class.id)).all()]
+        cache[model_class] = _unique_prefix_lengths(ids)
+        logger.debug(
+            f"Computed unique prefixes for {len(ids)} {model_class.__name__} IDs."
+        )
+    return cache[model_class]
+
+
+def _shorten(full: str, length: int, min_length: int) -> str:
+    """Cut `full` to at least `length` and `min_length` characters, never on a dash."""
+    length = max(length, min_length)
+    if length < len(full) and full[length - 1] == "-":
+        length += 1
+    return full[:length]
+
 
 def string_to_uuid(
     session: Session,
@@ -22,6 +81,11 @@ def string_to_uuid(
 ) -> UUID:
     """Determine a UUID from a string containing the first few characters.
 
+    On SQLite, UUIDs are stored as 32-character lowercase hex strings, so all
+    IDs starting with a given prefix form a contiguous range of the primary
+    key index. The lookup is therefore a range search on that index rather
+    than a scan of the whole table.
+
     Args:
         session: Database session.
         id: Input string to find UUID for.
@@ -34,12 +98,24 @@ def string_to_uuid(
     Raises:
         ValueError: If the UUID could not be determined.
     """
-    statement = select(aimbat_class.id).where(
-        func.replace(cast(aimbat_class.id, String), "-", "").like(
-            f"{id.replace('-', '')}%"
-        )
-    )
-    uuid_set = set(session.exec(statement).all())
+    prefix = id.replace("-", "").lower()
+
+    if not all(char in hexdigits for char in prefix):
+        uuid_set: set[UUID] = set()
+    else:
+        if session.get_bind().dialect.name == "sqlite":
+            stored_id = type_coerce(aimbat_class.id, String)
+            # "g" sorts after every hex digit, closing the range of IDs
+            # that start with `prefix`.
+            condition = (stored_id >= prefix) & (stored_id < f"{prefix}g")
+        else:
+            condition = func.replace(cast(aimbat_class.id, String), "-", "").like(
+                f"{prefix}%"
+            )
+        # Two rows are enough to tell a unique match from an ambiguous one.
+        statement = select(aimbat_class.id).where(condition).limit(2)
+        uuid_set = set(session.exec(statement).all())
+
     if len(uuid_set) == 1:
         resolved = uuid_set.pop()
         logger.debug(f"Resolved {id} to UUID: {resolved}")
@@ -59,6 +135,10 @@ def uuid_shortener[T: AimbatTypes](
 ) -> str:
     """Calculates the shortest unique prefix for a UUID, returning with dashes.
 
+    The prefixes of the whole table are computed in one go and cached on the
+    session (see [`uuid_shortener_map`][aimbat.utils.uuid_shortener_map]), so
+    calling this once per displayed row is cheap.
+
     Args:
         session: An active SQLModel/SQLAlchemy session.
         aimbat_obj: Either an instance of a SQLModel or the SQLModel class itself.
@@ -78,31 +158,40 @@ def uuid_shortener[T: AimbatTypes](
         model_class = type(aimbat_obj)
         target_full = str(aimbat_obj.id)
 
-    prefix_clean = target_full.replace("-", "")[:min_length]
+    lengths = _prefix_lengths(session, model_class)
+    if target_full not in lengths:
+        # The row may have been committed by another session since the cache
+        # was built.
+        lengths = _prefix_lengths(session, model_class, refresh=True)
+    if target_full not in lengths:
+        raise ValueError(f"ID {target_full} not found in table {model_class.__name__}")
 
-    # select with a WHERE clause that removes dashes and compares the cleaned prefix
-    statement = select(model_class.id).where(
-        func.replace(cast(model_class.id, String), "-", "").like(f"{prefix_clean}%")
-    )
+    shortened = _shorten(target_full, lengths[target_full], min_length)
+    logger.debug(f"Shortened {target_full} to: {shortened}")
+    return shortened
 
-    # Store results as standard hyphenated strings
-    results = session.exec(statement).all()
-    relevant_pool = [str(uid) for uid in results]
 
-    if target_full not in relevant_pool:
-        raise ValueError(f"ID {target_full} not found in table {model_class.__name__}")
+def uuid_shortener_map(
+    session: Session,
+    model_class: type[AimbatTypes],
+    min_length: int = 2,
+) -> dict[UUID, str]:
+    """Calculates the shortest unique prefix for every UUID in a table.
 
-    current_length = min_length
-    while current_length < len(target_full):
-        candidate = target_full[:current_length]
-        if candidate.endswith("-"):
-            current_length += 1
-            continue
+    All IDs are fetched once and sorted; each ID's shortest unique prefix then
+    follows from comparing it with its neighbours. The result is cached on the
+    session until it next flushes or rolls back.
 
-        matches = [u for u in relevant_pool if u.startswith(candidate)]
-        if len(matches) == 1:
-            logger.debug(f"Shortened {target_full} to: {candidate}")
-            return candidate
-        current_length += 1
+    Args:
+        session: An active SQLModel/SQLAlchemy session.
+        model_class: The SQLModel class whose table IDs are shortened.
+        min_length: The starting character length for the shortened IDs.
 
-    return target_full
+    Returns:
+        Dictionary mapping each UUID to its shortest unique prefix string,
+            including hyphens where applicable.
+    """
+    return {
+        UUID(full): _shorten(full, length, min_length)
+        for full, length in _prefix_lengths(session, model_class).items()
+    }
@@ -0,0 +1,420 @@
+"""Fixtures for the scale benchmarks.
+
+The benchmarks run against a synthetic project written as SAC files and are
+skipped unless selected with `-m benchmark`. The size of the project and the
+handling of the results are controlled with environment variables:
+
+| Variable                   | Default | Meaning                                       |
+| -------------------------- | ------- | --------------------------------------------- |
+| `BENCHMARK_EVENTS`         | 3       | Number of events                              |
+| `BENCHMARK_STATIONS`       | 20      | Number of stations (one seismogram per event) |
+| `BENCHMARK_SAMPLING_RATE`  | 40      | Sampling rate in Hz                           |
+| `BENCHMARK_DURATION`       | 300     | Length of each seismogram in seconds          |
+| `BENCHMARK_OUTPUT`         | unset   | JSON file the timings are written to          |
+| `BENCHMARK_BASELINE`       | unset   | JSON file from an earlier run to compare with |
+| `BENCHMARK_THRESHOLD`      | 0.25    | Allowed slowdown relative to the baseline     |
+"""
+
+import json
+import os
+import platform
+import sqlite3
+import time
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from pandas import Timedelta, Timestamp
+from sqlalchemy import Engine, event
+from sqlmodel import Session, create_engine
+
+from pysmo.classes import SAC
+
+import aimbat
+import aimbat.db
+from aimbat.app import __version__
+from aimbat.core import add_data_to_project, create_project
+from aimbat.io import DataType
+from aimbat.logger import configure_logging
+
+# Slowdowns smaller than this are treated as timing noise.
+_MIN_REGRESSION = 0.01
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BenchmarkScale:
+    """Size of the synthetic benchmark project."""
+
+    events: int = 3
+    stations: int = 20
+    sampling_rate: float = 40.0
+    duration: float = 300.0
+
+    @classmethod
+    def from_env(cls) -> "BenchmarkScale":
+        """Read the scale from the `BENCHMARK_*` environment variables."""
+        defaults = cls()
+        return cls(
+            events=int(os.environ.get("BENCHMARK_EVENTS", defaults.events)),
+            stations=int(os.environ.get("BENCHMARK_STATIONS", defaults.stations)),
+            sampling_rate=float(
+                os.environ.get("BENCHMARK_SAMPLING_RATE", defaults.sampling_rate)
+            ),
+            duration=float(os.environ.get("BENCHMARK_DURATION", defaults.duration)),
+        )
+
+
+def _ricker(t: np.ndarray, frequency: float) -> np.ndarray:
+    """Ricker wavelet centred on `t = 0`."""
+    a = (np.pi * frequency * t) ** 2
+    return (1 - 2 * a) * np.exp(-a)
+
+
+def write_synthetic_sac_files(
+    directory: Path, scale: BenchmarkScale, seed: int = 0
+) -> list[Path]:
+    """Write a synthetic array recording of several teleseismic events.
+
+    Every station records every event. Each seismogram contains a Ricker
+    wavelet arriving close to the `t0` pick, with a random delay, a random
+    polarity reversal for one in ten stations and Gaussian noise, so ICCS and
+    MCCC have realistic work to do.
+
+    Args:
+        directory: Directory to write the SAC files to.
+        scale: Number of events and stations, sampling rate and duration.
+        seed: Seed of the random number generator.
+
+    Returns:
+        Paths of the written files.
+    """
+    rng = np.random.default_rng(seed)
+    n_samples = int(scale.duration * scale.sampling_rate)
+    times = np.arange(n_samples) / scale.sampling_rate
+    pick_offset = scale.duration / 2
+
+    stations = [
+        (
+            f"S{i:04d}",
+            rng.uniform(55, 70),
+            rng.uniform(-165, -140),
+            rng.uniform(0, 2000),
+            rng.random() < 0.1,
+        )
+        for i in range(scale.stations)
+    ]
+
+    paths = []
+    for i in range(scale.events):
+        origin = Timestamp("2020-01-01T00:00:00", tz="UTC") + Timedelta(days=i)
+        event_latitude = rng.uniform(-60, 60)
+        event_longitude = rng.uniform(-180, 180)
+        event_depth = rng.uniform(10_000, 600_000)
+        begin_time = origin + Timedelta(seconds=rng.uniform(300, 900))
+
+        for name, latitude, longitude, elevation, reversed_polarity in stations:
+            arrival = pick_offset + rng.normal(0, 0.5)
+            data = _ricker(times - arrival, frequency=0.5)
+            if reversed_polarity:
+                data = -data
+            data = data + rng.normal(0, 0.1, n_samples)
+
+            sac = SAC()
+            sac.seismogram.data = data
+            sac.seismogram.delta = Timedelta(seconds=1 / scale.sampling_rate)
+            sac.seismogram.begin_time = begin_time
+            sac.station.name = name
+            sac.station.network = "SY"
+            sac.station.channel = "BHZ"
+            sac.station.latitude = latitude
+            sac.station.longitude = longitude
+            sac.station.elevation = elevation
+            sac.event.time = origin
+            sac.event.latitude = event_latitude
+            sac.event.longitude = event_longitude
+            sac.event.depth = event_depth
+            sac.timestamps.t0 = begin_time + Timedelta(seconds=pick_offset)
+
+            path = directory / f"event{i:03d}.SY.{name}.BHZ.sac"
+            sac.write(path)
+            paths.append(path)
+
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BenchmarkRecorder:
+    """Collect benchmark timings and compare them with a baseline.
+
+    Attributes:
+        scale: Size of the benchmark project.
+        baseline: Timings in seconds from an earlier run, by benchmark name.
+        threshold: Allowed relative slowdown compared to the baseline.
+        results: Timings in seconds of this run, by benchmark name.
+    """
+
+    scale: BenchmarkScale
+    baseline: dict[str, float] = field(default_factory=dict)
+    threshold: float = 0.25
+    results: dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def __call__(self, name: str) -> Iterator[None]:
+        """Time the `with` block and fail if it regressed against the baseline.
+
+        Args:
+            name: Name of the benchmark.
+        """
+        start = time.perf_counter()
+        yield
+        self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, elapsed: float) -> None:
+        """Record a timing measured elsewhere and compare it with the baseline.
+
+        Args:
+            name: Name of the benchmark.
+            elapsed: Duration in seconds.
+        """
+        self.results[name] = elapsed
+
+        reference = self.baseline.get(name)
+        if reference is None:
+            return
+        limit = reference * (1 + self.threshold)
+        if elapsed > limit and elapsed - reference > _MIN_REGRESSION:
+            pytest.fail(
+                f"Benchmark {name!r} took {elapsed:.3f} s, more than "
+                f"{self.threshold:.0%} slower than the baseline ({reference:.3f} s)."
+            )
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the results with the information needed to compare runs."""
+        return {
+            "scale": self.scale.__dict__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "aimbat": __version__,
+            "results": self.results,
+        }
+
+
+@pytest.fixture(scope="session")
+def benchmark_scale() -> BenchmarkScale:
+    """Size of the synthetic benchmark project.
+
+    Returns:
+        The scale read from the environment.
+    """
+    return BenchmarkScale.from_env()
+
+
+@pytest.fixture(scope="session")
+def benchmark(
+    benchmark_scale: BenchmarkScale,
+) -> Generator[BenchmarkRecorder, None, None]:
+    """Records benchmark timings for the whole session.
+
+    The baseline is only used if it was recorded at the same scale. On
+    teardown the timings are written to `BENCHMARK_OUTPUT` if it is set.
+
+    Args:
+        benchmark_scale: Size of the synthetic benchmark project.
+
+    Yields:
+        Callable context manager timing a named benchmark.
+    """
+    recorder = BenchmarkRecorder(
+        scale=benchmark_scale,
+        threshold=float(os.environ.get("BENCHMARK_THRESHOLD", 0.25)),
+    )
+
+    baseline_file = os.environ.get("BENCHMARK_BASELINE")
+    if baseline_file:
+        baseline = json.loads(Path(baseline_file).read_text())
+        if baseline["scale"] == benchmark_scale.__dict__:
+            recorder.baseline = baseline["results"]
+        else:
+            pytest.exit(
+                f"Baseline {baseline_file} was recorded at a different scale "
+                f"({baseline['scale']}).",
+                returncode=4,
+            )
+
+    yield recorder
+
+    output_file = os.environ.get("BENCHMARK_OUTPUT")
+    if output_file:
+        Path(output_file).write_text(json.dumps(recorder.to_json(), indent=2))
+
+
+# ---------------------------------------------------------------------------
+# Project
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def patch_debug_setting(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Overrides the suite-wide debug logging, which would distort the timings.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Yields:
+        None
+    """
+    monkeypatch.setattr(aimbat.settings, "logfile", "aimbat_benchmark.log")
+    monkeypatch.setattr(aimbat.settings, "log_level", "WARNING")
+    configure_logging()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def mock_uuid4() -> None:
+    """Overrides the suite-wide deterministic UUIDs.
+
+    The benchmarks share one project across tests, and restarting the same
+    UUID sequence in every test would produce colliding primary keys.
+    """
+
+
+@pytest.fixture(scope="session")
+def synthetic_data(
+    benchmark_scale: BenchmarkScale, tmp_path_factory: pytest.TempPathFactory
+) -> list[Path]:
+    """Writes the synthetic SAC files once per session.
+
+    Args:
+        benchmark_scale: Size of the synthetic benchmark project.
+        tmp_path_factory: The pytest tmp_path_factory fixture.
+
+    Returns:
+        Paths of the SAC files.
+    """
+    return write_synthetic_sac_files(
+        tmp_path_factory.mktemp("benchmark-data"), benchmark_scale
+    )
+
+
+def _file_engine(path: Path) -> Engine:
+    """Create an engine for a file-backed project database."""
+    engine = create_engine(
+        f"sqlite+pysqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    return engine
+
+
+@pytest.fixture()
+def empty_benchmark_engine(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[Engine, None, None]:
+    """A file-backed engine with an empty project.
+
+    Args:
+        tmp_path: The pytest tmp_path fixture.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Yields:
+        The engine, also patched into `aimbat.db.engine`.
+    """
+    engine = _file_engine(tmp_path / "benchmark.db")
+    create_project(engine)
+    monkeypatch.setattr(aimbat.db, "engine", engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def benchmark_engine(
+    synthetic_data: list[Path], tmp_path_factory: pytest.TempPathFactory
+) -> Generator[Engine, None, None]:
+    """A file-backed project with the synthetic data, shared by a test module.
+
+    Args:
+        synthetic_data: Paths of the synthetic SAC files.
+        tmp_path_factory: The pytest tmp_path_factory fixture.
+
+    Yields:
+        The engine, also patched into `aimbat.db.engine`.
+    """
+    engine = _file_engine(tmp_path_factory.mktemp("benchmark-db") / "benchmark.db")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(aimbat.db, "engine", engine)
+        create_project(engine)
+        with Session(engine) as session:
+            add_data_to_project(session, synthetic_data, DataType.SAC)
+        yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def unindexed_benchmark_engine(
+    benchmark_engine: Engine, tmp_path: Path
+) -> Generator[Engine, None, None]:
+    """A copy of the benchmark project without the lookup (`ix_*`) indexes.
+
+    The copy is taken when the fixture is requested, so it holds the same
+    data as `benchmark_engine` at that point.
+
+    Args:
+        benchmark_engine: The engine of the benchmark project.
+        tmp_path: The pytest tmp_path fixture.
+
+    Yields:
+        The engine of the copy (not patched into `aimbat.db.engine`).
+    """
+    path = tmp_path / "unindexed.db"
+    source = sqlite3.connect(str(benchmark_engine.url.database))
+    target = sqlite3.connect(path)
+    try:
+        source.backup(target)
+        names = [
+            name
+            for (name,) in target.execute(
+                "SELECT name FROM sqlite_master"
+                " WHERE type = 'index' AND name LIKE 'ix_%'"
+            )
+        ]
+        for name in names:
+            target.execute(f'DROP INDEX "{name}"')
+        target.commit()
+    finally:
+        source.close()
+        target.close()
+
+    engine = _file_engine(path)
+    yield engine
+    engine.dispose()
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip the benchmarks unless they are selected with `-m benchmark`."""
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
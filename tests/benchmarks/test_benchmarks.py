@@ -0,0 +1,186 @@
+"""Scale benchmarks of the hot paths of AIMBAT.
+
+Run with `make benchmarks` or `pytest tests/benchmarks -m benchmark`; see
+`tests/benchmarks/conftest.py` for the environment variables controlling the
+size of the synthetic project and the comparison with a baseline.
+"""
+
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from sqlalchemy import Engine
+from sqlmodel import Session, select
+
+import aimbat._tui._panels
+import aimbat._tui._widgets
+import aimbat._tui.app
+import aimbat._tui.modals
+import aimbat.io._base
+from aimbat._tui.app import AimbatTUI
+from aimbat.core import (
+    add_data_to_project,
+    clear_iccs_cache,
+    create_iccs_instance,
+    create_snapshot,
+    dump_data_table,
+    dump_event_parameter_table,
+    dump_event_quality_table,
+    dump_event_table,
+    dump_seismogram_parameter_table,
+    dump_seismogram_table,
+    dump_snapshot_table,
+    dump_station_quality_table,
+    dump_station_table,
+    rollback_to_snapshot,
+    run_iccs,
+    run_mccc,
+)
+from aimbat.io import DataType
+from aimbat.models import AimbatEvent, AimbatSnapshot
+
+type Benchmark = Callable[[str], AbstractContextManager[None]]
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+
+def _cold_caches() -> None:
+    """Drop the cached seismogram data and ICCS instances."""
+    aimbat.io._base._cache.clear()
+    clear_iccs_cache()
+
+
+def _first_event(session: Session) -> AimbatEvent:
+    event = session.exec(select(AimbatEvent)).first()
+    assert event is not None
+    return event
+
+
+def test_add_data_to_project(
+    empty_benchmark_engine: Engine,
+    synthetic_data: list[Path],
+    benchmark: Benchmark,
+) -> None:
+    with Session(empty_benchmark_engine) as session:
+        with benchmark("add_data_to_project"):
+            add_data_to_project(session, synthetic_data, DataType.SAC)
+
+
+class TestIccs:
+    def test_create_iccs_instance(
+        self, benchmark_engine: Engine, benchmark: Benchmark
+    ) -> None:
+        _cold_caches()
+        with Session(benchmark_engine) as session:
+            event = _first_event(session)
+            with benchmark("create_iccs_instance"):
+                create_iccs_instance(session, event)
+
+    def test_run_iccs(self, benchmark_engine: Engine, benchmark: Benchmark) -> None:
+        with Session(benchmark_engine) as session:
+            event = _first_event(session)
+            bound = create_iccs_instance(session, event)
+            with benchmark("run_iccs"):
+                run_iccs(session, event, bound.iccs, autoflip=True, autoselect=True)
+
+    def test_run_mccc(self, benchmark_engine: Engine, benchmark: Benchmark) -> None:
+        with Session(benchmark_engine) as session:
+            event = _first_event(session)
+            bound = create_iccs_instance(session, event)
+            with benchmark("run_mccc"):
+                run_mccc(session, event, bound.iccs, all_seismograms=False)
+
+
+class TestSnapshots:
+    def test_create_snapshot(
+        self, benchmark_engine: Engine, benchmark: Benchmark
+    ) -> None:
+        with Session(benchmark_engine) as session:
+            event = _first_event(session)
+            with benchmark("create_snapshot"):
+                create_snapshot(session, event, comment="benchmark")
+
+    def test_rollback_to_snapshot(
+        self, benchmark_engine: Engine, benchmark: Benchmark
+    ) -> None:
+        with Session(benchmark_engine) as session:
+            event = _first_event(session)
+            create_snapshot(session, event, comment="rollback benchmark")
+            snapshot = session.exec(
+                select(AimbatSnapshot).where(
+                    AimbatSnapshot.comment == "rollback benchmark"
+                )
+            ).one()
+            with benchmark("rollback_to_snapshot"):
+                rollback_to_snapshot(session, snapshot.id)
+
+
+@pytest.mark.parametrize(
+    "dump",
+    [
+        dump_data_table,
+        dump_event_table,
+        dump_event_parameter_table,
+        dump_event_quality_table,
+        dump_seismogram_table,
+        dump_seismogram_parameter_table,
+        dump_snapshot_table,
+        dump_station_table,
+        dump_station_quality_table,
+    ],
+    ids=lambda f: f.__name__,
+)
+def test_dump_table(
+    dump: Callable[[Session], Any],
+    benchmark_engine: Engine,
+    benchmark: Benchmark,
+) -> None:
+    with Session(benchmark_engine) as session:
+        with benchmark(dump.__name__):
+            dump(session)
+
+
+@pytest.mark.parametrize(
+    "dump", [dump_event_table, dump_station_table], ids=lambda f: f.__name__
+)
+def test_dump_table_without_indexes(
+    dump: Callable[..., Any],
+    benchmark_engine: Engine,
+    unindexed_benchmark_engine: Engine,
+    benchmark: Benchmark,
+) -> None:
+    for label, engine in (
+        ("indexed", benchmark_engine),
+        ("unindexed", unindexed_benchmark_engine),
+    ):
+        with Session(engine) as session:
+            with benchmark(f"{dump.__name__}[{label}]"):
+                dump(session, from_read_model=True)
+
+
+def test_tui_refresh_all(
+    benchmark_engine: Engine,
+    benchmark: Benchmark,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for module in (
+        aimbat._tui.app,
+        aimbat._tui._panels,
+        aimbat._tui.modals,
+        aimbat._tui._widgets,
+    ):
+        monkeypatch.setattr(module, "engine", benchmark_engine)
+
+    async def _run() -> None:
+        async with AimbatTUI().run_test(size=(120, 40)) as pilot:
+            app = cast(AimbatTUI, pilot.app)
+            await app.workers.wait_for_complete()
+            with Session(benchmark_engine) as session:
+                app._current_event_id = _first_event(session).id
+            with benchmark("tui_refresh_all"):
+                app.refresh_all()
+
+    asyncio.run(_run())
@@ -0,0 +1,56 @@
+"""Startup benchmarks of the `aimbat` command line interface.
+
+Scripts often call `aimbat` hundreds of times, so the time it takes to start
+matters as much as the time spent in a command.
+"""
+
+import subprocess
+import sys
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
+from typing import Protocol
+
+import pytest
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+
+class Benchmark(Protocol):
+    def __call__(self, name: str) -> AbstractContextManager[None]: ...
+
+    def record(self, name: str, elapsed: float) -> None: ...
+
+
+def _import_time(module: str) -> float:
+    """Cumulative time in seconds to import a module in a fresh interpreter, as
+    reported by `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1e6
+    raise AssertionError(f"{module} missing from the -X importtime output.")
+
+
+@pytest.mark.parametrize("module", ["aimbat", "aimbat.app"])
+def test_import_time(module: str, benchmark: Benchmark) -> None:
+    # The fastest of a few runs is the least affected by other processes.
+    benchmark.record(f"import {module}", min(_import_time(module) for _ in range(3)))
+
+
+@pytest.mark.parametrize(
+    "args", [["--help"], ["--version"], ["utils", "settings"]], ids=" ".join
+)
+def test_cli_startup(args: Sequence[str], benchmark: Benchmark) -> None:
+    command = [sys.executable, "-m", "aimbat.app", *args]
+    # Warm up the bytecode and file system caches.
+    subprocess.run(command, capture_output=True, check=True)
+    with benchmark(f"aimbat {' '.join(args)}"):
+        subprocess.run(command, capture_output=True, check=True)
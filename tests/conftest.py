@@ -4,7 +4,8 @@ import random
 import shutil
 import subprocess
 import uuid
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
 from typing import Any, Literal
 
@@ -25,6 +26,7 @@ from aimbat.app import app
 from aimbat.core import add_data_to_project, create_project
 from aimbat.io import DataType
 from aimbat.logger import configure_logging
+from aimbat.utils import SQLProfiler
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -320,6 +322,44 @@ def loaded_session(loaded_engine: Engine) -> Generator[Session, None, None]:
         yield session
 
 
+@pytest.fixture()
+def query_budget() -> Callable[[Engine, int], AbstractContextManager[SQLProfiler]]:
+    """Returns a context manager that limits the SQL statements executed on an engine.
+
+    The test fails if more than `max_statements` statements are executed on
+    `engine` inside the `with` block, listing the statements that were run.
+    The yielded `SQLProfiler` can be used for more specific assertions.
+
+    Examples:
+        ```python
+        with query_budget(loaded_engine, 5):
+            _write_back_seismograms(session, iccs)
+        ```
+
+    Returns:
+        A callable that accepts an engine and the maximum number of statements.
+    """
+
+    @contextmanager
+    def _budget(engine: Engine, max_statements: int) -> Iterator[SQLProfiler]:
+        profiler = SQLProfiler().attach(engine)
+        try:
+            yield profiler
+        finally:
+            profiler.detach()
+        if profiler.statement_count > max_statements:
+            statements = "\n".join(
+                f"{s['count']:>6}x  {s['statement']}"
+                for s in profiler.report()["statements"]
+            )
+            pytest.fail(
+                f"Expected at most {max_statements} SQL statement(s), but "
+                f"{profiler.statement_count} were executed:\n{statements}"
+            )
+
+    return _budget
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
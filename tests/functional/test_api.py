@@ -0,0 +1,285 @@
+"""Functional tests for the local JSON-RPC API (`aimbat api`).
+
+Most tests call `dispatch` directly in the test thread. The HTTP tests run the
+server in a background thread against a file-backed database, as the
+in-memory test database is private to the thread that opened it.
+"""
+
+import asyncio
+import contextlib
+import http.client
+import json
+import queue
+import socket
+import threading
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine
+
+from aimbat._cli._api import dispatch, serve
+
+type Rpc = Callable[..., dict[str, Any]]
+
+
+@pytest.fixture()
+def rpc(loaded_engine: Engine) -> Rpc:
+    """Returns a callable that sends a request to `dispatch`.
+
+    Args:
+        loaded_engine: The monkeypatched SQLAlchemy Engine with data loaded.
+
+    Returns:
+        A callable accepting the method name and its parameters, returning
+            the decoded response.
+    """
+
+    def _call(method: str, **params: Any) -> dict[str, Any]:
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        response = dispatch(json.dumps(request).encode())
+        assert response is not None
+        return json.loads(response)
+
+    return _call
+
+
+@pytest.fixture()
+def api_port(loaded_engine_from_file: Engine) -> Generator[int, None, None]:
+    """Runs the API server in a background thread.
+
+    Args:
+        loaded_engine_from_file: The monkeypatched, file-backed SQLAlchemy
+            Engine with data loaded.
+
+    Yields:
+        The port the server listens on.
+    """
+    servers: queue.Queue[asyncio.Server] = queue.Queue()
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(serve(0, ready=servers.put))
+
+    def _run() -> None:
+        with contextlib.suppress(asyncio.CancelledError):
+            loop.run_until_complete(task)
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    yield servers.get(timeout=10).sockets[0].getsockname()[1]
+    loop.call_soon_threadsafe(task.cancel)
+    thread.join()
+    loop.close()
+
+
+class TestDispatch:
+    def test_dump_matches_cli(
+        self, rpc: Rpc, cli_json: Callable[[str], list | dict]
+    ) -> None:
+        """Verifies that a dump method returns the same data as the CLI."""
+        assert rpc("event.dump")["result"] == cli_json("event dump")
+        assert rpc("station.dump")["result"] == cli_json("station dump")
+
+    def test_set_parameter(
+        self, rpc: Rpc, cli_json: Callable[[str], list | dict], event_id: str
+    ) -> None:
+        """Verifies that parameters set through the API are written to the database."""
+        response = rpc(
+            "event.parameter.set", event_id=event_id[:8], name="min_cc", value=0.42
+        )
+
+        assert response["result"] is None
+        parameters = rpc("event.parameter.dump", event_id=event_id)["result"]
+        assert parameters[0]["min_cc"] == pytest.approx(0.42)
+        assert cli_json("event parameter dump")[0]["min_cc"] == pytest.approx(0.42)
+
+    def test_run_iccs(self, rpc: Rpc, event_id: str) -> None:
+        """Verifies that ICCS can be run and reports its convergence."""
+        result = rpc("align.iccs", event_id=event_id)["result"]
+
+        assert isinstance(result["converged"], bool)
+        assert result["iterations"] > 0
+
+    def test_snapshot_create_and_rollback(self, rpc: Rpc, event_id: str) -> None:
+        """Verifies that snapshots can be created and rolled back to."""
+        min_cc = rpc("event.parameter.dump", event_id=event_id)["result"][0]["min_cc"]
+        rpc("snapshot.create", event_id=event_id, comment="api")
+        rpc("event.parameter.set", event_id=event_id, name="min_cc", value=0.42)
+
+        snapshots = rpc("snapshot.dump", event_id=event_id)["result"]
+        rpc("snapshot.rollback", snapshot_id=snapshots[0]["id"])
+
+        parameters = rpc("event.parameter.dump", event_id=event_id)["result"]
+        assert parameters[0]["min_cc"] == pytest.approx(min_cc)
+
+    def test_export_inside_project(
+        self,
+        rpc: Rpc,
+        event_id: str,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Verifies that relative export paths are written to the project directory."""
+        monkeypatch.chdir(tmp_path)
+        rpc("snapshot.create", event_id=event_id)
+
+        result = rpc("snapshot.export", path="results.csv", format="csv")["result"]
+
+        assert result["rows"] > 0
+        assert (tmp_path / "results.csv").exists()
+
+    @pytest.mark.parametrize("path", ["../results.csv", "/tmp/results.csv"])
+    def test_export_outside_project_refused(
+        self,
+        rpc: Rpc,
+        event_id: str,
+        path: str,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Verifies that the API does not write files outside the project directory."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        monkeypatch.chdir(project_dir)
+        rpc("snapshot.create", event_id=event_id)
+
+        error = rpc("snapshot.export", path=path, format="csv")["error"]
+
+        assert error["data"]["type"] == "ValueError"
+        assert not (tmp_path / "results.csv").exists()
+
+    def test_unknown_method(self, rpc: Rpc) -> None:
+        """Verifies that an unknown method is reported as such."""
+        assert rpc("event.explode")["error"]["code"] == -32601
+
+    def test_invalid_params(self, rpc: Rpc) -> None:
+        """Verifies that missing or unknown parameters are reported."""
+        assert rpc("snapshot.rollback")["error"]["code"] == -32602
+        assert rpc("event.dump", colour="red")["error"]["code"] == -32602
+
+    def test_method_error(self, rpc: Rpc) -> None:
+        """Verifies that an exception in a method is returned as an error."""
+        error = rpc("snapshot.rollback", snapshot_id="ffffffff")["error"]
+
+        assert error["code"] == -32000
+        assert error["data"]["type"] == "ValueError"
+
+    def test_parse_error(self) -> None:
+        """Verifies that a request that is not JSON is reported."""
+        response = dispatch(b"{not json")
+
+        assert response is not None
+        assert json.loads(response)["error"]["code"] == -32700
+
+    def test_batch_and_notification(self, loaded_engine: Engine) -> None:
+        """Verifies that batches are answered and notifications are not."""
+        batch = [
+            {"jsonrpc": "2.0", "id": 1, "method": "event.dump"},
+            {"jsonrpc": "2.0", "method": "event.dump"},
+            {"jsonrpc": "2.0", "id": 2, "method": "station.dump"},
+        ]
+        response = dispatch(json.dumps(batch).encode())
+
+        assert response is not None
+        assert [r["id"] for r in json.loads(response)] == [1, 2]
+        assert dispatch(json.dumps(batch[1]).encode()) is None
+
+
+class TestHttp:
+    def _post(
+        self,
+        connection: http.client.HTTPConnection,
+        body: dict[str, Any],
+        content_type: str = "application/json",
+    ) -> tuple[int, bytes]:
+        connection.request(
+            "POST", "/", body=json.dumps(body), headers={"Content-Type": content_type}
+        )
+        response = connection.getresponse()
+        return response.status, response.read()
+
+    def test_requests_on_one_connection(self, api_port: int) -> None:
+        """Verifies that several requests can be sent over a kept-alive connection."""
+        connection = http.client.HTTPConnection("127.0.0.1", api_port, timeout=30)
+        try:
+            for request_id in (1, 2):
+                status, body = self._post(
+                    connection,
+                    {"jsonrpc": "2.0", "id": request_id, "method": "event.dump"},
+                )
+                assert status == 200
+                assert json.loads(body)["id"] == request_id
+                assert json.loads(body)["result"]
+        finally:
+            connection.close()
+
+    def test_requires_json_content_type(self, api_port: int) -> None:
+        """Verifies that requests a web page could send without a CORS preflight are refused."""
+        connection = http.client.HTTPConnection("127.0.0.1", api_port, timeout=30)
+        try:
+            status, _ = self._post(
+                connection,
+                {"jsonrpc": "2.0", "id": 1, "method": "event.dump"},
+                content_type="text/plain",
+            )
+        finally:
+            connection.close()
+
+        assert status == 415
+
+    @pytest.mark.parametrize("host", ["evil.example:{port}", "127.0.0.1:1", None])
+    def test_rejects_foreign_host(self, api_port: int, host: str | None) -> None:
+        """Verifies that requests for other host names (DNS rebinding) are refused."""
+        connection = http.client.HTTPConnection("127.0.0.1", api_port, timeout=30)
+        try:
+            connection.putrequest("POST", "/", skip_host=True)
+            if host is not None:
+                connection.putheader("Host", host.format(port=api_port))
+            connection.putheader("Content-Type", "application/json")
+            body = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "event.dump"})
+            connection.putheader("Content-Length", str(len(body)))
+            connection.endheaders(body.encode())
+            response = connection.getresponse()
+            response.read()
+        finally:
+            connection.close()
+
+        assert response.status == 403
+
+    def test_accepts_localhost(self, api_port: int) -> None:
+        """Verifies that requests addressed to `localhost` are answered."""
+        connection = http.client.HTTPConnection("localhost", api_port, timeout=30)
+        try:
+            status, _ = self._post(
+                connection, {"jsonrpc": "2.0", "id": 1, "method": "event.dump"}
+            )
+        finally:
+            connection.close()
+
+        assert status == 200
+
+    @pytest.mark.parametrize("length", ["abc", "-1", "1.5"])
+    def test_invalid_content_length(self, api_port: int, length: str) -> None:
+        """Verifies that a malformed Content-Length is answered with 400."""
+        with socket.create_connection(("127.0.0.1", api_port), timeout=30) as sock:
+            sock.sendall(
+                f"POST / HTTP/1.1\r\nHost: 127.0.0.1:{api_port}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {length}\r\n"
+                "\r\n".encode("latin-1")
+            )
+            status_line = sock.makefile("rb").readline()
+
+        assert status_line.split()[1] == b"400"
+
+    def test_only_post(self, api_port: int) -> None:
+        """Verifies that only POST requests are accepted."""
+        connection = http.client.HTTPConnection("127.0.0.1", api_port, timeout=30)
+        try:
+            connection.request("GET", "/")
+            response = connection.getresponse()
+            response.read()
+        finally:
+            connection.close()
+
+        assert response.status == 405
+        assert response.getheader("Allow") == "POST"
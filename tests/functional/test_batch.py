@@ -0,0 +1,235 @@
+"""Functional tests for running command files with `aimbat batch`."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine
+
+from aimbat._cli.batch import _transaction_conflict
+
+type Cli = Callable[[str | list[str]], None]
+type CliJson = Callable[[str], list | dict]
+
+
+@pytest.fixture()
+def batch_file(tmp_path: Path) -> Callable[[str], Path]:
+    """Returns a callable that writes a batch file.
+
+    Args:
+        tmp_path: Temporary directory for the file.
+
+    Returns:
+        A callable that accepts the contents and returns the path of the file.
+    """
+
+    def _write(contents: str) -> Path:
+        path = tmp_path / "commands.aimbat"
+        path.write_text(contents)
+        return path
+
+    return _write
+
+
+def _min_cc(cli_json: CliJson) -> float:
+    return cli_json("event parameter dump")[0]["min_cc"]
+
+
+@pytest.mark.cli
+class TestBatch:
+    def test_runs_all_commands(
+        self,
+        cli: Cli,
+        cli_json: CliJson,
+        event_id: str,
+        batch_file: Callable[[str], Path],
+    ) -> None:
+        """Verifies that every command in the file is run, skipping comments."""
+        path = batch_file(
+            "# set some parameters\n"
+            "\n"
+            f"event parameter set --event-id {event_id} min_cc 0.42\n"
+            f"aimbat event parameter set --event-id {event_id} bandpass_fmin 0.3\n"
+        )
+
+        cli(["batch", str(path)])
+
+        parameters = cli_json("event parameter dump")[0]
+        assert parameters["min_cc"] == pytest.approx(0.42)
+        assert parameters["bandpass_fmin"] == pytest.approx(0.3)
+
+    def test_prints_timing(
+        self,
+        cli: Cli,
+        event_id: str,
+        batch_file: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Verifies that the run time of each command is printed with its line."""
+        path = batch_file(f"\nevent parameter set --event-id {event_id} min_cc 0.42\n")
+
+        cli(["batch", str(path)])
+
+        err = capsys.readouterr().err
+        assert "line    2" in err
+        assert "Ran 1 of 1 commands (0 failed)" in err
+
+    def test_fail_fast(
+        self,
+        cli: Cli,
+        cli_json: CliJson,
+        event_id: str,
+        batch_file: Callable[[str], Path],
+    ) -> None:
+        """Verifies that the batch stops at the first failing command."""
+        min_cc = _min_cc(cli_json)
+        path = batch_file(
+            "event delete ffffffff\n"
+            f"event parameter set --event-id {event_id} min_cc 0.42\n"
+        )
+
+        with pytest.raises(SystemExit) as excinfo:
+            cli(["batch", str(path)])
+
+        assert excinfo.value.code == 1
+        assert _min_cc(cli_json) == pytest.approx(min_cc)
+
+    def test_continue_on_error(
+        self,
+        cli: Cli,
+        cli_json: CliJson,
+        event_id: str,
+        batch_file: Callable[[str], Path],
+    ) -> None:
+        """Verifies that `--continue-on-error` runs the remaining commands."""
+        path = batch_file(
+            "event delete ffffffff\n"
+            f"event parameter set --event-id {event_id} min_cc 0.42\n"
+        )
+
+        with pytest.raises(SystemExit) as excinfo:
+            cli(["batch", str(path), "--continue-on-error"])
+
+        assert excinfo.value.code == 1
+        assert _min_cc(cli_json) == pytest.approx(0.42)
+
+    @pytest.mark.parametrize("command", ["tui", "shell", "plot stack", "batch x"])
+    def test_interactive_command_rejected(
+        self,
+        cli: Cli,
+        cli_json: CliJson,
+        event_id: str,
+        batch_file: Callable[[str], Path],
+        command: str,
+    ) -> None:
+        """Verifies that a file with an interactive command is not run at all."""
+        min_cc = _min_cc(cli_json)
+        path = batch_file(
+            f"event parameter set --event-id {event_id} min_cc 0.42\n{command}\n"
+        )
+
+        with pytest.raises(ValueError, match="line 2"):
+            cli(["batch", str(path)])
+
+        assert _min_cc(cli_json) == pytest.approx(min_cc)
+
+
+@pytest.mark.cli
+class TestBatchTransaction:
+    def test_committed(
+        self,
+        cli: Cli,
+        cli_json: CliJson,
+        event_id: str,
+        batch_file: Callable[[str], Path],
+        loaded_engine: Engine,
+    ) -> None:
+        """Verifies that the changes are committed and the engine is restored."""
+        import aimbat.db
+
+        path = batch_file(f"event parameter set --event-id {event_id} min_cc 0.42\n")
+
+        cli(["batch", str(path), "--transaction"])
+
+        assert aimbat.db.engine is loaded_engine
+        assert _min_cc(cli_json) == pytest.approx(0.42)
+
+    def test_rolled_back_on_failure(
+        self,
+        cli: Cli,
+        cli_json: CliJson,
+        event_id: str,
+        batch_file: Callable[[str], Path],
+    ) -> None:
+        """Verifies that a failing command rolls back the earlier ones."""
+        min_cc = _min_cc(cli_json)
+        path = batch_file(
+            f"event parameter set --event-id {event_id} min_cc 0.42\n"
+            "event delete ffffffff\n"
+        )
+
+        with pytest.raises(SystemExit):
+            cli(["batch", str(path), "--transaction"])
+
+        assert _min_cc(cli_json) == pytest.approx(min_cc)
+
+    def test_continue_on_error_keeps_successful_commands(
+        self,
+        cli: Cli,
+        cli_json: CliJson,
+        event_id: str,
+        batch_file: Callable[[str], Path],
+    ) -> None:
+        """Verifies that only failed commands are discarded with `--continue-on-error`."""
+        path = batch_file(
+            "event delete ffffffff\n"
+            f"event parameter set --event-id {event_id} min_cc 0.42\n"
+        )
+
+        with pytest.raises(SystemExit):
+            cli(["batch", str(path), "--transaction", "--continue-on-error"])
+
+        assert _min_cc(cli_json) == pytest.approx(0.42)
+
+    def test_project_commands_rejected(
+        self, cli: Cli, loaded_engine: Engine, batch_file: Callable[[str], Path]
+    ) -> None:
+        """Verifies that commands managing the project cannot run in a transaction."""
+        path = batch_file("project info\n")
+
+        with pytest.raises(ValueError, match="transaction"):
+            cli(["batch", str(path), "--transaction"])
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "data add --bulk x.sac",
+            "data add --bulk=true x.sac",
+            "snapshot prune --keep-automatic 1 --vacuum full",
+            "snapshot prune --vacuum=incremental",
+        ],
+    )
+    def test_own_connection_options_rejected(
+        self,
+        cli: Cli,
+        loaded_engine: Engine,
+        batch_file: Callable[[str], Path],
+        command: str,
+    ) -> None:
+        """Verifies that options needing their own connection cannot run in a transaction."""
+        path = batch_file(f"{command}\n")
+
+        with pytest.raises(ValueError, match="cannot be run in a transaction"):
+            cli(["batch", str(path), "--transaction"])
+
+    @pytest.mark.parametrize(
+        "tokens",
+        [
+            ["data", "add", "--bulk=false", "x.sac"],
+            ["snapshot", "prune", "--vacuum", "none"],
+            ["snapshot", "prune", "--dry-run"],
+        ],
+    )
+    def test_safe_options_allowed(self, tokens: list[str]) -> None:
+        """Verifies that the same commands without those options are allowed."""
+        assert _transaction_conflict(tokens) is None
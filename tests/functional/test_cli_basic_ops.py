@@ -4,6 +4,8 @@ All commands are invoked in-process via `app()` with `aimbat.db.engine`
 monkeypatched to the test fixture's in-memory database.
 """
 
+import csv
+import json
 from collections import Counter
 from collections.abc import Callable, Sequence
 from pathlib import Path
@@ -11,6 +13,8 @@ from pathlib import Path
 import pytest
 from sqlalchemy import Engine
 
+import aimbat
+
 # ===================================================================
 # Project lifecycle (in-memory)
 # ===================================================================
@@ -92,6 +96,19 @@ class TestDataManagement:
         events = cli_json("event dump")
         assert len(events) > 0
 
+    def test_add_data_bulk(
+        self,
+        patched_engine: Engine,
+        multi_event_data: Sequence[Path],
+        cli: Callable[[str], None],
+        cli_json: Callable[[str], list | dict],
+    ) -> None:
+        """Verifies that data added with `--bulk` is committed to the project."""
+        files = " ".join(f.as_posix() for f in multi_event_data)
+        cli(f"data add {files} --no-progress --bulk")
+        seismograms = cli_json("seismogram dump")
+        assert len(seismograms) == len(multi_event_data)
+
     def test_add_data_creates_automatic_snapshot_per_event(
         self,
         patched_engine: Engine,
@@ -347,6 +364,21 @@ class TestEventOperations:
         """Verifies that event list command runs successfully."""
         cli("event list")
 
+    def test_event_list_profile(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Verifies that --profile writes a cProfile and a collapsed-stack file."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(aimbat.settings, "profile_dir", None)
+        cli("event list --profile")
+        profile_dir = tmp_path / "aimbat-profiles"
+        assert len(list(profile_dir.glob("cli_event_list-*.pstats"))) == 1
+        assert len(list(profile_dir.glob("cli_event_list-*.collapsed"))) == 1
+
     def test_event_dump(
         self,
         loaded_engine: Engine,
@@ -583,6 +615,37 @@ class TestSeismogramOperations:
         data = cli_json("seismogram dump")
         assert len(data) > 0
 
+    def test_seismogram_dump_ndjson(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        cli_json: Callable[[str], list | dict],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Verifies that the NDJSON dump has one JSON record per seismogram."""
+        data = cli_json("seismogram dump")
+        cli("seismogram dump --format ndjson")
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert sorted(records, key=lambda r: r["id"]) == sorted(
+            data, key=lambda d: d["id"]
+        )
+
+    def test_seismogram_dump_csv_to_file(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        cli_json: Callable[[str], list | dict],
+        tmp_path: Path,
+    ) -> None:
+        """Verifies that the CSV dump is written to the output file."""
+        data = cli_json("seismogram dump")
+        output = tmp_path / "seismograms.csv"
+        cli(f"seismogram dump --format csv --output {output}")
+        with output.open(newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == len(data)
+        assert {r["id"] for r in rows} == {d["id"] for d in data}
+
     def test_delete_seismogram(
         self,
         loaded_engine: Engine,
@@ -260,3 +260,84 @@ class TestStrictSchemaCheck:
             f"expected exactly 1 raise across 3 new connections, "
             f"got stdout={result.stdout!r} stderr={result.stderr!r}"
         )
+
+
+@pytest.mark.slow
+@pytest.mark.cli
+class TestSqliteProfiles:
+    """Tests for `AIMBAT_SQLITE_PROFILE` and `aimbat.db.sqlite_profile`.
+
+    Run in a subprocess so the real `aimbat.db.engine` (and its pool
+    listeners) is configured from the environment, as it is for users."""
+
+    _SCRIPT = (
+        "from sqlalchemy import text\n"
+        "from aimbat.db import engine, sqlite_profile\n"
+        "def pragmas(connection):\n"
+        "    return [\n"
+        "        connection.execute(text(f'PRAGMA {name}')).scalar()\n"
+        "        for name in ('synchronous', 'cache_size', 'temp_store')\n"
+        "    ]\n"
+        "def pooled_pragmas():\n"
+        "    with engine.connect() as connection:\n"
+        "        return pragmas(connection)\n"
+        "print(pooled_pragmas())\n"
+        "with sqlite_profile('bulk-import') as bulk:\n"
+        "    print(pragmas(bulk))\n"
+        "    print(pooled_pragmas())\n"
+        "print(pooled_pragmas())\n"
+        "print(pooled_pragmas())\n"
+    )
+
+    def _run(
+        self, db_path: Path, profile: str | None
+    ) -> subprocess.CompletedProcess[str]:
+        """Print the tuned PRAGMAs before, during and after a `bulk-import` block.
+
+        Inside the block, the PRAGMAs of the `bulk-import` connection are
+        printed first, then those of another pooled connection.
+        """
+        env = os.environ.copy()
+        env["AIMBAT_DB_URL"] = f"sqlite+pysqlite:///{db_path}"
+        if profile is not None:
+            env["AIMBAT_SQLITE_PROFILE"] = profile
+        return subprocess.run(
+            ["uv", "run", "python", "-c", self._SCRIPT],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+
+    def test_default_profile_is_safe_and_bulk_import_is_scoped(
+        self,
+        aimbat_subprocess: Callable[[Sequence[str]], subprocess.CompletedProcess[str]],
+        db_path: Path,
+    ) -> None:
+        """Verifies the `safe` PRAGMAs apply by default, `bulk-import` only
+        applies to the connection it yields, and `safe` is restored on the
+        pooled connections afterwards."""
+        aimbat_subprocess(["project", "create"])
+
+        result = self._run(db_path, profile=None)
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split("\n")[:5] == [
+            "[2, -2000, 0]",
+            "[0, -262144, 2]",
+            "[2, -2000, 0]",
+            "[2, -2000, 0]",
+            "[2, -2000, 0]",
+        ]
+
+    def test_profile_from_environment(
+        self,
+        aimbat_subprocess: Callable[[Sequence[str]], subprocess.CompletedProcess[str]],
+        db_path: Path,
+    ) -> None:
+        """Verifies `AIMBAT_SQLITE_PROFILE` selects the profile for new connections."""
+        aimbat_subprocess(["project", "create"])
+
+        result = self._run(db_path, profile="fast")
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split("\n")[0] == "[1, -65536, 2]"
@@ -349,6 +349,114 @@ class TestSnapshotDelete:
         )
 
 
+# ===================================================================
+# Snapshot prune
+# ===================================================================
+
+
+@pytest.mark.cli
+class TestSnapshotPrune:
+    """Tests for the `snapshot prune` CLI command."""
+
+    def test_prune_keeps_most_recent(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        cli_json: Callable[[str], list | dict],
+        event_id: str,
+    ) -> None:
+        """Verifies that only the most recent snapshots are kept.
+
+        Args:
+            loaded_engine: The monkeypatched engine with data loaded.
+            cli: The in-process CLI callable.
+            cli_json: The in-process CLI JSON dump callable.
+        """
+        for comment in ("first", "second", "third"):
+            cli(f"snapshot create --event-id {event_id} --comment {comment}")
+
+        cli(
+            f"snapshot prune --event-id {event_id} --keep-automatic 1"
+            " --include-manual --no-progress"
+        )
+
+        data = cli_json("snapshot dump")
+        assert isinstance(data, dict), "Dump should return a dict"
+        assert [s["comment"] for s in data["snapshots"]] == ["third"], (
+            "Only the most recent snapshot should remain"
+        )
+
+    def test_prune_keeps_manual_snapshots_by_default(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        cli_json: Callable[[str], list | dict],
+        event_id: str,
+    ) -> None:
+        """Verifies that manually created snapshots are not pruned by default.
+
+        Args:
+            loaded_engine: The monkeypatched engine with data loaded.
+            cli: The in-process CLI callable.
+            cli_json: The in-process CLI JSON dump callable.
+        """
+        cli(f"snapshot create --event-id {event_id}")
+        cli(f"snapshot create --event-id {event_id}")
+
+        cli("snapshot prune --event-id all --keep-automatic 0 --no-progress")
+
+        data = cli_json("snapshot dump")
+        assert isinstance(data, dict), "Dump should return a dict"
+        assert len(data["snapshots"]) == 2, "Manual snapshots should be kept"
+
+    def test_dry_run_deletes_nothing(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        cli_json: Callable[[str], list | dict],
+        capsys: pytest.CaptureFixture[str],
+        event_id: str,
+    ) -> None:
+        """Verifies that `--dry-run` only reports the number of snapshots.
+
+        Args:
+            loaded_engine: The monkeypatched engine with data loaded.
+            cli: The in-process CLI callable.
+            cli_json: The in-process CLI JSON dump callable.
+            capsys: The pytest capsys fixture.
+        """
+        cli(f"snapshot create --event-id {event_id}")
+        cli(f"snapshot create --event-id {event_id}")
+        capsys.readouterr()
+
+        cli(
+            f"snapshot prune --event-id {event_id} --keep-automatic 0"
+            " --include-manual --dry-run"
+        )
+        assert "2 snapshot(s) would be deleted" in capsys.readouterr().out
+
+        data = cli_json("snapshot dump")
+        assert isinstance(data, dict), "Dump should return a dict"
+        assert len(data["snapshots"]) == 2, "A dry run should not delete snapshots"
+
+    def test_no_rules(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        capsys: pytest.CaptureFixture[str],
+        event_id: str,
+    ) -> None:
+        """Verifies that nothing is pruned without retention rules.
+
+        Args:
+            loaded_engine: The monkeypatched engine with data loaded.
+            cli: The in-process CLI callable.
+            capsys: The pytest capsys fixture.
+        """
+        cli(f"snapshot prune --event-id {event_id}")
+        assert "nothing to prune" in capsys.readouterr().out
+
+
 # ===================================================================
 # Snapshot rollback
 # ===================================================================
@@ -549,6 +657,41 @@ class TestSnapshotDump:
             "Dump should contain 'seismogram_parameters' key"
         )
 
+    def test_dump_seismogram_records_keep_id_keys(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        cli_json: Callable[[str], list | dict],
+        event_id: str,
+    ) -> None:
+        """Verifies that seismogram snapshot records still carry their ID keys.
+
+        Args:
+            loaded_engine: The monkeypatched engine with data loaded.
+            cli: The in-process CLI callable.
+            cli_json: The in-process CLI JSON dump callable.
+        """
+        cli(f"snapshot create --event-id {event_id}")
+        data = cli_json("snapshot dump")
+        assert isinstance(data, dict), "Dump should return a dict"
+        assert len(data["seismogram_parameters"]) > 0, (
+            "Dump should contain seismogram parameter records"
+        )
+        for key, live_key in (
+            ("seismogram_parameters", "seismogram_parameters_id"),
+            ("seismogram_quality", "seismogram_quality_id"),
+        ):
+            records = data[key]
+            assert all(r["id"] is not None for r in records), (
+                f"Every {key} record should have an 'id'"
+            )
+            assert len({r["id"] for r in records}) == len(records), (
+                f"The {key} record IDs should be unique"
+            )
+            assert all(r[live_key] is not None for r in records), (
+                f"Every {key} record should reference its live row via '{live_key}'"
+            )
+
     def test_dump_all_events_includes_default(
         self,
         loaded_engine: Engine,
@@ -926,3 +1069,77 @@ class TestSnapshotResults:
         assert "snapshot_id" not in result
         assert "seismogramId" in result["seismograms"][0]
         assert "seismogram_id" not in result["seismograms"][0]
+
+
+# ===================================================================
+# Snapshot export
+# ===================================================================
+
+
+@pytest.mark.cli
+class TestSnapshotExport:
+    """Tests for the `snapshot export` CLI command."""
+
+    def test_export_csv(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        cli_json: Callable[[str], list | dict],
+        event_id: str,
+        tmp_path: Path,
+    ) -> None:
+        """Verifies that the latest snapshot of each event is exported as CSV.
+
+        Args:
+            loaded_engine: The monkeypatched engine with data loaded.
+            cli: The in-process CLI callable.
+            cli_json: The in-process CLI JSON dump callable.
+            event_id: The default event ID fixture.
+            tmp_path: The pytest tmp_path fixture.
+        """
+        import csv
+
+        cli(f"snapshot create --event-id {event_id}")
+        data = cli_json("snapshot dump")
+        assert isinstance(data, dict)
+        snapshot_id = data["snapshots"][0]["id"]
+
+        output = tmp_path / "results.csv"
+        cli(f"snapshot export {output}")
+
+        with output.open(newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == len(data["seismogram_parameters"])
+        assert {row["snapshot_id"] for row in rows} == {snapshot_id}
+
+    def test_export_chosen_snapshot_by_short_id(
+        self,
+        loaded_engine: Engine,
+        cli: Callable[[str], None],
+        cli_json: Callable[[str], list | dict],
+        event_id: str,
+        tmp_path: Path,
+    ) -> None:
+        """Verifies that `--snapshot` accepts a short ID.
+
+        Args:
+            loaded_engine: The monkeypatched engine with data loaded.
+            cli: The in-process CLI callable.
+            cli_json: The in-process CLI JSON dump callable.
+            event_id: The default event ID fixture.
+            tmp_path: The pytest tmp_path fixture.
+        """
+        import csv
+
+        cli(f"snapshot create --event-id {event_id} --comment first")
+        cli(f"snapshot create --event-id {event_id} --comment second")
+        data = cli_json("snapshot dump")
+        assert isinstance(data, dict)
+        first = next(s for s in data["snapshots"] if s["comment"] == "first")
+
+        output = tmp_path / "results.csv"
+        cli(f"snapshot export {output} --snapshot {first['id'][:8]}")
+
+        with output.open(newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert {row["snapshot_comment"] for row in rows} == {"first"}
@@ -0,0 +1,229 @@
+"""Functional tests for the AIMBAT daemon (`aimbat serve`) and its client.
+
+The daemon is run in a background thread of the test process, against the
+monkeypatched test database. Output of forwarded commands is collected in
+`StringIO` buffers rather than the (redirected) standard streams.
+"""
+
+import io
+import json
+import socket
+import tempfile
+import threading
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine
+
+from aimbat import settings
+from aimbat._cli._daemon import create_server, forward, is_forwardable
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+type Forward = Callable[[list[str]], tuple[int | None, str, str]]
+
+
+@pytest.fixture()
+def socket_path() -> Generator[Path, None, None]:
+    """A socket path short enough for the limits of Unix domain sockets.
+
+    Yields:
+        Path of the (not yet created) socket.
+    """
+    with tempfile.TemporaryDirectory(prefix="aimbat-") as directory:
+        yield Path(directory) / "aimbat.sock"
+
+
+@pytest.fixture()
+def daemon(
+    loaded_engine_from_file: Engine,
+    socket_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[Path, None, None]:
+    """Runs the daemon in a background thread.
+
+    The in-memory test database is private to the thread that opened it, so a
+    file-backed one is used. Its absolute URL is set as `db_url`, so clients
+    in other directories still share the daemon's project.
+
+    Args:
+        loaded_engine_from_file: The monkeypatched, file-backed SQLAlchemy
+            Engine with data loaded.
+        socket_path: Path of the socket.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Yields:
+        Path of the socket the daemon listens on.
+    """
+    monkeypatch.setattr(
+        settings,
+        "db_url",
+        loaded_engine_from_file.url.render_as_string(hide_password=False),
+    )
+    server = create_server(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture()
+def forwarded(daemon: Path) -> Forward:
+    """Returns a callable that forwards a command to the daemon.
+
+    Args:
+        daemon: Path of the socket the daemon listens on.
+
+    Returns:
+        A callable returning the exit code, stdout and stderr of a command.
+    """
+
+    def _run(argv: list[str]) -> tuple[int | None, str, str]:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = forward(argv, daemon, stdout=stdout, stderr=stderr)
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    return _run
+
+
+@pytest.mark.cli
+class TestForwarding:
+    def test_output_matches_in_process(
+        self, forwarded: Forward, cli_json: Callable[[str], list | dict]
+    ) -> None:
+        """Verifies that a forwarded command prints the same as an in-process one."""
+        code, stdout, _ = forwarded(["event", "dump"])
+
+        assert code == 0
+        assert json.loads(stdout) == cli_json("event dump")
+
+    def test_changes_are_persisted(
+        self, forwarded: Forward, cli_json: Callable[[str], list | dict]
+    ) -> None:
+        """Verifies that changes made by the daemon are written to the database."""
+        event_id = cli_json("event dump")[0]["id"]
+        code, _, _ = forwarded(
+            ["event", "parameter", "set", "--event-id", event_id, "min_cc", "0.42"]
+        )
+
+        assert code == 0
+        assert cli_json("event parameter dump")[0]["min_cc"] == pytest.approx(0.42)
+
+    def test_failing_command_exit_code(self, forwarded: Forward) -> None:
+        """Verifies that a failing command reports a non-zero exit code."""
+        code, _, _ = forwarded(["event", "delete", "ffffffff"])
+
+        assert code not in (0, None)
+
+    def test_settings_changed_by_a_command_are_restored(
+        self, forwarded: Forward, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies that `--profile` does not leak into later commands."""
+        monkeypatch.chdir(tmp_path)
+        profile_dir = settings.profile_dir
+
+        code, _, _ = forwarded(["event", "dump", "--profile"])
+
+        assert code == 0
+        assert settings.profile_dir == profile_dir
+
+    def test_working_directory_of_client(
+        self, forwarded: Forward, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies that relative paths are resolved in the client's directory."""
+        monkeypatch.chdir(tmp_path)
+
+        code, _, _ = forwarded(["event", "dump", "--output", "events.json"])
+
+        assert code == 0
+        assert json.loads((tmp_path / "events.json").read_text())
+
+
+@pytest.mark.cli
+class TestFallback:
+    def test_no_daemon(self, socket_path: Path) -> None:
+        """Verifies that the command is not run without a daemon."""
+        assert forward(["event", "dump"], socket_path) is None
+
+    def test_different_settings(
+        self, forwarded: Forward, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies that the daemon rejects clients with different settings."""
+        monkeypatch.setattr(settings, "min_cc", 0.99)
+
+        assert forwarded(["event", "dump"]) == (None, "", "")
+
+    def test_relative_database_in_other_directory(
+        self,
+        loaded_engine_from_file: Engine,
+        socket_path: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Verifies that a relative `db_url` only matches in the daemon's directory."""
+        monkeypatch.setattr(settings, "db_url", "sqlite+pysqlite:///aimbat.db")
+        daemon_dir, client_dir = tmp_path / "daemon", tmp_path / "client"
+        daemon_dir.mkdir()
+        client_dir.mkdir()
+        monkeypatch.chdir(daemon_dir)
+
+        with create_server(socket_path) as server:
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                monkeypatch.chdir(client_dir)
+                code = forward(
+                    ["event", "dump"],
+                    socket_path,
+                    stdout=io.StringIO(),
+                    stderr=io.StringIO(),
+                )
+            finally:
+                server.shutdown()
+                thread.join()
+
+        assert code is None
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["tui"],
+            ["shell"],
+            ["plot", "stack"],
+            ["event", "note", "edit"],
+            ["batch", "-"],
+            ["batch", "--transaction", "-"],
+            [],
+        ],
+    )
+    def test_local_commands(self, argv: list[str], forwarded: Forward) -> None:
+        """Verifies that interactive commands and standard input batches are never forwarded."""
+        assert not is_forwardable(argv)
+        assert forwarded(argv) == (None, "", "")
+
+    def test_batch_file_forwardable(self) -> None:
+        """Verifies that a batch read from a file can still run in the daemon."""
+        assert is_forwardable(["batch", "commands.aimbat"])
+
+
+class TestServer:
+    def test_second_daemon_refused(self, daemon: Path) -> None:
+        """Verifies that only one daemon can listen on a socket."""
+        with pytest.raises(RuntimeError, match="already listening"):
+            create_server(daemon)
+
+    def test_stale_socket_replaced(
+        self, loaded_engine: Engine, socket_path: Path
+    ) -> None:
+        """Verifies that a socket file without a daemon behind it is replaced."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        with create_server(socket_path):
+            pass
@@ -14,20 +14,23 @@ monkeypatched to the test fixture's database:
 import asyncio
 import uuid
 from collections.abc import Generator
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from typing import cast
 
 import pytest
 from sqlalchemy import Engine
 from sqlmodel import Session, select
 from textual.binding import Binding
+from textual.pilot import Pilot
 from textual.widgets import DataTable, Static, TabbedContent, TabPane
+from textual.worker import WorkerCancelled
 
 import aimbat._tui._panels
 import aimbat._tui._widgets
 import aimbat._tui.app
 import aimbat._tui.modals
 import aimbat.db
+from aimbat._tui._panels import SeismogramPanel
 from aimbat._tui.app import AimbatTUI
 from aimbat._tui.modals import (
     InteractiveToolsModal,
@@ -38,8 +41,10 @@ from aimbat._tui.modals import (
 from aimbat.core import (
     BoundICCS,
     create_snapshot,
+    delete_seismogram,
     get_current_revision,
     get_head_revision,
+    set_seismogram_parameter,
 )
 from aimbat.core import create_iccs_instance as _real_create_iccs_instance
 from aimbat.models import AimbatEvent, AimbatSeismogram
@@ -61,6 +66,19 @@ def _patch_engine(monkeypatch: pytest.MonkeyPatch, engine: Engine) -> None:
     monkeypatch.setattr(aimbat._tui._widgets, "engine", engine)
 
 
+async def _wait_for_workers(app: AimbatTUI) -> None:
+    """Wait for all running workers to finish.
+
+    Panel loads are cancelled when a newer refresh supersedes them (see
+    `_LoadingPanel` in `_panels.py`), so cancelled workers are skipped rather
+    than raising `WorkerCancelled` as `app.workers.wait_for_complete()` would.
+    """
+    while pending := [worker for worker in app.workers if not worker.is_finished]:
+        for worker in pending:
+            with suppress(WorkerCancelled):
+                await worker.wait()
+
+
 async def _wait_for_iccs_worker(app: AimbatTUI) -> None:
     """Wait for the background ICCS-creation worker to actually finish.
 
@@ -69,7 +87,21 @@ async def _wait_for_iccs_worker(app: AimbatTUI) -> None:
     sleep on slower CI runners (observed flaking on Windows). Waiting on the
     worker itself is deterministic regardless of how long it takes.
     """
-    await app.workers.wait_for_complete()
+    await _wait_for_workers(app)
+
+
+async def _wait_for_panels(pilot: Pilot[None]) -> None:
+    """Wait for the panels' background loads to be applied.
+
+    Panels read their rows in thread workers and apply them on the UI thread,
+    so a refresh is not visible in the tables until those workers have
+    finished and the app has processed the results. Waiting twice covers the
+    refresh a finishing ICCS worker triggers when its result is assigned.
+    """
+    app = cast(AimbatTUI, pilot.app)
+    for _ in range(2):
+        await _wait_for_workers(app)
+        await pilot.pause()
 
 
 # ===========================================================================
@@ -252,52 +284,186 @@ class TestTUIWithData:
     """TUI tests against a project pre-populated with multi-event data."""
 
     def test_starts_without_error(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """App mounts without raising an exception when data is present."""
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
 
         asyncio.run(_run())
 
     def test_seismogram_table_populated(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Seismogram table has rows once an event is selected."""
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                with Session(loaded_engine) as session:
+                with Session(loaded_engine_from_file) as session:
                     event = session.exec(select(AimbatEvent)).first()
                 assert event is not None
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event.id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 table = pilot.app.query_one("#seismogram-table", DataTable)
                 assert table.row_count > 0
 
         asyncio.run(_run())
 
     def test_snapshot_table_empty_initially(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Snapshot table starts empty before any snapshot is created."""
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 table = pilot.app.query_one("#snapshot-table", DataTable)
                 assert table.row_count == 0
 
         asyncio.run(_run())
 
 
+# ===========================================================================
+# Table refresh
+# ===========================================================================
+
+
+@pytest.mark.slow
+class TestTableRefresh:
+    """Panels load rows in background workers and apply row-level diffs
+    instead of rebuilding their tables (see `_LoadingPanel` and `_sync_rows`
+    in `_panels.py`)."""
+
+    def test_changed_row_updated_in_place(
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Changing one seismogram only updates its cells; other rows and the
+        cursor are untouched."""
+        _patch_engine(monkeypatch, loaded_engine_from_file)
+
+        with Session(loaded_engine_from_file) as session:
+            event = session.exec(select(AimbatEvent)).first()
+            assert event is not None
+            event_id = event.id
+
+        async def _run() -> None:
+            async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
+                await _wait_for_panels(pilot)
+                app = cast(AimbatTUI, pilot.app)
+                app._current_event_id = event_id
+                app.refresh_all()
+                await _wait_for_panels(pilot)
+                table = pilot.app.query_one("#seismogram-table", DataTable)
+                table.move_cursor(row=2)
+                await pilot.pause()
+                rows_before = dict(table.rows)
+                keys_before = [row.key for row in table.ordered_rows]
+                changed_key = keys_before[1]
+                flip_column = list(table.columns)[
+                    [c.label.plain for c in table.columns.values()].index("Flip")
+                ]
+                flip_before = table.get_cell(changed_key, flip_column)
+
+                with Session(loaded_engine_from_file) as session:
+                    seismogram = session.get(
+                        AimbatSeismogram, uuid.UUID(changed_key.value)
+                    )
+                    assert seismogram is not None
+                    set_seismogram_parameter(
+                        session,
+                        seismogram.id,
+                        "flip",
+                        not seismogram.parameters.flip,
+                    )
+                pilot.app.query_one(SeismogramPanel).refresh_data(event_id, None)
+                await _wait_for_panels(pilot)
+
+                assert [row.key for row in table.ordered_rows] == keys_before
+                assert all(table.rows[k] is rows_before[k] for k in keys_before)
+                assert table.get_cell(changed_key, flip_column) != flip_before
+                assert table.cursor_row == 2
+
+        asyncio.run(_run())
+
+    def test_cursor_follows_row_when_rows_removed(
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Removing a row above the cursor keeps the cursor on the same row."""
+        _patch_engine(monkeypatch, loaded_engine_from_file)
+
+        with Session(loaded_engine_from_file) as session:
+            event = session.exec(select(AimbatEvent)).first()
+            assert event is not None
+            event_id = event.id
+
+        async def _run() -> None:
+            async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
+                await _wait_for_panels(pilot)
+                app = cast(AimbatTUI, pilot.app)
+                app._current_event_id = event_id
+                app.refresh_all()
+                await _wait_for_panels(pilot)
+                table = pilot.app.query_one("#seismogram-table", DataTable)
+                table.move_cursor(row=3)
+                await pilot.pause()
+                keys_before = [row.key for row in table.ordered_rows]
+                deleted_key, cursor_key = keys_before[0], keys_before[3]
+
+                with Session(loaded_engine_from_file) as session:
+                    delete_seismogram(session, uuid.UUID(deleted_key.value))
+                app.refresh_all()
+                await _wait_for_panels(pilot)
+
+                assert deleted_key not in table.rows
+                assert table.row_count == len(keys_before) - 1
+                assert (
+                    table.coordinate_to_cell_key(table.cursor_coordinate).row_key
+                    == cursor_key
+                )
+
+        asyncio.run(_run())
+
+    def test_only_latest_load_is_applied(
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """When refreshes overlap, the table shows the rows of the last one."""
+        _patch_engine(monkeypatch, loaded_engine_from_file)
+
+        with Session(loaded_engine_from_file) as session:
+            events = session.exec(select(AimbatEvent)).all()
+            assert len(events) > 1
+            first_id, last_id = events[0].id, events[-1].id
+            expected = {
+                str(seismogram_id)
+                for seismogram_id in session.exec(
+                    select(AimbatSeismogram.id).where(
+                        AimbatSeismogram.event_id == last_id
+                    )
+                ).all()
+            }
+
+        async def _run() -> None:
+            async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
+                await _wait_for_panels(pilot)
+                panel = pilot.app.query_one(SeismogramPanel)
+                panel.refresh_data(first_id, None)
+                panel.refresh_data(last_id, None)
+                await _wait_for_panels(pilot)
+
+                table = pilot.app.query_one("#seismogram-table", DataTable)
+                assert {row.key.value for row in table.ordered_rows} == expected
+                assert not table.loading
+
+        asyncio.run(_run())
+
+
 # ===========================================================================
 # Tab navigation
 # ===========================================================================
@@ -498,14 +664,14 @@ class TestRowActionMenuWiring:
     """
 
     def test_project_event_action_toggles_completed(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Choosing 'Toggle completed' from an event's action menu flips its flag."""
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
         async def _run() -> uuid.UUID:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 table = pilot.app.query_one("#project-event-table", DataTable)
                 table.focus()
                 await pilot.pause()
@@ -520,29 +686,29 @@ class TestRowActionMenuWiring:
 
         event_id = asyncio.run(_run())
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.get(AimbatEvent, event_id)
             assert event is not None
             assert event.parameters.completed is True
 
     def test_seismogram_action_toggles_select(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Choosing 'Toggle select' from a seismogram's action menu flips its flag."""
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.exec(select(AimbatEvent)).first()
             assert event is not None
             event_id = event.id
 
         async def _run() -> uuid.UUID:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event_id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 await pilot.press("L")  # Project -> Live data
                 await pilot.pause()
                 table = pilot.app.query_one("#seismogram-table", DataTable)
@@ -558,18 +724,18 @@ class TestRowActionMenuWiring:
 
         seismogram_id = asyncio.run(_run())
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             seismogram = session.get(AimbatSeismogram, seismogram_id)
             assert seismogram is not None
             assert seismogram.parameters.select is False
 
     def test_snapshot_action_shows_details(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Choosing 'Show details' from a snapshot's action menu opens the details modal."""
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.exec(select(AimbatEvent)).first()
             assert event is not None
             event_id = event.id
@@ -577,11 +743,11 @@ class TestRowActionMenuWiring:
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event_id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 await pilot.press("L")  # Project -> Live data
                 await pilot.press("L")  # Live data -> Snapshots
                 await pilot.pause()
@@ -609,25 +775,25 @@ class TestRowActionFooterHotkeys:
     `_panels.py`)."""
 
     def test_seismogram_hotkey_toggles_select(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Pressing 's' directly on a focused seismogram row toggles select,
         with no Enter/menu navigation, and produces the same result the
         Enter -> menu path does."""
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.exec(select(AimbatEvent)).first()
             assert event is not None
             event_id = event.id
 
         async def _run() -> uuid.UUID:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event_id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 await pilot.press("L")  # Project -> Live data
                 await pilot.pause()
                 table = pilot.app.query_one("#seismogram-table", DataTable)
@@ -641,21 +807,21 @@ class TestRowActionFooterHotkeys:
 
         seismogram_id = asyncio.run(_run())
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             seismogram = session.get(AimbatSeismogram, seismogram_id)
             assert seismogram is not None
             assert seismogram.parameters.select is False
 
     def test_footer_shows_row_action_only_for_focused_table(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """An events-table-only hotkey appears only while that table (not the
         stations table) has keyboard focus."""
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 event_table = pilot.app.query_one("#project-event-table", DataTable)
                 event_table.focus()
                 await pilot.pause()
@@ -724,22 +890,22 @@ class TestHotkeyScoping:
         asyncio.run(_run())
 
     def test_new_snapshot_only_on_seismograms_tab(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.exec(select(AimbatEvent)).first()
             assert event is not None
             event_id = event.id
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event_id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 assert app.check_action("new_snapshot", ()) is False  # tab-project
 
                 await pilot.press("L")  # -> tab-seismograms
@@ -753,22 +919,22 @@ class TestHotkeyScoping:
         asyncio.run(_run())
 
     def test_tools_and_align_hidden_outside_seismograms_tab(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.exec(select(AimbatEvent)).first()
             assert event is not None
             event_id = event.id
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event_id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 for action in ("open_interactive_tools", "open_align"):
                     assert app.check_action(action, ()) is False  # tab-project
 
@@ -787,22 +953,22 @@ class TestHotkeyScoping:
         asyncio.run(_run())
 
     def test_parameters_visible_on_events_table_not_stations_table(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.exec(select(AimbatEvent)).first()
             assert event is not None
             event_id = event.id
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event_id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
 
                 event_table = pilot.app.query_one("#project-event-table", DataTable)
                 event_table.focus()
@@ -819,22 +985,22 @@ class TestHotkeyScoping:
         asyncio.run(_run())
 
     def test_parameters_visible_on_seismograms_tab(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.exec(select(AimbatEvent)).first()
             assert event is not None
             event_id = event.id
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event_id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
 
                 # Leave focus on the stations table (where 'p' is hidden),
                 # then switch tabs — the seismograms-tab branch must not
@@ -850,22 +1016,22 @@ class TestHotkeyScoping:
         asyncio.run(_run())
 
     def test_parameters_hidden_on_snapshots_tab(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.exec(select(AimbatEvent)).first()
             assert event is not None
             event_id = event.id
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event_id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 await pilot.press("L")  # -> tab-seismograms
                 await pilot.press("L")  # -> tab-snapshots
                 await pilot.pause()
@@ -906,24 +1072,24 @@ class TestEventSwitcherRetirement:
         asyncio.run(_run())
 
     def test_event_bar_hint_no_longer_mentions_e(
-        self, loaded_engine: Engine, monkeypatch: pytest.MonkeyPatch
+        self, loaded_engine_from_file: Engine, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """With an event selected, the bar's dimmed hint points at the
         Project tab instead of the retired 'e' hotkey."""
-        _patch_engine(monkeypatch, loaded_engine)
+        _patch_engine(monkeypatch, loaded_engine_from_file)
 
-        with Session(loaded_engine) as session:
+        with Session(loaded_engine_from_file) as session:
             event = session.exec(select(AimbatEvent)).first()
             assert event is not None
             event_id = event.id
 
         async def _run() -> None:
             async with AimbatTUI().run_test(size=_TUI_SIZE) as pilot:
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 app = cast(AimbatTUI, pilot.app)
                 app._current_event_id = event_id
                 app.refresh_all()
-                await pilot.pause(delay=0.5)
+                await _wait_for_panels(pilot)
                 bar = pilot.app.query_one("#event-bar", Static)
                 text = str(bar.render())
                 assert "e = switch event" not in text
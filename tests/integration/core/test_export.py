@@ -0,0 +1,182 @@
+"""Integration tests for the streaming table export in aimbat.core._export."""
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pandas import Timedelta, Timestamp
+from sqlmodel import Session, select
+
+from aimbat.core import (
+    RESULTS_COLUMNS,
+    create_snapshot,
+    dump_seismogram_table,
+    dump_snapshot_results,
+    dump_station_table,
+    export_results_table,
+    export_table,
+    get_results_table,
+    iter_table_rows,
+)
+from aimbat.models import AimbatEvent, AimbatSeismogram, AimbatSnapshot, AimbatStation
+
+
+class TestIterTableRows:
+    """Tests for iter_table_rows."""
+
+    def test_matches_dump(self, loaded_session: Session) -> None:
+        """Verifies that the rows match the list built by the dump function."""
+        rows = list(iter_table_rows(loaded_session, AimbatSeismogram, batch_size=2))
+        assert sorted(rows, key=lambda r: r["id"]) == sorted(
+            dump_seismogram_table(loaded_session), key=lambda r: r["id"]
+        )
+
+    def test_is_lazy(self, loaded_session: Session) -> None:
+        """Verifies that rows are produced one at a time."""
+        rows = iter_table_rows(loaded_session, AimbatSeismogram)
+        assert isinstance(next(rows), dict)
+
+    def test_statement_and_exclude(self, loaded_session: Session) -> None:
+        """Verifies that a custom statement filters rows and fields are excluded."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        statement = select(AimbatSeismogram).where(
+            AimbatSeismogram.event_id == event.id
+        )
+        rows = list(
+            iter_table_rows(
+                loaded_session, AimbatSeismogram, exclude={"id"}, statement=statement
+            )
+        )
+        assert len(rows) == len(event.seismograms)
+        assert all("id" not in row for row in rows)
+        assert all(row["event_id"] == str(event.id) for row in rows)
+
+    def test_invalid_batch_size(self, loaded_session: Session) -> None:
+        """Verifies that a batch size smaller than 1 is rejected."""
+        with pytest.raises(ValueError):
+            next(iter_table_rows(loaded_session, AimbatSeismogram, batch_size=0))
+
+
+class TestExportTable:
+    """Tests for export_table."""
+
+    def test_ndjson(self, loaded_session: Session) -> None:
+        """Verifies that NDJSON output has one JSON object per row."""
+        buffer = io.StringIO()
+        count = export_table(loaded_session, AimbatStation, buffer, "ndjson")
+        records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        assert count == len(records)
+        assert sorted(records, key=lambda r: r["id"]) == sorted(
+            dump_station_table(loaded_session), key=lambda r: r["id"]
+        )
+
+    def test_csv(self, loaded_session: Session) -> None:
+        """Verifies that CSV output has a header and one line per row."""
+        buffer = io.StringIO()
+        count = export_table(loaded_session, AimbatStation, buffer, "csv", batch_size=1)
+        rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+        expected = dump_station_table(loaded_session)
+        assert count == len(rows) == len(expected)
+        assert set(rows[0]) == set(expected[0])
+
+    def test_by_alias(self, loaded_session: Session) -> None:
+        """Verifies that aliases are used as field names when requested."""
+        buffer = io.StringIO()
+        export_table(loaded_session, AimbatStation, buffer, "ndjson", by_alias=True)
+        first = json.loads(buffer.getvalue().splitlines()[0])
+        assert set(first) == set(dump_station_table(loaded_session, by_alias=True)[0])
+
+    def test_empty_table(self, patched_session: Session) -> None:
+        """Verifies that an empty table produces no output."""
+        buffer = io.StringIO()
+        assert export_table(patched_session, AimbatStation, buffer, "csv") == 0
+        assert buffer.getvalue() == ""
+
+
+class TestResultsTable:
+    """Tests for get_results_table and export_results_table."""
+
+    @staticmethod
+    def _snapshot_all_events(session: Session) -> list[AimbatEvent]:
+        events = list(session.exec(select(AimbatEvent)).all())
+        for event in events:
+            create_snapshot(session, event)
+        return events
+
+    def test_one_row_per_seismogram(self, loaded_session: Session) -> None:
+        """Verifies the table has a row for every seismogram of every event."""
+        events = self._snapshot_all_events(loaded_session)
+
+        results = get_results_table(loaded_session)
+
+        assert tuple(results.columns) == RESULTS_COLUMNS
+        assert len(results) == sum(len(e.seismograms) for e in events)
+        assert set(results["event_id"]) == {str(e.id) for e in events}
+
+    def test_matches_snapshot_results(self, loaded_session: Session) -> None:
+        """Verifies the values match the per-snapshot results export."""
+        self._snapshot_all_events(loaded_session)
+        snapshot = loaded_session.exec(select(AimbatSnapshot)).first()
+        assert snapshot is not None
+        expected = dump_snapshot_results(loaded_session, snapshot.id)
+
+        results = get_results_table(loaded_session, [snapshot.id])
+
+        assert set(results["snapshot_id"]) == {str(snapshot.id)}
+        rows = results.set_index("seismogram_id")
+        for seismogram in expected["seismograms"]:
+            row = rows.loc[seismogram["seismogram_id"]]
+            assert bool(row["select"]) == seismogram["select"]
+            assert bool(row["flip"]) == seismogram["flip"]
+            if seismogram["t1"] is None:
+                assert pd.isna(row["t1"])
+            else:
+                assert row["t1"] == Timestamp(seismogram["t1"])
+            assert row["channel"] == seismogram["channel"]
+
+    def test_latest_snapshot_per_event(self, loaded_session: Session) -> None:
+        """Verifies only the most recent snapshot of an event is used."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        create_snapshot(loaded_session, event, comment="old")
+        old = loaded_session.exec(select(AimbatSnapshot)).one()
+        old.time = old.time - Timedelta(days=1)
+        loaded_session.add(old)
+        loaded_session.commit()
+        create_snapshot(loaded_session, event, comment="new")
+
+        results = get_results_table(loaded_session)
+
+        assert set(results["snapshot_comment"]) == {"new"}
+
+    def test_no_snapshots(self, loaded_session: Session) -> None:
+        """Verifies an empty table is returned when there are no snapshots."""
+        results = get_results_table(loaded_session)
+        assert results.empty
+        assert tuple(results.columns) == RESULTS_COLUMNS
+
+    def test_export_csv(self, loaded_session: Session, tmp_path: Path) -> None:
+        """Verifies the table is written as CSV."""
+        self._snapshot_all_events(loaded_session)
+        path = tmp_path / "results.csv"
+
+        count = export_results_table(loaded_session, path, "csv")
+
+        with path.open(newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert count == len(rows) > 0
+        assert tuple(rows[0]) == RESULTS_COLUMNS
+
+    def test_export_parquet(self, loaded_session: Session, tmp_path: Path) -> None:
+        """Verifies the table round-trips through Parquet."""
+        pytest.importorskip("pyarrow")
+        self._snapshot_all_events(loaded_session)
+        path = tmp_path / "results.parquet"
+
+        count = export_results_table(loaded_session, path, "parquet")
+
+        assert len(pd.read_parquet(path)) == count > 0
@@ -1,5 +1,10 @@
 """Integration tests for ICCS alignment and MCCC quality clearing."""
 
+import uuid
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+from sqlalchemy import Engine
 from sqlmodel import Session, select
 
 from aimbat.core import (
@@ -10,7 +15,11 @@ from aimbat.core import (
     run_iccs,
     run_mccc,
 )
+from aimbat.core._iccs import _write_back_seismograms, _write_iccs_stats
 from aimbat.models import AimbatEvent, AimbatSeismogramQuality, AimbatSnapshot
+from aimbat.utils import SQLProfiler
+
+type QueryBudget = Callable[[Engine, int], AbstractContextManager[SQLProfiler]]
 
 
 class TestIccsMcccInterplay:
@@ -160,6 +169,29 @@ class TestIccsMcccInterplay:
                 assert s.quality.iccs_cc is None
 
 
+class TestBoundIccsIndexOf:
+    """Tests for `BoundICCS.index_of`."""
+
+    def test_matches_seismogram_order(self, loaded_session: Session) -> None:
+        """Verifies every seismogram is found at its position in the ICCS instance."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+
+        iccs_bound = create_iccs_instance(loaded_session, event)
+
+        for i, seis in enumerate(iccs_bound.iccs.seismograms):
+            assert iccs_bound.index_of(seis.extra["id"]) == i
+
+    def test_unknown_id(self, loaded_session: Session) -> None:
+        """Verifies that a seismogram of another event is not found."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+
+        iccs_bound = create_iccs_instance(loaded_session, event)
+
+        assert iccs_bound.index_of(uuid.uuid4()) is None
+
+
 class TestCcStats:
     """Tests for `core.cc_stats`."""
 
@@ -263,3 +295,42 @@ class TestBuildIccsFromSnapshot:
             s for s in bound.iccs.seismograms if s.extra["id"] == seis.id
         )
         assert snapshot_seis.select == original_select
+
+
+class TestIccsWriteQueryBudget:
+    """Tests that writing ICCS results does not issue a query per seismogram."""
+
+    def test_write_iccs_stats(
+        self, loaded_engine: Engine, loaded_session: Session, query_budget: QueryBudget
+    ) -> None:
+        """Verifies that ICCS CC values are written in a fixed number of statements."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        iccs = create_iccs_instance(loaded_session, event).iccs
+        assert len(iccs.seismograms) > 3
+
+        # Rows deleted in the meantime are re-inserted.
+        for quality in loaded_session.exec(select(AimbatSeismogramQuality)).all()[:3]:
+            loaded_session.delete(quality)
+        loaded_session.commit()
+
+        with query_budget(loaded_engine, 3):
+            _write_iccs_stats(event.id, iccs)
+
+    def test_write_back_seismograms(
+        self, loaded_engine: Engine, loaded_session: Session, query_budget: QueryBudget
+    ) -> None:
+        """Verifies that parameters are written back in a fixed number of statements."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        iccs = create_iccs_instance(loaded_session, event).iccs
+        assert len(iccs.seismograms) > 3
+        for seis in iccs.seismograms:
+            seis.flip = not seis.flip
+
+        with query_budget(loaded_engine, 3):
+            _write_back_seismograms(loaded_session, iccs)
+
+        loaded_session.refresh(event)
+        flips = {s.id: s.parameters.flip for s in event.seismograms}
+        assert all(flips[s.extra["id"]] == s.flip for s in iccs.seismograms)
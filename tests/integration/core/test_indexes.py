@@ -0,0 +1,172 @@
+"""Integration tests for the foreign-key and lookup indexes."""
+
+import uuid
+from typing import Any
+
+from pandas import Timedelta, Timestamp
+from sqlalchemy import Engine, event, inspect, text
+from sqlmodel import Session, SQLModel
+
+from aimbat.core import dump_station_table
+from aimbat.models import AimbatEvent, AimbatSeismogram, AimbatStation
+
+
+def _leading_index_columns(engine: Engine, table: str) -> set[str]:
+    """Set of column names that are the leading column of some index on `table`."""
+    return {
+        idx["column_names"][0]
+        for idx in inspect(engine).get_indexes(table)
+        if idx["column_names"] and idx["column_names"][0] is not None
+    }
+
+
+def _query_plan(session: Session, sql: str, **params: Any) -> str:
+    """Return the `EXPLAIN QUERY PLAN` output for `sql` as a single string."""
+    rows = session.connection().execute(text(f"EXPLAIN QUERY PLAN {sql}"), params)
+    return " | ".join(str(row[-1]) for row in rows)
+
+
+def _populate(session: Session, n_events: int, n_stations: int) -> None:
+    """Fill the project with a synthetic event x station grid of seismograms.
+
+    Every station records every event, so the project holds
+    `n_events * n_stations` seismograms without needing any waveform data.
+
+    Args:
+        session: Database session.
+        n_events: Number of events to create.
+        n_stations: Number of stations to create.
+    """
+    origin = Timestamp("2000-01-01T00:00:00Z")
+    events = [
+        AimbatEvent(
+            time=origin + Timedelta(days=i),
+            latitude=0.0,
+            longitude=float(i % 360),
+            depth=10.0,
+        )
+        for i in range(n_events)
+    ]
+    stations = [
+        AimbatStation(
+            name=f"S{i:04d}",
+            network="XX",
+            location="00",
+            channel="BHZ",
+            latitude=float(i % 90),
+            longitude=0.0,
+        )
+        for i in range(n_stations)
+    ]
+    session.add_all(events)
+    session.add_all(stations)
+    session.flush()
+    session.add_all(
+        AimbatSeismogram(
+            begin_time=event.time,
+            delta=Timedelta(seconds=0.1),
+            t0=event.time + Timedelta(seconds=30),
+            event_id=event.id,
+            station_id=station.id,
+        )
+        for event in events
+        for station in stations
+    )
+    session.commit()
+
+
+class TestForeignKeyIndexes:
+    """Every foreign key and lookup column is backed by an index."""
+
+    def test_every_foreign_key_is_indexed(self, engine: Engine) -> None:
+        """Verifies each foreign key column leads at least one index.
+
+        Args:
+            engine: The SQLAlchemy Engine for the test database.
+        """
+        for table in SQLModel.metadata.sorted_tables:
+            indexed = _leading_index_columns(engine, table.name)
+            for fk in table.foreign_keys:
+                assert fk.parent.name in indexed, (
+                    f"{table.name}.{fk.parent.name} has no index"
+                )
+
+    def test_seismogram_count_uses_index(self, patched_session: Session) -> None:
+        """Verifies the per-event seismogram count does not scan the whole table.
+
+        Args:
+            patched_session: The database session.
+        """
+        plan = _query_plan(
+            patched_session,
+            "SELECT count(id) FROM aimbatseismogram WHERE event_id = :event_id",
+            event_id=uuid.uuid4().hex,
+        )
+        assert "ix_aimbatseismogram_event_id" in plan
+
+    def test_station_lookup_uses_composite_index(
+        self, patched_session: Session
+    ) -> None:
+        """Verifies the station identity lookup used when adding data is indexed.
+
+        Args:
+            patched_session: The database session.
+        """
+        plan = _query_plan(
+            patched_session,
+            "SELECT id FROM aimbatstation WHERE name = :name AND network = :network"
+            " AND channel = :channel AND location = :location",
+            name="S0001",
+            network="XX",
+            channel="BHZ",
+            location="00",
+        )
+        assert "ix_aimbatstation_name_network_location_channel" in plan
+
+
+def test_station_dump_uses_seismogram_station_index(engine: Engine) -> None:
+    """Verifies the seismograms of the dumped stations are looked up by index.
+
+    Captures the statements `dump_station_table` executes and checks the query
+    plan of the one loading the stations' seismograms.
+
+    Args:
+        engine: The SQLAlchemy Engine for the test database.
+    """
+    with Session(engine) as session:
+        _populate(session, n_events=3, n_stations=4)
+
+    statements: list[tuple[str, Any]] = []
+
+    def capture(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as session:
+            dump_station_table(session, from_read_model=True)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    lookups = [
+        (statement, parameters)
+        for statement, parameters in statements
+        if "FROM aimbatseismogram" in statement
+        and "aimbatseismogram.station_id IN" in statement
+    ]
+    assert lookups
+
+    with engine.connect() as connection:
+        for statement, parameters in lookups:
+            rows = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            plan = " | ".join(str(row[-1]) for row in rows)
+            assert "ix_aimbatseismogram_station_id" in plan
@@ -127,6 +127,36 @@ class TestCreateAllVsMigrateParity:
                 migrated_engine, table
             ), f"column mismatch in {table!r}"
 
+    @pytest.mark.parametrize(
+        ("table", "column"),
+        [
+            ("aimbatevent", "seismogram_count"),
+            ("aimbatevent", "station_count"),
+            ("aimbatevent", "snapshot_count"),
+            ("aimbatstation", "seismogram_count"),
+            ("aimbatstation", "event_count"),
+            ("aimbatsnapshot", "seismogram_count"),
+            ("aimbatsnapshot", "selected_seismogram_count"),
+            ("aimbatsnapshot", "flipped_seismogram_count"),
+        ],
+    )
+    def test_same_counter_column_defaults(
+        self,
+        create_all_engine: Engine,
+        migrated_engine: Engine,
+        table: str,
+        column: str,
+    ) -> None:
+        """The trigger-maintained counters default to 0 on both paths."""
+
+        def default(engine: Engine) -> str | None:
+            (col,) = (
+                c for c in inspect(engine).get_columns(table) if c["name"] == column
+            )
+            return col["default"]
+
+        assert default(create_all_engine) == default(migrated_engine) == "0"
+
     def test_same_foreign_keys_per_table(
         self, create_all_engine: Engine, migrated_engine: Engine
     ) -> None:
@@ -294,6 +324,121 @@ class TestUpgradeProject:
             upgrade_project(engine_from_file)
 
 
+class TestCounterColumnsMigration:
+    """The counter-column migration must backfill counts for rows that
+    already exist, since its triggers only see changes made afterwards."""
+
+    def test_backfills_existing_rows(self, db_path: Path) -> None:
+        from alembic import command
+
+        from aimbat.core._migrations import _alembic_config
+
+        engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+        command.upgrade(_alembic_config(engine), "c9c4de85a2eb")
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO aimbatevent (id, time, latitude, longitude)"
+                    " VALUES ('e1', '2000-01-01', 0, 0), ('e2', '2000-01-02', 0, 0)"
+                )
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO aimbatstation"
+                    " (id, name, network, location, channel, latitude, longitude)"
+                    " VALUES ('s1', 'A', 'XX', '', 'BHZ', 0, 0),"
+                    " ('s2', 'B', 'XX', '', 'BHZ', 0, 0)"
+                )
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO aimbatseismogram"
+                    " (id, begin_time, delta, t0, station_id, event_id)"
+                    " VALUES ('x1', '2000-01-01', 1, '2000-01-01', 's1', 'e1'),"
+                    " ('x2', '2000-01-01', 1, '2000-01-01', 's1', 'e1'),"
+                    " ('x3', '2000-01-01', 1, '2000-01-01', 's2', 'e1'),"
+                    " ('x4', '2000-01-02', 1, '2000-01-02', 's1', 'e2')"
+                )
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO aimbatsnapshot (id, time, event_id)"
+                    " VALUES ('p1', '2001-01-01', 'e1')"
+                )
+            )
+
+        upgrade_project(engine)
+
+        with engine.connect() as connection:
+            events = connection.execute(
+                text(
+                    "SELECT id, seismogram_count, station_count, snapshot_count"
+                    " FROM aimbatevent ORDER BY id"
+                )
+            ).all()
+            stations = connection.execute(
+                text(
+                    "SELECT id, seismogram_count, event_count"
+                    " FROM aimbatstation ORDER BY id"
+                )
+            ).all()
+        assert [tuple(row) for row in events] == [("e1", 3, 2, 1), ("e2", 1, 1, 0)]
+        assert [tuple(row) for row in stations] == [("s1", 3, 2), ("s2", 1, 1)]
+        engine.dispose()
+
+
+class TestSharedPayloadMigration:
+    """The payload-sharing migration must merge identical existing payloads
+    and backfill their reference counts."""
+
+    def test_merges_identical_payloads(self, db_path: Path) -> None:
+        from alembic import command
+
+        from aimbat.core._migrations import _alembic_config
+
+        engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+        command.upgrade(_alembic_config(engine), "121b562c0c67")
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO aimbatevent (id, time, latitude, longitude)"
+                    " VALUES ('e1', '2000-01-01', 0, 0)"
+                )
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO aimbatsnapshot (id, time, event_id)"
+                    " VALUES ('p1', '2001-01-01', 'e1'), ('p2', '2001-01-02', 'e1')"
+                )
+            )
+
+        upgrade_project(engine)
+
+        with engine.begin() as connection:
+            payloads = connection.execute(
+                text("SELECT id, ref_count FROM aimbatsnapshotpayload")
+            ).all()
+            assert len(payloads) == 1
+            assert payloads[0].ref_count == 2
+            payload_ids = connection.execute(
+                text("SELECT DISTINCT payload_id FROM aimbatsnapshot")
+            ).scalars()
+            assert list(payload_ids) == [payloads[0].id]
+
+            connection.execute(text("DELETE FROM aimbatsnapshot WHERE id = 'p1'"))
+            ref_count = connection.execute(
+                text("SELECT ref_count FROM aimbatsnapshotpayload")
+            ).scalar_one()
+            assert ref_count == 1
+
+            connection.execute(text("DELETE FROM aimbatsnapshot WHERE id = 'p2'"))
+            remaining = connection.execute(
+                text("SELECT COUNT(*) FROM aimbatsnapshotpayload")
+            ).scalar_one()
+            assert remaining == 0
+        engine.dispose()
+
+
 _FIRST_REVISION = """
 revision = "aaa000000001"
 down_revision = None
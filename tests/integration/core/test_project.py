@@ -8,9 +8,18 @@ from pathlib import Path
 
 import pytest
 from sqlalchemy import Engine
-
-from aimbat.core import create_project, delete_project
+from sqlmodel import Session, select
+
+from aimbat.core import (
+    SnapshotRetentionPolicy,
+    create_project,
+    create_snapshot,
+    delete_project,
+    prune_snapshots,
+    vacuum_project,
+)
 from aimbat.core._project import _project_exists
+from aimbat.models import AimbatEvent
 
 
 class TestProjectLifecycle:
@@ -107,3 +116,58 @@ class TestPrintProjectInfo:
         """
         with pytest.raises(RuntimeError):
             delete_project(engine_from_file)
+
+
+class TestVacuumProject:
+    """Integration tests for vacuum_project."""
+
+    @staticmethod
+    def _create_and_prune_snapshots(engine: Engine) -> None:
+        # Long comments make the deleted snapshots span plenty of pages.
+        with Session(engine) as session:
+            for event in session.exec(select(AimbatEvent)).all():
+                for _ in range(50):
+                    create_snapshot(session, event, comment="x" * 2000)
+            prune_snapshots(
+                session,
+                SnapshotRetentionPolicy(keep_last_automatic=0, keep_manual=False),
+            )
+
+    @pytest.fixture
+    def engine(self, loaded_engine_from_file: Engine) -> Generator[Engine, None, None]:
+        self._create_and_prune_snapshots(loaded_engine_from_file)
+        yield loaded_engine_from_file
+
+    @staticmethod
+    def _pragma(engine: Engine, name: str) -> int:
+        with engine.connect() as conn:
+            return conn.exec_driver_sql(f"PRAGMA {name}").scalar_one()
+
+    def test_full_vacuum(self, engine: Engine) -> None:
+        """Verifies that a full vacuum releases all free pages.
+
+        Args:
+            engine (Engine): The SQLAlchemy engine.
+        """
+        assert self._pragma(engine, "freelist_count") > 0, (
+            "expected free pages after deleting snapshots"
+        )
+        assert vacuum_project(engine) > 0
+        assert self._pragma(engine, "freelist_count") == 0
+
+    def test_incremental_vacuum(self, engine: Engine) -> None:
+        """Verifies that an incremental vacuum switches the project over and
+        releases all free pages.
+
+        Args:
+            engine (Engine): The SQLAlchemy engine.
+        """
+        vacuum_project(engine, mode="incremental")
+        assert self._pragma(engine, "auto_vacuum") == 2
+        assert self._pragma(engine, "freelist_count") == 0
+
+        self._create_and_prune_snapshots(engine)
+        assert self._pragma(engine, "freelist_count") > 0
+
+        assert vacuum_project(engine, mode="incremental") > 0
+        assert self._pragma(engine, "freelist_count") == 0
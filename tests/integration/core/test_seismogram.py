@@ -3,6 +3,7 @@
 import uuid
 
 import pytest
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 from sqlalchemy import Engine
 from sqlalchemy.exc import NoResultFound
@@ -20,6 +21,7 @@ from aimbat.core import (
 from aimbat.models import AimbatEvent, AimbatSeismogram, AimbatStation
 from aimbat.models._parameters import AimbatSeismogramParametersBase
 from aimbat.plot import plot_seismograms
+from aimbat.plot._plot_utils import clear_prepared_cache, event_seismograms
 
 
 @pytest.fixture
@@ -339,3 +341,63 @@ class TestPlotSeismograms:
         """
         fig, _ = plot_seismograms(loaded_session, plot_for=station, return_fig=True)
         assert isinstance(fig, Figure)
+
+    def test_plot_event_draws_visible_traces(self, loaded_session: Session) -> None:
+        """Verifies that only the traces in view are drawn, decimated to the axes width.
+
+        Args:
+            loaded_session: The database session.
+        """
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        fig, ax = plot_seismograms(loaded_session, plot_for=event, return_fig=True)
+        (collection,) = ax.collections
+        assert isinstance(collection, LineCollection)
+        drawn = len(collection.get_segments())
+
+        ymin, ymax = ax.get_ylim()
+        ax.set_ylim(ymin - 2 * (ymax - ymin), ymin - (ymax - ymin))
+
+        assert 0 < drawn <= len(event.seismograms)
+        assert len(collection.get_segments()) < drawn
+        assert all(
+            len(segment) <= 2 * max(ax.bbox.width, 200) + 2
+            for segment in collection.get_segments()
+        )
+
+
+class TestPreparedSeismograms:
+    """Tests for the cache of seismograms prepared for plotting."""
+
+    def test_prepared_seismograms_reused(self, loaded_session: Session) -> None:
+        """Verifies that a second plot of an event reuses the prepared traces.
+
+        Args:
+            loaded_session: The database session.
+        """
+        clear_prepared_cache()
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+
+        first = event_seismograms(event)
+        second = event_seismograms(event)
+
+        assert [s[3] for s in first] == [s[3] for s in second]
+        assert all(a[0] is b[0] for a, b in zip(first, second, strict=True))
+
+    def test_filter_change_prepares_again(self, loaded_session: Session) -> None:
+        """Verifies that changing the bandpass filter invalidates the prepared traces.
+
+        Args:
+            loaded_session: The database session.
+        """
+        clear_prepared_cache()
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+
+        first = {s[3]: s[0] for s in event_seismograms(event)}
+        event.parameters.bandpass_apply = not event.parameters.bandpass_apply
+        second = {s[3]: s[0] for s in event_seismograms(event)}
+
+        assert first.keys() == second.keys()
+        assert all(first[k] is not second[k] for k in first)
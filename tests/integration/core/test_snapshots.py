@@ -5,10 +5,13 @@ import uuid
 import pandas as pd
 import pytest
 from pandas import Timedelta, Timestamp
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import InvalidRequestError, NoResultFound
 from sqlmodel import Session, col, select
 
 from aimbat.core._snapshot import (
+    SnapshotRetentionPolicy,
+    _live_record_ids,
     compute_parameters_hash,
     create_snapshot,
     delete_snapshot,
@@ -19,15 +22,19 @@ from aimbat.core._snapshot import (
     dump_snapshot_results,
     dump_snapshot_table,
     get_snapshots,
+    prune_snapshots,
     rollback_to_snapshot,
+    select_snapshots_to_prune,
     sync_from_matching_hash,
 )
 from aimbat.models import (
     AimbatEvent,
     AimbatEventQuality,
     AimbatSeismogram,
+    AimbatSeismogramParameters,
     AimbatSeismogramQuality,
     AimbatSnapshot,
+    AimbatSnapshotPayload,
 )
 
 
@@ -350,7 +357,7 @@ class TestRollbackToSnapshot:
         snap = next(
             s
             for s in snapshot.seismogram_parameters_snapshots
-            if s.seismogram_parameters_id == params.id
+            if s.seismogram_id == seismogram.id
         )
 
         # Mutate every seismogram parameter to a value distinct from the snapshot
@@ -446,7 +453,7 @@ class TestRollbackToSnapshot:
         rollback_to_snapshot(loaded_session, snapshot.id)
 
         snap_quality = {
-            sq.seismogram_quality_id: sq for sq in snapshot.seismogram_quality_snapshots
+            sq.seismogram_id: sq for sq in snapshot.seismogram_quality_snapshots
         }
         for seis_id in seis_ids:
             sq = loaded_session.exec(
@@ -454,7 +461,7 @@ class TestRollbackToSnapshot:
                     col(AimbatSeismogramQuality.seismogram_id) == seis_id
                 )
             ).one()
-            expected = snap_quality[sq.id]
+            expected = snap_quality[seis_id]
             assert sq.mccc_cc_mean == expected.mccc_cc_mean
             assert sq.mccc_error == expected.mccc_error
 
@@ -508,6 +515,26 @@ class TestGetSnapshots:
         all_snapshots = get_snapshots(loaded_session)
         assert len(all_snapshots) >= 1
 
+    def test_payload_not_loaded_by_default(
+        self, loaded_session: Session, snapshot: AimbatSnapshot
+    ) -> None:
+        """Verifies that listing snapshots leaves the payloads unloaded.
+
+        Args:
+            loaded_session: The database session.
+            snapshot: An AimbatSnapshot for the event.
+        """
+        event_id, seismogram_count = snapshot.event_id, snapshot.seismogram_count
+        loaded_session.expunge_all()
+        (listed,) = get_snapshots(loaded_session, event_id=event_id)
+        assert "payload" in sa_inspect(listed).unloaded
+        with pytest.raises(InvalidRequestError):
+            listed.seismogram_parameters_snapshots
+
+        (loaded,) = get_snapshots(loaded_session, event_id=event_id, load_payload=True)
+        assert loaded is listed
+        assert len(loaded.seismogram_parameters_snapshots) == seismogram_count
+
     def test_multiple_snapshots(self, loaded_session: Session) -> None:
         """Verifies that multiple snapshots can be created and retrieved.
 
@@ -787,6 +814,35 @@ class TestDumpSeismogramParameterSnapshotTable:
         )
         assert "id" not in result[0]
 
+    def test_live_record_ids_in_batches(
+        self, loaded_session: Session, snapshot: AimbatSnapshot
+    ) -> None:
+        """Verifies that live IDs are found when looked up in several batches."""
+        live = {
+            p.seismogram_id: p.id
+            for p in loaded_session.exec(select(AimbatSeismogramParameters))
+        }
+        assert len(live) > 2
+
+        result = _live_record_ids(
+            loaded_session,
+            AimbatSeismogramParameters,
+            set(live) | {uuid.uuid4()},
+            batch_size=2,
+        )
+
+        assert result == live
+
+    def test_live_ids_in_dump(
+        self, loaded_session: Session, snapshot: AimbatSnapshot
+    ) -> None:
+        """Verifies that every dumped record references its live parameters."""
+        live_ids = {
+            str(p.id) for p in loaded_session.exec(select(AimbatSeismogramParameters))
+        }
+        result = dump_seismogram_parameter_snapshot_table(loaded_session)
+        assert {r["seismogram_parameters_id"] for r in result} <= live_ids
+
 
 class TestDumpEventQualitySnapshotTable:
     """Tests for dump_event_quality_snapshot_table."""
@@ -857,7 +913,7 @@ class TestDumpSeismogramQualitySnapshotTable:
         )
         assert len(result) == len(event.seismograms)
         assert "snapshot_id" in result[0]
-        assert "seismogram_quality_id" in result[0]
+        assert "seismogram_id" in result[0]
 
     def test_dump_seismogram_quality_snapshot_table_exclude(
         self, loaded_session: Session
@@ -1228,3 +1284,143 @@ class TestDumpSnapshotResults:
         assert "event_time" not in result
         assert "seismogramId" in result["seismograms"][0]
         assert "seismogram_id" not in result["seismograms"][0]
+
+
+def _create_snapshots(
+    session: Session, event: AimbatEvent, times: list[Timestamp], automatic: bool
+) -> list[AimbatSnapshot]:
+    """Create snapshots of an event and backdate them to the given times."""
+    snapshots: list[AimbatSnapshot] = []
+    for time in times:
+        create_snapshot(session, event, automatic=automatic)
+        known_ids = [s.id for s in snapshots]
+        snapshot = session.exec(
+            select(AimbatSnapshot).where(
+                AimbatSnapshot.event_id == event.id,
+                col(AimbatSnapshot.id).not_in(known_ids),
+            )
+        ).one()
+        snapshot.time = time
+        session.add(snapshot)
+        session.commit()
+        snapshots.append(snapshot)
+    return snapshots
+
+
+class TestSnapshotRetentionPolicy:
+    """Tests for SnapshotRetentionPolicy."""
+
+    def test_default_policy_has_no_rules(self) -> None:
+        """Verifies the default policy deletes nothing."""
+        assert not SnapshotRetentionPolicy().has_rules
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"keep_last_automatic": -1},
+            {"thin_after": Timedelta(days=-1)},
+            {"thin_interval": Timedelta(0)},
+        ],
+    )
+    def test_invalid_policy_rejected(self, kwargs: dict) -> None:
+        """Verifies invalid rules raise a ValueError."""
+        with pytest.raises(ValueError):
+            SnapshotRetentionPolicy(**kwargs)
+
+
+class TestPruneSnapshots:
+    """Tests for select_snapshots_to_prune and prune_snapshots."""
+
+    NOW = Timestamp("2026-01-31T12:00:00", tz="UTC")
+
+    def test_keep_last_automatic(self, loaded_session: Session) -> None:
+        """Verifies only the most recent automatic snapshots of an event are kept."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        times = [self.NOW - Timedelta(hours=h) for h in range(5)]
+        snapshots = _create_snapshots(loaded_session, event, times, automatic=True)
+
+        policy = SnapshotRetentionPolicy(keep_last_automatic=2)
+        expected = [s.id for s in reversed(snapshots[2:])]
+        assert select_snapshots_to_prune(loaded_session, policy) == expected
+
+        assert prune_snapshots(loaded_session, policy) == 3
+        remaining = {s.id for s in loaded_session.exec(select(AimbatSnapshot)).all()}
+        assert remaining == {snapshots[0].id, snapshots[1].id}
+
+    def test_manual_snapshots_kept(self, loaded_session: Session) -> None:
+        """Verifies manual snapshots are only pruned when not exempted."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        times = [self.NOW - Timedelta(hours=h) for h in range(3)]
+        _create_snapshots(loaded_session, event, times, automatic=False)
+
+        policy = SnapshotRetentionPolicy(keep_last_automatic=0)
+        assert select_snapshots_to_prune(loaded_session, policy) == []
+
+        policy = SnapshotRetentionPolicy(keep_last_automatic=1, keep_manual=False)
+        assert len(select_snapshots_to_prune(loaded_session, policy)) == 2
+
+    def test_keep_last_is_per_event(self, loaded_session: Session) -> None:
+        """Verifies the keep-last rule counts snapshots per event."""
+        events = loaded_session.exec(select(AimbatEvent)).all()
+        assert len(events) >= 2
+        times = [self.NOW - Timedelta(hours=h) for h in range(3)]
+        for event in events[:2]:
+            _create_snapshots(loaded_session, event, times, automatic=True)
+
+        policy = SnapshotRetentionPolicy(keep_last_automatic=1)
+        assert len(select_snapshots_to_prune(loaded_session, policy)) == 4
+        assert len(select_snapshots_to_prune(loaded_session, policy, events[0].id)) == 2
+
+    def test_thinning(self, loaded_session: Session) -> None:
+        """Verifies old snapshots are thinned to the newest one per interval."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        day = Timestamp("2026-01-01", tz="UTC")
+        times = [
+            self.NOW - Timedelta(hours=1),  # recent, kept
+            day + Timedelta(hours=18),  # newest of the day, kept
+            day + Timedelta(hours=12),
+            day + Timedelta(hours=6),
+            day - Timedelta(hours=6),  # only one of the previous day, kept
+        ]
+        snapshots = _create_snapshots(loaded_session, event, times, automatic=True)
+
+        policy = SnapshotRetentionPolicy(
+            thin_after=Timedelta(days=7), thin_interval=Timedelta(days=1)
+        )
+        selected = select_snapshots_to_prune(loaded_session, policy, now=self.NOW)
+        assert selected == [snapshots[3].id, snapshots[2].id]
+
+    def test_prune_in_batches(self, loaded_session: Session) -> None:
+        """Verifies progress is reported after each batch."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        times = [self.NOW - Timedelta(hours=h) for h in range(5)]
+        _create_snapshots(loaded_session, event, times, automatic=True)
+
+        progress: list[tuple[int, int]] = []
+        deleted = prune_snapshots(
+            loaded_session,
+            SnapshotRetentionPolicy(keep_last_automatic=0),
+            batch_size=2,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+        assert deleted == 5
+        assert progress == [(2, 5), (4, 5), (5, 5)]
+        assert loaded_session.exec(select(AimbatSnapshot)).all() == []
+
+    def test_prune_removes_unreferenced_payloads(self, loaded_session: Session) -> None:
+        """Verifies payloads are removed together with their last snapshot."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        times = [self.NOW - Timedelta(hours=h) for h in range(3)]
+        _create_snapshots(loaded_session, event, times, automatic=True)
+
+        prune_snapshots(loaded_session, SnapshotRetentionPolicy(keep_last_automatic=1))
+        payload = loaded_session.exec(select(AimbatSnapshotPayload)).one()
+        assert payload.ref_count == 1
+
+        prune_snapshots(loaded_session, SnapshotRetentionPolicy(keep_last_automatic=0))
+        assert loaded_session.exec(select(AimbatSnapshotPayload)).all() == []
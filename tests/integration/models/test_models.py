@@ -19,8 +19,8 @@ from aimbat.models import (
     AimbatEventParametersSnapshot,
     AimbatSeismogram,
     AimbatSeismogramParameters,
-    AimbatSeismogramParametersSnapshot,
     AimbatSnapshot,
+    AimbatSnapshotPayload,
     AimbatStation,
 )
 from aimbat.models._parameters import AimbatEventParametersBase
@@ -281,10 +281,7 @@ class TestCascadeDeleteSnapshot:
         assert (
             len(patched_session.exec(select(AimbatEventParametersSnapshot)).all()) == 0
         )
-        assert (
-            len(patched_session.exec(select(AimbatSeismogramParametersSnapshot)).all())
-            == 0
-        )
+        assert len(patched_session.exec(select(AimbatSnapshotPayload)).all()) == 0
 
 
 # ===================================================================
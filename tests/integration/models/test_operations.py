@@ -13,6 +13,7 @@ from aimbat.models import (
     AimbatSeismogramParameters,
     AimbatSeismogramParametersSnapshot,
     AimbatSnapshot,
+    AimbatSnapshotPayload,
     AimbatStation,
 )
 
@@ -408,7 +409,7 @@ class TestCascadeDeleteEvent:
         session.commit()
 
         assert len(session.exec(select(AimbatEventParametersSnapshot)).all()) == 0
-        assert len(session.exec(select(AimbatSeismogramParametersSnapshot)).all()) == 0
+        assert len(session.exec(select(AimbatSnapshotPayload)).all()) == 0
 
 
 class TestCascadeDeleteStation:
@@ -504,10 +505,13 @@ class TestCascadeDeleteSeismogram:
 
         assert session.get(AimbatSeismogramParameters, parameters_id) is None
 
-    def test_parameter_snapshots_deleted(
+    def test_parameter_snapshots_kept(
         self, session: Session, seismogram: AimbatSeismogram
     ) -> None:
-        """Verifies that deleting a seismogram removes its parameter snapshots.
+        """Verifies that deleting a seismogram leaves existing snapshots untouched.
+
+        Snapshot payloads are immutable; readers skip seismograms that no
+        longer exist instead.
 
         Args:
             session: The database session.
@@ -515,14 +519,18 @@ class TestCascadeDeleteSeismogram:
         """
         event = seismogram.event
         create_snapshot(session, event)
+        seismogram_id = seismogram.id
         parameters_id = seismogram.parameters.id
 
         session.delete(seismogram)
         session.commit()
 
         assert session.get(AimbatSeismogramParameters, parameters_id) is None
-        remaining = session.exec(select(AimbatSeismogramParametersSnapshot)).all()
-        assert not any(s.seismogram_parameters_id == parameters_id for s in remaining)
+        snapshot = session.exec(select(AimbatSnapshot)).one()
+        assert any(
+            s.seismogram_id == seismogram_id
+            for s in snapshot.seismogram_parameters_snapshots
+        )
 
 
 class TestCascadeDeleteSnapshot:
@@ -546,10 +554,8 @@ class TestCascadeDeleteSnapshot:
 
         assert session.get(AimbatEventParametersSnapshot, ep_snapshot_id) is None
 
-    def test_seismogram_parameters_snapshots_deleted(
-        self, session: Session, event: AimbatEvent
-    ) -> None:
-        """Verifies that deleting a snapshot removes all its seismogram parameter snapshots.
+    def test_payload_deleted(self, session: Session, event: AimbatEvent) -> None:
+        """Verifies that deleting a snapshot removes its seismogram payload.
 
         Args:
             session: The database session.
@@ -557,11 +563,10 @@ class TestCascadeDeleteSnapshot:
         """
         create_snapshot(session, event)
         snapshot = session.exec(select(AimbatSnapshot)).one()
-        sp_snapshot_ids = [s.id for s in snapshot.seismogram_parameters_snapshots]
-        assert len(sp_snapshot_ids) > 0
+        assert snapshot.payload is not None
+        payload_id = snapshot.payload.id
 
         session.delete(snapshot)
         session.commit()
 
-        for sid in sp_snapshot_ids:
-            assert session.get(AimbatSeismogramParametersSnapshot, sid) is None
+        assert session.get(AimbatSnapshotPayload, payload_id) is None
@@ -0,0 +1,161 @@
+"""Integration tests for the packed per-seismogram snapshot payload."""
+
+import uuid
+import zlib
+from datetime import timezone
+
+import pandas as pd
+import pytest
+from pandas import Timedelta, Timestamp
+from sqlmodel import Session, select
+
+from aimbat.core import create_snapshot, delete_snapshot
+from aimbat.models import AimbatEvent, AimbatSnapshot, AimbatSnapshotPayload
+from aimbat.models._payload import (
+    SeismogramSnapshotRow,
+    pack_seismogram_snapshots,
+    unpack_seismogram_snapshot_columns,
+    unpack_seismogram_snapshots,
+)
+
+
+def _rows() -> list[SeismogramSnapshotRow]:
+    return [
+        SeismogramSnapshotRow(
+            seismogram_id=uuid.uuid4(),
+            flip=True,
+            select=False,
+            t1=Timestamp("2010-02-27T06:40:01.123456", tz=timezone.utc),
+            iccs_cc=0.87,
+            mccc_cc_mean=0.91,
+            mccc_cc_std=0.02,
+            mccc_error=Timedelta(milliseconds=12),
+        ),
+        SeismogramSnapshotRow(
+            seismogram_id=uuid.uuid4(),
+            flip=False,
+            select=True,
+            t1=None,
+            iccs_cc=None,
+            mccc_cc_mean=None,
+            mccc_cc_std=None,
+            mccc_error=None,
+        ),
+    ]
+
+
+class TestPackUnpack:
+    """Tests for pack_seismogram_snapshots and unpack_seismogram_snapshots."""
+
+    def test_round_trip(self) -> None:
+        """Verifies values, including missing ones, survive a round trip."""
+        rows = _rows()
+        assert unpack_seismogram_snapshots(pack_seismogram_snapshots(rows)) == rows
+
+    def test_empty(self) -> None:
+        """Verifies a snapshot without seismograms packs to an empty payload."""
+        assert unpack_seismogram_snapshots(pack_seismogram_snapshots([])) == []
+
+    def test_unpack_columns(self) -> None:
+        """Verifies the columnar unpack matches the row-wise unpack."""
+        rows = _rows()
+        columns = unpack_seismogram_snapshot_columns(pack_seismogram_snapshots(rows))
+        assert list(columns["seismogram_id"]) == [str(r.seismogram_id) for r in rows]
+        assert list(columns["flip"]) == [True, False]
+        assert list(columns["select"]) == [False, True]
+        assert Timestamp(columns["t1"][0], tz=timezone.utc) == rows[0].t1
+        assert pd.isna(columns["t1"][1])
+        assert columns["iccs_cc"][0] == pytest.approx(0.87)
+        assert pd.isna(columns["iccs_cc"][1])
+        assert Timedelta(columns["mccc_error"][0]) == rows[0].mccc_error
+        assert pd.isna(columns["mccc_error"][1])
+
+    def test_unknown_version_rejected(self) -> None:
+        """Verifies payloads written with an unknown format version are rejected."""
+        raw = bytearray(zlib.decompress(pack_seismogram_snapshots(_rows())))
+        raw[0] = 255
+        with pytest.raises(ValueError, match="format version"):
+            unpack_seismogram_snapshots(zlib.compress(bytes(raw)))
+
+    def test_truncated_rejected(self) -> None:
+        """Verifies truncated payloads are rejected."""
+        raw = zlib.decompress(pack_seismogram_snapshots(_rows()))
+        with pytest.raises(ValueError, match="truncated"):
+            unpack_seismogram_snapshots(zlib.compress(raw[:-1]))
+
+
+class TestSnapshotPayload:
+    """Tests for the AimbatSnapshotPayload written by create_snapshot."""
+
+    def test_identical_snapshots_share_payload(self, loaded_session: Session) -> None:
+        """Verifies snapshots of an unchanged state reference a single payload."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+
+        create_snapshot(loaded_session, event)
+        create_snapshot(loaded_session, event)
+
+        payload = loaded_session.exec(select(AimbatSnapshotPayload)).one()
+        assert payload.ref_count == 2
+        snapshots = loaded_session.exec(select(AimbatSnapshot)).all()
+        assert {s.payload_id for s in snapshots} == {payload.id}
+        for snapshot in snapshots:
+            assert len(snapshot.seismogram_parameters_snapshots) == len(
+                event.seismograms
+            )
+
+    def test_changed_state_gets_new_payload(self, loaded_session: Session) -> None:
+        """Verifies a snapshot of a different state stores its own payload."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+
+        create_snapshot(loaded_session, event)
+        seismogram = event.seismograms[0]
+        seismogram.parameters.flip = not seismogram.parameters.flip
+        loaded_session.add(seismogram.parameters)
+        loaded_session.commit()
+        create_snapshot(loaded_session, event)
+
+        payloads = loaded_session.exec(select(AimbatSnapshotPayload)).all()
+        assert len(payloads) == 2
+        assert all(p.ref_count == 1 for p in payloads)
+
+    def test_shared_payload_kept_until_last_reference(
+        self, loaded_session: Session
+    ) -> None:
+        """Verifies a shared payload is only removed with its last snapshot."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        create_snapshot(loaded_session, event)
+        create_snapshot(loaded_session, event)
+        first, second = loaded_session.exec(select(AimbatSnapshot)).all()
+        payload_id = first.payload_id
+
+        delete_snapshot(loaded_session, first.id)
+        payload = loaded_session.get(AimbatSnapshotPayload, payload_id)
+        assert payload is not None
+        assert payload.ref_count == 1
+        assert len(second.seismogram_parameters_snapshots) == len(event.seismograms)
+
+        delete_snapshot(loaded_session, second.id)
+        assert loaded_session.get(AimbatSnapshotPayload, payload_id) is None
+
+    def test_payload_matches_live_parameters(self, loaded_session: Session) -> None:
+        """Verifies decoded records match the parameters at creation time."""
+        event = loaded_session.exec(select(AimbatEvent)).first()
+        assert event is not None
+        seismogram = event.seismograms[0]
+        seismogram.parameters.flip = True
+        loaded_session.add(seismogram.parameters)
+        loaded_session.commit()
+
+        create_snapshot(loaded_session, event)
+        snapshot = loaded_session.exec(select(AimbatSnapshot)).one()
+
+        records = {r.seismogram_id: r for r in snapshot.seismogram_parameters_snapshots}
+        for seis in event.seismograms:
+            record = records[seis.id]
+            assert record.snapshot_id == snapshot.id
+            assert record.flip == seis.parameters.flip
+            assert record.select == seis.parameters.select
+            assert record.t1 == seis.parameters.t1
@@ -3,10 +3,14 @@
 from pandas import Timedelta, Timestamp
 from sqlmodel import Session, select
 
+from aimbat.core import create_snapshot, delete_snapshot
 from aimbat.models import (
+    AimbatEvent,
     AimbatEventQuality,
     AimbatSeismogram,
     AimbatSeismogramQuality,
+    AimbatSnapshot,
+    AimbatStation,
 )
 
 
@@ -230,3 +234,99 @@ def test_trigger_null_event_quality_on_select_change(loaded_session: Session) ->
     assert event_quality.mccc_rmse is None
 
     # TODO: Add application-level logic to null seismogram quality metrics
+
+
+def _assert_counters_consistent(session: Session) -> None:
+    """Helper asserting every trigger-maintained counter matches the actual rows."""
+    session.expire_all()
+    for event in session.exec(select(AimbatEvent)).all():
+        assert event.seismogram_count == len(event.seismograms)
+        assert event.station_count == len({s.station_id for s in event.seismograms})
+        assert event.snapshot_count == len(event.snapshots)
+    for station in session.exec(select(AimbatStation)).all():
+        assert station.seismogram_count == len(station.seismograms)
+        assert station.event_count == len({s.event_id for s in station.seismograms})
+    for snapshot in session.exec(select(AimbatSnapshot)).all():
+        records = snapshot.seismogram_parameters_snapshots
+        assert snapshot.seismogram_count == len(records)
+        assert snapshot.selected_seismogram_count == sum(r.select for r in records)
+        assert snapshot.flipped_seismogram_count == sum(r.flip for r in records)
+
+
+def test_trigger_counters_after_adding_data(loaded_session: Session) -> None:
+    """Verifies the event and station counters are maintained as data is added."""
+    _assert_counters_consistent(loaded_session)
+    assert any(
+        event.seismogram_count > 0
+        for event in loaded_session.exec(select(AimbatEvent)).all()
+    )
+
+
+def test_trigger_counters_on_seismogram_delete(loaded_session: Session) -> None:
+    """Verifies deleting a seismogram decrements its event and station counters."""
+    seismogram = loaded_session.exec(select(AimbatSeismogram)).first()
+    assert seismogram is not None
+    event_id, station_id = seismogram.event_id, seismogram.station_id
+    event = loaded_session.get(AimbatEvent, event_id)
+    station = loaded_session.get(AimbatStation, station_id)
+    assert event is not None and station is not None
+    event_count_before = event.seismogram_count
+    station_count_before = station.seismogram_count
+
+    loaded_session.delete(seismogram)
+    loaded_session.commit()
+
+    loaded_session.refresh(event)
+    loaded_session.refresh(station)
+    assert event.seismogram_count == event_count_before - 1
+    assert station.seismogram_count == station_count_before - 1
+    _assert_counters_consistent(loaded_session)
+
+
+def test_trigger_counters_on_event_delete(loaded_session: Session) -> None:
+    """Verifies cascading an event delete keeps the station counters in step."""
+    event = loaded_session.exec(select(AimbatEvent)).first()
+    assert event is not None
+
+    loaded_session.delete(event)
+    loaded_session.commit()
+
+    _assert_counters_consistent(loaded_session)
+
+
+def test_trigger_counters_on_seismogram_reparent(loaded_session: Session) -> None:
+    """Verifies moving a seismogram to another event updates both events."""
+    events = loaded_session.exec(select(AimbatEvent)).all()
+    assert len(events) >= 2
+    seismogram = events[0].seismograms[0]
+
+    seismogram.event_id = events[1].id
+    loaded_session.add(seismogram)
+    loaded_session.commit()
+
+    _assert_counters_consistent(loaded_session)
+
+
+def test_trigger_snapshot_counters(loaded_session: Session) -> None:
+    """Verifies snapshot counters follow snapshot creation and deletion."""
+    event = loaded_session.exec(select(AimbatEvent)).first()
+    assert event is not None
+    seismograms = event.seismograms
+    seismograms[0].parameters.flip = True
+    seismograms[1].parameters.select = False
+    loaded_session.add_all([seismograms[0].parameters, seismograms[1].parameters])
+    loaded_session.commit()
+
+    create_snapshot(loaded_session, event)
+    create_snapshot(loaded_session, event)
+    _assert_counters_consistent(loaded_session)
+
+    snapshot = loaded_session.exec(select(AimbatSnapshot)).first()
+    assert snapshot is not None
+    assert snapshot.flipped_seismogram_count == 1
+    assert snapshot.selected_seismogram_count == snapshot.seismogram_count - 1
+
+    delete_snapshot(loaded_session, snapshot.id)
+    loaded_session.refresh(event)
+    assert event.snapshot_count == 1
+    _assert_counters_consistent(loaded_session)
@@ -0,0 +1,123 @@
+"""Integration tests for external change detection in the TUI."""
+
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import Engine
+from sqlmodel import Session, select
+
+from aimbat._tui._changes import ChangeWatcher
+from aimbat.core import (
+    create_snapshot,
+    resolve_event,
+    save_note,
+    set_event_parameter,
+)
+from aimbat.models import AimbatEvent
+
+
+@pytest.fixture()
+def watcher(loaded_engine_from_file: Engine) -> Generator[ChangeWatcher, None, None]:
+    """A `ChangeWatcher` with its baseline taken.
+
+    Uses a file-backed database, as changes are only reported when they are
+    committed through another connection than the watcher's own.
+
+    Args:
+        loaded_engine_from_file: The file-backed SQLAlchemy Engine with data loaded.
+
+    Yields:
+        The watcher.
+    """
+    watcher = ChangeWatcher(loaded_engine_from_file)
+    assert watcher.poll() is None
+    yield watcher
+    watcher.close()
+
+
+@pytest.fixture()
+def events(loaded_engine_from_file: Engine) -> list[AimbatEvent]:
+    """All events in the project.
+
+    Args:
+        loaded_engine_from_file: The file-backed SQLAlchemy Engine with data loaded.
+
+    Returns:
+        The events.
+    """
+    with Session(loaded_engine_from_file) as session:
+        return list(session.exec(select(AimbatEvent)).all())
+
+
+class TestChangeWatcher:
+    """Tests for `ChangeWatcher`."""
+
+    def test_no_changes(self, watcher: ChangeWatcher) -> None:
+        """Verifies that nothing is reported while the project is unchanged."""
+        assert watcher.poll() is None
+        assert watcher.poll() is None
+
+    def test_parameter_change(
+        self,
+        watcher: ChangeWatcher,
+        events: list[AimbatEvent],
+        loaded_engine_from_file: Engine,
+    ) -> None:
+        """Verifies that only the modified event is reported, and only once."""
+        event = events[0]
+        with Session(loaded_engine_from_file) as session:
+            set_event_parameter(session, event.id, "min_cc", 0.42)
+
+        changes = watcher.poll()
+
+        assert changes is not None
+        assert changes.events == {event.id}
+        assert not changes.snapshots
+        assert not changes.stations
+        assert not changes.notes
+        assert watcher.poll() is None
+
+    def test_snapshot_change(
+        self,
+        watcher: ChangeWatcher,
+        events: list[AimbatEvent],
+        loaded_engine_from_file: Engine,
+    ) -> None:
+        """Verifies that a new snapshot is reported for its event."""
+        event = events[-1]
+        with Session(loaded_engine_from_file) as session:
+            create_snapshot(session, resolve_event(session, event.id))
+
+        changes = watcher.poll()
+
+        assert changes is not None
+        assert changes.snapshots == {event.id}
+
+    def test_note_change(
+        self,
+        watcher: ChangeWatcher,
+        events: list[AimbatEvent],
+        loaded_engine_from_file: Engine,
+    ) -> None:
+        """Verifies that an edited note is reported."""
+        with Session(loaded_engine_from_file) as session:
+            save_note(session, "event", events[0].id, "Checked picks.")
+
+        changes = watcher.poll()
+
+        assert changes is not None
+        assert changes.notes
+
+    def test_reset(
+        self,
+        watcher: ChangeWatcher,
+        events: list[AimbatEvent],
+        loaded_engine_from_file: Engine,
+    ) -> None:
+        """Verifies that changes before a reset are not reported."""
+        with Session(loaded_engine_from_file) as session:
+            set_event_parameter(session, events[0].id, "min_cc", 0.42)
+
+        watcher.reset()
+
+        assert watcher.poll() is None
@@ -0,0 +1,59 @@
+"""Integration tests for aimbat.utils._sqlprofile."""
+
+import pytest
+from sqlalchemy import Engine
+from sqlmodel import Session, select
+
+from aimbat.models import AimbatEvent, AimbatSeismogram
+from aimbat.utils._sqlprofile import SQLProfiler
+
+
+class TestSQLProfilerEngine:
+    """Tests for SQLProfiler attached to a database engine."""
+
+    def test_records_executed_statements(self, loaded_engine: Engine) -> None:
+        """Verifies that statements executed while attached are recorded."""
+        profiler = SQLProfiler().attach(loaded_engine)
+        try:
+            with Session(loaded_engine) as session:
+                session.exec(select(AimbatEvent)).all()
+        finally:
+            profiler.detach()
+
+        assert profiler.statement_count == 1
+        assert "aimbatevent" in profiler.report()["statements"][0]["statement"]
+
+    def test_detach_stops_recording(self, loaded_engine: Engine) -> None:
+        """Verifies that nothing is recorded after detaching."""
+        profiler = SQLProfiler().attach(loaded_engine)
+        profiler.detach()
+
+        with Session(loaded_engine) as session:
+            session.exec(select(AimbatEvent)).all()
+
+        assert profiler.statement_count == 0
+
+    def test_attach_twice_raises(self, loaded_engine: Engine) -> None:
+        """Verifies that a profiler cannot be attached to two engines at once."""
+        profiler = SQLProfiler().attach(loaded_engine)
+        try:
+            with pytest.raises(RuntimeError):
+                profiler.attach(loaded_engine)
+        finally:
+            profiler.detach()
+
+    def test_detects_lazy_loading_per_row(self, loaded_engine: Engine) -> None:
+        """Verifies that lazy-loading a relationship row by row is flagged."""
+        profiler = SQLProfiler(repeat_threshold=5)
+        with Session(loaded_engine) as session:
+            seismograms = session.exec(select(AimbatSeismogram).limit(10)).all()
+            profiler.attach(loaded_engine)
+            try:
+                for seismogram in seismograms:
+                    _ = seismogram.station.name
+            finally:
+                profiler.detach()
+
+        suspects = profiler.n_plus_one_suspects()
+        assert len(suspects) == 1
+        assert "aimbatstation" in suspects[0][0]
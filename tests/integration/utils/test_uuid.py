@@ -1,13 +1,18 @@
 """Integration tests for aimbat.utils._uuid."""
 
 import uuid
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from typing import Any
 
 import pandas as pd
 import pytest
+from sqlalchemy import Engine, event
 from sqlmodel import Session
 
 from aimbat.models import AimbatEvent
-from aimbat.utils._uuid import string_to_uuid, uuid_shortener
+from aimbat.utils import SQLProfiler
+from aimbat.utils._uuid import string_to_uuid, uuid_shortener, uuid_shortener_map
 
 
 def _make_event(uid: uuid.UUID, offset_seconds: int = 0) -> AimbatEvent:
@@ -103,6 +108,60 @@ class TestStringToUuid:
         result = string_to_uuid(patched_session, "abcdef12-1234", AimbatEvent)
         assert result == uid
 
+    def test_resolves_uppercase_prefix(self, patched_session: Session) -> None:
+        """Verifies that prefixes are matched case-insensitively.
+
+        Args:
+            patched_session: The database session.
+        """
+        uid = uuid.UUID("abcdef12-1234-4000-8000-000000000001")
+        patched_session.add(_make_event(uid))
+        patched_session.commit()
+        assert string_to_uuid(patched_session, "ABCDEF", AimbatEvent) == uid
+
+    def test_raises_on_non_hex_input(self, patched_session: Session) -> None:
+        """Verifies that input which cannot be a UUID prefix matches nothing.
+
+        Args:
+            patched_session: The database session.
+        """
+        patched_session.add(_make_event(uuid.uuid4()))
+        patched_session.commit()
+        with pytest.raises(ValueError, match="Unable to find"):
+            string_to_uuid(patched_session, "%", AimbatEvent)
+
+    def test_lookup_uses_primary_key_index(self, patched_session: Session) -> None:
+        """Verifies that the prefix lookup is a range search, not a table scan.
+
+        Args:
+            patched_session: The database session.
+        """
+        uid = uuid.uuid4()
+        patched_session.add(_make_event(uid))
+        patched_session.commit()
+
+        statements: list[tuple[str, Any]] = []
+
+        def capture(
+            conn: Any, cursor: Any, statement: str, params: Any, *_: Any
+        ) -> None:
+            statements.append((statement, params))
+
+        engine = patched_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            string_to_uuid(patched_session, str(uid)[:6], AimbatEvent)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        statement, params = statements[-1]
+        plan = patched_session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", params
+        )
+        details = " ".join(str(row[-1]) for row in plan)
+        assert "SEARCH" in details
+        assert "SCAN" not in details
+
 
 class TestUuidShortener:
     """Tests for the uuid_shortener function."""
@@ -207,3 +266,97 @@ class TestUuidShortener:
         assert len(short.replace("-", "")) >= 4, (
             "result should be at least 4 characters excluding dashes"
         )
+
+    def test_one_query_for_many_rows(
+        self,
+        patched_session: Session,
+        query_budget: Callable[[Engine, int], AbstractContextManager[SQLProfiler]],
+    ) -> None:
+        """Verifies that shortening every ID of a table runs a single query.
+
+        Args:
+            patched_session: The database session.
+            query_budget: Fixture limiting the SQL statements executed.
+        """
+        uids = [uuid.uuid4() for _ in range(200)]
+        patched_session.add_all(
+            _make_event(uid, offset_seconds=i) for i, uid in enumerate(uids)
+        )
+        patched_session.commit()
+
+        with query_budget(patched_session.get_bind(), 1):
+            for uid in uids:
+                uuid_shortener(patched_session, AimbatEvent, str_uuid=str(uid))
+
+
+class TestUuidShortenerMap:
+    """Tests for the uuid_shortener_map function."""
+
+    def test_matches_uuid_shortener(self, patched_session: Session) -> None:
+        """Verifies the batch prefixes are identical to the per-row ones.
+
+        Args:
+            patched_session: The database session.
+        """
+        uids = [
+            uuid.UUID("aaaaaaaa-0000-4000-8000-000000000001"),
+            uuid.UUID("aaaaaaaa-0000-4000-8000-000000000002"),
+            uuid.UUID("aaaaaaab-0000-4000-8000-000000000003"),
+            uuid.UUID("b0000000-0000-4000-8000-000000000004"),
+        ] + [uuid.uuid4() for _ in range(50)]
+        events = [_make_event(uid, offset_seconds=i) for i, uid in enumerate(uids)]
+        patched_session.add_all(events)
+        patched_session.commit()
+
+        for min_length in (2, 8, 9):
+            short_ids = uuid_shortener_map(
+                patched_session, AimbatEvent, min_length=min_length
+            )
+            assert set(short_ids) == set(uids)
+            for ev in events:
+                assert short_ids[ev.id] == uuid_shortener(
+                    patched_session, ev, min_length=min_length
+                )
+
+    def test_prefixes_are_unique(self, patched_session: Session) -> None:
+        """Verifies no returned prefix matches more than one UUID.
+
+        Args:
+            patched_session: The database session.
+        """
+        uids = [uuid.uuid4() for _ in range(100)]
+        patched_session.add_all(
+            _make_event(uid, offset_seconds=i) for i, uid in enumerate(uids)
+        )
+        patched_session.commit()
+
+        short_ids = uuid_shortener_map(patched_session, AimbatEvent)
+        for uid, short in short_ids.items():
+            assert not short.endswith("-")
+            assert [u for u in uids if str(u).startswith(short)] == [uid]
+
+    def test_cache_invalidated_on_flush(self, patched_session: Session) -> None:
+        """Verifies newly added rows are taken into account after a flush.
+
+        Args:
+            patched_session: The database session.
+        """
+        uid1 = uuid.UUID("aaaaaaaa-0000-4000-8000-000000000001")
+        uid2 = uuid.UUID("aaaaaaaa-0000-4000-8000-000000000002")
+        patched_session.add(_make_event(uid1))
+        patched_session.commit()
+        assert uuid_shortener_map(patched_session, AimbatEvent)[uid1] == "aa"
+
+        patched_session.add(_make_event(uid2, offset_seconds=1))
+        patched_session.commit()
+        short_ids = uuid_shortener_map(patched_session, AimbatEvent)
+        assert short_ids[uid1] != short_ids[uid2]
+        assert len(short_ids[uid1]) == len(str(uid1))
+
+    def test_empty_table(self, patched_session: Session) -> None:
+        """Verifies an empty table yields an empty mapping.
+
+        Args:
+            patched_session: The database session.
+        """
+        assert uuid_shortener_map(patched_session, AimbatEvent) == {}
@@ -1,10 +1,15 @@
 """Unit tests for the main CLI application entry point."""
 
+import importlib
+import subprocess
+import sys
 from importlib import metadata, reload
 from typing import Any
 
 import pytest
 
+from aimbat.app import _COMMANDS, _module_docstring
+
 
 def mock_return_str(*args: list[Any], **kwargs: dict[str, Any]) -> str:
     """Mock function that returns a fixed string version.
@@ -73,3 +78,35 @@ def test_cli_version(
         app.app(["--version"])
     assert excinfo.value.code == 0
     assert "unknown" in capsys.readouterr().out
+
+
+def test_cli_imports_commands_lazily() -> None:
+    """Test that importing the CLI does not import the sub-apps or the models."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import aimbat.app"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+    assert "aimbat.app" in imported
+    for module in ("aimbat._cli.common", "aimbat.models", "aimbat.core", "sqlmodel"):
+        assert module not in imported
+
+
+@pytest.mark.parametrize("name", list(_COMMANDS))
+def test_cli_lazy_command_help(name: str) -> None:
+    """Test that a lazily registered command has the help and name of its sub-app.
+
+    Args:
+        name: Name of the command.
+    """
+    module = importlib.import_module(_COMMANDS[name])
+
+    assert _module_docstring(_COMMANDS[name]) == module.__doc__
+    assert module.app.name[0] == name
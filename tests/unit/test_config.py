@@ -64,6 +64,58 @@ class TestSettings:
         """Verifies that the environment variable prefix is 'aimbat_'."""
         assert Settings.model_config.get("env_prefix") == "aimbat_"
 
+    def test_sqlite_profile_default(self) -> None:
+        """Verifies that the durable `safe` SQLite profile is the default."""
+        s = Settings()
+        assert s.sqlite_profile == "safe"
+
+    def test_sqlite_profile_rejects_unknown(self) -> None:
+        """Verifies that an unknown SQLite profile name is rejected."""
+        with pytest.raises(ValueError):
+            Settings(sqlite_profile="reckless")  # type: ignore[arg-type]
+
+    def test_snapshot_retention_disabled_by_default(self) -> None:
+        """Verifies that no snapshot retention rules are configured by default."""
+        s = Settings()
+        assert s.snapshot_auto_prune is False
+        assert s.snapshot_keep_automatic is None
+        assert s.snapshot_thin_after is None
+
+    def test_snapshot_keep_automatic_rejects_negative(self) -> None:
+        """Verifies that a negative number of kept snapshots is rejected."""
+        with pytest.raises(ValueError):
+            Settings(snapshot_keep_automatic=-1)
+
+    def test_profile_dir_unset_by_default(self) -> None:
+        """Verifies that profiling is disabled by default."""
+        assert Settings().profile_dir is None
+
+    def test_daemon_disabled_by_default(self) -> None:
+        """Verifies that CLI commands are not forwarded to a daemon by default."""
+        s = Settings()
+        assert s.daemon is False
+        assert s.daemon_socket == Path("aimbat.sock")
+
+    def test_api_port_rejects_invalid_port(self) -> None:
+        """Verifies that the API port must be a valid TCP port number."""
+        with pytest.raises(ValueError):
+            Settings(api_port=70000)
+
+    def test_timing_log_unset_by_default(self) -> None:
+        """Verifies that no timing log is written by default."""
+        assert Settings().timing_log is None
+
+    def test_sql_profile_disabled_by_default(self) -> None:
+        """Verifies that SQL profiling is off and writes no report by default."""
+        s = Settings()
+        assert s.sql_profile is False
+        assert s.sql_profile_report is None
+
+    def test_sql_repeat_threshold_rejects_one(self) -> None:
+        """Verifies that a repeat threshold below two is rejected."""
+        with pytest.raises(ValueError):
+            Settings(sql_repeat_threshold=1)
+
     def test_min_id_length_default(self) -> None:
         """Verifies the default minimum ID length."""
         s = Settings()
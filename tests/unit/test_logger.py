@@ -0,0 +1,112 @@
+"""Unit tests for the timing spans in aimbat.logger."""
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import aimbat
+from aimbat.logger import Span, annotate_span, configure_logging, logger
+
+
+@pytest.fixture()
+def span_records() -> Generator[list[dict[str, Any]], None, None]:
+    """Collects the `extra` dict of every span logged during a test.
+
+    Yields:
+        List that the span records are appended to.
+    """
+    records: list[dict[str, Any]] = []
+    handler_id = logger.add(
+        lambda message: records.append(message.record["extra"]),
+        level="TRACE",
+        filter=lambda record: "span" in record["extra"],
+    )
+    yield records
+    logger.remove(handler_id)
+
+
+class TestSpan:
+    """Tests for the Span context manager and decorator."""
+
+    def test_context_manager(self, span_records: list[dict[str, Any]]) -> None:
+        """Verifies that a span logs its name, duration and fields."""
+        with Span("test.block", items=3) as span:
+            span.set(written=2)
+
+        assert span.duration is not None and span.duration >= 0
+        assert span_records == [
+            {
+                "span": "test.block",
+                "duration": span.duration,
+                "status": "ok",
+                "fields": {"items": 3, "written": 2},
+            }
+        ]
+
+    def test_error_status(self, span_records: list[dict[str, Any]]) -> None:
+        """Verifies that a span records a failure and does not swallow it."""
+        with pytest.raises(ValueError):
+            with Span("test.fail"):
+                raise ValueError("boom")
+
+        assert span_records[0]["status"] == "error"
+
+    def test_decorator_with_annotate(self, span_records: list[dict[str, Any]]) -> None:
+        """Verifies that each call of a decorated function gets its own fields."""
+
+        @Span("test.func")
+        def func(n: int) -> int:
+            annotate_span(n=n)
+            return n * 2
+
+        assert func(1) == 2
+        assert func(5) == 10
+
+        assert [r["fields"] for r in span_records] == [{"n": 1}, {"n": 5}]
+
+    def test_nested_annotate_targets_innermost(
+        self, span_records: list[dict[str, Any]]
+    ) -> None:
+        """Verifies that annotate_span adds fields to the innermost span only."""
+        with Span("test.outer"):
+            with Span("test.inner"):
+                annotate_span(inner=True)
+            annotate_span(outer=True)
+
+        assert [(r["span"], r["fields"]) for r in span_records] == [
+            ("test.inner", {"inner": True}),
+            ("test.outer", {"outer": True}),
+        ]
+
+    def test_annotate_without_span(self) -> None:
+        """Verifies that annotate_span outside of a span does nothing."""
+        annotate_span(ignored=True)
+
+
+class TestTimingLog:
+    """Tests for the JSON-lines timing sink."""
+
+    def test_writes_json_lines(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies that spans are appended to the timing log as JSON lines."""
+        timing_log = tmp_path / "timing.jsonl"
+        monkeypatch.setattr(aimbat.settings, "timing_log", timing_log)
+        monkeypatch.setattr(aimbat.settings, "log_level", "ERROR")
+        configure_logging()
+
+        with Span("test.first", path=tmp_path):
+            pass
+        with Span("test.second"):
+            pass
+        logger.error("not a span")
+
+        entries = [json.loads(line) for line in timing_log.read_text().splitlines()]
+        assert [e["span"] for e in entries] == ["test.first", "test.second"]
+        assert entries[0]["fields"] == {"path": str(tmp_path)}
+        assert entries[0]["status"] == "ok"
+        assert entries[0]["duration_ms"] >= 0
+        assert {"time", "host", "pid", "thread"} <= set(entries[0])
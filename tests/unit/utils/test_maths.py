@@ -1,9 +1,10 @@
 """Unit tests for aimbat.utils._maths."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from aimbat.utils._maths import mean_and_sem, mean_and_sem_timedelta
+from aimbat.utils._maths import mean_and_sem, mean_and_sem_timedelta, minmax_decimate
 
 
 class TestMeanAndSem:
@@ -152,3 +153,38 @@ class TestMeanAndSemTimedelta:
 
         assert mean == pd.Timedelta(seconds=0)
         assert sem is not None
+
+
+class TestMinmaxDecimate:
+    """Tests for the minmax_decimate function."""
+
+    def test_short_trace_unchanged(self) -> None:
+        """Verifies that a trace with few samples is returned as is."""
+        x, y = minmax_decimate([0.0, 1.0, 2.0], [3.0, -1.0, 2.0], 10)
+
+        assert x.tolist() == [0.0, 1.0, 2.0]
+        assert y.tolist() == [3.0, -1.0, 2.0]
+
+    def test_keeps_envelope(self) -> None:
+        """Verifies the decimated trace is short and keeps every bin's extremes."""
+        x = np.arange(10_000) * 0.01
+        y = np.sin(x)
+        y[5_003] = 5.0
+
+        x_dec, y_dec = minmax_decimate(x, y, 100)
+
+        assert len(y_dec) <= 200
+        assert y_dec.max() == 5.0
+        assert y_dec.min() == pytest.approx(y.min())
+        assert np.all(np.diff(x_dec) >= 0)
+        assert x_dec[0] == x[0]
+
+    def test_points_are_samples(self) -> None:
+        """Verifies the decimated points are original (x, y) pairs."""
+        rng = np.random.default_rng(42)
+        x = np.arange(1_001, dtype=float)
+        y = rng.normal(size=1_001)
+
+        x_dec, y_dec = minmax_decimate(x, y, 50)
+
+        assert np.array_equal(y[x_dec.astype(int)], y_dec)
@@ -0,0 +1,109 @@
+"""Unit tests for aimbat.utils._profiling."""
+
+import pstats
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import aimbat
+from aimbat.utils._profiling import StackSampler, profiled, profiling
+
+
+def _busy(seconds: float) -> None:
+    """Keep the current thread busy for a while."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestStackSampler:
+    """Tests for the StackSampler class."""
+
+    def test_samples_selected_thread(self, tmp_path: Path) -> None:
+        """Verifies that stacks of the sampled thread are written collapsed."""
+        sampler = StackSampler(interval=0.001, thread_ids={threading.get_ident()})
+        sampler.start()
+        _busy(0.1)
+        sampler.stop()
+
+        path = tmp_path / "stacks.collapsed"
+        sampler.write(path)
+        lines = path.read_text().splitlines()
+
+        assert lines
+        assert any("_busy (test_profiling.py)" in line for line in lines)
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+            assert stack.startswith(f"{threading.current_thread().name};")
+
+    def test_ignores_other_threads(self) -> None:
+        """Verifies that threads not selected are not sampled."""
+        sampler = StackSampler(interval=0.001, thread_ids={-1})
+        sampler.start()
+        _busy(0.05)
+        sampler.stop()
+
+        assert not sampler.counts
+
+
+class TestProfiling:
+    """Tests for the profiling context manager and profiled decorator."""
+
+    def test_disabled_without_directory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies that nothing is profiled if no directory is configured."""
+        monkeypatch.setattr(aimbat.settings, "profile_dir", None)
+        with profiling("test") as stem:
+            assert stem is None
+
+    def test_writes_pstats_and_collapsed(self, tmp_path: Path) -> None:
+        """Verifies that a cProfile and a collapsed-stack file are written."""
+        with profiling("test", tmp_path) as stem:
+            assert stem is not None
+            _busy(0.05)
+
+        stats = pstats.Stats(str(stem) + ".pstats")
+        assert any(func[2] == "_busy" for func in stats.stats)
+        assert "_busy" in Path(f"{stem}.collapsed").read_text()
+
+    def test_nested_blocks_share_profile(self, tmp_path: Path) -> None:
+        """Verifies that a nested block does not start a profile of its own."""
+        with profiling("outer", tmp_path):
+            with profiling("inner", tmp_path) as inner:
+                assert inner is None
+
+        assert {p.suffix for p in tmp_path.iterdir()} == {".pstats", ".collapsed"}
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_concurrent_profiles(self, tmp_path: Path) -> None:
+        """Verifies that a profile in another thread still samples its stacks."""
+        stems: list[Path | None] = []
+
+        def worker() -> None:
+            with profiling("worker", tmp_path) as stem:
+                stems.append(stem)
+                _busy(0.05)
+
+        with profiling("main", tmp_path):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        assert len(stems) == 1 and stems[0] is not None
+        assert Path(f"{stems[0]}.collapsed").exists()
+
+    def test_profiled_decorator(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies that the decorator profiles each call under the given name."""
+        monkeypatch.setattr(aimbat.settings, "profile_dir", tmp_path)
+
+        @profiled("decorated")
+        def func(x: int) -> int:
+            return x + 1
+
+        assert func(1) == 2
+        assert func(2) == 3
+        assert len(list(tmp_path.glob("decorated-*.collapsed"))) == 2
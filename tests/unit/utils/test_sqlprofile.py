@@ -0,0 +1,94 @@
+"""Unit tests for aimbat.utils._sqlprofile."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from aimbat.utils._sqlprofile import SQLProfiler, normalise_statement
+
+
+class TestNormaliseStatement:
+    """Tests for the normalise_statement function."""
+
+    def test_replaces_literals(self) -> None:
+        """Verifies that string and number literals are replaced by placeholders."""
+        statement = "SELECT * FROM t WHERE name = 'it''s' AND x > 1.5 AND y = 2"
+        assert normalise_statement(statement) == (
+            "SELECT * FROM t WHERE name = ? AND x > ? AND y = ?"
+        )
+
+    def test_keeps_identifiers_with_digits(self) -> None:
+        """Verifies that digits inside identifiers are left alone."""
+        statement = "SELECT t1, col_2 FROM t"
+        assert normalise_statement(statement) == statement
+
+    def test_collapses_in_lists(self) -> None:
+        """Verifies that IN lists of any length normalise to the same statement."""
+        short = normalise_statement("SELECT * FROM t WHERE id IN (?, ?)")
+        long = normalise_statement("SELECT * FROM t WHERE id IN (?, ?, ?, ?)")
+        assert short == long == "SELECT * FROM t WHERE id IN (?...)"
+
+    def test_collapses_multi_row_values(self) -> None:
+        """Verifies that multi-row inserts normalise to the same statement."""
+        one = normalise_statement("INSERT INTO t (a, b) VALUES (?, ?)")
+        three = normalise_statement(
+            "INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)"
+        )
+        assert one == three
+
+    def test_collapses_whitespace(self) -> None:
+        """Verifies that newlines and repeated spaces are collapsed."""
+        assert normalise_statement("SELECT a\n  FROM t\n") == "SELECT a FROM t"
+
+
+class TestSQLProfiler:
+    """Tests for the SQLProfiler class without a database."""
+
+    def test_aggregates_per_statement(self) -> None:
+        """Verifies that executions of the same statement shape are aggregated."""
+        profiler = SQLProfiler()
+        profiler.record("SELECT * FROM t WHERE id = 1", 0.001)
+        profiler.record("SELECT * FROM t WHERE id = 2", 0.003)
+        profiler.record("UPDATE t SET x = 1", 0.002)
+
+        report = profiler.report()
+
+        assert report["statement_count"] == 3
+        assert report["total_ms"] == pytest.approx(6.0)
+        select = report["statements"][0]
+        assert select["statement"] == "SELECT * FROM t WHERE id = ?"
+        assert select["count"] == 2
+        assert select["mean_ms"] == pytest.approx(2.0)
+        assert select["max_ms"] == pytest.approx(3.0)
+
+    def test_slow_statements(self) -> None:
+        """Verifies that only statements above the threshold are reported as slow."""
+        profiler = SQLProfiler(slow_threshold=0.05)
+        profiler.record("SELECT 1", 0.01)
+        profiler.record("SELECT 2", 0.2)
+
+        slow = profiler.report()["slow_statements"]
+
+        assert slow == [{"statement": "SELECT 2", "duration_ms": pytest.approx(200)}]
+
+    def test_n_plus_one_suspects(self) -> None:
+        """Verifies that only frequently repeated SELECTs are flagged."""
+        profiler = SQLProfiler(repeat_threshold=5)
+        for i in range(5):
+            profiler.record(f"SELECT * FROM t WHERE id = {i}", 0.001)
+            profiler.record(f"INSERT INTO t (id) VALUES ({i})", 0.001)
+        for i in range(4):
+            profiler.record(f"SELECT * FROM u WHERE id = {i}", 0.001)
+
+        assert profiler.n_plus_one_suspects() == [("SELECT * FROM t WHERE id = ?", 5)]
+
+    def test_write_report(self, tmp_path: Path) -> None:
+        """Verifies that the report is written as JSON."""
+        profiler = SQLProfiler()
+        profiler.record("SELECT 1", 0.001)
+        path = tmp_path / "profile.json"
+
+        profiler.write_report(path)
+
+        assert json.loads(path.read_text())["statement_count"] == 1